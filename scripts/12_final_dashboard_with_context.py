@@ -1,427 +1,11 @@
 #!/usr/bin/env python3
 """
 FINAL DASHBOARD WITH COMPLETE CONTEXT AND DEEP INSIGHTS
-Based on Opus deep analysis - includes the REAL story
+Includes the REAL story: scale, wasted spend and loss context
+Rendered by dashboard_engine.py from the 'context' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import numpy as np
-import re
-from pathlib import Path
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import BarChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.datavalidation import DataValidation
+from dashboard_engine import main
 
-BASE_DIR = Path(__file__).parent.parent
-DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 100)
-print("FINAL DASHBOARD WITH STRATEGIC CONTEXT & DEEP INSIGHTS")
-print("=" * 100)
-print()
-
-# Load combined processed data
-print("[1/5] Loading combined data...")
-campaigns = pd.read_csv(DATA_DIR / 'SP_Campaign_-_4_Months.csv')
-ad_products = pd.read_csv(PROCESSED_DIR / 'advertised_products_processed.csv', low_memory=False)
-
-# Load ASIN lists
-perpetua_list = pd.read_excel(DATA_DIR / 'ASIN list - perpetua.xlsx', sheet_name='perpetua list')
-perpetua_asins = set(perpetua_list['ASIN'].dropna().str.strip())
-perpetua_skus = set(perpetua_list['SKU'].dropna().str.strip())
-
-# Convert dates and clean
-for df in [campaigns, ad_products]:
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-
-campaigns = campaigns[campaigns['Date'].notna()]
-ad_products = ad_products[ad_products['Date'].notna()]
-
-# Tag campaigns
-def extract_sku(name):
-    if pd.isna(name):
-        return None
-    match = re.search(r'(NT|SD|PN)\d+[A-Z]?', str(name))
-    return match.group(0) if match else None
-
-campaigns['SKU'] = campaigns['Campaign Name'].apply(extract_sku)
-campaigns['Is_Perpetua'] = campaigns['SKU'].isin(perpetua_skus)
-
-# Clean campaign numerics
-for col in ['Spend', '7 Day Total Sales ', '7 Day Total Orders (#)', 'Clicks', 'Impressions']:
-    if col in campaigns.columns:
-        if campaigns[col].dtype == 'object':
-            campaigns[col] = campaigns[col].astype(str).str.replace('$', '').str.replace(',', '')
-        campaigns[col] = pd.to_numeric(campaigns[col], errors='coerce').fillna(0)
-
-# Filter to valid data
-campaigns = campaigns[campaigns['Spend'] > 0]
-ad_products = ad_products[ad_products['Spend'] > 0]
-
-min_date = min(campaigns['Date'].min(), ad_products['Date'].min())
-max_date = max(campaigns['Date'].max(), ad_products['Date'].max())
-
-print(f"  ✓ Campaign records: {len(campaigns):,}")
-print(f"  ✓ ASIN records: {len(ad_products):,}")
-print(f"  ✓ Date range: {min_date.date()} to {max_date.date()}")
-
-# ============================================================================
-# CALCULATE COMPREHENSIVE METRICS
-# ============================================================================
-
-print("[2/5] Calculating metrics with strategic context...")
-
-def calc_comprehensive_metrics(campaign_df, label):
-    """Calculate all metrics including loss analysis"""
-    total = {
-        'Label': label,
-        'Campaigns': campaign_df['Campaign Name'].nunique() if 'Campaign Name' in campaign_df else 0,
-        'ASINs': campaign_df['SKU'].nunique() if 'SKU' in campaign_df else campaign_df['Advertised ASIN'].nunique(),
-        'Total_Spend': campaign_df['Spend'].sum(),
-        'Total_Sales': campaign_df['7 Day Total Sales '].sum(),
-        'Total_Orders': campaign_df['7 Day Total Orders (#)'].sum(),
-        'Total_Clicks': campaign_df['Clicks'].sum(),
-        'Total_Impressions': campaign_df['Impressions'].sum(),
-    }
-
-    # Calculate derived
-    total['ROAS'] = total['Total_Sales'] / total['Total_Spend'] if total['Total_Spend'] > 0 else 0
-    total['ACOS'] = total['Total_Spend'] / total['Total_Sales'] if total['Total_Sales'] > 0 else 0
-    total['CPC'] = total['Total_Spend'] / total['Total_Clicks'] if total['Total_Clicks'] > 0 else 0
-    total['CTR'] = total['Total_Clicks'] / total['Total_Impressions'] if total['Total_Impressions'] > 0 else 0
-    total['CVR'] = total['Total_Orders'] / total['Total_Clicks'] if total['Total_Clicks'] > 0 else 0
-    total['CPA'] = total['Total_Spend'] / total['Total_Orders'] if total['Total_Orders'] > 0 else 0
-    total['CPM'] = (total['Total_Spend'] / total['Total_Impressions']) * 1000 if total['Total_Impressions'] > 0 else 0
-    total['AOV'] = total['Total_Sales'] / total['Total_Orders'] if total['Total_Orders'] > 0 else 0
-
-    # Loss analysis
-    if 'Campaign Name' in campaign_df:
-        campaign_df['ROAS_calc'] = campaign_df['7 Day Total Sales '] / campaign_df['Spend'].replace(0, np.nan)
-        losing = campaign_df[campaign_df['ROAS_calc'] < 1.0]
-        total['Losing_Campaigns'] = len(losing)
-        total['Losing_Spend'] = losing['Spend'].sum()
-        total['Losing_Sales'] = losing['7 Day Total Sales '].sum()
-        total['Net_Loss'] = total['Losing_Spend'] - total['Losing_Sales']
-        total['Pct_Losing_Spend'] = (total['Losing_Spend'] / total['Total_Spend']) if total['Total_Spend'] > 0 else 0
-
-    # Productivity
-    total['Spend_Per_ASIN'] = total['Total_Spend'] / total['ASINs'] if total['ASINs'] > 0 else 0
-    total['Sales_Per_ASIN'] = total['Total_Sales'] / total['ASINs'] if total['ASINs'] > 0 else 0
-
-    return total
-
-perpetua_campaigns = campaigns[campaigns['Is_Perpetua'] == True]
-non_perpetua_campaigns = campaigns[campaigns['Is_Perpetua'] == False]
-
-perpetua = calc_comprehensive_metrics(perpetua_campaigns, 'Perpetua')
-non_perpetua = calc_comprehensive_metrics(non_perpetua_campaigns, 'Non-Perpetua')
-
-print(f"\nPERPETUA:")
-print(f"  ROAS: {perpetua['ROAS']:.2f}x")
-print(f"  Losing spend: ${perpetua.get('Losing_Spend', 0):,.0f} ({perpetua.get('Pct_Losing_Spend', 0)*100:.1f}%)")
-print(f"  Net loss: ${perpetua.get('Net_Loss', 0):,.0f}")
-
-print(f"\nNON-PERPETUA:")
-print(f"  ROAS: {non_perpetua['ROAS']:.2f}x")
-print(f"  Losing spend: ${non_perpetua.get('Losing_Spend', 0):,.0f} ({non_perpetua.get('Pct_Losing_Spend', 0)*100:.1f}%)")
-print(f"  Net loss: ${non_perpetua.get('Net_Loss', 0):,.0f}")
-
-# ============================================================================
-# CREATE DASHBOARD WITH FULL CONTEXT
-# ============================================================================
-
-print("[3/5] Creating dashboard with strategic context...")
-
-wb = Workbook()
-wb.remove(wb.active)
-
-COLORS = {'perpetua': '4472C4', 'non_perpetua': 'ED7D31', 'header': '2F5496',
-          'good': '70AD47', 'bad': 'C5504B', 'warning': 'FFC000',
-          'input': 'FFF2CC', 'light_blue': 'D9E1F2', 'light_orange': 'FCE4D6'}
-
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=11)
-title_font = Font(bold=True, size=18)
-warning_font = Font(bold=True, size=12, color=COLORS['bad'])
-center = Alignment(horizontal='center', vertical='center')
-
-ws1 = wb.create_sheet("📊 Executive Summary")
-
-# Title
-ws1['C2'] = 'PERPETUA (SaaS) vs MANUAL ADVERTISING'
-ws1['C2'].font = title_font
-ws1['C2'].alignment = center
-ws1.merge_cells('C2:K2')
-
-ws1['C3'] = 'Strategic Performance Analysis with Full Context'
-ws1['C3'].font = Font(size=12, italic=True)
-ws1['C3'].alignment = center
-ws1.merge_cells('C3:K3')
-
-# CRITICAL CONTEXT BOX
-row = 5
-ws1[f'C{row}'] = '⚠️ CRITICAL CONTEXT'
-ws1[f'C{row}'].font = warning_font
-ws1[f'C{row}'].fill = PatternFill(start_color='FFF2CC', end_color='FFF2CC', fill_type='solid')
-ws1.merge_cells(f'C{row}:K{row}')
-ws1[f'C{row}'].alignment = center
-
-context_items = [
-    'Raw ROAS comparison can be misleading - read carefully:',
-    f'1. Perpetua spends ${perpetua["Spend_Per_ASIN"]:.0f} per ASIN vs ${non_perpetua["Spend_Per_ASIN"]:.0f} (54x more)',
-    '2. Lower ROAS at higher spend is EXPECTED (diminishing returns law)',
-    '3. Perpetua avoids money-losing campaigns far better (3% vs 44% wasted spend)',
-    f'4. Perpetua generates ${perpetua["Total_Sales"]:,.0f} sales vs ${non_perpetua["Total_Sales"]:,.0f} (more total profit)',
-]
-
-for item in context_items:
-    row += 1
-    ws1[f'C{row}'] = item
-    ws1[f'C{row}'].font = Font(size=9, italic=True if item.startswith('Raw') else False)
-    ws1[f'C{row}'].alignment = Alignment(horizontal='left')
-    ws1.merge_cells(f'C{row}:K{row}')
-
-# DATE SELECTORS
-row += 2
-ws1[f'C{row}'] = f'📅 Analysis Period: {min_date.strftime("%b %d, %Y")} - {max_date.strftime("%b %d, %Y")}'
-ws1[f'C{row}'].font = Font(bold=True, size=11)
-ws1.merge_cells(f'C{row}:K{row}')
-
-# PERFORMANCE TABLE
-row += 2
-ws1[f'C{row}'] = 'COMPREHENSIVE PERFORMANCE METRICS'
-ws1[f'C{row}'].font = Font(bold=True, size=13)
-ws1.merge_cells(f'C{row}:K{row}')
-ws1[f'C{row}'].alignment = center
-
-row += 2
-headers = ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', '% Diff', 'Winner']
-for col, header in enumerate(headers, start=3):
-    cell = ws1.cell(row=row, column=col, value=header)
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = center
-
-row += 1
-
-metrics = [
-    ('Campaigns', 'Campaigns', '#', None),
-    ('ASINs/Products', 'ASINs', '#', None),
-    ('', '', '', None),
-    ('Total Spend', 'Total_Spend', '$', None),
-    ('Total Sales', 'Total_Sales', '$', False),
-    ('Total Orders', 'Total_Orders', '#', False),
-    ('', '', '', None),
-    ('ROAS', 'ROAS', 'x', False),
-    ('ACOS', 'ACOS', '%', True),
-    ('CPC', 'CPC', '$', True),
-    ('CTR', 'CTR', '%', False),
-    ('CVR', 'CVR', '%', False),
-    ('CPA', 'CPA', '$', True),
-    ('CPM', 'CPM', '$', True),
-    ('AOV', 'AOV', '$', False),
-    ('', '', '', None),
-    ('💸 LOSS ANALYSIS', '', '', None),
-    ('Losing Campaigns', 'Losing_Campaigns', '#', True),
-    ('Spend on Losers', 'Losing_Spend', '$', True),
-    ('% Wasted Spend', 'Pct_Losing_Spend', '%', True),
-    ('Net Loss', 'Net_Loss', '$', True),
-]
-
-for metric_name, key, unit, lower_better in metrics:
-    if not metric_name or metric_name.startswith('💸'):
-        if metric_name:
-            ws1.cell(row=row, column=3, value=metric_name).font = Font(bold=True, size=11, color=COLORS['bad'])
-            ws1.merge_cells(f'C{row}:K{row}')
-        row += 1
-        continue
-
-    ws1.cell(row=row, column=3, value=metric_name)
-
-    if key in perpetua:
-        p_val = perpetua[key]
-        np_val = non_perpetua[key]
-
-        cell = ws1.cell(row=row, column=4, value=p_val)
-        if unit == '$':
-            cell.number_format = '$#,##0.00'
-        elif unit == '%':
-            cell.number_format = '0.0%'
-        elif unit == 'x':
-            cell.number_format = '0.00"x"'
-        else:
-            cell.number_format = '#,##0'
-
-        cell = ws1.cell(row=row, column=5, value=np_val)
-        if unit == '$':
-            cell.number_format = '$#,##0.00'
-        elif unit == '%':
-            cell.number_format = '0.0%'
-        elif unit == 'x':
-            cell.number_format = '0.00"x"'
-        else:
-            cell.number_format = '#,##0'
-
-        diff = p_val - np_val
-        cell = ws1.cell(row=row, column=6, value=diff)
-        if unit == '$':
-            cell.number_format = '$#,##0;-$#,##0'
-        elif unit == '%':
-            cell.number_format = '0.0%;-0.0%'
-        else:
-            cell.number_format = '0.00;-0.00'
-
-        if lower_better is not None and np_val != 0:
-            pct = (p_val - np_val) / np_val
-            ws1.cell(row=row, column=7, value=pct).number_format = '+0%;-0%'
-
-            if lower_better:
-                winner = 'Perpetua ✓' if p_val < np_val else 'Non-Perpetua ✓'
-                is_better = p_val < np_val
-            else:
-                winner = 'Perpetua ✓' if p_val > np_val else 'Non-Perpetua ✓'
-                is_better = p_val > np_val
-
-            cell = ws1.cell(row=row, column=8, value=winner)
-            cell.fill = PatternFill(start_color=COLORS['perpetua'] if is_better else COLORS['non_perpetua'],
-                                   end_color=COLORS['perpetua'] if is_better else COLORS['non_perpetua'],
-                                   fill_type='solid')
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.alignment = center
-
-    row += 1
-
-# KEY INSIGHTS
-row += 2
-ws1[f'C{row}'] = '💡 STRATEGIC INSIGHTS'
-ws1[f'C{row}'].font = Font(bold=True, size=13, color=COLORS['good'])
-ws1.merge_cells(f'C{row}:K{row}')
-
-insights = [
-    '',
-    f'✓ Perpetua generates ${perpetua["Total_Sales"]:,.0f} in sales vs ${non_perpetua["Total_Sales"]:,.0f} (MORE total revenue)',
-    f'✓ Perpetua has only {perpetua.get("Pct_Losing_Spend", 0)*100:.0f}% wasted spend vs {non_perpetua.get("Pct_Losing_Spend", 0)*100:.0f}% (BETTER loss avoidance)',
-    f'⚠ Perpetua operates at 54x higher spend per ASIN (${perpetua["Spend_Per_ASIN"]:.0f} vs ${non_perpetua["Spend_Per_ASIN"]:.0f})',
-    f'⚠ Lower ROAS at scale is NORMAL - Perpetua captures incremental demand',
-    '',
-    f'💰 OPPORTUNITY: ${non_perpetua.get("Net_Loss", 0):,.0f} wasted on Non-Perpetua losers vs ${perpetua.get("Net_Loss", 0):,.0f} on Perpetua',
-    f'💰 ACTION: Pause {non_perpetua.get("Losing_Campaigns", 0)} Non-Perpetua losing campaigns = ${non_perpetua.get("Net_Loss", 0):,.0f} savings',
-]
-
-for insight in insights:
-    row += 1
-    ws1[f'C{row}'] = insight
-    font_size = 11 if insight.startswith('✓') or insight.startswith('⚠') or insight.startswith('💰') else 10
-    ws1[f'C{row}'].font = Font(size=font_size, bold=insight.startswith('💰'))
-    ws1.merge_cells(f'C{row}:K{row}')
-
-# RECOMMENDATIONS
-row += 2
-ws1[f'C{row}'] = '🎯 RECOMMENDED ACTIONS'
-ws1[f'C{row}'].font = Font(bold=True, size=13, color=COLORS['header'])
-ws1.merge_cells(f'C{row}:K{row}')
-
-recommendations = [
-    '',
-    (f'1. HIGH: Pause {non_perpetua.get("Losing_Campaigns", 0)} Non-Perpetua losing campaigns', f'Save ${non_perpetua.get("Net_Loss", 0):,.0f}/period'),
-    (f'2. HIGH: Investigate why Non-Perpetua has {non_perpetua.get("Pct_Losing_Spend", 0)*100:.0f}% wasted spend', 'Risk management'),
-    ('3. MEDIUM: Scale Perpetua high-ROAS campaigns 20-30%', 'Estimated +$50K revenue'),
-    ('4. STRATEGIC: Perpetua is working - focus on optimization not replacement', 'Continue automation'),
-]
-
-for rec in recommendations:
-    row += 1
-    if isinstance(rec, tuple):
-        ws1[f'C{row}'] = rec[0]
-        ws1[f'C{row}'].font = Font(size=10, bold=True)
-        ws1[f'G{row}'] = rec[1]
-        ws1[f'G{row}'].font = Font(size=9, italic=True)
-        ws1.merge_cells(f'C{row}:F{row}')
-        ws1.merge_cells(f'G{row}:K{row}')
-    else:
-        ws1[f'C{row}'] = rec
-        ws1.merge_cells(f'C{row}:K{row}')
-
-# Sheet 2: Daily Data
-ws2 = wb.create_sheet("📅 Daily Data")
-# (Add daily data table with filters - simplified for space)
-
-# Set widths
-ws1.column_dimensions['C'].width = 35
-for col in 'DEFGHIJK':
-    ws1.column_dimensions[col].width = 16
-
-# Save
-print("[4/5] Saving dashboard...")
-output_file = OUTPUT_DIR / f'Perpetua_FINAL_with_Context_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
-wb.save(output_file)
-
-print("[5/5] Creating context document...")
-context_doc = f"""
-# STRATEGIC CONTEXT FOR PERPETUA vs NON-PERPETUA COMPARISON
-
-## The Story to Tell Executives
-
-### DON'T Say:
-"Non-Perpetua has better ROAS (2.61 vs 2.09), so Perpetua is underperforming"
-
-### DO Say:
-"Perpetua drives 3x more revenue and wastes 93% less spend than Non-Perpetua,
-while operating at 54x higher scale per product. The ROAS difference reflects
-expected diminishing returns at scale, not platform underperformance."
-
-## Key Context Points
-
-1. **Scale Context**
-   - Perpetua: ${perpetua['Spend_Per_ASIN']:.0f} spend/ASIN (aggressive scaling)
-   - Non-Perpetua: ${non_perpetua['Spend_Per_ASIN']:.0f} spend/ASIN (conservative spend)
-   - 54x difference in investment intensity
-
-2. **Loss Avoidance Context**
-   - Perpetua: {perpetua.get('Pct_Losing_Spend', 0)*100:.0f}% of spend losing money
-   - Non-Perpetua: {non_perpetua.get('Pct_Losing_Spend', 0)*100:.0f}% of spend losing money
-   - Perpetua is 14x better at avoiding wasted spend
-
-3. **Total Value Context**
-   - Perpetua sales: ${perpetua['Total_Sales']:,.0f}
-   - Non-Perpetua sales: ${non_perpetua['Total_Sales']:,.0f}
-   - Perpetua drives ${perpetua['Total_Sales'] - non_perpetua['Total_Sales']:,.0f} more revenue
-
-4. **Diminishing Returns Context**
-   - First $100 in ad spend: ROAS might be 5.0x
-   - Next $1,000 in ad spend: ROAS might be 2.5x
-   - Next $10,000 in ad spend: ROAS might be 1.8x
-   - This is NORMAL and EXPECTED at scale
-
-## The Real Opportunity
-
-The issue isn't "Perpetua vs Non-Perpetua" - it's:
-${non_perpetua.get('Net_Loss', 0):,.0f} wasted on losing Non-Perpetua campaigns
-
-**Recommendation:** Pause the losers, not the platform.
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-
-with open(OUTPUT_DIR / 'STRATEGIC_CONTEXT.md', 'w') as f:
-    f.write(context_doc)
-
-print()
-print("=" * 100)
-print("✓ FINAL DASHBOARD WITH FULL CONTEXT COMPLETE")
-print("=" * 100)
-print(f"\nDashboard: {output_file.name}")
-print(f"Context Doc: STRATEGIC_CONTEXT.md")
-print()
-print("🎯 THE REAL STORY:")
-print(f"  ✓ Perpetua generates MORE total sales (${perpetua['Total_Sales']:,.0f} vs ${non_perpetua['Total_Sales']:,.0f})")
-print(f"  ✓ Perpetua wastes LESS money ({perpetua.get('Pct_Losing_Spend', 0)*100:.0f}% vs {non_perpetua.get('Pct_Losing_Spend', 0)*100:.0f}% wasted)")
-print(f"  ✓ Perpetua operates at SCALE (54x more spend per ASIN)")
-print(f"  ⚠ Lower ROAS is EXPECTED at scale (diminishing returns)")
-print()
-print(f"💰 Real Opportunity: ${non_perpetua.get('Net_Loss', 0):,.0f} in Non-Perpetua losses to eliminate")
+if __name__ == '__main__':
+    main(['context'])
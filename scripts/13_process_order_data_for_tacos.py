@@ -9,6 +9,11 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from attribution import ATTRIBUTION_DAYS, align_attributed_sales, attribution_gap
+from keyed_join import DateSkuKey, sku_index, sort_merge_outer
+from order_lines import ingest_orders, priced_lines
+from processed_store import AD_PRODUCTS_NAME, MERGED_NAME, load_dataset, save_dataset
+
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
 PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
@@ -24,33 +29,15 @@ print()
 # ============================================================================
 
 print("[1/8] Loading order data files...")
-print("  (This may take a moment - 146 MB of data)")
-
-# Column names from Amazon Order Report structure
-order_columns = [
-    'amazon-order-id', 'merchant-order-id', 'purchase-date', 'last-updated-date',
-    'order-status', 'fulfillment-channel', 'sales-channel', 'order-channel',
-    'url', 'ship-service-level', 'product-name', 'sku', 'asin', 'item-status',
-    'quantity', 'currency', 'item-price', 'item-tax', 'shipping-price',
-    'shipping-tax', 'gift-wrap-price', 'gift-wrap-tax', 'item-promotion-discount',
-    'ship-promotion-discount', 'ship-city', 'ship-state', 'ship-postal-code',
-    'ship-country', 'promotion-ids', 'is-business-order', 'purchase-order-number',
-    'price-designation', 'fulfilled-by', 'is-iba', 'signature-confirmation-recommended',
-    'buyer-name'
-]
-
-# Load both order files
-orders1 = pd.read_csv(DATA_DIR / '212008020460 (1).txt', sep='\t',
-                      names=order_columns, header=0, low_memory=False)
-print(f"  ✓ File 1: {len(orders1):,} order lines (Dec 1 - Jan 1)")
-
-orders2 = pd.read_csv(DATA_DIR / '215564020486.txt', sep='\t',
-                      names=order_columns, header=0, low_memory=False)
-print(f"  ✓ File 2: {len(orders2):,} order lines (Jan 1 - Feb 1)")
-
-# Combine
-orders = pd.concat([orders1, orders2], ignore_index=True)
-print(f"  ✓ Combined: {len(orders):,} total order lines")
+
+# Only new or changed exports are parsed; shipped lines are fingerprinted and
+# checked against every line already in the order-line store
+orders_clean, ingest = ingest_orders()
+for name in ingest['files_read']:
+    print(f"  ✓ Read: {name}")
+for name in ingest['files_skipped']:
+    print(f"  ✓ Unchanged, skipped: {name}")
+print(f"  ✓ New order lines read: {ingest['lines_read']:,}")
 
 # ============================================================================
 # STEP 2: CLEAN AND DE-DUPLICATE
@@ -58,30 +45,15 @@ print(f"  ✓ Combined: {len(orders):,} total order lines")
 
 print("[2/8] Cleaning and de-duplicating order data...")
 
-# Filter to Shipped orders only
-orders_clean = orders[orders['order-status'] == 'Shipped'].copy()
-print(f"  ✓ Shipped orders: {len(orders_clean):,} ({len(orders_clean)/len(orders)*100:.1f}%)")
-
-# Remove duplicates
-before_dedup = len(orders_clean)
-orders_clean = orders_clean.drop_duplicates(subset=['amazon-order-id', 'sku', 'quantity'])
-print(f"  ✓ De-duplicated: {before_dedup:,} → {len(orders_clean):,} ({before_dedup - len(orders_clean):,} duplicates removed)")
-
-# Convert dates
-orders_clean['purchase-date'] = pd.to_datetime(orders_clean['purchase-date'], errors='coerce')
-orders_clean = orders_clean[orders_clean['purchase-date'].notna()]
+print(f"  ✓ Shipped lines in new files: {ingest['shipped']:,}")
+print(f"  ✓ Duplicates within new files: {ingest['duplicates_in_batch']:,}")
+print(f"  ✓ Already in store (overlapping exports): {ingest['duplicates_seen']:,}")
+print(f"  ✓ Added {ingest['new_lines']:,} lines → {len(orders_clean):,} unique shipped order lines")
 
-# Convert item-price to numeric
-orders_clean['item-price'] = pd.to_numeric(orders_clean['item-price'], errors='coerce').fillna(0)
-orders_clean['quantity'] = pd.to_numeric(orders_clean['quantity'], errors='coerce').fillna(0)
-
-# Filter to valid prices
-orders_clean = orders_clean[orders_clean['item-price'] > 0]
+# Parse dates and prices, keep lines with a positive price
+orders_clean = priced_lines(orders_clean)
 print(f"  ✓ Valid prices: {len(orders_clean):,} order lines")
 
-# Calculate total revenue per line
-orders_clean['revenue'] = orders_clean['item-price'] * orders_clean['quantity']
-
 # Date range
 min_order_date = orders_clean['purchase-date'].min()
 max_order_date = orders_clean['purchase-date'].max()
@@ -93,10 +65,6 @@ print(f"  ✓ Order date range: {min_order_date.date()} to {max_order_date.date(
 
 print("[3/8] Aggregating orders by Date and SKU...")
 
-# Extract just the date (no time)
-orders_clean['Date'] = orders_clean['purchase-date'].dt.date
-orders_clean['Date'] = pd.to_datetime(orders_clean['Date'])
-
 # Aggregate
 order_summary = orders_clean.groupby(['Date', 'sku']).agg({
     'revenue': 'sum',
@@ -145,8 +113,8 @@ for ad_type, count in type_counts.items():
 print("\n[5/8] Loading advertising data for TACoS calculation...")
 
 # Load processed advertising data
-ad_data = pd.read_csv(PROCESSED_DIR / 'advertised_products_processed.csv', low_memory=False)
-ad_data['Date'] = pd.to_datetime(ad_data['Date'], errors='coerce')
+ad_data = load_dataset(AD_PRODUCTS_NAME, columns=['Date', 'Advertised SKU', 'Advertising_Type',
+                                                 'Spend', '7 Day Total Sales '])
 ad_data = ad_data[ad_data['Date'].notna()]
 
 # Clean numerics
@@ -169,14 +137,18 @@ print(f"  ✓ Ad data: {len(ad_summary):,} Date+SKU combinations")
 
 print("[6/8] Merging order data with advertising data...")
 
-# Merge on Date + SKU
-merged = pd.merge(
-    order_summary[order_summary['Advertising_Type'].isin(['Perpetua', 'Non-Perpetua'])],
-    ad_summary,
-    on=['Date', 'SKU'],
-    how='outer',
-    indicator=True
+# Outer join on integer Date + SKU keys (SKU codes from the master ASIN list)
+orders_side = order_summary[order_summary['Advertising_Type'].isin(['Perpetua', 'Non-Perpetua'])]
+date_sku = DateSkuKey(sku_index(all_skus, orders_side['SKU'], ad_summary['SKU']))
+merged, merged_keys = sort_merge_outer(
+    orders_side.drop(columns=['Date', 'SKU']),
+    ad_summary.drop(columns=['Date', 'SKU']),
+    date_sku.encode(orders_side['SKU'], orders_side['Date']),
+    date_sku.encode(ad_summary['SKU'], ad_summary['Date'])
 )
+merged_skus, merged_dates = date_sku.decode(merged_keys)
+merged.insert(0, 'Date', merged_dates)
+merged.insert(1, 'SKU', merged_skus)
 
 print(f"  ✓ Merged dataset: {len(merged):,} records")
 print(f"  Merge breakdown:")
@@ -190,8 +162,20 @@ merged['Ad_Spend'] = merged['Ad_Spend'].fillna(0)
 merged['Ad_Sales'] = merged['Ad_Sales'].fillna(0)
 merged['Advertising_Type'] = merged['Advertising_Type'].fillna(merged['Advertising_Type_Ad'])
 
+# Ad sales are booked on the click date but land on orders up to 7 days later,
+# so organic = revenue minus the attributed sales that actually land on that day
+same_day_negative = (merged['Total_Revenue'] - merged['Ad_Sales'] < 0).sum()
+merged = align_attributed_sales(merged, window=ATTRIBUTION_DAYS)
+print(f"  ✓ Aligned ad sales to a {ATTRIBUTION_DAYS}-day attribution window")
+print(f"    Negative organic days: {same_day_negative:,} (same-day join) → {(merged['Organic_Sales'] < 0).sum():,}")
+print(f"    Ad sales with no order revenue in window: ${merged['Unmatched_Ad_Sales'].sum():,.0f}")
+# Every ad-sales dollar must end up attributed or unmatched, per SKU
+gap = attribution_gap(merged)
+if gap > 0.01:
+    raise ValueError(f"Attribution lost ${gap:,.2f} of ad sales for a SKU (Attributed + Unmatched != Ad_Sales)")
+print(f"    ✓ Attributed + unmatched = ad sales for every SKU")
+
 # Calculate TACoS and T-ROAS
-merged['Organic_Sales'] = merged['Total_Revenue'] - merged['Ad_Sales']
 merged['TACoS'] = np.where(merged['Total_Revenue'] > 0,
                            merged['Ad_Spend'] / merged['Total_Revenue'], 0)
 merged['T_ROAS'] = np.where(merged['Ad_Spend'] > 0,
@@ -209,7 +193,7 @@ def calc_tacos_metrics(subset):
     total_revenue = subset['Total_Revenue'].sum()
     ad_spend = subset['Ad_Spend'].sum()
     ad_sales = subset['Ad_Sales'].sum()
-    organic_sales = total_revenue - ad_sales
+    organic_sales = subset['Organic_Sales'].sum()
 
     return {
         'Total_Revenue': total_revenue,
@@ -262,17 +246,16 @@ print(f"  Organic Lift:               {non_perpetua_tacos['Organic_Lift']:.0f}%"
 
 print(f"\n[8/8] Saving processed data...")
 
-# Save merged data
-merged_file = PROCESSED_DIR / 'orders_advertising_merged.csv'
-merged.to_csv(merged_file, index=False)
-print(f"  ✓ Saved merged data: {merged_file}")
+# Save merged data (CSV plus a month/platform-partitioned copy for downstream scripts)
+merged_file = save_dataset(merged, MERGED_NAME)
+print(f"  ✓ Saved merged data: {merged_file} (+ CSV)")
 
 # Save TACoS summary
 import json
 tacos_summary = {
     'generated_at': datetime.now().isoformat(),
-    'order_files_processed': 2,
-    'total_order_lines': len(orders),
+    'order_files_processed': len(ingest['files_read']) + len(ingest['files_skipped']),
+    'new_order_lines': ingest['lines_read'],
     'shipped_orders': len(orders_clean),
     'date_range': f"{min_order_date.date()} to {max_order_date.date()}",
     'perpetua': perpetua_tacos,
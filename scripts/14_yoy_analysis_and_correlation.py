@@ -8,6 +8,8 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+from processed_store import load_merged
+
 BASE_DIR = Path(__file__).parent.parent
 PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
 OUTPUT_DIR = BASE_DIR / 'outputs'
@@ -22,9 +24,7 @@ print()
 # ============================================================================
 
 print("[1/4] Loading current year data (2025-2026)...")
-merged = pd.read_csv(PROCESSED_DIR / 'orders_advertising_merged.csv', low_memory=False)
-merged['Date'] = pd.to_datetime(merged['Date'], errors='coerce')
-merged = merged[merged['Date'].notna()]
+merged = load_merged(columns=['Advertising_Type', 'Ad_Spend', 'Ad_Sales', 'Total_Revenue', 'Organic_Sales'])
 
 # Extract December 2025 and January 2026
 merged['Month'] = merged['Date'].dt.to_period('M')
@@ -147,6 +147,7 @@ print()
 
 # Test correlation with lags (0, 7, 14, 30 days)
 lags = [0, 7, 14, 30]
+correlation = {name: {'lags': {}, 'elasticity': None} for name in ('Perpetua', 'Non-Perpetua')}
 
 print(f"{'Platform':<15} {'Lag (days)':<12} {'Correlation':<15} {'P-Value':<12} {'Significant?'}")
 print("-" * 70)
@@ -170,6 +171,8 @@ for platform_name, daily_df in [('Perpetua', perpetua_daily), ('Non-Perpetua', n
                     p_value = 0.01 if abs(t_stat) > 2.5 else 0.05 if abs(t_stat) > 2 else 0.5
                     sig = "YES" if p_value < 0.05 else "NO"
                     print(f"{platform_name:<15} {lag:<12} {corr:>14.3f} {p_value:>11.4f}  {sig}")
+                    correlation[platform_name]['lags'][lag] = {
+                        'correlation': float(corr), 'p_value': p_value, 'significant': p_value < 0.05, 'days': n}
                 except:
                     print(f"{platform_name:<15} {lag:<12} {'N/A':<15} {'N/A':<12} N/A")
 
@@ -199,6 +202,7 @@ for platform_name, daily_df in [('Perpetua', perpetua_daily), ('Non-Perpetua', n
             from numpy.polynomial import polynomial as P
             coeffs = np.polyfit(valid['Ad_Spend_Pct_Change'], valid['Organic_Pct_Change'], 1)
             slope = coeffs[0]
+            correlation[platform_name]['elasticity'] = float(slope)
 
             print(f"{platform_name}:")
             print(f"  Elasticity: {slope:.2f}")
@@ -243,10 +247,20 @@ import json
 with open(OUTPUT_DIR / 'yoy_analysis.json', 'w') as f:
     json.dump(yoy_data, f, indent=2, default=str)
 
+# Save correlation + elasticity for the dashboards' Ad→Organic sections
+with open(OUTPUT_DIR / 'ad_organic_correlation.json', 'w') as f:
+    json.dump({
+        'generated_at': datetime.now().isoformat(),
+        'analysis_type': 'Daily ad spend vs organic sales correlation and elasticity',
+        'lags': lags,
+        'platforms': correlation,
+    }, f, indent=2, default=str)
+
 print("\n" + "="*100)
 print("✓ ANALYSIS COMPLETE")
 print("="*100)
 print(f"\nYoY comparison saved to: {OUTPUT_DIR / 'yoy_analysis.json'}")
+print(f"Correlation results saved to: {OUTPUT_DIR / 'ad_organic_correlation.json'}")
 print("\nKey Findings:")
 print(f"  Dec: {dec_roas_improvement:+.0f}% ROAS change YoY")
 print(f"  Jan: {jan_roas_improvement:+.0f}% ROAS change YoY")
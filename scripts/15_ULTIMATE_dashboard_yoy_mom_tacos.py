@@ -2,290 +2,10 @@
 """
 ULTIMATE DASHBOARD - YoY + MoM + TACoS + Correlation + All Context
 The complete story in one Excel file
+Rendered by dashboard_engine.py from the 'ultimate' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import numpy as np
-import json
-from pathlib import Path
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.chart import BarChart, LineChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
+from dashboard_engine import main
 
-BASE_DIR = Path(__file__).parent.parent
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 100)
-print("ULTIMATE DASHBOARD - COMPLETE ANALYSIS")
-print("YoY + MoM + TACoS + Correlation + Context + All Metrics")
-print("=" * 100)
-print()
-
-# Load data
-print("[1/5] Loading all data...")
-with open(OUTPUT_DIR / 'tacos_analysis_summary.json') as f:
-    tacos = json.load(f)
-with open(OUTPUT_DIR / 'yoy_analysis.json') as f:
-    yoy = json.load(f)
-
-merged = pd.read_csv(PROCESSED_DIR / 'orders_advertising_merged.csv', low_memory=False)
-merged['Date'] = pd.to_datetime(merged['Date'], errors='coerce')
-merged = merged[merged['Date'].notna()]
-merged['Month'] = merged['Date'].dt.to_period('M')
-
-# Monthly aggregation
-monthly = merged.groupby(['Month', 'Advertising_Type']).agg({
-    'Ad_Spend': 'sum',
-    'Ad_Sales': 'sum',
-    'Total_Revenue': 'sum',
-    'Organic_Sales': 'sum'
-}).reset_index()
-
-monthly['ROAS'] = monthly['Ad_Sales'] / monthly['Ad_Spend'].replace(0, np.nan)
-monthly['TACoS'] = (monthly['Ad_Spend'] / monthly['Total_Revenue'].replace(0, np.nan)) * 100
-monthly['T_ROAS'] = monthly['Total_Revenue'] / monthly['Ad_Spend'].replace(0, np.nan)
-monthly = monthly.replace([np.inf, -np.inf], np.nan).fillna(0)
-
-# Convert Period to string for Excel compatibility
-monthly['Month'] = monthly['Month'].astype(str)
-
-print(f"  ✓ Monthly data: {len(monthly)} records")
-
-# Create workbook
-print("[2/5] Creating ultimate dashboard...")
-wb = Workbook()
-wb.remove(wb.active)
-
-COLORS = {'perpetua': '4472C4', 'non_perpetua': 'ED7D31', 'header': '2F5496',
-          'excellent': '70AD47', 'good': '92D050', 'warning': 'FFC000', 'poor': 'C5504B'}
-
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=11)
-title_font = Font(bold=True, size=18)
-center = Alignment(horizontal='center', vertical='center')
-
-# ============================================================================
-# SHEET 1: YoY + MoM SUMMARY
-# ============================================================================
-
-print("[3/5] Creating YoY + MoM Summary...")
-ws1 = wb.create_sheet("📊 YoY + MoM Summary")
-
-ws1['C2'] = 'YEAR-OVER-YEAR & MONTH-OVER-MONTH ANALYSIS'
-ws1['C2'].font = title_font
-ws1['C2'].alignment = center
-ws1.merge_cells('C2:L2')
-
-# YoY Table
-row = 5
-ws1[f'C{row}'] = 'YEAR-OVER-YEAR COMPARISON'
-ws1[f'C{row}'].font = Font(bold=True, size=14)
-ws1.merge_cells(f'C{row}:L{row}')
-
-row += 2
-ws1[f'C{row}'] = 'DECEMBER: 2024 vs 2025'
-ws1[f'C{row}'].font = Font(bold=True, size=12)
-ws1.merge_cells(f'C{row}:L{row}')
-
-row += 1
-headers = ['Metric', '2024', '2025', 'Change $', 'Change %', 'Status']
-for col, h in enumerate(headers, start=3):
-    ws1.cell(row=row, column=col, value=h).fill = header_fill
-    ws1.cell(row=row, column=col).font = header_font
-    ws1.cell(row=row, column=col).alignment = center
-
-row += 1
-dec_metrics = [
-    ('Ad Spend', yoy['december']['2024']['Ad_Spend'], yoy['december']['2025']['Ad_Spend']),
-    ('Ad Sales', yoy['december']['2024']['Ad_Sales'], yoy['december']['2025']['Ad_Sales']),
-    ('ROAS', yoy['december']['2024']['ROAS'], yoy['december']['2025']['ROAS']),
-]
-
-for name, val_2024, val_2025 in dec_metrics:
-    ws1.cell(row=row, column=3, value=name)
-
-    if name == 'ROAS':
-        ws1.cell(row=row, column=4, value=val_2024).number_format = '0.00"x"'
-        ws1.cell(row=row, column=5, value=val_2025).number_format = '0.00"x"'
-        ws1.cell(row=row, column=6, value=val_2025 - val_2024).number_format = '+0.00"x";-0.00"x"'
-    else:
-        ws1.cell(row=row, column=4, value=val_2024).number_format = '$#,##0'
-        ws1.cell(row=row, column=5, value=val_2025).number_format = '$#,##0'
-        ws1.cell(row=row, column=6, value=val_2025 - val_2024).number_format = '$#,##0;-$#,##0'
-
-    pct = ((val_2025 - val_2024) / val_2024 * 100) if val_2024 != 0 else 0
-    ws1.cell(row=row, column=7, value=pct / 100).number_format = '+0%;-0%'
-
-    status = '✓ Improved' if pct > 0 else '✗ Declined'
-    cell = ws1.cell(row=row, column=8, value=status)
-    cell.fill = PatternFill(start_color=COLORS['excellent'] if pct > 0 else COLORS['poor'],
-                           end_color=COLORS['excellent'] if pct > 0 else COLORS['poor'],
-                           fill_type='solid')
-    cell.font = Font(bold=True, color='FFFFFF')
-    cell.alignment = center
-
-    row += 1
-
-# January YoY
-row += 2
-ws1[f'C{row}'] = 'JANUARY: 2024 vs 2026'
-ws1[f'C{row}'].font = Font(bold=True, size=12)
-ws1.merge_cells(f'C{row}:L{row}')
-
-row += 1
-for col, h in enumerate(headers, start=3):
-    ws1.cell(row=row, column=col, value=h).fill = header_fill
-    ws1.cell(row=row, column=col).font = header_font
-    ws1.cell(row=row, column=col).alignment = center
-
-row += 1
-jan_metrics = [
-    ('Ad Spend', yoy['january']['2024']['Ad_Spend'], yoy['january']['2026']['Ad_Spend']),
-    ('Ad Sales', yoy['january']['2024']['Ad_Sales'], yoy['january']['2026']['Ad_Sales']),
-    ('ROAS', yoy['january']['2024']['ROAS'], yoy['january']['2026']['ROAS']),
-]
-
-for name, val_2024, val_2026 in jan_metrics:
-    ws1.cell(row=row, column=3, value=name)
-
-    if name == 'ROAS':
-        ws1.cell(row=row, column=4, value=val_2024).number_format = '0.00"x"'
-        ws1.cell(row=row, column=5, value=val_2026).number_format = '0.00"x"'
-        ws1.cell(row=row, column=6, value=val_2026 - val_2024).number_format = '+0.00"x";-0.00"x"'
-    else:
-        ws1.cell(row=row, column=4, value=val_2024).number_format = '$#,##0'
-        ws1.cell(row=row, column=5, value=val_2026).number_format = '$#,##0'
-        ws1.cell(row=row, column=6, value=val_2026 - val_2024).number_format = '$#,##0;-$#,##0'
-
-    pct = ((val_2026 - val_2024) / val_2024 * 100) if val_2024 != 0 else 0
-    ws1.cell(row=row, column=7, value=pct / 100).number_format = '+0%;-0%'
-
-    status = '✓ Improved' if pct > 0 else '✗ Declined'
-    cell = ws1.cell(row=row, column=8, value=status)
-    cell.fill = PatternFill(start_color=COLORS['excellent'] if pct > 0 else COLORS['poor'],
-                           end_color=COLORS['excellent'] if pct > 0 else COLORS['poor'],
-                           fill_type='solid')
-    cell.font = Font(bold=True, color='FFFFFF')
-    cell.alignment = center
-
-    row += 1
-
-# MoM Table
-row += 3
-ws1[f'C{row}'] = 'MONTH-OVER-MONTH TRENDS (Oct 2025 → Jan 2026)'
-ws1[f'C{row}'].font = Font(bold=True, size=14)
-ws1.merge_cells(f'C{row}:L{row}')
-
-row += 2
-for r_idx, row_data in enumerate(dataframe_to_rows(monthly, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=3):
-        cell = ws1.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center
-        else:
-            if isinstance(value, str) and '-' in value:  # Month period
-                cell.value = str(value)
-            elif c_idx in [4, 5, 6, 7]:
-                cell.number_format = '$#,##0'
-            elif c_idx in [8, 9, 10]:
-                cell.number_format = '0.00'
-
-# Sheet 2: Correlation Analysis
-ws2 = wb.create_sheet("📈 Ad→Organic Correlation")
-
-ws2['C3'] = 'DOES ADVERTISING DRIVE ORGANIC SALES?'
-ws2['C3'].font = title_font
-ws2.merge_cells('C3:J3')
-
-row = 5
-ws2[f'C{row}'] = '✓ ANSWER: YES - Perpetua ads strongly correlate with organic sales'
-ws2[f'C{row}'].font = Font(bold=True, size=13, color=COLORS['excellent'])
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 2
-ws2[f'C{row}'] = 'Perpetua: 0.52 correlation (p<0.01) - SIGNIFICANT'
-ws2[f'C{row}'].font = Font(size=11)
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 1
-ws2[f'C{row}'] = 'Elasticity: 1% ad spend increase → 1.39% organic sales increase'
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 2
-ws2[f'C{row}'] = 'Non-Perpetua: 0.10 correlation (not significant)'
-ws2[f'C{row}'].font = Font(size=11)
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 1
-ws2[f'C{row}'] = 'Products already organic-strong, ads have minimal incremental impact'
-ws2.merge_cells(f'C{row}:J{row}')
-
-# Set widths
-for ws in [ws1, ws2]:
-    for col in 'CDEFGHIJKL':
-        ws.column_dimensions[col].width = 15
-
-# Save
-print("[4/5] Saving ultimate dashboard...")
-output_file = OUTPUT_DIR / f'Perpetua_ULTIMATE_YoY_MoM_TACoS_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
-wb.save(output_file)
-
-print("[5/5] Creating summary...")
-summary = f"""
-ULTIMATE ANALYSIS SUMMARY
-========================
-
-YoY PERFORMANCE (MASSIVE IMPROVEMENT):
-  December 2024: 0.84x ROAS (LOSING MONEY)
-  December 2025: 2.37x ROAS (+181% improvement!) ✓
-
-  January 2024: 1.25x ROAS
-  January 2026: 1.85x ROAS (+48% improvement!) ✓
-
-CORRELATION ANALYSIS (Ad → Organic):
-  Perpetua: 0.52 correlation ✓ PROVEN linkage
-  Elasticity: 1% ad spend → 1.39% organic increase
-
-  Non-Perpetua: 0.10 correlation (not significant)
-  Organic sales independent of ad spend
-
-TACOS METRICS:
-  Perpetua: 6.1% TACoS, 16.4x T-ROAS, 88% organic
-  Non-Perpetua: 2.2% TACoS, 46x T-ROAS, 94% organic
-
-THE COMPLETE STORY:
-✓ Advertising performance improved 48-181% YoY
-✓ Perpetua ads DO drive organic sales (proven correlation)
-✓ Both platforms working correctly for their product types
-✓ Total business revenue: $6.2M (orders), growing +10.5% YoY
-
-File: {output_file.name}
-"""
-
-with open(OUTPUT_DIR / 'ULTIMATE_ANALYSIS_SUMMARY.txt', 'w') as f:
-    f.write(summary)
-
-print()
-print("=" * 100)
-print("✓ ULTIMATE DASHBOARD COMPLETE")
-print("=" * 100)
-print(f"\nFile: {output_file.name}")
-print()
-print("📊 INCLUDES:")
-print("  ✅ Year-over-Year: Dec 2024→2025, Jan 2024→2026")
-print("  ✅ Month-over-Month: Oct→Nov→Dec→Jan trends")
-print("  ✅ TACoS: Total business impact metrics")
-print("  ✅ Correlation: Ad spend → Organic sales proven (0.52)")
-print("  ✅ All metrics: ROAS, ACOS, TACoS, T-ROAS, CPC, CTR, CVR")
-print()
-print("🎯 KEY INSIGHTS:")
-print("  • December 2024 was LOSING MONEY (0.84x ROAS)")
-print("  • December 2025 is PROFITABLE (2.37x ROAS) - 181% improvement!")
-print("  • Perpetua ads drive 1.39x organic lift per 1% spend increase")
-print("  • Total business: $6.2M revenue, +10.5% YoY growth")
+if __name__ == '__main__':
+    main(['ultimate'])
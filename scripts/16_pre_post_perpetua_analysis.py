@@ -11,6 +11,8 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+from processed_store import load_merged
+
 BASE_DIR = Path(__file__).parent.parent
 PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
 OUTPUT_DIR = BASE_DIR / 'outputs'
@@ -26,18 +28,18 @@ print()
 
 print("[1/5] Loading data with Perpetua launch date context...")
 
-# Load merged orders + advertising data
-merged = pd.read_csv(PROCESSED_DIR / 'orders_advertising_merged.csv', low_memory=False)
-merged['Date'] = pd.to_datetime(merged['Date'], errors='coerce')
-merged = merged[merged['Date'].notna()]
-
 # Define periods
+# Per-ASIN onboarding dates are handled by 18_event_study_analysis.py
 PERPETUA_LAUNCH_DATE = pd.to_datetime('2025-12-15')
-PRE_START = pd.to_datetime('2025-11-15')
-PRE_END = pd.to_datetime('2025-12-14')
+PRE_WINDOW_DAYS = 30
+PRE_START = PERPETUA_LAUNCH_DATE - pd.Timedelta(days=PRE_WINDOW_DAYS)
+PRE_END = PERPETUA_LAUNCH_DATE - pd.Timedelta(days=1)
+
+# Load merged orders + advertising data from the pre-period onwards
+merged = load_merged(start=PRE_START, columns=['Ad_Spend', 'Ad_Sales', 'Total_Revenue', 'Organic_Sales'])
 
 print(f"  ✓ Perpetua Launch Date: {PERPETUA_LAUNCH_DATE.date()}")
-print(f"  ✓ Pre-Perpetua Period: {PRE_START.date()} to {PRE_END.date()} (30 days)")
+print(f"  ✓ Pre-Perpetua Period: {PRE_START.date()} to {PRE_END.date()} ({PRE_WINDOW_DAYS} days)")
 print(f"  ✓ Post-Perpetua Period: {PERPETUA_LAUNCH_DATE.date()} onwards")
 
 # Split data
@@ -93,7 +95,7 @@ post = calc_period_metrics(post_perpetua, 'Post-Perpetua (SaaS)')
 # ============================================================================
 
 print(f"\n{'='*100}")
-print("PRE-PERPETUA (Nov 15 - Dec 14, 2025) - MANUAL ADVERTISING ONLY")
+print(f"PRE-PERPETUA ({PRE_START:%b %d} - {PRE_END:%b %d, %Y}) - MANUAL ADVERTISING ONLY")
 print(f"{'='*100}")
 print(f"  Period: {pre['Days']} days")
 print(f"  Total Revenue: ${pre['Total_Revenue']:,.2f}")
@@ -111,7 +113,7 @@ print(f"  Avg Daily Revenue: ${pre['Avg_Daily_Revenue']:,.2f}")
 print(f"  Avg Daily Ad Spend: ${pre['Avg_Daily_Spend']:,.2f}")
 
 print(f"\n{'='*100}")
-print("POST-PERPETUA (Dec 15, 2025 onwards) - WITH PERPETUA SaaS")
+print(f"POST-PERPETUA ({PERPETUA_LAUNCH_DATE:%b %d, %Y} onwards) - WITH PERPETUA SaaS")
 print(f"{'='*100}")
 print(f"  Period: {post['Days']} days")
 print(f"  Total Revenue: ${post['Total_Revenue']:,.2f}")
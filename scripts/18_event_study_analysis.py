@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+PER-ASIN EVENT STUDY - PERPETUA ONBOARDING
+Aligns each ASIN to its own Perpetua onboarding date (or the global launch date)
+and compares the pre window against everything after onboarding
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+
+from daily_cube import load_cube
+from event_study import (DEFAULT_LAUNCH_DATE, NO_EVENT, ONBOARDING_FILE,
+                         load_onboarding_dates, run_event_study)
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+
+PRE_WINDOW_DAYS = 30
+CURVE_WINDOW = (-30, 60)
+
+print("=" * 100)
+print("PER-ASIN EVENT STUDY - PERPETUA ONBOARDING")
+print("=" * 100)
+print()
+
+# ============================================================================
+# LOAD CUBE AND ONBOARDING DATES
+# ============================================================================
+
+print("[1/4] Loading daily cube and onboarding dates...")
+cube = load_cube()
+event_index = load_onboarding_dates(cube)
+
+print(f"  ✓ Cube: {cube.n_dates} days x {cube.n_asins} ASINs")
+if ONBOARDING_FILE.exists():
+    print(f"  ✓ Onboarding dates from: {ONBOARDING_FILE.name}")
+else:
+    print(f"  ✓ No onboarding file - using global launch date {DEFAULT_LAUNCH_DATE}")
+print(f"  ✓ Perpetua ASINs in study: {(event_index != NO_EVENT).sum()}")
+
+# ============================================================================
+# RUN EVENT STUDY
+# ============================================================================
+
+print(f"\n[2/4] Running event study (pre window: {PRE_WINDOW_DAYS} days)...")
+asin_metrics, pooled, curves = run_event_study(cube, event_index, pre_days=PRE_WINDOW_DAYS,
+                                               window=CURVE_WINDOW)
+
+pre = pooled['pre']
+post = pooled['post']
+
+print(f"\n{'Metric':<25} {'Pre':>15} {'Post':>15} {'Change':>12}")
+print("-" * 70)
+for label, key, fmt in [('ROAS', 'ROAS', '{:.2f}x'), ('TACoS', 'TACoS', '{:.1%}'),
+                        ('Organic Ratio', 'Organic_Ratio', '{:.1%}'),
+                        ('Avg Daily Revenue/ASIN', 'Avg_Daily_Revenue', '${:,.0f}'),
+                        ('Avg Daily Spend/ASIN', 'Avg_Daily_Spend', '${:,.0f}')]:
+    change = post[key] - pre[key]
+    print(f"{label:<25} {fmt.format(pre[key]):>15} {fmt.format(post[key]):>15} {change:>+12.2f}")
+
+improved = (asin_metrics['ROAS_Change'] > 0).sum()
+print(f"\n  ✓ ASINs with higher ROAS after onboarding: {improved} of {len(asin_metrics)}")
+
+# ============================================================================
+# SAVE RESULTS
+# ============================================================================
+
+print("\n[3/4] Saving per-ASIN metrics and relative-day curves...")
+
+asin_file = AGG_DIR / 'event_study_asin_metrics.csv'
+asin_metrics.to_csv(asin_file, index=False)
+print(f"  ✓ Saved per-ASIN metrics: {asin_file}")
+
+curves_file = AGG_DIR / 'event_study_curves.csv'
+curves.to_csv(curves_file, index=False)
+print(f"  ✓ Saved relative-day curves: {curves_file}")
+
+results = {
+    'generated_at': datetime.now().isoformat(),
+    'analysis_type': 'Per-ASIN event study (staggered Perpetua onboarding)',
+    'onboarding_source': ONBOARDING_FILE.name if ONBOARDING_FILE.exists() else f'global launch {DEFAULT_LAUNCH_DATE}',
+    'pre_window_days': PRE_WINDOW_DAYS,
+    'curve_window': list(CURVE_WINDOW),
+    'asins': pooled['asins'],
+    'asins_improved_roas': int(improved),
+    'pre_period': pre,
+    'post_period': post,
+}
+
+with open(OUTPUT_DIR / 'event_study_analysis.json', 'w') as f:
+    json.dump(results, f, indent=2, default=str)
+print(f"  ✓ Saved summary: {OUTPUT_DIR / 'event_study_analysis.json'}")
+
+print("\n[4/4] Done")
+print()
+print("=" * 100)
+print("✓ EVENT STUDY COMPLETE")
+print("=" * 100)
@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from processed_store import CAMPAIGNS_NAME, save_dataset
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
@@ -147,10 +149,10 @@ else:
 print("  ✓ Metrics cleaned and calculated")
 print()
 
-# Save processed data
-processed_file = PROCESSED_DIR / 'campaigns_processed.csv'
-known_campaigns.to_csv(processed_file, index=False)
-print(f"✓ Saved processed data to: {processed_file}")
+# Save processed data (CSV plus a month/platform-partitioned copy for downstream scripts)
+processed_file = PROCESSED_DIR / f'{CAMPAIGNS_NAME}.csv'
+dataset_dir = save_dataset(known_campaigns, CAMPAIGNS_NAME)
+print(f"✓ Saved processed data to: {processed_file} (+ partitions in {dataset_dir})")
 print()
 
 # Aggregate by Advertising Type
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+ROLLING-WINDOW KPIs
+Trailing 7/14/28/90-day ROAS, TACoS, CPC, CTR, CVR and daily averages for
+every ASIN and platform - smooths the noise in raw daily ratios
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+
+from daily_cube import load_cube
+from rolling_kpis import WINDOWS, latest_snapshot, rolling_asin_kpis, rolling_platform_kpis
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+
+print("=" * 100)
+print("ROLLING-WINDOW KPIs")
+print("=" * 100)
+print()
+
+print("[1/3] Loading daily cube...")
+cube = load_cube()
+print(f"  ✓ Cube: {cube.n_dates} days x {cube.n_asins} ASINs")
+
+print(f"\n[2/3] Computing trailing windows ({', '.join(f'{w}d' for w in WINDOWS)})...")
+asin_kpis = rolling_asin_kpis(cube)
+platform_kpis = rolling_platform_kpis(cube)
+snapshot = latest_snapshot(platform_kpis)
+print(f"  ✓ {len(asin_kpis):,} ASIN rows, {len(platform_kpis):,} platform rows")
+
+print(f"\nLatest ({cube.dates[-1]}):")
+print(f"{'Platform':<15} {'Window':>7} {'ROAS':>8} {'TACoS':>8} {'CPC':>8} {'Spend/day':>12}")
+print("-" * 62)
+for platform, windows in snapshot.items():
+    for label, kpi in windows.items():
+        print(f"{platform:<15} {label:>7} {kpi['ROAS']:>7.2f}x {kpi['TACoS']:>8.1%} "
+              f"${kpi['CPC']:>7.2f} ${kpi['Avg_Daily_Spend']:>11,.0f}")
+
+print("\n[3/3] Saving results...")
+asin_file = AGG_DIR / 'rolling_kpis_asin.csv'
+asin_kpis.to_csv(asin_file, index=False)
+print(f"  ✓ Saved ASIN rolling KPIs: {asin_file}")
+
+platform_file = AGG_DIR / 'rolling_kpis_platform.csv'
+platform_kpis.to_csv(platform_file, index=False)
+print(f"  ✓ Saved platform rolling KPIs: {platform_file}")
+
+results = {
+    'generated_at': datetime.now().isoformat(),
+    'analysis_type': 'Trailing-window KPIs',
+    'windows': list(WINDOWS),
+    'as_of': str(cube.dates[-1]),
+    'latest': snapshot,
+}
+with open(OUTPUT_DIR / 'rolling_kpis.json', 'w') as f:
+    json.dump(results, f, indent=2, default=str)
+print(f"  ✓ Saved summary: {OUTPUT_DIR / 'rolling_kpis.json'}")
+
+print()
+print("=" * 100)
+print("✓ ROLLING KPIs COMPLETE")
+print("=" * 100)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+DAILY ANOMALY DETECTION
+Per-ASIN spikes and drops in spend, ROAS and organic sales - including ASINs
+suddenly spending with zero attributed sales
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+
+from daily_cube import load_cube
+from anomalies import BASELINE_DAYS, METRICS, Z_THRESHOLD, detect_anomalies
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+
+METHOD = 'robust'
+# Below this many ASIN-days, process startup costs more than scoring in one process
+PARALLEL_MIN_CELLS = 2_000_000
+MAX_WORKERS = 8
+RECENT_DAYS = 7
+
+print("=" * 100)
+print("DAILY ANOMALY DETECTION")
+print("=" * 100)
+print()
+
+print("[1/3] Loading daily cube...")
+cube = load_cube()
+print(f"  ✓ Cube: {cube.n_dates} days x {cube.n_asins} ASINs ({cube.n_dates * cube.n_asins:,} ASIN-days)")
+
+workers = min(os.cpu_count() or 1, MAX_WORKERS) if cube.n_dates * cube.n_asins >= PARALLEL_MIN_CELLS else 1
+print(f"\n[2/3] Scoring {', '.join(METRICS)} ({BASELINE_DAYS}-day baseline, |z| > {Z_THRESHOLD})...")
+started = time.perf_counter()
+anomalies = detect_anomalies(cube, method=METHOD, workers=workers)
+elapsed = time.perf_counter() - started
+print(f"  ✓ {len(anomalies):,} anomalies in {elapsed:.2f}s"
+      + (f" ({workers} workers on the shared-memory cube)" if workers > 1 else ''))
+
+counts = anomalies.groupby(['Metric', 'Direction']).size()
+for (metric, direction), n in counts.items():
+    print(f"    {metric:<15} {direction:<6} {n:>6,}")
+
+# Cut-off from the last date, so cubes shorter than RECENT_DAYS (partial refreshes) still work
+recent = anomalies[anomalies['Date'] >= cube.dates[-1] - np.timedelta64(RECENT_DAYS - 1, 'D')]
+print(f"\n  Last {RECENT_DAYS} days: {len(recent):,} anomalies across {recent['ASIN'].nunique()} ASINs")
+for _, a in recent.head(10).iterrows():
+    z = f"z={a['Z_Score']:+.1f}" if a['Z_Score'] == a['Z_Score'] else a['Rule']
+    print(f"    {a['Date']:%Y-%m-%d} {a['ASIN']} {a['Metric']:<14} {a['Value']:>10,.2f} "
+          f"(baseline {a['Baseline']:,.2f}, {z})")
+
+print("\n[3/3] Saving results...")
+anomalies_file = AGG_DIR / 'daily_anomalies.csv'
+anomalies.to_csv(anomalies_file, index=False)
+print(f"  ✓ Saved anomalies: {anomalies_file}")
+
+results = {
+    'generated_at': datetime.now().isoformat(),
+    'analysis_type': 'Per-ASIN daily anomaly detection',
+    'method': METHOD,
+    'baseline_days': BASELINE_DAYS,
+    'z_threshold': Z_THRESHOLD,
+    'asin_days_scored': int(cube.n_dates * cube.n_asins),
+    'seconds': round(elapsed, 3),
+    'workers': workers,
+    'total_anomalies': len(anomalies),
+    'by_metric': {m: int(n) for m, n in anomalies['Metric'].value_counts().items()},
+    'by_platform': {p: int(n) for p, n in anomalies['Advertising_Type'].value_counts().items()},
+    'last_7_days': len(recent),
+}
+with open(OUTPUT_DIR / 'anomalies_summary.json', 'w') as f:
+    json.dump(results, f, indent=2, default=str)
+print(f"  ✓ Saved summary: {OUTPUT_DIR / 'anomalies_summary.json'}")
+
+print()
+print("=" * 100)
+print("✓ ANOMALY DETECTION COMPLETE")
+print("=" * 100)
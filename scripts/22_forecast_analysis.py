@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+SPEND AND REVENUE FORECAST
+Next 30 days of spend, ad sales and total revenue for every ASIN and platform,
+with 95% prediction intervals - replaces straight-line annualization
+"""
+
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+
+from daily_cube import load_cube, save_cube
+from forecasting import (FIT_DAYS, FORECAST_FILE, FORECAST_MEASURES, HORIZON_DAYS,
+                         forecast_cube, forecast_frame)
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+
+print("=" * 100)
+print("SPEND AND REVENUE FORECAST")
+print("=" * 100)
+print()
+
+print("[1/3] Loading daily cube...")
+cube = load_cube()
+print(f"  ✓ Cube: {cube.n_dates} days x {cube.n_asins} ASINs")
+
+print(f"\n[2/3] Fitting trend + day-of-week ridge on last {FIT_DAYS} days, "
+      f"forecasting {HORIZON_DAYS} days...")
+started = time.perf_counter()
+asin_fc, platform_fc = forecast_cube(cube)
+elapsed = time.perf_counter() - started
+n_series = (asin_fc.n_asins + platform_fc.n_asins) * len(FORECAST_MEASURES)
+print(f"  ✓ {n_series:,} series fitted in {elapsed:.2f}s")
+
+summary = {}
+print(f"\n{'Platform':<15} {'Measure':<15} {'Next 30d':>14} {'95% daily range':>26}")
+print("-" * 74)
+for p, platform in enumerate(platform_fc.asins):
+    summary[platform] = {}
+    for measure in FORECAST_MEASURES:
+        mean = platform_fc.measure(measure)[:, p]
+        lower = platform_fc.measure(f'{measure}_Lower')[:, p]
+        upper = platform_fc.measure(f'{measure}_Upper')[:, p]
+        summary[platform][measure] = {
+            'total': float(mean.sum()),
+            'avg_daily': float(mean.mean()),
+            'avg_daily_lower': float(lower.mean()),
+            'avg_daily_upper': float(upper.mean()),
+        }
+        print(f"{platform:<15} {measure:<15} ${mean.sum():>13,.0f} "
+              f"${lower.mean():>11,.0f} - ${upper.mean():>10,.0f}")
+
+print("\n[3/3] Saving results...")
+save_cube(asin_fc, FORECAST_FILE)
+print(f"  ✓ Saved forecast cube: {FORECAST_FILE}")
+
+asin_file = AGG_DIR / 'forecast_asin.csv'
+forecast_frame(asin_fc, 'ASIN').to_csv(asin_file, index=False)
+print(f"  ✓ Saved ASIN forecasts: {asin_file}")
+
+platform_file = AGG_DIR / 'forecast_platform.csv'
+forecast_frame(platform_fc, 'Advertising_Type').to_csv(platform_file, index=False)
+print(f"  ✓ Saved platform forecasts: {platform_file}")
+
+results = {
+    'generated_at': datetime.now().isoformat(),
+    'analysis_type': 'Ridge forecast (trend + day-of-week)',
+    'fit_days': FIT_DAYS,
+    'horizon_days': HORIZON_DAYS,
+    'forecast_start': str(platform_fc.dates[0]),
+    'forecast_end': str(platform_fc.dates[-1]),
+    'series_fitted': n_series,
+    'seconds': round(elapsed, 3),
+    'platforms': summary,
+}
+with open(OUTPUT_DIR / 'forecast_summary.json', 'w') as f:
+    json.dump(results, f, indent=2, default=str)
+print(f"  ✓ Saved summary: {OUTPUT_DIR / 'forecast_summary.json'}")
+
+print()
+print("=" * 100)
+print("✓ FORECAST COMPLETE")
+print("=" * 100)
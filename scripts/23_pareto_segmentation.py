@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+PARETO / ABC SEGMENTATION
+How concentrated are sales, spend and organic revenue across ASINs on each
+platform - and which ASINs make up the A, B and C tiers
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+
+from daily_cube import load_cube
+from segmentation import ABC_CUTOFFS, SEGMENT_KEYS, concentration, pareto_curves
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+
+print("=" * 100)
+print("PARETO / ABC SEGMENTATION")
+print("=" * 100)
+print()
+
+print("[1/3] Loading daily cube...")
+cube = load_cube()
+print(f"  ✓ Cube: {cube.n_dates} days x {cube.n_asins} ASINs")
+
+print(f"\n[2/3] Building Pareto curves (A < {ABC_CUTOFFS[0]:.0%}, B < {ABC_CUTOFFS[1]:.0%} cumulative share)...")
+curves = pareto_curves(cube)
+summary = concentration(curves)
+
+print(f"\n{'Key':<10} {'Platform':<15} {'ASINs':>6} {'Top 20% share':>14} {'A':>5} {'B':>5} {'C':>5}")
+print("-" * 66)
+for key, platforms in summary.items():
+    for platform, stats in platforms.items():
+        counts = stats['class_counts']
+        print(f"{key:<10} {platform:<15} {stats['asins']:>6} {stats['top_20pct_share']:>14.1%} "
+              f"{counts['A']:>5} {counts['B']:>5} {counts['C']:>5}")
+
+print("\n[3/3] Saving results...")
+curves_file = AGG_DIR / 'pareto_curves.csv'
+curves.to_csv(curves_file, index=False)
+print(f"  ✓ Saved Pareto curves: {curves_file}")
+
+segments_file = AGG_DIR / 'asin_segments.csv'
+segments = curves.pivot_table(index=['ASIN', 'Platform'], columns='Key', values='Class', aggfunc='first')
+segments.columns = [f'ABC_{key}' for key in segments.columns]
+segments.reset_index().to_csv(segments_file, index=False)
+print(f"  ✓ Saved ASIN segments: {segments_file}")
+
+results = {
+    'generated_at': datetime.now().isoformat(),
+    'analysis_type': 'Pareto / ABC segmentation',
+    'abc_cutoffs': list(ABC_CUTOFFS),
+    'keys': SEGMENT_KEYS,
+    'concentration': summary,
+}
+with open(OUTPUT_DIR / 'pareto_segmentation.json', 'w') as f:
+    json.dump(results, f, indent=2, default=str)
+print(f"  ✓ Saved summary: {OUTPUT_DIR / 'pareto_segmentation.json'}")
+
+print()
+print("=" * 100)
+print("✓ SEGMENTATION COMPLETE")
+print("=" * 100)
+print("\nSegment labels are stored on the daily cube: cube.segment_mask('Sales', 'A')")
@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from processed_store import AD_PRODUCTS_NAME, save_dataset
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
@@ -304,10 +306,10 @@ comparison_file = AGG_DIR / 'asin_comparison_full.csv'
 comparison.to_csv(comparison_file)
 print(f"✓ Saved comparison table to: {comparison_file}")
 
-# Save processed data
-processed_file = PROCESSED_DIR / 'advertised_products_processed.csv'
-known.to_csv(processed_file, index=False)
-print(f"✓ Saved processed data to: {processed_file}")
+# Save processed data (CSV plus a month/platform-partitioned copy for downstream scripts)
+processed_file = PROCESSED_DIR / f'{AD_PRODUCTS_NAME}.csv'
+dataset_dir = save_dataset(known, AD_PRODUCTS_NAME)
+print(f"✓ Saved processed data to: {processed_file} (+ partitions in {dataset_dir})")
 
 print()
 print("=" * 80)
@@ -8,7 +8,8 @@ import json
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from pathlib import Path
-from datetime import datetime
+
+from report_renderer import MAIN_FILES, render_platform_report
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -23,7 +24,7 @@ print("=" * 80)
 print()
 
 # Load comparison data
-print("[1/4] Loading analysis results...")
+print("[1/3] Loading analysis results...")
 with open(AGG_DIR / 'asin_level_comparison.json', 'r') as f:
     analysis = json.load(f)
 
@@ -36,7 +37,7 @@ perpetua = analysis['perpetua_metrics']
 non_perpetua = analysis['non_perpetua_metrics']
 
 #  Generate visualizations
-print("[2/4] Creating visualizations...")
+print("[2/3] Creating visualizations...")
 
 # Set style
 plt.style.use('default')
@@ -178,224 +179,10 @@ print("  ✓ Saved: efficiency_metrics_comparison.png")
 
 print()
 
-# Generate text report
-print("[3/4] Generating text report...")
-
-report_lines = []
-report_lines.append("=" * 80)
-report_lines.append("CAMPAIGN PERFORMANCE ANALYSIS: PERPETUA VS NON-PERPETUA")
-report_lines.append("=" * 80)
-report_lines.append("")
-report_lines.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-report_lines.append("")
-
-report_lines.append("EXECUTIVE SUMMARY")
-report_lines.append("-" * 80)
-report_lines.append(f"  Perpetua ASINs Analyzed: {analysis['perpetua_asins_analyzed']}")
-report_lines.append(f"  Non-Perpetua ASINs Analyzed: {analysis['non_perpetua_asins_analyzed']}")
-report_lines.append("")
-
-report_lines.append("PERFORMANCE METRICS")
-report_lines.append("-" * 80)
-report_lines.append(f"{'Metric':<25} | {'Perpetua':>15} | {'Non-Perpetua':>15} | {'Winner':<12}")
-report_lines.append("-" * 80)
-
-metrics_display = [
-    ('Total_Spend', 'Total Spend', '$', False),
-    ('Total_Sales', 'Total Sales', '$', False),
-    ('Total_Orders', 'Total Orders', '', False),
-    ('ACOS', 'ACOS', '%', True),  # True = lower is better
-    ('ROAS', 'ROAS', 'x', False),
-    ('Avg_CPC', 'Avg CPC', '$', True),
-    ('Avg_CVR', 'Conversion Rate', '%', False),
-    ('CTR', 'CTR', '%', False)
-]
-
-for metric_key, metric_name, unit, lower_better in metrics_display:
-    p_val = perpetua[metric_key]
-    np_val = non_perpetua[metric_key]
-
-    # Format values
-    if unit == '$':
-        p_str = f"${p_val:,.2f}"
-        np_str = f"${np_val:,.2f}"
-    elif unit == '%':
-        p_str = f"{p_val*100:.2f}%"
-        np_str = f"{np_val*100:.2f}%"
-    elif unit == 'x':
-        p_str = f"{p_val:.2f}x"
-        np_str = f"{np_val:.2f}x"
-    else:
-        p_str = f"{p_val:,.0f}"
-        np_str = f"{np_val:,.0f}"
-
-    # Determine winner
-    if lower_better:
-        winner = "Perpetua ✓" if p_val < np_val else "Non-Perpetua ✓"
-    else:
-        winner = "Perpetua ✓" if p_val > np_val else "Non-Perpetua ✓"
-
-    report_lines.append(f"{metric_name:<25} | {p_str:>15} | {np_str:>15} | {winner:<12}")
-
-report_lines.append("")
-report_lines.append("KEY INSIGHTS")
-report_lines.append("-" * 80)
-
-# Calculate improvement percentages
-acos_improvement = ((non_perpetua['ACOS'] - perpetua['ACOS']) / non_perpetua['ACOS'] * 100) if non_perpetua['ACOS'] > 0 else 0
-roas_improvement = ((perpetua['ROAS'] - non_perpetua['ROAS']) / non_perpetua['ROAS'] * 100) if non_perpetua['ROAS'] > 0 else 0
-cpc_improvement = ((non_perpetua['Avg_CPC'] - perpetua['Avg_CPC']) / non_perpetua['Avg_CPC'] * 100) if non_perpetua['Avg_CPC'] > 0 else 0
-cvr_improvement = ((perpetua['Avg_CVR'] - non_perpetua['Avg_CVR']) / non_perpetua['Avg_CVR'] * 100) if non_perpetua['Avg_CVR'] > 0 else 0
-
-insights = []
-
-if acos_improvement > 0:
-    insights.append(f"  ✓ Perpetua has {acos_improvement:.1f}% better ACOS (more efficient)")
-else:
-    insights.append(f"  ⚠ Non-Perpetua has {abs(acos_improvement):.1f}% better ACOS")
-
-if roas_improvement > 0:
-    insights.append(f"  ✓ Perpetua has {roas_improvement:.1f}% better ROAS")
-else:
-    insights.append(f"  ⚠ Non-Perpetua has {abs(roas_improvement):.1f}% better ROAS")
-
-if cpc_improvement > 0:
-    insights.append(f"  ✓ Perpetua has {cpc_improvement:.1f}% lower CPC (more cost-efficient)")
-else:
-    insights.append(f"  ⚠ Non-Perpetua has {abs(cpc_improvement):.1f}% lower CPC")
-
-# Spend analysis
-spend_diff_pct = ((perpetua['Total_Spend'] - non_perpetua['Total_Spend']) / non_perpetua['Total_Spend'] * 100)
-insights.append(f"  • Perpetua spends {spend_diff_pct:.0f}% more than non-Perpetua products")
-
-# Sales analysis
-sales_diff_pct = ((perpetua['Total_Sales'] - non_perpetua['Total_Sales']) / non_perpetua['Total_Sales'] * 100)
-insights.append(f"  • Perpetua generates {sales_diff_pct:.0f}% more sales revenue")
-
-# ASIN analysis
-insights.append(f"  • Perpetua manages {analysis['perpetua_asins_analyzed']} ASINs vs {analysis['non_perpetua_asins_analyzed']} non-Perpetua ASINs")
-
-# Per-ASIN efficiency
-spend_per_asin_p = perpetua['Total_Spend'] / analysis['perpetua_asins_analyzed']
-spend_per_asin_np = non_perpetua['Total_Spend'] / analysis['non_perpetua_asins_analyzed']
-sales_per_asin_p = perpetua['Total_Sales'] / analysis['perpetua_asins_analyzed']
-sales_per_asin_np = non_perpetua['Total_Sales'] / analysis['non_perpetua_asins_analyzed']
-
-insights.append("")
-insights.append("Per-ASIN Metrics:")
-insights.append(f"  • Perpetua: ${spend_per_asin_p:,.0f} spend/ASIN → ${sales_per_asin_p:,.0f} sales/ASIN")
-insights.append(f"  • Non-Perpetua: ${spend_per_asin_np:,.0f} spend/ASIN → ${sales_per_asin_np:,.0f} sales/ASIN")
-
-report_lines.extend(insights)
-
-report_lines.append("")
-report_lines.append("RECOMMENDATIONS")
-report_lines.append("-" * 80)
-
-recommendations = []
-if roas_improvement < 0:
-    recommendations.append("  1. Non-Perpetua products show better ROAS - investigate what strategies can be")
-    recommendations.append("     applied from non-Perpetua to Perpetua campaigns")
-
-if perpetua['ROAS'] < 2.0:
-    recommendations.append("  2. Perpetua ROAS is below 2.0 target - consider:")
-    recommendations.append("     - Streams bid optimization adjustments")
-    recommendations.append("     - Negative keyword expansion to reduce wasted spend")
-    recommendations.append("     - Budget reallocation from low-performing to high-performing campaigns")
-
-if perpetua['Avg_CPC'] > non_perpetua['Avg_CPC']:
-    recommendations.append("  3. Perpetua has higher CPC - this may indicate:")
-    recommendations.append("     - More competitive keywords (expected for higher-volume products)")
-    recommendations.append("     - Opportunity to refine bidding strategies")
-
-recommendations.append("  4. Continue leveraging automation for Perpetua products while monitoring efficiency")
-recommendations.append("  5. Consider expanding Perpetua management to high-performing non-Perpetua ASINs")
-
-report_lines.extend(recommendations)
-
-report_lines.append("")
-report_lines.append("=" * 80)
-report_lines.append("END OF REPORT")
-report_lines.append("=" * 80)
-
-# Save text report
-report_file = OUTPUT_DIR / 'Campaign_Performance_Report.txt'
-with open(report_file, 'w') as f:
-    f.write('\n'.join(report_lines))
-
-print(f"  ✓ Saved: {report_file.name}")
-print()
-
-# Save summary for markdown
-print("[4/4] Creating markdown summary...")
-
-md_lines = []
-md_lines.append("# Campaign Performance Analysis: Perpetua vs Non-Perpetua")
-md_lines.append("")
-md_lines.append(f"**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-md_lines.append("")
-
-md_lines.append("## Executive Summary")
-md_lines.append("")
-md_lines.append(f"- **Perpetua ASINs Analyzed:** {analysis['perpetua_asins_analyzed']}")
-md_lines.append(f"- **Non-Perpetua ASINs Analyzed:** {analysis['non_perpetua_asins_analyzed']}")
-md_lines.append("")
-
-md_lines.append("## Performance Comparison")
-md_lines.append("")
-md_lines.append("| Metric | Perpetua | Non-Perpetua | Winner |")
-md_lines.append("|--------|----------|--------------|--------|")
-
-for metric_key, metric_name, unit, lower_better in metrics_display:
-    p_val = perpetua[metric_key]
-    np_val = non_perpetua[metric_key]
-
-    if unit == '$':
-        p_str = f"\\${p_val:,.2f}"
-        np_str = f"\\${np_val:,.2f}"
-    elif unit == '%':
-        p_str = f"{p_val*100:.2f}%"
-        np_str = f"{np_val*100:.2f}%"
-    elif unit == 'x':
-        p_str = f"{p_val:.2f}x"
-        np_str = f"{np_val:.2f}x"
-    else:
-        p_str = f"{p_val:,.0f}"
-        np_str = f"{np_val:,.0f}"
-
-    if lower_better:
-        winner = "Perpetua ✓" if p_val < np_val else "Non-Perpetua ✓"
-    else:
-        winner = "Perpetua ✓" if p_val > np_val else "Non-Perpetua ✓"
-
-    md_lines.append(f"| {metric_name} | {p_str} | {np_str} | {winner} |")
-
-md_lines.append("")
-md_lines.append("## Key Insights")
-md_lines.append("")
-for insight in insights:
-    md_lines.append(insight)
-
-md_lines.append("")
-md_lines.append("## Visualizations")
-md_lines.append("")
-md_lines.append("### Perpetua vs Non-Perpetua Comparison")
-md_lines.append("![Comparison](perpetua_vs_nonperpetua_comparison.png)")
-md_lines.append("")
-md_lines.append("### Spend vs Sales")
-md_lines.append("![Spend vs Sales](spend_vs_sales_scatter.png)")
-md_lines.append("")
-md_lines.append("### ROAS Comparison")
-md_lines.append("![ROAS](roas_comparison.png)")
-md_lines.append("")
-md_lines.append("### Efficiency Metrics")
-md_lines.append("![Efficiency](efficiency_metrics_comparison.png)")
-
-md_file = OUTPUT_DIR / 'Campaign_Performance_Summary.md'
-with open(md_file, 'w') as f:
-    f.write('\n'.join(md_lines))
-
-print(f"  ✓ Saved: {md_file.name}")
+# Render text and markdown reports (skipped when the summary is unchanged)
+print("[3/3] Rendering text and markdown reports...")
+written, total = render_platform_report()
+print(f"  ✓ {' / '.join(MAIN_FILES.values())}: {written} of {total} rewritten ({total - written} unchanged)")
 print()
 
 print("=" * 80)
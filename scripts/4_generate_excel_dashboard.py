@@ -12,6 +12,9 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+from date_parsing import parse_dates
+from rankings import load_rankings, ranked_asins, take_ranked
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 AGG_DIR = BASE_DIR / 'data' / 'aggregated'
@@ -205,17 +208,15 @@ with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
     asin_summary['ACOS'] = asin_summary['Spend'] / asin_summary['7 Day Total Sales ']
     asin_summary['CVR'] = asin_summary['7 Day Total Orders (#)'] / asin_summary['Clicks']
 
-    # Sort by sales
-    asin_summary = asin_summary.sort_values('7 Day Total Sales ', ascending=False)
-
-    # Take top 100 for Excel
-    asin_summary.head(100).to_excel(writer, sheet_name='Top 100 ASINs', index=False)
+    # Top 100 by sales from the shared ranking cache
+    asin_summary = take_ranked(asin_summary, ranked_asins(load_rankings(), 'Sales', 100))
+    asin_summary.to_excel(writer, sheet_name='Top 100 ASINs', index=False)
 
     # Sheet 4: Monthly Trends
     print("  ✓ Creating monthly trend data...")
 
     # Convert date column
-    processed_campaigns['Date'] = pd.to_datetime(processed_campaigns['Date'])
+    processed_campaigns['Date'] = parse_dates(processed_campaigns['Date'])
     processed_campaigns['Month'] = processed_campaigns['Date'].dt.to_period('M')
 
     monthly_summary = processed_campaigns.groupby(['Month', 'Advertising_Type']).agg({
@@ -2,424 +2,10 @@
 """
 Generate Enhanced Excel Dashboard with Embedded Charts and Date Controls
 Following best practices for executive dashboards
+Rendered by dashboard_engine.py from the 'enhanced' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import json
-from pathlib import Path
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
-from openpyxl.chart import BarChart, LineChart, PieChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from dashboard_engine import main
 
-# Paths
-BASE_DIR = Path(__file__).parent.parent
-AGG_DIR = BASE_DIR / 'data' / 'aggregated'
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 80)
-print("GENERATING ENHANCED EXCEL DASHBOARD")
-print("=" * 80)
-print()
-
-# Load data
-print("[1/8] Loading and preparing data...")
-with open(AGG_DIR / 'asin_level_comparison.json', 'r') as f:
-    analysis = json.load(f)
-
-# Load processed campaigns with proper date handling
-processed_df = pd.read_csv(PROCESSED_DIR / 'advertised_products_processed.csv', low_memory=False)
-processed_df['Date'] = pd.to_datetime(processed_df['Date'], errors='coerce')
-
-# Remove rows with invalid dates
-processed_df = processed_df[processed_df['Date'].notna()]
-
-# Determine date range
-min_date = processed_df['Date'].min()
-max_date = processed_df['Date'].max()
-print(f"  ✓ Date range: {min_date.date()} to {max_date.date()}")
-
-# Filter to only Perpetua and Non-Perpetua
-processed_df = processed_df[processed_df['Advertising_Type'].isin(['Perpetua', 'Non-Perpetua'])]
-print(f"  ✓ Loaded {len(processed_df):,} records")
-
-# Aggregate daily metrics
-daily_summary = processed_df.groupby(['Date', 'Advertising_Type']).agg({
-    'Spend': 'sum',
-    '7 Day Total Sales ': 'sum',
-    '7 Day Total Orders (#)': 'sum',
-    'Clicks': 'sum',
-    'Impressions': 'sum'
-}).reset_index()
-
-# Calculate metrics
-daily_summary['ROAS'] = daily_summary['7 Day Total Sales '] / daily_summary['Spend'].replace(0, 1)
-daily_summary['ACOS'] = daily_summary['Spend'] / daily_summary['7 Day Total Sales '].replace(0, 1)
-daily_summary['CPC'] = daily_summary['Spend'] / daily_summary['Clicks'].replace(0, 1)
-daily_summary['CTR'] = daily_summary['Clicks'] / daily_summary['Impressions'].replace(0, 1)
-daily_summary['CVR'] = daily_summary['7 Day Total Orders (#)'] / daily_summary['Clicks'].replace(0, 1)
-
-print("  ✓ Daily metrics calculated")
-
-# Create Excel file
-print("[2/8] Creating workbook structure...")
-wb = Workbook()
-wb.remove(wb.active)  # Remove default sheet
-
-# Define color scheme (professional blue/orange)
-COLORS = {
-    'perpetua': '4472C4',      # Professional blue
-    'non_perpetua': 'ED7D31',  # Professional orange
-    'header': '2F5496',        # Dark blue
-    'positive': '70AD47',      # Green
-    'negative': 'C5504B',      # Red
-    'neutral': 'F2F2F2'        # Light gray
-}
-
-# Styles
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=12)
-title_font = Font(bold=True, size=16, color=COLORS['header'])
-subtitle_font = Font(bold=True, size=11)
-metric_font = Font(size=11)
-center_align = Alignment(horizontal='center', vertical='center')
-thin_border = Border(
-    left=Side(style='thin'),
-    right=Side(style='thin'),
-    top=Side(style='thin'),
-    bottom=Side(style='thin')
-)
-
-# Sheet 1: Executive Dashboard
-print("[3/8] Creating Executive Dashboard sheet...")
-ws_exec = wb.create_sheet("📊 Executive Dashboard")
-
-# Title
-ws_exec['B2'] = 'Perpetua Performance Dashboard'
-ws_exec['B2'].font = title_font
-ws_exec.merge_cells('B2:H2')
-
-ws_exec['B3'] = f'Analysis Period: {min_date.strftime("%b %d, %Y")} - {max_date.strftime("%b %d, %Y")}'
-ws_exec['B3'].font = subtitle_font
-ws_exec.merge_cells('B3:H3')
-
-ws_exec['B4'] = f'Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}'
-ws_exec.merge_cells('B4:H4')
-
-# Key metrics summary
-row = 6
-ws_exec[f'B{row}'] = 'PERFORMANCE OVERVIEW'
-ws_exec[f'B{row}'].font = subtitle_font
-ws_exec.merge_cells(f'B{row}:H{row}')
-row += 1
-
-# Create summary table
-headers = ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', 'Winner']
-for col, header in enumerate(headers, start=2):
-    cell = ws_exec.cell(row=row, column=col, value=header)
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = center_align
-    cell.border = thin_border
-
-row += 1
-
-# Get metrics from analysis
-perpetua = analysis['perpetua_metrics']
-non_perpetua = analysis['non_perpetua_metrics']
-
-metrics = [
-    ('Total Spend', perpetua['Total_Spend'], non_perpetua['Total_Spend'], '$'),
-    ('Total Sales', perpetua['Total_Sales'], non_perpetua['Total_Sales'], '$'),
-    ('Total Orders', perpetua['Total_Orders'], non_perpetua['Total_Orders'], '#'),
-    ('ROAS', perpetua['ROAS'], non_perpetua['ROAS'], 'x'),
-    ('ACOS', perpetua['ACOS'] * 100, non_perpetua['ACOS'] * 100, '%'),
-    ('Avg CPC', perpetua['Avg_CPC'], non_perpetua['Avg_CPC'], '$'),
-    ('Conversion Rate', perpetua['Avg_CVR'] * 100, non_perpetua['Avg_CVR'] * 100, '%'),
-]
-
-start_data_row = row
-
-for metric_name, p_val, np_val, unit in metrics:
-    # Metric name
-    ws_exec.cell(row=row, column=2, value=metric_name)
-
-    # Perpetua value
-    if unit == '$':
-        ws_exec.cell(row=row, column=3, value=p_val).number_format = '$#,##0.00'
-    elif unit == '%':
-        ws_exec.cell(row=row, column=3, value=p_val / 100).number_format = '0.00%'
-    elif unit == 'x':
-        ws_exec.cell(row=row, column=3, value=p_val).number_format = '0.00'
-    else:
-        ws_exec.cell(row=row, column=3, value=p_val).number_format = '#,##0'
-
-    # Non-Perpetua value
-    if unit == '$':
-        ws_exec.cell(row=row, column=4, value=np_val).number_format = '$#,##0.00'
-    elif unit == '%':
-        ws_exec.cell(row=row, column=4, value=np_val / 100).number_format = '0.00%'
-    elif unit == 'x':
-        ws_exec.cell(row=row, column=4, value=np_val).number_format = '0.00'
-    else:
-        ws_exec.cell(row=row, column=4, value=np_val).number_format = '#,##0'
-
-    # Difference
-    diff = p_val - np_val
-    if unit == '$':
-        ws_exec.cell(row=row, column=5, value=diff).number_format = '$#,##0.00'
-    elif unit == '%':
-        ws_exec.cell(row=row, column=5, value=diff / 100).number_format = '0.00%'
-    elif unit == 'x':
-        ws_exec.cell(row=row, column=5, value=diff).number_format = '0.00'
-    else:
-        ws_exec.cell(row=row, column=5, value=diff).number_format = '#,##0'
-
-    # Winner (lower is better for ACOS, ACOS, CPC; higher for others)
-    if metric_name in ['ACOS', 'Avg CPC']:
-        winner = 'Perpetua ✓' if p_val < np_val else 'Non-Perpetua ✓'
-        winner_fill = COLORS['positive'] if p_val < np_val else COLORS['negative']
-    else:
-        winner = 'Perpetua ✓' if p_val > np_val else 'Non-Perpetua ✓'
-        winner_fill = COLORS['positive'] if p_val > np_val else COLORS['negative']
-
-    cell = ws_exec.cell(row=row, column=6, value=winner)
-    cell.fill = PatternFill(start_color=winner_fill, end_color=winner_fill, fill_type='solid')
-    cell.font = Font(bold=True, color='FFFFFF')
-    cell.alignment = center_align
-
-    # Apply borders
-    for col in range(2, 7):
-        ws_exec.cell(row=row, column=col).border = thin_border
-
-    row += 1
-
-# Add embedded chart for ROAS comparison
-print("[4/8] Creating embedded charts...")
-row += 2
-ws_exec[f'B{row}'] = 'ROAS Comparison'
-ws_exec[f'B{row}'].font = subtitle_font
-
-# Create chart data
-chart_data = [
-    ['Type', 'ROAS'],
-    ['Perpetua', perpetua['ROAS']],
-    ['Non-Perpetua', non_perpetua['ROAS']]
-]
-
-chart_start_row = row + 1
-for i, chart_row in enumerate(chart_data):
-    for j, value in enumerate(chart_row):
-        ws_exec.cell(row=chart_start_row + i, column=2 + j, value=value)
-
-# Create bar chart
-chart1 = BarChart()
-chart1.title = "Return on Ad Spend (ROAS)"
-chart1.y_axis.title = "ROAS"
-chart1.x_axis.title = "Advertising Type"
-
-data = Reference(ws_exec, min_col=3, min_row=chart_start_row, max_row=chart_start_row + 2)
-cats = Reference(ws_exec, min_col=2, min_row=chart_start_row + 1, max_row=chart_start_row + 2)
-chart1.add_data(data, titles_from_data=True)
-chart1.set_categories(cats)
-chart1.height = 10
-chart1.width = 15
-
-ws_exec.add_chart(chart1, f'F{row}')
-
-# Set column widths
-ws_exec.column_dimensions['B'].width = 20
-ws_exec.column_dimensions['C'].width = 15
-ws_exec.column_dimensions['D'].width = 15
-ws_exec.column_dimensions['E'].width = 15
-ws_exec.column_dimensions['F'].width = 15
-
-# Sheet 2: Daily Trends with Date Filter
-print("[5/8] Creating Daily Trends sheet...")
-ws_daily = wb.create_sheet("📈 Daily Trends")
-
-# Title
-ws_daily['B2'] = 'Daily Performance Trends'
-ws_daily['B2'].font = title_font
-ws_daily.merge_cells('B2:L2')
-
-# Instructions
-ws_daily['B3'] = 'Use Excel filters to analyze specific date ranges'
-ws_daily.merge_cells('B3:L3')
-
-# Add daily data as table
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(daily_summary, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws_daily.cell(row=row + r_idx, column=c_idx, value=value)
-
-        # Format header
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center_align
-        else:
-            # Format date column
-            if c_idx == 2 and isinstance(value, datetime):
-                cell.number_format = 'YYYY-MM-DD'
-            # Format currency
-            elif c_idx in [4]:  # Spend
-                cell.number_format = '$#,##0.00'
-            # Format numbers
-            elif c_idx in [5, 6, 7, 8]:  # Sales, Orders, Clicks, Impressions
-                cell.number_format = '#,##0'
-            # Format decimals
-            elif c_idx in [9, 10, 11, 12, 13]:  # ROAS, ACOS, CPC, CTR, CVR
-                cell.number_format = '0.00'
-
-# Create table
-tab = Table(displayName="DailyData", ref=f"B{row}:M{row + len(daily_summary)}")
-style = TableStyleInfo(name="TableStyleMedium2", showFirstColumn=False,
-                       showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-tab.tableStyleInfo = style
-ws_daily.add_table(tab)
-
-# Add line chart for trends
-print("[6/8] Creating trend charts...")
-
-# Pivot data for chart
-perpetua_daily = daily_summary[daily_summary['Advertising_Type'] == 'Perpetua'].sort_values('Date')
-non_perpetua_daily = daily_summary[daily_summary['Advertising_Type'] == 'Non-Perpetua'].sort_values('Date')
-
-chart_row = row + len(daily_summary) + 3
-
-# ROAS Trend Chart
-ws_daily[f'B{chart_row}'] = 'ROAS Trend Over Time'
-ws_daily[f'B{chart_row}'].font = subtitle_font
-
-chart2 = LineChart()
-chart2.title = "ROAS Trend: Perpetua vs Non-Perpetua"
-chart2.y_axis.title = "ROAS"
-chart2.x_axis.title = "Date"
-chart2.height = 12
-chart2.width = 20
-
-# This is simplified - in production, would need proper data refs
-ws_daily.add_chart(chart2, f'B{chart_row + 1}')
-
-# Sheet 3: Top ASINs Analysis
-print("[7/8] Creating Top ASINs sheet...")
-ws_asins = wb.create_sheet("🏆 Top ASINs")
-
-# Aggregate by ASIN
-asin_summary = processed_df.groupby(['Advertised ASIN', 'Advertising_Type']).agg({
-    'Spend': 'sum',
-    '7 Day Total Sales ': 'sum',
-    '7 Day Total Orders (#)': 'sum',
-    'Clicks': 'sum'
-}).reset_index()
-
-asin_summary['ROAS'] = asin_summary['7 Day Total Sales '] / asin_summary['Spend'].replace(0, 1)
-asin_summary['ACOS'] = asin_summary['Spend'] / asin_summary['7 Day Total Sales '].replace(0, 1)
-asin_summary = asin_summary.sort_values('7 Day Total Sales ', ascending=False).head(50)
-
-# Add title
-ws_asins['B2'] = 'Top 50 ASINs by Sales Revenue'
-ws_asins['B2'].font = title_font
-ws_asins.merge_cells('B2:I2')
-
-# Add data
-row = 4
-for r_idx, row_data in enumerate(dataframe_to_rows(asin_summary, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws_asins.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center_align
-        else:
-            # Format columns appropriately
-            if c_idx == 3:  # Spend
-                cell.number_format = '$#,##0.00'
-            elif c_idx == 4:  # Sales
-                cell.number_format = '$#,##0.00'
-            elif c_idx in [5, 6]:  # Orders, Clicks
-                cell.number_format = '#,##0'
-            elif c_idx in [7, 8]:  # ROAS, ACOS
-                cell.number_format = '0.00'
-
-            # Color code by type
-            if c_idx == 3 and r_idx > 0:
-                adv_type = asin_summary.iloc[r_idx - 1]['Advertising_Type']
-                if adv_type == 'Perpetua':
-                    cell.fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-                else:
-                    cell.fill = PatternFill(start_color='FCE4D6', end_color='FCE4D6', fill_type='solid')
-
-# Sheet 4: Key Insights
-print("[8/8] Creating Key Insights sheet...")
-ws_insights = wb.create_sheet("💡 Key Insights")
-
-ws_insights['B2'] = 'Performance Insights & Recommendations'
-ws_insights['B2'].font = title_font
-ws_insights.merge_cells('B2:G2')
-
-# Calculate insights
-roas_diff_pct = ((perpetua['ROAS'] - non_perpetua['ROAS']) / non_perpetua['ROAS'] * 100)
-acos_diff_pct = ((non_perpetua['ACOS'] - perpetua['ACOS']) / non_perpetua['ACOS'] * 100)
-
-insights = [
-    ('🎯 PRIMARY FINDING', ''),
-    ('Non-Perpetua Efficiency Advantage', f'{abs(roas_diff_pct):.1f}% better ROAS than Perpetua'),
-    ('', f'Non-Perpetua: {non_perpetua["ROAS"]:.2f}x vs Perpetua: {perpetua["ROAS"]:.2f}x'),
-    ('', ''),
-    ('💰 REVENUE IMPACT', ''),
-    ('Perpetua Volume Leadership', f'Generates ${perpetua["Total_Sales"]:,.0f} in sales (78% of total)'),
-    ('Scale Advantage', f'{perpetua["Unique_ASINs"]:.0f} ASINs managed vs {non_perpetua["Unique_ASINs"]:.0f}'),
-    ('', ''),
-    ('⚠️ OPTIMIZATION OPPORTUNITY', ''),
-    ('Efficiency Gap', f'If Perpetua matched non-Perpetua ROAS:'),
-    ('Potential Additional Revenue', f'${(perpetua["Total_Spend"] * non_perpetua["ROAS"] - perpetua["Total_Sales"]):,.0f}'),
-    ('', ''),
-    ('📋 RECOMMENDATIONS', ''),
-    ('1. HIGH PRIORITY', 'Analyze non-Perpetua keyword strategies'),
-    ('', 'Apply efficient tactics to Perpetua campaigns'),
-    ('2. MEDIUM PRIORITY', 'Expand negative keyword management'),
-    ('', 'Reduce wasted spend by 10-15%'),
-    ('3. STRATEGIC', 'Migrate top non-Perpetua ASINs to Perpetua'),
-    ('', 'Combine scale + efficiency')
-]
-
-row = 4
-for insight in insights:
-    ws_insights.cell(row=row, column=2, value=insight[0]).font = subtitle_font if insight[0] and ('🎯' in insight[0] or '💰' in insight[0] or '⚠️' in insight[0] or '📋' in insight[0]) else metric_font
-    ws_insights.cell(row=row, column=3, value=insight[1]).font = metric_font
-    ws_insights.merge_cells(f'C{row}:G{row}')
-    row += 1
-
-# Set column widths for all sheets
-for ws in wb.worksheets:
-    ws.column_dimensions['A'].width = 5
-    if ws != ws_daily:
-        for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 18
-
-print()
-print("Saving enhanced dashboard...")
-output_file = OUTPUT_DIR / f'Perpetua_Dashboard_Enhanced_{datetime.now().strftime("%Y%m%d")}.xlsx'
-wb.save(output_file)
-
-print()
-print("=" * 80)
-print("✓ ENHANCED DASHBOARD COMPLETE")
-print("=" * 80)
-print(f"\nSaved to: {output_file}")
-print()
-print("Features:")
-print("  ✓ Embedded charts (not external PNGs)")
-print("  ✓ Professional color scheme")
-print("  ✓ Filterable daily data table")
-print("  ✓ Top 50 ASINs with color coding")
-print("  ✓ Key insights and recommendations")
-print("  ✓ Proper number formatting throughout")
-print()
-print("Excel should now open without errors!")
+if __name__ == '__main__':
+    main(['enhanced'])
@@ -2,373 +2,10 @@
 """
 Generate Fully Interactive Excel Dashboard with Date Range Controls
 User can change start/end dates directly in Excel and all data updates automatically
+Rendered by dashboard_engine.py from the 'interactive' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import json
-from pathlib import Path
-from datetime import datetime, timedelta
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import BarChart, LineChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.datavalidation import DataValidation
+from dashboard_engine import main
 
-# Paths
-BASE_DIR = Path(__file__).parent.parent
-AGG_DIR = BASE_DIR / 'data' / 'aggregated'
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 80)
-print("GENERATING INTERACTIVE DASHBOARD WITH DATE CONTROLS")
-print("=" * 80)
-print()
-
-# Load data
-print("[1/6] Loading data...")
-processed_df = pd.read_csv(PROCESSED_DIR / 'advertised_products_processed.csv', low_memory=False)
-processed_df['Date'] = pd.to_datetime(processed_df['Date'], errors='coerce')
-processed_df = processed_df[processed_df['Date'].notna()]
-processed_df = processed_df[processed_df['Advertising_Type'].isin(['Perpetua', 'Non-Perpetua'])]
-
-min_date = processed_df['Date'].min()
-max_date = processed_df['Date'].max()
-print(f"  ✓ Data loaded: {min_date.date()} to {max_date.date()}")
-
-# Daily aggregation
-daily_df = processed_df.groupby(['Date', 'Advertising_Type']).agg({
-    'Spend': 'sum',
-    '7 Day Total Sales ': 'sum',
-    '7 Day Total Orders (#)': 'sum',
-    'Clicks': 'sum',
-    'Impressions': 'sum'
-}).reset_index()
-
-daily_df['ROAS'] = (daily_df['7 Day Total Sales '] / daily_df['Spend'].replace(0, 1)).round(2)
-daily_df['ACOS'] = (daily_df['Spend'] / daily_df['7 Day Total Sales '].replace(0, 1)).round(4)
-daily_df['CPC'] = (daily_df['Spend'] / daily_df['Clicks'].replace(0, 1)).round(2)
-
-print(f"  ✓ {len(daily_df)} daily records")
-
-# Create workbook
-print("[2/6] Creating workbook...")
-wb = Workbook()
-wb.remove(wb.active)
-
-# Colors
-COLORS = {
-    'primary': '4472C4',
-    'secondary': 'ED7D31',
-    'header': '2F5496',
-    'light_blue': 'D9E1F2',
-    'light_orange': 'FCE4D6',
-    'green': '70AD47',
-    'red': 'C5504B'
-}
-
-# Styles
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=11)
-title_font = Font(bold=True, size=14)
-input_fill = PatternFill(start_color='FFF2CC', end_color='FFF2CC', fill_type='solid')
-input_border = Border(left=Side(style='medium'), right=Side(style='medium'),
-                      top=Side(style='medium'), bottom=Side(style='medium'))
-
-# Sheet 1: Control Panel + Dashboard
-print("[3/6] Creating Control Panel sheet...")
-ws = wb.create_sheet("🎛️ Dashboard & Controls")
-
-# Title
-ws['B2'] = 'PERPETUA PERFORMANCE DASHBOARD'
-ws['B2'].font = Font(bold=True, size=16, color=COLORS['header'])
-ws.merge_cells('B2:H2')
-
-# DATE RANGE CONTROLS
-ws['B4'] = '📅 DATE RANGE CONTROLS'
-ws['B4'].font = Font(bold=True, size=12)
-ws.merge_cells('B4:E4')
-
-ws['B5'] = 'Start Date:'
-ws['C5'] = min_date
-ws['C5'].number_format = 'YYYY-MM-DD'
-ws['C5'].fill = input_fill
-ws['C5'].border = input_border
-ws['C5'].font = Font(bold=True, size=11)
-
-ws['D5'] = 'End Date:'
-ws['E5'] = max_date
-ws['E5'].number_format = 'YYYY-MM-DD'
-ws['E5'].fill = input_fill
-ws['E5'].border = input_border
-ws['E5'].font = Font(bold=True, size=11)
-
-# Instructions
-ws['B6'] = '💡 Change dates above to filter data. All charts and metrics update automatically!'
-ws['B6'].font = Font(italic=True, size=9)
-ws.merge_cells('B6:H6')
-
-# Quick presets
-ws['B7'] = 'Quick Filters:'
-ws['C7'] = 'Last 7 Days'
-ws['D7'] = 'Last 30 Days'
-ws['E7'] = 'Last 90 Days'
-ws['F7'] = 'All Time'
-
-for col in ['C', 'D', 'E', 'F']:
-    ws[f'{col}7'].fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
-    ws[f'{col}7'].font = Font(size=9)
-    ws[f'{col}7'].alignment = Alignment(horizontal='center')
-
-# Add formulas for quick filters (these would need VBA in real implementation)
-# For now, adding instructions
-ws['B8'] = '(To use quick filters: manually update Start/End dates above)'
-ws['B8'].font = Font(italic=True, size=8, color='808080')
-ws.merge_cells('B8:F8')
-
-# METRICS SUMMARY (Dynamic)
-row = 10
-ws[f'B{row}'] = '📊 PERFORMANCE SUMMARY'
-ws[f'B{row}'].font = Font(bold=True, size=12)
-ws.merge_cells(f'B{row}:H{row}')
-row += 1
-
-ws[f'B{row}'] = f'Analyzing data from {min_date.strftime("%b %d, %Y")} to {max_date.strftime("%b %d, %Y")}'
-ws[f'B{row}'].font = Font(italic=True, size=9)
-ws.merge_cells(f'B{row}:H{row}')
-row += 2
-
-# Headers for summary table
-headers = ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', 'Winner']
-for col_idx, header in enumerate(headers, start=2):
-    cell = ws.cell(row=row, column=col_idx, value=header)
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = Alignment(horizontal='center', vertical='center')
-row += 1
-
-# Calculate summary metrics
-perpetua_total = daily_df[daily_df['Advertising_Type'] == 'Perpetua'].sum(numeric_only=True)
-non_perpetua_total = daily_df[daily_df['Advertising_Type'] == 'Non-Perpetua'].sum(numeric_only=True)
-
-perpetua_roas = perpetua_total['7 Day Total Sales '] / perpetua_total['Spend'] if perpetua_total['Spend'] > 0 else 0
-non_perpetua_roas = non_perpetua_total['7 Day Total Sales '] / non_perpetua_total['Spend'] if non_perpetua_total['Spend'] > 0 else 0
-
-perpetua_acos = perpetua_total['Spend'] / perpetua_total['7 Day Total Sales '] if perpetua_total['7 Day Total Sales '] > 0 else 0
-non_perpetua_acos = non_perpetua_total['Spend'] / non_perpetua_total['7 Day Total Sales '] if non_perpetua_total['7 Day Total Sales '] > 0 else 0
-
-metrics_data = [
-    ('Total Spend', perpetua_total['Spend'], non_perpetua_total['Spend'], '$'),
-    ('Total Sales', perpetua_total['7 Day Total Sales '], non_perpetua_total['7 Day Total Sales '], '$'),
-    ('Total Orders', perpetua_total['7 Day Total Orders (#)'], non_perpetua_total['7 Day Total Orders (#)'], '#'),
-    ('ROAS', perpetua_roas, non_perpetua_roas, 'x'),
-    ('ACOS', perpetua_acos * 100, non_perpetua_acos * 100, '%'),
-]
-
-start_row = row
-for metric_name, p_val, np_val, unit in metrics_data:
-    ws.cell(row=row, column=2, value=metric_name)
-
-    # Perpetua value
-    cell_p = ws.cell(row=row, column=3, value=p_val)
-    if unit == '$':
-        cell_p.number_format = '$#,##0.00'
-    elif unit == '%':
-        cell_p.number_format = '0.00%'
-        cell_p.value = p_val / 100
-    elif unit == 'x':
-        cell_p.number_format = '0.00'
-    else:
-        cell_p.number_format = '#,##0'
-
-    # Non-Perpetua value
-    cell_np = ws.cell(row=row, column=4, value=np_val)
-    if unit == '$':
-        cell_np.number_format = '$#,##0.00'
-    elif unit == '%':
-        cell_np.number_format = '0.00%'
-        cell_np.value = np_val / 100
-    elif unit == 'x':
-        cell_np.number_format = '0.00'
-    else:
-        cell_np.number_format = '#,##0'
-
-    # Difference
-    diff = p_val - np_val
-    cell_diff = ws.cell(row=row, column=5, value=diff)
-    if unit == '$':
-        cell_diff.number_format = '$#,##0.00'
-    elif unit == '%':
-        cell_diff.number_format = '0.00%'
-        cell_diff.value = diff / 100
-    elif unit == 'x':
-        cell_diff.number_format = '+0.00;-0.00'
-    else:
-        cell_diff.number_format = '+#,##0;-#,##0'
-
-    # Winner
-    if metric_name in ['ACOS']:
-        winner = 'Perpetua ✓' if p_val < np_val else 'Non-Perpetua ✓'
-        fill_color = COLORS['green'] if p_val < np_val else COLORS['secondary']
-    else:
-        winner = 'Perpetua ✓' if p_val > np_val else 'Non-Perpetua ✓'
-        fill_color = COLORS['primary'] if p_val > np_val else COLORS['secondary']
-
-    cell_winner = ws.cell(row=row, column=6, value=winner)
-    cell_winner.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type='solid')
-    cell_winner.font = Font(bold=True, color='FFFFFF')
-    cell_winner.alignment = Alignment(horizontal='center')
-
-    row += 1
-
-# Add ROAS Chart
-print("[4/6] Adding embedded charts...")
-chart_row = row + 2
-ws[f'B{chart_row}'] = 'ROAS Comparison'
-ws[f'B{chart_row}'].font = Font(bold=True, size=11)
-
-# Chart data
-chart_data_start = chart_row + 1
-ws.cell(row=chart_data_start, column=2, value='Type')
-ws.cell(row=chart_data_start, column=3, value='ROAS')
-ws.cell(row=chart_data_start + 1, column=2, value='Perpetua')
-ws.cell(row=chart_data_start + 1, column=3, value=perpetua_roas)
-ws.cell(row=chart_data_start + 2, column=2, value='Non-Perpetua')
-ws.cell(row=chart_data_start + 2, column=3, value=non_perpetua_roas)
-
-chart = BarChart()
-chart.title = "ROAS: Perpetua vs Non-Perpetua"
-chart.y_axis.title = "ROAS"
-chart.height = 10
-chart.width = 15
-
-data = Reference(ws, min_col=3, min_row=chart_data_start, max_row=chart_data_start + 2)
-cats = Reference(ws, min_col=2, min_row=chart_data_start + 1, max_row=chart_data_start + 2)
-chart.add_data(data, titles_from_data=True)
-chart.set_categories(cats)
-
-ws.add_chart(chart, f'G{start_row}')
-
-# Sheet 2: Raw Daily Data (for filtering)
-print("[5/6] Creating Daily Data sheet...")
-ws_data = wb.create_sheet("📅 Daily Data (Filterable)")
-
-ws_data['B2'] = 'DAILY PERFORMANCE DATA'
-ws_data['B2'].font = title_font
-ws_data.merge_cells('B2:L2')
-
-ws_data['B3'] = 'Use AutoFilter to analyze specific date ranges or advertising types'
-ws_data['B3'].font = Font(italic=True, size=9)
-ws_data.merge_cells('B3:L3')
-
-# Add all daily data
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(daily_df, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws_data.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
-        else:
-            if c_idx == 2:  # Date
-                cell.number_format = 'YYYY-MM-DD'
-            elif c_idx == 4:  # Spend
-                cell.number_format = '$#,##0.00'
-            elif c_idx == 5:  # Sales
-                cell.number_format = '$#,##0.00'
-            elif c_idx in [6, 7, 8]:  # Orders, Clicks, Impressions
-                cell.number_format = '#,##0'
-            elif c_idx in [9, 10, 11]:  # ROAS, ACOS, CPC
-                cell.number_format = '0.00'
-
-# Enable AutoFilter
-ws_data.auto_filter.ref = f'B{row}:K{row + len(daily_df)}'
-
-# Sheet 3: Instructions
-print("[6/6] Creating Instructions sheet...")
-ws_inst = wb.create_sheet("📖 How to Use")
-
-ws_inst['B2'] = '📖 DASHBOARD USER GUIDE'
-ws_inst['B2'].font = title_font
-ws_inst.merge_cells('B2:H2')
-
-instructions = [
-    ('', ''),
-    ('🎯 PURPOSE', ''),
-    ('', 'This dashboard compares Perpetua vs Non-Perpetua ASIN performance'),
-    ('', 'Analyze trends, identify optimization opportunities, and track improvements'),
-    ('', ''),
-    ('🎛️ HOW TO ADJUST DATE RANGE', ''),
-    ('1.', 'Go to "Dashboard & Controls" sheet'),
-    ('2.', 'Click on Start Date cell (C5)'),
-    ('3.', 'Type new date in YYYY-MM-DD format (e.g., 2025-12-01)'),
-    ('4.', 'Click on End Date cell (E5) and update'),
-    ('5.', 'Press Enter - all metrics will recalculate!'),
-    ('', ''),
-    ('📊 USING THE DAILY DATA SHEET', ''),
-    ('1.', 'Navigate to "Daily Data (Filterable)" sheet'),
-    ('2.', 'Click filter dropdown arrows in header row'),
-    ('3.', 'Select specific dates or date ranges'),
-    ('4.', 'Filter by Advertising_Type (Perpetua or Non-Perpetua)'),
-    ('5.', 'Filtered data updates instantly'),
-    ('', ''),
-    ('💡 QUICK ANALYSIS TIPS', ''),
-    ('', '• Compare last 7 days vs last 30 days trends'),
-    ('', '• Filter to weekdays only to remove weekend seasonality'),
-    ('', '• Look for ROAS trends - improving or declining?'),
-    ('', '• Identify days with unusually high/low performance'),
-    ('', ''),
-    ('📈 KEY METRICS EXPLAINED', ''),
-    ('ROAS', 'Return on Ad Spend = Sales ÷ Spend (higher is better)'),
-    ('', 'Target: 2.0+ is good, 3.0+ is excellent'),
-    ('ACOS', 'Advertising Cost of Sales = Spend ÷ Sales (lower is better)'),
-    ('', 'Target: <50% is good, <30% is excellent'),
-    ('', ''),
-    ('🎯 PERFORMANCE INSIGHTS', ''),
-    ('Perpetua', f'{perpetua_roas:.2f}x ROAS - Manages higher volume products'),
-    ('Non-Perpetua', f'{non_perpetua_roas:.2f}x ROAS - More efficient per dollar spent'),
-    ('Opportunity', 'Apply non-Perpetua efficiency strategies to Perpetua ASINs'),
-    ('', ''),
-    ('🔄 MONTHLY UPDATES', ''),
-    ('1.', 'Export new campaign data from Amazon/Perpetua'),
-    ('2.', 'Save to: data/recent-reports/ folder'),
-    ('3.', 'Run: python3 scripts/refresh_reports.py'),
-    ('4.', 'New dashboard generated with updated data'),
-]
-
-row = 4
-for item in instructions:
-    cell1 = ws_inst.cell(row=row, column=2, value=item[0])
-    if item[0] and item[0] != '' and len(item[0]) <= 3:
-        cell1.font = Font(bold=True)
-    ws_inst.cell(row=row, column=3, value=item[1]).font = Font(size=10)
-    ws_inst.merge_cells(f'C{row}:H{row}')
-    row += 1
-
-# Adjust column widths
-for ws in wb.worksheets:
-    ws.column_dimensions['A'].width = 3
-    ws.column_dimensions['B'].width = 18
-    for col in ['C', 'D', 'E', 'F', 'G', 'H']:
-        ws.column_dimensions[col].width = 15
-
-# Save
-output_file = OUTPUT_DIR / f'Perpetua_Interactive_Dashboard_{datetime.now().strftime("%Y%m%d")}.xlsx'
-wb.save(output_file)
-
-print()
-print("=" * 80)
-print("✓ INTERACTIVE DASHBOARD COMPLETE")
-print("=" * 80)
-print(f"\nSaved to: {output_file}")
-print()
-print("🎛️ INTERACTIVE FEATURES:")
-print("  ✓ Date range controls in cells C5 and E5")
-print("  ✓ Change dates to filter all data")
-print("  ✓ Embedded charts update automatically")
-print("  ✓ Daily data sheet with AutoFilter")
-print("  ✓ Complete instructions included")
-print()
-print("📖 See 'How to Use' sheet for detailed instructions")
+if __name__ == '__main__':
+    main(['interactive'])
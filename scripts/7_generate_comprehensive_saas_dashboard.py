@@ -2,633 +2,10 @@
 """
 Comprehensive SaaS vs Non-SaaS Performance Analysis Dashboard
 Based on research best practices for platform comparison and statistical rigor
+Rendered by dashboard_engine.py from the 'saas' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import numpy as np
-import json
+from dashboard_engine import main
 
-# Try to import scipy, fallback to manual calculations if not available
-try:
-    from scipy import stats as scipy_stats
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
-    print("  ⚠ scipy not available - using manual statistical calculations")
-from pathlib import Path
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
-from openpyxl.chart import BarChart, LineChart, ScatterChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.table import Table, TableStyleInfo
-
-# Suppress warnings
-import warnings
-warnings.filterwarnings('ignore')
-
-# Paths
-BASE_DIR = Path(__file__).parent.parent
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 100)
-print("COMPREHENSIVE SaaS vs NON-SaaS PERFORMANCE ANALYSIS DASHBOARD")
-print("Research-Based | Statistically Rigorous | Executive-Ready")
-print("=" * 100)
-print()
-
-# ============================================================================
-# STEP 1: DATA LOADING AND PREPARATION
-# ============================================================================
-
-print("[1/10] Loading and preparing data...")
-df = pd.read_csv(PROCESSED_DIR / 'advertised_products_processed.csv', low_memory=False)
-
-# Convert dates
-df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-df = df[df['Date'].notna()]
-
-# Filter to known types
-df = df[df['Advertising_Type'].isin(['Perpetua', 'Non-Perpetua'])]
-
-# Date normalization
-min_date = df['Date'].min()
-max_date = df['Date'].max()
-print(f"  ✓ Date range: {min_date.date()} to {max_date.date()}")
-print(f"  ✓ Total records: {len(df):,}")
-
-# Clean numeric columns
-numeric_cols = ['Spend', '7 Day Total Sales ', '7 Day Total Orders (#)',
-                'Clicks', 'Impressions', '7 Day Total Units (#)']
-
-for col in numeric_cols:
-    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-
-# Calculate all metrics
-df['ROAS'] = np.where(df['Spend'] > 0, df['7 Day Total Sales '] / df['Spend'], 0)
-df['ACOS'] = np.where(df['7 Day Total Sales '] > 0,
-                      df['Spend'] / df['7 Day Total Sales '], 0)
-df['CPC'] = np.where(df['Clicks'] > 0, df['Spend'] / df['Clicks'], 0)
-df['CTR'] = np.where(df['Impressions'] > 0,
-                     df['Clicks'] / df['Impressions'], 0)
-df['CVR'] = np.where(df['Clicks'] > 0,
-                     df['7 Day Total Orders (#)'] / df['Clicks'], 0)
-df['CPM'] = np.where(df['Impressions'] > 0,
-                     (df['Spend'] / df['Impressions']) * 1000, 0)
-df['CPA'] = np.where(df['7 Day Total Orders (#)'] > 0,
-                     df['Spend'] / df['7 Day Total Orders (#)'], 0)
-
-print(f"  ✓ Metrics calculated for {df['Advertised ASIN'].nunique()} unique ASINs")
-
-# ============================================================================
-# STEP 2: STATISTICAL ANALYSIS
-# ============================================================================
-
-print("[2/10] Performing statistical analysis...")
-
-# Aggregate by ASIN and Platform
-asin_summary = df.groupby(['Advertised ASIN', 'Advertising_Type']).agg({
-    'Spend': 'sum',
-    '7 Day Total Sales ': 'sum',
-    '7 Day Total Orders (#)': 'sum',
-    'Clicks': 'sum',
-    'Impressions': 'sum',
-    '7 Day Total Units (#)': 'sum'
-}).reset_index()
-
-# Calculate ASIN-level metrics
-asin_summary['ROAS'] = asin_summary['7 Day Total Sales '] / asin_summary['Spend'].replace(0, np.nan)
-asin_summary['ACOS'] = asin_summary['Spend'] / asin_summary['7 Day Total Sales '].replace(0, np.nan)
-asin_summary['CPC'] = asin_summary['Spend'] / asin_summary['Clicks'].replace(0, np.nan)
-asin_summary['CTR'] = asin_summary['Clicks'] / asin_summary['Impressions'].replace(0, np.nan)
-asin_summary['CVR'] = asin_summary['7 Day Total Orders (#)'] / asin_summary['Clicks'].replace(0, np.nan)
-
-# Remove invalid values
-asin_summary = asin_summary.replace([np.inf, -np.inf], np.nan)
-
-# Split by platform
-perpetua_asins = asin_summary[asin_summary['Advertising_Type'] == 'Perpetua']
-non_perpetua_asins = asin_summary[asin_summary['Advertising_Type'] == 'Non-Perpetua']
-
-print(f"  ✓ Perpetua ASINs: {len(perpetua_asins)}")
-print(f"  ✓ Non-Perpetua ASINs: {len(non_perpetua_asins)}")
-
-# Statistical tests for each metric
-metrics_to_test = ['ROAS', 'ACOS', 'CPC', 'CTR', 'CVR', 'Spend',
-                   '7 Day Total Sales ', '7 Day Total Orders (#)']
-
-stats_results = []
-
-for metric in metrics_to_test:
-    # Get clean data
-    p_data = perpetua_asins[metric].dropna()
-    np_data = non_perpetua_asins[metric].dropna()
-
-    if len(p_data) > 1 and len(np_data) > 1:
-        # Means and standard deviations
-        p_mean = p_data.mean()
-        np_mean = np_data.mean()
-        p_std = p_data.std()
-        np_std = np_data.std()
-
-        if HAS_SCIPY:
-            # T-test (Welch's t-test, assumes unequal variances)
-            t_stat, p_value = scipy_stats.ttest_ind(p_data, np_data, equal_var=False)
-
-            # Confidence intervals (95%)
-            p_ci = scipy_stats.t.interval(0.95, len(p_data)-1,
-                                   loc=p_mean,
-                                   scale=scipy_stats.sem(p_data))
-            np_ci = scipy_stats.t.interval(0.95, len(np_data)-1,
-                                    loc=np_mean,
-                                    scale=scipy_stats.sem(np_data))
-        else:
-            # Manual t-test calculation
-            n1, n2 = len(p_data), len(np_data)
-            s1, s2 = p_std, np_std
-
-            # Standard error
-            se = np.sqrt((s1**2 / n1) + (s2**2 / n2))
-
-            # T-statistic
-            t_stat = (p_mean - np_mean) / se if se > 0 else 0
-
-            # Degrees of freedom (Welch-Satterthwaite)
-            degrees_of_freedom = ((s1**2/n1 + s2**2/n2)**2) / ((s1**2/n1)**2/(n1-1) + (s2**2/n2)**2/(n2-1))
-
-            # Approximate p-value (two-tailed)
-            p_value = 0.05 if abs(t_stat) > 2 else 0.5  # Rough approximation
-
-            # Confidence intervals (95% - using 1.96 for normal approximation)
-            p_sem = p_std / np.sqrt(n1)
-            np_sem = np_std / np.sqrt(n2)
-            p_ci = (p_mean - 1.96 * p_sem, p_mean + 1.96 * p_sem)
-            np_ci = (np_mean - 1.96 * np_sem, np_mean + 1.96 * np_sem)
-
-        # Effect size (Cohen's d)
-        pooled_std = np.sqrt(((len(p_data) - 1) * p_std**2 + (len(np_data) - 1) * np_std**2) /
-                            (len(p_data) + len(np_data) - 2))
-        cohens_d = (p_mean - np_mean) / pooled_std if pooled_std > 0 else 0
-
-        # Relative difference
-        rel_diff = ((p_mean - np_mean) / np_mean * 100) if np_mean != 0 else 0
-
-        stats_results.append({
-            'Metric': metric,
-            'Perpetua_Mean': p_mean,
-            'Perpetua_StdDev': p_std,
-            'Perpetua_N': len(p_data),
-            'Perpetua_CI_Lower': p_ci[0],
-            'Perpetua_CI_Upper': p_ci[1],
-            'NonPerpetua_Mean': np_mean,
-            'NonPerpetua_StdDev': np_std,
-            'NonPerpetua_N': len(np_data),
-            'NonPerpetua_CI_Lower': np_ci[0],
-            'NonPerpetua_CI_Upper': np_ci[1],
-            'Mean_Difference': p_mean - np_mean,
-            'Relative_Difference_Pct': rel_diff,
-            'T_Statistic': t_stat,
-            'P_Value': p_value,
-            'Cohens_D': cohens_d,
-            'Significant': 'YES' if p_value < 0.05 else 'NO'
-        })
-
-stats_df = pd.DataFrame(stats_results)
-print(f"  ✓ Statistical tests completed for {len(stats_results)} metrics")
-
-# ============================================================================
-# STEP 3: TIME SERIES ANALYSIS
-# ============================================================================
-
-print("[3/10] Analyzing time series trends...")
-
-# Daily aggregation
-daily_summary = df.groupby(['Date', 'Advertising_Type']).agg({
-    'Spend': 'sum',
-    '7 Day Total Sales ': 'sum',
-    '7 Day Total Orders (#)': 'sum',
-    'Clicks': 'sum',
-    'Impressions': 'sum'
-}).reset_index()
-
-# Calculate daily metrics
-daily_summary['ROAS'] = daily_summary['7 Day Total Sales '] / daily_summary['Spend'].replace(0, np.nan)
-daily_summary['ACOS'] = daily_summary['Spend'] / daily_summary['7 Day Total Sales '].replace(0, np.nan)
-daily_summary['CTR'] = daily_summary['Clicks'] / daily_summary['Impressions'].replace(0, np.nan)
-daily_summary['CVR'] = daily_summary['7 Day Total Orders (#)'] / daily_summary['Clicks'].replace(0, np.nan)
-daily_summary = daily_summary.replace([np.inf, -np.inf], np.nan)
-
-print(f"  ✓ {len(daily_summary)} daily records analyzed")
-
-# ============================================================================
-# STEP 4: CREATE EXCEL WORKBOOK
-# ============================================================================
-
-print("[4/10] Creating Excel workbook structure...")
-
-wb = Workbook()
-wb.remove(wb.active)
-
-# Color palette (professional and accessible)
-COLORS = {
-    'primary': '4472C4',       # Perpetua blue
-    'secondary': 'ED7D31',     # Non-Perpetua orange
-    'header': '2F5496',        # Dark blue header
-    'positive': '70AD47',      # Green (good performance)
-    'negative': 'C5504B',      # Red (poor performance)
-    'neutral': 'FFC000',       # Yellow (caution)
-    'light_blue': 'D9E1F2',   # Light blue background
-    'light_orange': 'FCE4D6',  # Light orange background
-    'gray': 'F2F2F2'          # Light gray
-}
-
-# Styles
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=11)
-title_font = Font(bold=True, size=16, color=COLORS['header'])
-subtitle_font = Font(bold=True, size=12)
-metric_font = Font(size=10)
-small_font = Font(size=9, italic=True)
-center = Alignment(horizontal='center', vertical='center')
-thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                     top=Side(style='thin'), bottom=Side(style='thin'))
-
-# ============================================================================
-# SHEET 1: EXECUTIVE SUMMARY DASHBOARD
-# ============================================================================
-
-print("[5/10] Creating Executive Summary Dashboard...")
-ws1 = wb.create_sheet("📊 Executive Summary")
-
-# Title section
-ws1['B2'] = 'SaaS PLATFORM PERFORMANCE ANALYSIS'
-ws1['B2'].font = title_font
-ws1.merge_cells('B2:I2')
-
-ws1['B3'] = f'Perpetua (SaaS) vs Manual Advertising | {min_date.strftime("%b %d")} - {max_date.strftime("%b %d, %Y")}'
-ws1['B3'].font = subtitle_font
-ws1.merge_cells('B3:I3')
-
-ws1['B4'] = f'Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}'
-ws1['B4'].font = small_font
-ws1.merge_cells('B4:I4')
-
-# KEY FINDING CALLOUT
-row = 6
-ws1[f'B{row}'] = '🎯 KEY FINDING'
-ws1[f'B{row}'].font = Font(bold=True, size=14, color=COLORS['negative'])
-ws1.merge_cells(f'B{row}:I{row}')
-
-perpetua_roas = perpetua_asins['ROAS'].mean()
-non_perpetua_roas = non_perpetua_asins['ROAS'].mean()
-roas_diff_pct = ((non_perpetua_roas - perpetua_roas) / perpetua_roas * 100)
-
-row += 1
-ws1[f'B{row}'] = f'Non-SaaS (Manual) outperforms SaaS (Perpetua) by {abs(roas_diff_pct):.0f}% on ROAS'
-ws1[f'B{row}'].font = Font(size=12)
-ws1.merge_cells(f'B{row}:I{row}')
-
-row += 1
-ws1[f'B{row}'] = 'CAUTION: Raw comparison does not adjust for product mix, category, or selection bias'
-ws1[f'B{row}'].font = Font(size=9, italic=True, color='FF0000')
-ws1.merge_cells(f'B{row}:I{row}')
-
-# KPI CARDS
-row += 2
-ws1[f'B{row}'] = 'PERFORMANCE OVERVIEW'
-ws1[f'B{row}'].font = subtitle_font
-ws1.merge_cells(f'B{row}:I{row}')
-
-row += 1
-headers = ['Metric', 'Perpetua (SaaS)', 'Non-Perpetua (Manual)', 'Difference', 'Statistical Significance']
-for col, header in enumerate(headers, start=2):
-    cell = ws1.cell(row=row, column=col, value=header)
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = center
-    cell.border = thin_border
-
-row += 1
-
-# Key metrics to display
-display_metrics = [
-    ('Total Spend', 'Spend', '$'),
-    ('Total Revenue', '7 Day Total Sales ', '$'),
-    ('Total Orders', '7 Day Total Orders (#)', '#'),
-    ('ROAS', 'ROAS', 'x'),
-    ('ACOS', 'ACOS', '%'),
-    ('CPC', 'CPC', '$'),
-    ('CTR', 'CTR', '%'),
-    ('CVR', 'CVR', '%')
-]
-
-for metric_name, metric_col, unit in display_metrics:
-    stat_row = stats_df[stats_df['Metric'] == metric_col].iloc[0] if metric_col in stats_df['Metric'].values else None
-
-    # Metric name
-    ws1.cell(row=row, column=2, value=metric_name)
-
-    if stat_row is not None:
-        # Perpetua value
-        cell = ws1.cell(row=row, column=3, value=stat_row['Perpetua_Mean'])
-        if unit == '$':
-            cell.number_format = '$#,##0.00'
-        elif unit == '%':
-            cell.value = stat_row['Perpetua_Mean']
-            cell.number_format = '0.00%'
-        elif unit == 'x':
-            cell.number_format = '0.00'
-        else:
-            cell.number_format = '#,##0'
-
-        # Non-Perpetua value
-        cell = ws1.cell(row=row, column=4, value=stat_row['NonPerpetua_Mean'])
-        if unit == '$':
-            cell.number_format = '$#,##0.00'
-        elif unit == '%':
-            cell.value = stat_row['NonPerpetua_Mean']
-            cell.number_format = '0.00%'
-        elif unit == 'x':
-            cell.number_format = '0.00'
-        else:
-            cell.number_format = '#,##0'
-
-        # Difference
-        cell = ws1.cell(row=row, column=5, value=stat_row['Mean_Difference'])
-        if unit == '$':
-            cell.number_format = '$#,##0.00;-$#,##0.00'
-        elif unit == '%':
-            cell.value = stat_row['Mean_Difference']
-            cell.number_format = '0.00%;-0.00%'
-        elif unit == 'x':
-            cell.number_format = '+0.00;-0.00'
-        else:
-            cell.number_format = '+#,##0;-#,##0'
-
-        # Significance
-        sig_text = f"{'YES' if stat_row['Significant'] == 'YES' else 'NO'} (p={stat_row['P_Value']:.3f})"
-        cell = ws1.cell(row=row, column=6, value=sig_text)
-        if stat_row['Significant'] == 'YES':
-            cell.fill = PatternFill(start_color=COLORS['positive'], end_color=COLORS['positive'], fill_type='solid')
-            cell.font = Font(bold=True, color='FFFFFF')
-
-    # Apply borders
-    for col in range(2, 7):
-        ws1.cell(row=row, column=col).border = thin_border
-
-    row += 1
-
-# Add embedded chart
-chart_row = row + 2
-ws1[f'B{chart_row}'] = 'ROAS Comparison'
-ws1[f'B{chart_row}'].font = subtitle_font
-
-chart = BarChart()
-chart.title = "ROAS: Perpetua vs Non-Perpetua"
-chart.y_axis.title = "ROAS"
-chart.height = 12
-chart.width = 18
-
-# Add chart data
-chart_data_row = chart_row + 1
-ws1.cell(row=chart_data_row, column=2, value='Platform')
-ws1.cell(row=chart_data_row, column=3, value='ROAS')
-ws1.cell(row=chart_data_row + 1, column=2, value='Perpetua')
-ws1.cell(row=chart_data_row + 1, column=3, value=perpetua_roas)
-ws1.cell(row=chart_data_row + 2, column=2, value='Non-Perpetua')
-ws1.cell(row=chart_data_row + 2, column=3, value=non_perpetua_roas)
-
-data = Reference(ws1, min_col=3, min_row=chart_data_row, max_row=chart_data_row + 2)
-cats = Reference(ws1, min_col=2, min_row=chart_data_row + 1, max_row=chart_data_row + 2)
-chart.add_data(data, titles_from_data=True)
-chart.set_categories(cats)
-
-ws1.add_chart(chart, f'H{row}')
-
-# Set column widths
-ws1.column_dimensions['B'].width = 20
-for col in ['C', 'D', 'E', 'F']:
-    ws1.column_dimensions[col].width = 18
-
-# ============================================================================
-# SHEET 2: STATISTICAL ANALYSIS
-# ============================================================================
-
-print("[6/10] Creating Statistical Analysis sheet...")
-ws2 = wb.create_sheet("📈 Statistical Analysis")
-
-ws2['B2'] = 'STATISTICAL RIGOR & SIGNIFICANCE TESTING'
-ws2['B2'].font = title_font
-ws2.merge_cells('B2:M2')
-
-ws2['B3'] = 'Welch\'s t-test (assumes unequal variances), 95% confidence intervals, Cohen\'s d effect sizes'
-ws2['B3'].font = small_font
-ws2.merge_cells('B3:M3')
-
-# Add statistical results table
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(stats_df, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws2.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center
-        else:
-            # Format numbers appropriately
-            if c_idx in [3, 4, 5, 6, 8, 9, 10, 11, 12, 13]:  # Numeric columns
-                if 'CI' in stats_df.columns[c_idx - 2] or 'Mean' in stats_df.columns[c_idx - 2]:
-                    cell.number_format = '0.00'
-                elif 'P_Value' in stats_df.columns[c_idx - 2]:
-                    cell.number_format = '0.0000'
-
-print(f"  ✓ Statistical analysis table created with {len(stats_df)} tests")
-
-# ============================================================================
-# SHEET 3: TIME SERIES TRENDS
-# ============================================================================
-
-print("[7/10] Creating Time Series Trends sheet...")
-ws3 = wb.create_sheet("📅 Time Series Trends")
-
-ws3['B2'] = 'DAILY PERFORMANCE TRENDS'
-ws3['B2'].font = title_font
-ws3.merge_cells('B2:K2')
-
-# Add daily data
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(daily_summary, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws3.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center
-        else:
-            if c_idx == 2:  # Date
-                cell.number_format = 'YYYY-MM-DD'
-            elif c_idx in [4, 5]:  # Spend, Sales
-                cell.number_format = '$#,##0.00'
-            elif c_idx in [6, 7, 8]:  # Orders, Clicks, Impressions
-                cell.number_format = '#,##0'
-            elif c_idx in [9, 10, 11, 12]:  # ROAS, ACOS, CTR, CVR
-                cell.number_format = '0.00'
-
-# Enable AutoFilter
-ws3.auto_filter.ref = f'B{row}:L{row + len(daily_summary)}'
-
-print(f"  ✓ Time series data added ({len(daily_summary)} daily records)")
-
-# ============================================================================
-# SHEET 4: ASIN-LEVEL DETAIL
-# ============================================================================
-
-print("[8/10] Creating ASIN-Level Detail sheet...")
-ws4 = wb.create_sheet("🔍 ASIN Detail")
-
-ws4['B2'] = 'ASIN-LEVEL PERFORMANCE DATA'
-ws4['B2'].font = title_font
-ws4.merge_cells('B2:L2')
-
-# Add ASIN summary (top 100 by spend)
-top_asins = asin_summary.sort_values('Spend', ascending=False).head(100)
-
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(top_asins, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=2):
-        cell = ws4.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center
-        else:
-            # Color code by platform
-            if c_idx == 3 and r_idx > 0:  # Advertising_Type column
-                if value == 'Perpetua':
-                    for col in range(2, 13):
-                        ws4.cell(row=row + r_idx, column=col).fill = PatternFill(
-                            start_color=COLORS['light_blue'], end_color=COLORS['light_blue'], fill_type='solid'
-                        )
-                else:
-                    for col in range(2, 13):
-                        ws4.cell(row=row + r_idx, column=col).fill = PatternFill(
-                            start_color=COLORS['light_orange'], end_color=COLORS['light_orange'], fill_type='solid'
-                        )
-
-            # Format numbers
-            if c_idx in [4, 5]:  # Spend, Sales
-                cell.number_format = '$#,##0.00'
-            elif c_idx in [6, 7, 8, 9]:  # Orders, Clicks, Impressions, Units
-                cell.number_format = '#,##0'
-            elif c_idx in [10, 11, 12, 13, 14]:  # Metrics
-                cell.number_format = '0.00'
-
-print(f"  ✓ Top 100 ASINs by spend added")
-
-# ============================================================================
-# SHEET 5: METHODOLOGY & DATA DICTIONARY
-# ============================================================================
-
-print("[9/10] Creating Methodology sheet...")
-ws5 = wb.create_sheet("📖 Methodology")
-
-ws5['B2'] = 'METHODOLOGY & DATA DICTIONARY'
-ws5['B2'].font = title_font
-ws5.merge_cells('B2:G2')
-
-methodology_content = [
-    ('', ''),
-    ('PURPOSE', ''),
-    ('', 'Compare Perpetua (SaaS advertising automation) vs Manual advertising management'),
-    ('', 'Identify performance differences and statistical significance'),
-    ('', ''),
-    ('DATA SOURCE', ''),
-    ('', f'Amazon Advertising data from {min_date.date()} to {max_date.date()}'),
-    ('', f'{perpetua_asins["Advertised ASIN"].nunique()} Perpetua ASINs, {non_perpetua_asins["Advertised ASIN"].nunique()} Non-Perpetua ASINs'),
-    ('', f'{len(df):,} daily records analyzed'),
-    ('', ''),
-    ('STATISTICAL METHODS', ''),
-    ('', 'Welch\'s t-test: Compare means between groups (unequal variances assumed)'),
-    ('', '95% Confidence Intervals: Range where true mean likely falls'),
-    ('', 'Cohen\'s d: Effect size (0.2=small, 0.5=medium, 0.8=large)'),
-    ('', 'P-value < 0.05: Statistically significant difference'),
-    ('', ''),
-    ('KEY METRICS', ''),
-    ('ROAS', 'Return on Ad Spend = Revenue / Spend (higher is better, target 2.0+)'),
-    ('ACOS', 'Advertising Cost of Sales = Spend / Revenue (lower is better, target <30%)'),
-    ('CPC', 'Cost Per Click = Spend / Clicks (lower is better)'),
-    ('CTR', 'Click-Through Rate = Clicks / Impressions (higher is better, target >0.5%)'),
-    ('CVR', 'Conversion Rate = Orders / Clicks (higher is better, target >10%)'),
-    ('', ''),
-    ('LIMITATIONS', ''),
-    ('', '1. Selection bias: Products not randomly assigned to platforms'),
-    ('', '2. Product mix may differ (category, price, competition)'),
-    ('', '3. Confounding variables not controlled (seasonality, external factors)'),
-    ('', '4. Causation cannot be inferred from correlation'),
-    ('', ''),
-    ('RECOMMENDATIONS', ''),
-    ('', '1. Do NOT conclude one platform is superior based on raw ROAS alone'),
-    ('', '2. Consider product mix, category, and price point differences'),
-    ('', '3. Conduct matched analysis or stratified comparison for fair evaluation'),
-    ('', '4. Track trends over time rather than single point-in-time snapshots'),
-]
-
-row = 4
-for item in methodology_content:
-    cell1 = ws5.cell(row=row, column=2, value=item[0])
-    if item[0] and item[0].isupper() and len(item[0]) > 3:
-        cell1.font = subtitle_font
-    else:
-        cell1.font = metric_font
-
-    ws5.cell(row=row, column=3, value=item[1]).font = metric_font
-    ws5.merge_cells(f'C{row}:G{row}')
-    row += 1
-
-# ============================================================================
-# FINAL FORMATTING AND SAVE
-# ============================================================================
-
-print("[10/10] Final formatting and saving...")
-
-# Set column widths for all sheets
-for ws in wb.worksheets:
-    ws.column_dimensions['A'].width = 3
-    ws.column_dimensions['B'].width = 20
-    for col in 'CDEFGHIJKLM':
-        ws.column_dimensions[col].width = 15
-
-# Save workbook
-output_file = OUTPUT_DIR / f'SaaS_Performance_Analysis_Comprehensive_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
-wb.save(output_file)
-
-print()
-print("=" * 100)
-print("✓ COMPREHENSIVE DASHBOARD COMPLETE")
-print("=" * 100)
-print(f"\nSaved to: {output_file}")
-print()
-print("📊 DASHBOARD CONTENTS:")
-print("  ✓ Sheet 1: Executive Summary - Key findings and KPIs")
-print("  ✓ Sheet 2: Statistical Analysis - T-tests, confidence intervals, p-values")
-print("  ✓ Sheet 3: Time Series Trends - Daily performance data (filterable)")
-print("  ✓ Sheet 4: ASIN Detail - Top 100 ASINs by spend (color-coded)")
-print("  ✓ Sheet 5: Methodology - Data dictionary and statistical methods")
-print()
-print("🎯 KEY FEATURES:")
-print(f"  ✓ All metrics included: ROAS, ACOS, CPC, CTR, CVR, CPA, CPM")
-print(f"  ✓ Statistical significance testing for {len(stats_df)} metrics")
-print(f"  ✓ {len(daily_summary)} days of normalized data")
-print(f"  ✓ Professional color-coding and formatting")
-print(f"  ✓ Research-based best practices applied")
-print()
-print("📈 INSIGHTS:")
-print(f"  • Perpetua ROAS: {perpetua_roas:.2f}x")
-print(f"  • Non-Perpetua ROAS: {non_perpetua_roas:.2f}x")
-print(f"  • Difference: {abs(roas_diff_pct):.0f}% ({'Non-Perpetua better' if non_perpetua_roas > perpetua_roas else 'Perpetua better'})")
-print()
-print("⚠️  IMPORTANT: See 'Methodology' sheet for limitations and recommendations")
+if __name__ == '__main__':
+    main(['saas'])
@@ -2,670 +2,10 @@
 """
 MASTER CONSOLIDATED DASHBOARD
 ALL insights, ALL metrics, ALL analysis in ONE Excel file with organized tabs
+Rendered by dashboard_engine.py from the 'master' spec in dashboard_specs.py.
 """
 
-import pandas as pd
-import numpy as np
-import json
-from pathlib import Path
-from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import BarChart, LineChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.datavalidation import DataValidation
+from dashboard_engine import main
 
-BASE_DIR = Path(__file__).parent.parent
-DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
-PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
-OUTPUT_DIR = BASE_DIR / 'outputs'
-
-print("=" * 100)
-print("MASTER CONSOLIDATED DASHBOARD - ALL INSIGHTS IN ONE FILE")
-print("=" * 100)
-print()
-
-# ============================================================================
-# LOAD ALL DATA SOURCES
-# ============================================================================
-
-print("[1/10] Loading all analysis results...")
-
-# TACoS data
-with open(OUTPUT_DIR / 'tacos_analysis_summary.json') as f:
-    tacos_data = json.load(f)
-
-# YoY data
-with open(OUTPUT_DIR / 'yoy_analysis.json') as f:
-    yoy_data = json.load(f)
-
-# Merged daily data
-merged = pd.read_csv(PROCESSED_DIR / 'orders_advertising_merged.csv', low_memory=False)
-merged['Date'] = pd.to_datetime(merged['Date'], errors='coerce')
-merged = merged[merged['Date'].notna()]
-
-# Calculate monthly
-merged['Month'] = merged['Date'].dt.to_period('M').astype(str)
-monthly = merged.groupby(['Month', 'Advertising_Type']).agg({
-    'Ad_Spend': 'sum',
-    'Ad_Sales': 'sum',
-    'Total_Revenue': 'sum',
-    'Organic_Sales': 'sum'
-}).reset_index()
-
-monthly['ROAS'] = monthly['Ad_Sales'] / monthly['Ad_Spend'].replace(0, np.nan)
-monthly['TACoS'] = (monthly['Ad_Spend'] / monthly['Total_Revenue'].replace(0, np.nan)) * 100
-monthly['T_ROAS'] = monthly['Total_Revenue'] / monthly['Ad_Spend'].replace(0, np.nan)
-monthly['Organic_Ratio'] = (monthly['Organic_Sales'] / monthly['Total_Revenue'].replace(0, np.nan)) * 100
-monthly = monthly.replace([np.inf, -np.inf], np.nan).fillna(0)
-
-print(f"  ✓ All data loaded")
-
-# Extract key metrics
-perpetua = tacos_data['perpetua']
-non_perpetua = tacos_data['non_perpetua']
-
-# ============================================================================
-# CREATE MASTER WORKBOOK
-# ============================================================================
-
-print("[2/10] Creating master workbook structure...")
-
-wb = Workbook()
-wb.remove(wb.active)
-
-# Professional colors
-COLORS = {
-    'perpetua': '4472C4', 'non_perpetua': 'ED7D31', 'header': '2F5496',
-    'excellent': '70AD47', 'good': '92D050', 'warning': 'FFC000',
-    'poor': 'C5504B', 'input': 'FFF2CC',
-    'light_blue': 'D9E1F2', 'light_orange': 'FCE4D6', 'context': 'F2F2F2'
-}
-
-# Styles
-header_fill = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
-header_font = Font(bold=True, color='FFFFFF', size=11)
-title_font = Font(bold=True, size=20, color=COLORS['header'])
-subtitle_font = Font(bold=True, size=14)
-section_font = Font(bold=True, size=12)
-center = Alignment(horizontal='center', vertical='center')
-wrap = Alignment(wrap_text=True, vertical='top')
-
-# ============================================================================
-# TAB 1: EXECUTIVE SUMMARY
-# ============================================================================
-
-print("[3/10] Creating Tab 1: Executive Summary...")
-ws1 = wb.create_sheet("1️⃣ Executive Summary")
-
-ws1['C2'] = 'PERPETUA PERFORMANCE ANALYSIS'
-ws1['C2'].font = title_font
-ws1['C2'].alignment = center
-ws1.merge_cells('C2:L2')
-
-ws1['C3'] = 'Complete Analysis: Advertising + Orders + YoY + TACoS + Correlation'
-ws1['C3'].font = Font(size=11, italic=True)
-ws1['C3'].alignment = center
-ws1.merge_cells('C3:L3')
-
-# KEY FINDINGS BOX
-row = 5
-ws1[f'C{row}'] = '🎯 TOP-LINE FINDINGS'
-ws1[f'C{row}'].font = Font(bold=True, size=15, color='FFFFFF')
-ws1[f'C{row}'].fill = PatternFill(start_color=COLORS['excellent'], end_color=COLORS['excellent'], fill_type='solid')
-ws1[f'C{row}'].alignment = center
-ws1.merge_cells(f'C{row}:L{row}')
-ws1.row_dimensions[row].height = 25
-
-findings = [
-    '✓ MASSIVE YoY IMPROVEMENT: December ROAS went from 0.84x (losing money) to 2.37x (+181%)',
-    '✓ PROVEN IMPACT: Perpetua ads drive organic sales (0.52 correlation, 1.39 elasticity)',
-    f'✓ TOTAL BUSINESS: $6.2M revenue, +10.5% YoY growth, both platforms contributing',
-    '✓ PLATFORM ROLES: Perpetua for growth products (6.1% TACoS), Non-Perpetua for mature (2.2% TACoS)',
-    f'⚠ CONTEXT CRITICAL: Different TACoS reflects product types, not platform failure'
-]
-
-for finding in findings:
-    row += 1
-    ws1[f'C{row}'] = finding
-    ws1[f'C{row}'].font = Font(size=11, bold=True)
-    ws1[f'C{row}'].alignment = wrap
-    ws1.merge_cells(f'C{row}:L{row}')
-    ws1.row_dimensions[row].height = 30
-
-# SUMMARY METRICS TABLE
-row += 3
-ws1[f'C{row}'] = 'COMPLETE METRICS SUMMARY'
-ws1[f'C{row}'].font = subtitle_font
-ws1[f'C{row}'].alignment = center
-ws1.merge_cells(f'C{row}:L{row}')
-
-row += 2
-headers = ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', 'Winner', 'Insight']
-for col, header in enumerate(headers, start=3):
-    cell = ws1.cell(row=row, column=col, value=header)
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = center
-
-row += 1
-
-# Consolidated metrics
-consolidated_metrics = [
-    ('📊 BUSINESS SCALE', '', '', '', '', ''),
-    ('Total Revenue (Orders)', perpetua['Total_Revenue'], non_perpetua['Total_Revenue'], '$', False, 'Total business impact'),
-    ('Ad Spend', perpetua['Ad_Spend'], non_perpetua['Ad_Spend'], '$', None, 'Investment level'),
-
-    ('', '', '', '', '', ''),
-    ('🎯 TACOS METRICS (Total Impact)', '', '', '', '', ''),
-    ('TACoS %', perpetua['TACoS'], non_perpetua['TACoS'], '%', True, 'Ad spend as % of total revenue'),
-    ('T-ROAS', perpetua['T_ROAS'], non_perpetua['T_ROAS'], 'x', False, 'Total return including organic'),
-    ('Organic Ratio %', perpetua['Organic_Ratio'], non_perpetua['Organic_Ratio'], '%', None, '% of sales from organic'),
-
-    ('', '', '', '', '', ''),
-    ('📈 AD METRICS (Direct)', '', '', '', '', ''),
-    ('Ad Sales', perpetua['Ad_Sales'], non_perpetua['Ad_Sales'], '$', False, '7-day attributed sales'),
-    ('ROAS', perpetua['Regular_ROAS'], non_perpetua['Regular_ROAS'], 'x', False, 'Ad-attributed return'),
-    ('ACOS', (perpetua['Ad_Spend']/perpetua['Ad_Sales']*100) if perpetua['Ad_Sales']>0 else 0,
-     (non_perpetua['Ad_Spend']/non_perpetua['Ad_Sales']*100) if non_perpetua['Ad_Sales']>0 else 0,
-     '%', True, 'Ad cost as % of ad sales'),
-]
-
-for item in consolidated_metrics:
-    if len(item) < 6:
-        row += 1
-        continue
-
-    metric_name, p_val, np_val, unit, lower_better, insight = item
-
-    if metric_name.startswith('📊') or metric_name.startswith('🎯') or metric_name.startswith('📈'):
-        ws1.cell(row=row, column=3, value=metric_name).font = Font(bold=True, size=12, color=COLORS['header'])
-        ws1.merge_cells(f'C{row}:H{row}')
-        row += 1
-        continue
-
-    if not metric_name:
-        row += 1
-        continue
-
-    # Metric name
-    ws1.cell(row=row, column=3, value=metric_name).font = Font(size=10)
-
-    # Values
-    if isinstance(p_val, (int, float)) and isinstance(np_val, (int, float)):
-        cell = ws1.cell(row=row, column=4, value=p_val)
-        if unit == '$':
-            cell.number_format = '$#,##0'
-        elif unit == '%':
-            cell.number_format = '0.0%'
-        elif unit == 'x':
-            cell.number_format = '0.00"x"'
-        else:
-            cell.number_format = '#,##0'
-
-        cell = ws1.cell(row=row, column=5, value=np_val)
-        if unit == '$':
-            cell.number_format = '$#,##0'
-        elif unit == '%':
-            cell.number_format = '0.0%'
-        elif unit == 'x':
-            cell.number_format = '0.00"x"'
-        else:
-            cell.number_format = '#,##0'
-
-        # Difference
-        diff = p_val - np_val
-        cell = ws1.cell(row=row, column=6, value=diff)
-        if unit == '$':
-            cell.number_format = '$#,##0;-$#,##0'
-        elif unit == '%':
-            cell.number_format = '0.0%;-0.0%'
-        else:
-            cell.number_format = '0.00;-0.00'
-
-        # Winner
-        if lower_better is not None:
-            if lower_better:
-                winner = 'Perpetua ✓' if p_val < np_val else 'Non-Perpetua ✓'
-                is_better = p_val < np_val
-            else:
-                winner = 'Perpetua ✓' if p_val > np_val else 'Non-Perpetua ✓'
-                is_better = p_val > np_val
-
-            cell = ws1.cell(row=row, column=7, value=winner)
-            cell.fill = PatternFill(
-                start_color=COLORS['perpetua'] if is_better else COLORS['non_perpetua'],
-                end_color=COLORS['perpetua'] if is_better else COLORS['non_perpetua'],
-                fill_type='solid'
-            )
-            cell.font = Font(bold=True, color='FFFFFF', size=9)
-            cell.alignment = center
-
-        # Insight
-        ws1.cell(row=row, column=8, value=insight).font = Font(size=8, italic=True)
-        ws1[f'H{row}'].alignment = wrap
-
-    row += 1
-
-# ============================================================================
-# TAB 2: YEAR-OVER-YEAR
-# ============================================================================
-
-print("[4/10] Creating Tab 2: Year-over-Year...")
-ws2 = wb.create_sheet("2️⃣ Year-over-Year")
-
-ws2['C2'] = 'YEAR-OVER-YEAR PERFORMANCE'
-ws2['C2'].font = title_font
-ws2['C2'].alignment = center
-ws2.merge_cells('C2:J2')
-
-ws2['C3'] = 'Comparing 2024 vs 2025/2026'
-ws2['C3'].font = Font(size=11, italic=True)
-ws2['C3'].alignment = center
-ws2.merge_cells('C3:J3')
-
-row = 5
-ws2[f'C{row}'] = 'DECEMBER COMPARISON'
-ws2[f'C{row}'].font = subtitle_font
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 1
-headers = ['Metric', '2024', '2025', 'Change $', 'Change %', 'Status']
-for col, h in enumerate(headers, start=3):
-    ws2.cell(row=row, column=col, value=h).fill = header_fill
-    ws2.cell(row=row, column=col).font = header_font
-    ws2.cell(row=row, column=col).alignment = center
-
-row += 1
-dec_data = [
-    ('Ad Spend', yoy_data['december']['2024']['Ad_Spend'], yoy_data['december']['2025']['Ad_Spend'], '$'),
-    ('Ad Sales', yoy_data['december']['2024']['Ad_Sales'], yoy_data['december']['2025']['Ad_Sales'], '$'),
-    ('ROAS', yoy_data['december']['2024']['ROAS'], yoy_data['december']['2025']['ROAS'], 'x'),
-]
-
-for name, val_24, val_25, unit in dec_data:
-    ws2.cell(row=row, column=3, value=name)
-
-    if unit == 'x':
-        ws2.cell(row=row, column=4, value=val_24).number_format = '0.00"x"'
-        ws2.cell(row=row, column=5, value=val_25).number_format = '0.00"x"'
-        ws2.cell(row=row, column=6, value=val_25 - val_24).number_format = '+0.00;-0.00'
-    else:
-        ws2.cell(row=row, column=4, value=val_24).number_format = '$#,##0'
-        ws2.cell(row=row, column=5, value=val_25).number_format = '$#,##0'
-        ws2.cell(row=row, column=6, value=val_25 - val_24).number_format = '$#,##0;-$#,##0'
-
-    pct = ((val_25 - val_24) / val_24 * 100) if val_24 != 0 else 0
-    ws2.cell(row=row, column=7, value=pct / 100).number_format = '+0%;-0%'
-
-    # Status with conditional formatting
-    if name == 'ROAS' and val_24 < 1.0:
-        status = f'Was LOSING $ → Now Profitable!'
-        color = COLORS['excellent']
-    elif pct > 0:
-        status = '✓ Improved'
-        color = COLORS['good']
-    else:
-        status = '✗ Declined'
-        color = COLORS['poor']
-
-    cell = ws2.cell(row=row, column=8, value=status)
-    cell.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
-    cell.font = Font(bold=True, color='FFFFFF', size=9)
-    cell.alignment = center
-
-    row += 1
-
-# January
-row += 2
-ws2[f'C{row}'] = 'JANUARY COMPARISON'
-ws2[f'C{row}'].font = subtitle_font
-ws2.merge_cells(f'C{row}:J{row}')
-
-row += 1
-for col, h in enumerate(headers, start=3):
-    ws2.cell(row=row, column=col, value=h).fill = header_fill
-    ws2.cell(row=row, column=col).font = header_font
-    ws2.cell(row=row, column=col).alignment = center
-
-row += 1
-jan_data = [
-    ('Ad Spend', yoy_data['january']['2024']['Ad_Spend'], yoy_data['january']['2026']['Ad_Spend'], '$'),
-    ('Ad Sales', yoy_data['january']['2024']['Ad_Sales'], yoy_data['january']['2026']['Ad_Sales'], '$'),
-    ('ROAS', yoy_data['january']['2024']['ROAS'], yoy_data['january']['2026']['ROAS'], 'x'),
-]
-
-for name, val_24, val_26, unit in jan_data:
-    ws2.cell(row=row, column=3, value=name)
-
-    if unit == 'x':
-        ws2.cell(row=row, column=4, value=val_24).number_format = '0.00"x"'
-        ws2.cell(row=row, column=5, value=val_26).number_format = '0.00"x"'
-        ws2.cell(row=row, column=6, value=val_26 - val_24).number_format = '+0.00;-0.00'
-    else:
-        ws2.cell(row=row, column=4, value=val_24).number_format = '$#,##0'
-        ws2.cell(row=row, column=5, value=val_26).number_format = '$#,##0'
-        ws2.cell(row=row, column=6, value=val_26 - val_24).number_format = '$#,##0;-$#,##0'
-
-    pct = ((val_26 - val_24) / val_24 * 100) if val_24 != 0 else 0
-    ws2.cell(row=row, column=7, value=pct / 100).number_format = '+0%;-0%'
-
-    status = '✓ Improved' if pct > 0 else '✗ Declined'
-    cell = ws2.cell(row=row, column=8, value=status)
-    cell.fill = PatternFill(start_color=COLORS['good'] if pct > 0 else COLORS['poor'],
-                           end_color=COLORS['good'] if pct > 0 else COLORS['poor'],
-                           fill_type='solid')
-    cell.font = Font(bold=True, color='FFFFFF', size=9)
-    cell.alignment = center
-
-    row += 1
-
-# ============================================================================
-# TAB 3: MONTH-OVER-MONTH TRENDS
-# ============================================================================
-
-print("[5/10] Creating Tab 3: Month-over-Month...")
-ws3 = wb.create_sheet("3️⃣ Month-over-Month")
-
-ws3['C2'] = 'MONTH-OVER-MONTH TRENDS'
-ws3['C2'].font = title_font
-ws3['C2'].alignment = center
-ws3.merge_cells('C2:M2')
-
-ws3['C3'] = 'October 2025 → January 2026 Monthly Progression'
-ws3['C3'].font = Font(size=11, italic=True)
-ws3['C3'].alignment = center
-ws3.merge_cells('C3:M3')
-
-# Add monthly data table
-row = 5
-for r_idx, row_data in enumerate(dataframe_to_rows(monthly, index=False, header=True)):
-    for c_idx, value in enumerate(row_data, start=3):
-        cell = ws3.cell(row=row + r_idx, column=c_idx, value=value)
-
-        if r_idx == 0:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center
-        else:
-            if c_idx in [5, 6, 7, 8]:  # Money columns
-                cell.number_format = '$#,##0'
-            elif c_idx in [9, 10, 11, 12]:  # Ratio columns
-                cell.number_format = '0.00'
-
-            # Color by platform
-            if value == 'Perpetua':
-                cell.fill = PatternFill(start_color=COLORS['light_blue'], end_color=COLORS['light_blue'], fill_type='solid')
-            elif value == 'Non-Perpetua':
-                cell.fill = PatternFill(start_color=COLORS['light_orange'], end_color=COLORS['light_orange'], fill_type='solid')
-
-# ============================================================================
-# TAB 4: TACoS DEEP DIVE
-# ============================================================================
-
-print("[6/10] Creating Tab 4: TACoS Analysis...")
-ws4 = wb.create_sheet("4️⃣ TACoS Analysis")
-
-ws4['C2'] = 'TACOS DEEP DIVE'
-ws4['C2'].font = title_font
-ws4['C2'].alignment = center
-ws4.merge_cells('C2:J2')
-
-ws4['C3'] = 'Total Advertising Cost of Sales - Business-Wide Efficiency'
-ws4['C3'].font = Font(size=11, italic=True)
-ws4['C3'].alignment = center
-ws4.merge_cells('C3:J3')
-
-row = 5
-ws4[f'C{row}'] = 'WHAT IS TACOS?'
-ws4[f'C{row}'].font = section_font
-ws4.merge_cells(f'C{row}:J{row}')
-
-tacos_explanation = [
-    ('TACoS Formula', 'Ad Spend / Total Revenue × 100'),
-    ('Difference from ACOS', 'ACOS uses ad sales only, TACoS uses ALL sales (organic + paid)'),
-    ('Why It Matters', 'Shows true advertising efficiency against total business'),
-    ('Benchmark', '5-10% excellent, 10-15% healthy, >20% concerning'),
-    ('', ''),
-    ('PERPETUA TACOS', f'{perpetua["TACoS"]:.1f}%'),
-    ('Interpretation', 'Growth mode - investing to build market share'),
-    ('', ''),
-    ('NON-PERPETUA TACOS', f'{non_perpetua["TACoS"]:.1f}%'),
-    ('Interpretation', 'Maintenance mode - established organic performers'),
-]
-
-for label, value in tacos_explanation:
-    row += 1
-    ws4.cell(row=row, column=3, value=label).font = Font(bold=True if label.isupper() or 'TACOS' in label else False, size=10)
-    ws4.cell(row=row, column=5, value=value).font = Font(size=10)
-    ws4.merge_cells(f'E{row}:J{row}')
-
-# ============================================================================
-# TAB 5: CORRELATION ANALYSIS
-# ============================================================================
-
-print("[7/10] Creating Tab 5: Correlation Analysis...")
-ws5 = wb.create_sheet("5️⃣ Ad→Organic Proof")
-
-ws5['C2'] = 'DOES ADVERTISING DRIVE ORGANIC SALES?'
-ws5['C2'].font = title_font
-ws5['C2'].alignment = center
-ws5.merge_cells('C2:J2')
-
-row = 4
-ws5[f'C{row}'] = '✅ ANSWER: YES - STATISTICALLY PROVEN FOR PERPETUA'
-ws5[f'C{row}'].font = Font(bold=True, size=14, color=COLORS['excellent'])
-ws5[f'C{row}'].alignment = center
-ws5.merge_cells(f'C{row}:J{row}')
-
-correlation_findings = [
-    ('', ''),
-    ('PERPETUA', ''),
-    ('Correlation Coefficient', '0.52 (strong positive, p<0.01)'),
-    ('Statistical Significance', 'YES - relationship is real, not random'),
-    ('Elasticity', '1.39 (1% ad spend increase → 1.39% organic increase)'),
-    ('Practical Meaning', 'Every $1,000 more in ad spend → ~$1,390 more in organic sales'),
-    ('', ''),
-    ('NON-PERPETUA', ''),
-    ('Correlation Coefficient', '0.10 (weak, not significant)'),
-    ('Statistical Significance', 'NO - no proven relationship'),
-    ('Explanation', 'Products already organic-strong, ads have minimal incremental impact'),
-]
-
-for label, value in correlation_findings:
-    row += 1
-    ws5.cell(row=row, column=3, value=label).font = Font(bold=True if label.isupper() else False, size=10)
-    ws5.cell(row=row, column=5, value=value).font = Font(size=10)
-    ws5.merge_cells(f'E{row}:J{row}')
-
-# ============================================================================
-# TAB 6: STRATEGIC CONTEXT
-# ============================================================================
-
-print("[8/10] Creating Tab 6: Strategic Context...")
-ws6 = wb.create_sheet("6️⃣ Strategic Context")
-
-ws6['C2'] = 'STRATEGIC CONTEXT & INTERPRETATION'
-ws6['C2'].font = title_font
-ws6['C2'].alignment = center
-ws6.merge_cells('C2:K2')
-
-context_sections = [
-    ('', ''),
-    ('🎯 THE COMPLETE STORY', ''),
-    ('2024 Baseline', 'December 2024: Losing money (0.84x ROAS), January 2024: Marginal (1.25x)'),
-    ('2025-2026 Performance', 'Dramatic improvement: +48% to +181% ROAS gains, now consistently profitable'),
-    ('Platform Roles', 'Perpetua manages growth/competitive products, Non-Perpetua manages mature/organic-strong'),
-    ('TACoS Difference', 'Reflects product lifecycle, not platform failure'),
-    ('Organic Impact', 'Perpetua ads PROVEN to drive organic sales (0.52 correlation, 1.39 elasticity)'),
-    ('Total Business', '$6.2M revenue, +10.5% YoY growth - BOTH platforms contributing'),
-
-    ('', ''),
-    ('⚠️ CRITICAL INTERPRETATIONS', ''),
-    ('Lower ROAS at Scale', 'Perpetua operates at 4.4x higher ad spend - diminishing returns expected and normal'),
-    ('Higher TACoS', '6.1% vs 2.2% reflects growth vs maintenance strategy, not inefficiency'),
-    ('Organic Ratio Gap', 'Non-Perpetua 94% organic means products sell well anyway (ads supplemental)'),
-    ('Perpetua Value', '88% organic shows ads creating flywheel, plus manages $3.8M in revenue'),
-
-    ('', ''),
-    ('💰 DOLLAR-QUANTIFIED OPPORTUNITIES', ''),
-    ('From Earlier Analysis', '$128K in Non-Perpetua losing campaigns vs $35K Perpetua (pause losers)'),
-    ('YoY Momentum', 'Ride the +48-181% improvement wave, don\'t disrupt'),
-    ('Organic Optimization', 'Perpetua 1.39 elasticity means each $10K ad increase = $13.9K organic boost'),
-
-    ('', ''),
-    ('🎯 RECOMMENDATIONS', ''),
-    ('1. HIGH PRIORITY', 'Continue current platform assignments - working correctly'),
-    ('2. HIGH PRIORITY', 'Pause identified losing campaigns (saves $90K+)'),
-    ('3. MEDIUM', 'Invest more in Perpetua high-performers (1.39x organic multiplier proven)'),
-    ('4. STRATEGIC', 'Track TACoS monthly - target <6% for mature products'),
-]
-
-row = 4
-for label, text in context_sections:
-    row += 1
-    if label.startswith('🎯') or label.startswith('⚠️') or label.startswith('💰'):
-        ws6.cell(row=row, column=3, value=label).font = Font(bold=True, size=13, color=COLORS['header'])
-        ws6.merge_cells(f'C{row}:K{row}')
-    elif label:
-        ws6.cell(row=row, column=3, value=label).font = Font(bold=True, size=10)
-        ws6.cell(row=row, column=5, value=text).font = Font(size=10)
-        ws6.merge_cells(f'E{row}:K{row}')
-        ws6[f'E{row}'].alignment = wrap
-    else:
-        ws6.cell(row=row, column=3, value='')
-
-# ============================================================================
-# TAB 7: ALL METRICS REFERENCE
-# ============================================================================
-
-print("[9/10] Creating Tab 7: All Metrics Reference...")
-ws7 = wb.create_sheet("7️⃣ All Metrics")
-
-ws7['C2'] = 'COMPLETE METRICS REFERENCE'
-ws7['C2'].font = title_font
-ws7['C2'].alignment = center
-ws7.merge_cells('C2:J2')
-
-row = 4
-headers = ['Metric', 'Formula', 'Perpetua', 'Non-Perpetua', 'Benchmark']
-for col, h in enumerate(headers, start=3):
-    ws7.cell(row=row, column=col, value=h).fill = header_fill
-    ws7.cell(row=row, column=col).font = header_font
-    ws7.cell(row=row, column=col).alignment = center
-
-row += 1
-
-all_metrics_ref = [
-    ('TACoS', 'Ad Spend / Total Revenue', f'{perpetua["TACoS"]:.1f}%', f'{non_perpetua["TACoS"]:.1f}%', '5-15%'),
-    ('T-ROAS', 'Total Revenue / Ad Spend', f'{perpetua["T_ROAS"]:.1f}x', f'{non_perpetua["T_ROAS"]:.1f}x', '>5x'),
-    ('ROAS', 'Ad Sales / Ad Spend', f'{perpetua["Regular_ROAS"]:.2f}x', f'{non_perpetua["Regular_ROAS"]:.2f}x', '>2.0x'),
-    ('ACOS', 'Ad Spend / Ad Sales', f'{(perpetua["Ad_Spend"]/perpetua["Ad_Sales"]*100):.1f}%', f'{(non_perpetua["Ad_Spend"]/non_perpetua["Ad_Sales"]*100):.1f}%', '<30%'),
-    ('Organic Ratio', 'Organic / Total Revenue', f'{perpetua["Organic_Ratio"]:.1f}%', f'{non_perpetua["Organic_Ratio"]:.1f}%', '60-80%'),
-]
-
-for metric, formula, p_val, np_val, benchmark in all_metrics_ref:
-    ws7.cell(row=row, column=3, value=metric).font = Font(bold=True, size=10)
-    ws7.cell(row=row, column=4, value=formula).font = Font(size=9, italic=True)
-    ws7.cell(row=row, column=5, value=p_val).font = Font(size=10)
-    ws7.cell(row=row, column=6, value=np_val).font = Font(size=10)
-    ws7.cell(row=row, column=7, value=benchmark).font = Font(size=9)
-    row += 1
-
-# Set column widths for all sheets
-for ws in [ws1, ws2, ws3, ws4, ws5, ws6, ws7]:
-    ws.column_dimensions['A'].width = 2
-    ws.column_dimensions['B'].width = 2
-    ws.column_dimensions['C'].width = 30
-    for col in 'DEFGHIJKLM':
-        ws.column_dimensions[col].width = 16
-
-# ============================================================================
-# SAVE MASTER DASHBOARD
-# ============================================================================
-
-print("[10/10] Saving master consolidated dashboard...")
-output_file = OUTPUT_DIR / f'Perpetua_MASTER_Complete_{datetime.now().strftime("%Y%m%d_%H%M")}.xlsx'
-wb.save(output_file)
-
-# Create summary document
-summary = f"""
-MASTER CONSOLIDATED DASHBOARD - COMPLETE ANALYSIS
-================================================
-
-File: {output_file.name}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-7 COMPREHENSIVE TABS:
-====================
-
-1. Executive Summary - Top findings + complete metrics table
-2. Year-over-Year - 2024 vs 2025/2026 comparison
-3. Month-over-Month - Oct→Nov→Dec→Jan trends
-4. TACoS Analysis - Total business efficiency metrics
-5. Ad→Organic Proof - Correlation analysis showing ads drive organic
-6. Strategic Context - Complete story + interpretations + recommendations
-7. All Metrics Reference - Formulas + benchmarks + current values
-
-KEY INSIGHTS CONSOLIDATED:
-=========================
-
-YoY PERFORMANCE:
-✓ December: 0.84x → 2.37x ROAS (+181% improvement!)
-✓ January: 1.25x → 1.85x ROAS (+48% improvement)
-
-ORGANIC SALES CORRELATION:
-✓ Perpetua: 0.52 correlation (p<0.01) - PROVEN!
-✓ Elasticity: 1.39 (1% ad spend → 1.39% organic increase)
-✓ Non-Perpetua: 0.10 (no significant relationship)
-
-TACOS METRICS:
-✓ Perpetua: 6.1% TACoS, 16.4x T-ROAS, 88% organic
-✓ Non-Perpetua: 2.2% TACoS, 46x T-ROAS, 94% organic
-
-BUSINESS RESULTS:
-✓ Total revenue: $6.2M (from order data)
-✓ YoY growth: +10.5% (Jan 2026 vs Jan 2025)
-✓ Both platforms contributing to success
-
-ALL METRICS INCLUDED:
-====================
-✓ TACoS, T-ROAS, Organic Ratio, Organic Lift
-✓ ROAS, ACOS, CPC, CTR, CVR, CPA, CPM, AOV
-✓ YoY comparisons (2024 vs 2025/2026)
-✓ MoM trends (Oct→Nov→Dec→Jan)
-✓ Statistical correlations
-✓ Strategic context and recommendations
-
-DATA SOURCES INTEGRATED:
-=======================
-✓ Campaign Report (83K+ records)
-✓ Advertised Products Report (130K+ records)
-✓ Order Report File 1 (209K+ order lines)
-✓ Order Report File 2 (222K+ order lines)
-✓ ASIN/SKU mapping lists
-✓ Last year's baseline data
-
-TOTAL: 644K+ records analyzed and consolidated
-"""
-
-with open(OUTPUT_DIR / 'MASTER_DASHBOARD_SUMMARY.txt', 'w') as f:
-    f.write(summary)
-
-print()
-print("=" * 100)
-print("✓ MASTER CONSOLIDATED DASHBOARD COMPLETE")
-print("=" * 100)
-print(f"\nFile: {output_file.name}")
-print("\n📊 7 TABS WITH ALL INSIGHTS:")
-print("  1️⃣ Executive Summary - Complete story at a glance")
-print("  2️⃣ Year-over-Year - 2024 vs 2025/2026 (+48% to +181%!)")
-print("  3️⃣ Month-over-Month - Seasonal trends and progression")
-print("  4️⃣ TACoS Analysis - Total business efficiency")
-print("  5️⃣ Ad→Organic Proof - Correlation 0.52, elasticity 1.39")
-print("  6️⃣ Strategic Context - Complete validated story")
-print("  7️⃣ All Metrics - Reference table with formulas")
-print()
-print("✅ NO CONFLICTS - All insights aggregated and organized")
-print("✅ ALL earlier findings preserved and included")
-print("✅ Research-based + statistically validated")
+if __name__ == '__main__':
+    main(['master'])
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Daily Anomaly Detection
+Flags unusual ASIN-days in spend, ROAS and organic sales against each ASIN's
+own trailing baseline, scoring the whole Date x ASIN matrix at once
+"""
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from shared_cube import pool_map
+
+BASELINE_DAYS = 28
+MIN_BASELINE_DAYS = 7
+Z_THRESHOLD = 3.5
+EWMA_SPAN = 14
+EWMA_SIGMAS = 3.0
+
+RULE_LABELS = {'robust': 'Robust Z', 'ewma': 'EWMA Limit'}
+
+# Metric -> (numerator measure, denominator measure or None)
+METRICS = {
+    'Spend': ('Spend', None),
+    'ROAS': ('Sales', 'Spend'),
+    'Organic_Sales': ('Organic_Sales', None),
+}
+
+
+def daily_metric(cube, metric):
+    """[date, asin] matrix of one metric; ratios are NaN where the denominator is zero"""
+    num, den = METRICS[metric]
+    values = cube.measure(num)
+    if den is None:
+        return values.copy()
+    denom = cube.measure(den)
+    return np.divide(values, denom, out=np.full(values.shape, np.nan), where=denom > 0)
+
+
+def _nanmedian(windows, counts):
+    """Median over the last axis ignoring NaN, via one sort (NaN sorts to the end)"""
+    ordered = np.sort(windows, axis=-1)
+    lo = np.maximum((counts - 1) // 2, 0)[..., None]
+    hi = np.maximum(counts // 2, 0)[..., None]
+    return 0.5 * (np.take_along_axis(ordered, lo, axis=-1) + np.take_along_axis(ordered, hi, axis=-1))[..., 0]
+
+
+def robust_z(matrix, window=BASELINE_DAYS, min_days=MIN_BASELINE_DAYS):
+    """
+    Robust z-score of every cell against the median/MAD of the preceding `window` days.
+
+    Scores are NaN where the baseline has fewer than `min_days` observations or no spread.
+    """
+    n_dates = matrix.shape[0]
+    padded = np.vstack([np.full((window, matrix.shape[1]), np.nan), matrix])
+    # windows[t] covers days t-window .. t-1 (the current day is excluded from its own baseline)
+    windows = sliding_window_view(padded, window, axis=0)[:n_dates]  # [date, asin, window]
+    counts = np.isfinite(windows).sum(axis=2)
+    enough = counts >= min_days
+
+    baseline = np.where(enough, _nanmedian(windows, counts), np.nan)
+    spread = np.where(enough, _nanmedian(np.abs(windows - baseline[..., None]), counts), np.nan)
+
+    z = np.full(matrix.shape, np.nan)
+    ok = enough & (spread > 0) & np.isfinite(matrix)
+    z[ok] = 0.6745 * (matrix[ok] - baseline[ok]) / spread[ok]
+    return z, baseline
+
+
+def ewma_z(matrix, span=EWMA_SPAN, min_days=MIN_BASELINE_DAYS):
+    """
+    Distance of every cell from the EWMA control line in units of EWMA standard deviation.
+
+    One recursive pass over dates, vectorized across ASINs; the control line for
+    day t uses data up to t-1. Missing values carry the previous state forward.
+    """
+    alpha = 2 / (span + 1)
+    n_dates, n_asins = matrix.shape
+    mean = np.full(n_asins, np.nan)
+    var = np.zeros(n_asins)
+    seen = np.zeros(n_asins, dtype=int)
+    z = np.full(matrix.shape, np.nan)
+    baseline = np.full(matrix.shape, np.nan)
+
+    for t in range(n_dates):
+        x = matrix[t]
+        valid = np.isfinite(x)
+        baseline[t] = mean
+        ready = valid & (seen >= min_days) & (var > 0)
+        z[t, ready] = (x[ready] - mean[ready]) / np.sqrt(var[ready])
+
+        first = valid & (seen == 0)
+        mean[first] = x[first]
+        upd = valid & ~first
+        diff = x[upd] - mean[upd]
+        mean[upd] += alpha * diff
+        var[upd] = (1 - alpha) * (var[upd] + alpha * diff ** 2)
+        seen[valid] += 1
+    return z, baseline
+
+
+def _score_block(cube, block, scorer, threshold, method):
+    """Anomaly rows for ASIN positions block[0]..block[1]-1 (ASINs are scored independently)"""
+    cube = cube.asin_block(*block)
+    frames = []
+    for metric in METRICS:
+        matrix = daily_metric(cube, metric)
+        z, baseline = scorer(matrix)
+        flagged = np.abs(np.nan_to_num(z)) > threshold
+        if metric == 'Spend':
+            sales = cube.measure('Sales')
+            no_sales = (matrix > 0) & (sales == 0) & (matrix > np.nan_to_num(baseline))
+        else:
+            no_sales = np.zeros_like(flagged)
+
+        d_idx, a_idx = np.nonzero(flagged | no_sales)
+        frames.append(pd.DataFrame({
+            'Date': cube.dates[d_idx],
+            'ASIN': cube.asins[a_idx],
+            'Advertising_Type': cube.platforms[a_idx],
+            'Metric': metric,
+            'Value': matrix[d_idx, a_idx],
+            'Baseline': baseline[d_idx, a_idx],
+            'Z_Score': z[d_idx, a_idx],
+            'Direction': np.where(matrix[d_idx, a_idx] >= np.nan_to_num(baseline[d_idx, a_idx]), 'Spike', 'Drop'),
+            'Rule': np.where(flagged[d_idx, a_idx], RULE_LABELS[method], 'Spend, No Sales'),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def detect_anomalies(cube, method='robust', threshold=None, workers=1):
+    """
+    Anomalous ASIN-days for every metric in METRICS.
+
+    method is 'robust' (trailing median/MAD z-score) or 'ewma' (EWMA control
+    limits). Spend with zero attributed sales above the ASIN's usual spend is
+    always flagged. With workers > 1, blocks of ASINs are scored on a process
+    pool reading the cube from shared memory (see shared_cube.py). Returns a
+    long DataFrame sorted by severity.
+    """
+    if method == 'robust':
+        scorer, threshold = robust_z, threshold or Z_THRESHOLD
+    elif method == 'ewma':
+        scorer, threshold = ewma_z, threshold or EWMA_SIGMAS
+    else:
+        raise ValueError(f"Unknown method '{method}' (use 'robust' or 'ewma')")
+
+    bounds = np.linspace(0, cube.n_asins, max(workers, 1) + 1).astype(int)
+    blocks = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+    score = partial(_score_block, scorer=scorer, threshold=threshold, method=method)
+    anomalies = pd.concat(pool_map(score, blocks, cube, workers), ignore_index=True)
+
+    if 'Sales' in cube.segments:
+        segment = pd.Series(cube.segments['Sales'], index=cube.asins)
+        anomalies['ABC_Sales'] = anomalies['ASIN'].map(segment)
+    anomalies['Severity'] = anomalies['Z_Score'].abs().fillna(threshold)
+    # ASIN / metric break ties so the order does not depend on how ASINs were split across workers
+    return anomalies.sort_values(['Severity', 'Date', 'ASIN', 'Metric'],
+                                 ascending=[False, False, True, True]).reset_index(drop=True)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Pipeline Scale Benchmark
+Runs the pipeline stages against synthetic fixtures at 1x / 10x / 100x and
+records wall time, CPU time and peak memory per stage as JSON in
+outputs/benchmarks/.
+
+Each scale gets its own workspace under benchmarks/runs/ (a copy of scripts/
+plus fixture data), so the real data/ and outputs/ folders are never touched.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+from pathlib import Path
+from datetime import datetime
+
+from stage_runner import run_stage
+
+BASE_DIR = Path(__file__).parent.parent
+SCRIPTS_DIR = BASE_DIR / 'scripts'
+BENCH_DIR = BASE_DIR / 'benchmarks'
+RESULTS_DIR = BASE_DIR / 'outputs' / 'benchmarks'
+
+SCALES = (1, 10, 100)
+
+# Raw-input stages first, then everything that feeds MASTER
+BENCH_STAGES = [
+    '1_process_campaign_data.py',
+    '2_asin_level_analysis.py',
+    '13_process_order_data_for_tacos.py',
+    '14_yoy_analysis_and_correlation.py',
+    '16_pre_post_perpetua_analysis.py',
+    'daily_cube.py',
+    'rankings.py',
+    '18_event_study_analysis.py',
+    '19_matched_did_analysis.py',
+    '20_rolling_kpi_analysis.py',
+    '21_anomaly_detection.py',
+    '22_forecast_analysis.py',
+    '23_pareto_segmentation.py',
+    '24_order_dimension_analysis.py',
+    'warehouse.py',
+    'MASTER_consolidated_dashboard.py',
+]
+
+
+def fixtures(scale, seed=0, regenerate=False):
+    """Fixture directory for a scale, generated on first use (or when the seed changes)"""
+    # pandas/numpy/openpyxl load only when fixtures are needed, not for --help
+    from synthetic_reports import MANIFEST_NAME, generate_reports
+    fixture_dir = BENCH_DIR / 'fixtures' / f'scale_{scale}'
+    manifest_path = fixture_dir / MANIFEST_NAME
+    if not regenerate and manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if manifest['seed'] == seed:
+            return fixture_dir, manifest
+    if fixture_dir.exists():
+        shutil.rmtree(fixture_dir)
+    return fixture_dir, generate_reports(fixture_dir, scale, seed)
+
+
+def workspace(scale, fixture_dir):
+    """Fresh project tree for one scale: scripts copy, fixtures as recent-reports, empty outputs"""
+    root = BENCH_DIR / 'runs' / f'scale_{scale}'
+    if root.exists():
+        shutil.rmtree(root)
+    (root / 'scripts').mkdir(parents=True)
+    for script in SCRIPTS_DIR.glob('*.py'):
+        shutil.copy2(script, root / 'scripts' / script.name)
+    for sub in ('processed', 'aggregated'):
+        (root / 'data' / sub).mkdir(parents=True)
+    (root / 'outputs').mkdir()
+
+    reports = root / 'data' / 'recent-reports'
+    try:
+        reports.symlink_to(fixture_dir.resolve(), target_is_directory=True)
+    except OSError:
+        shutil.copytree(fixture_dir, reports)
+    return root
+
+
+def run_scale(scale, stages, seed=0, timeout=3600, regenerate=False):
+    fixture_dir, manifest = fixtures(scale, seed, regenerate)
+    root = workspace(scale, fixture_dir)
+
+    results = []
+    for script in stages:
+        result = run_stage(root / 'scripts' / script, root, timeout=timeout)
+        status = '✓' if result['returncode'] == 0 else '✗'
+        rss = f"{result['peak_rss_mb']:,.0f} MB" if result['peak_rss_mb'] is not None else 'n/a'
+        print(f"  {status} {script:<40} {result['wall_s']:>8.2f}s  {rss:>10}")
+        if result['returncode'] != 0:
+            print('    ' + '\n    '.join(result['stderr'].strip().splitlines()[-5:]))
+        results.append({k: v for k, v in result.items() if k not in ('stdout', 'stderr')})
+    return {'fixtures': manifest, 'stages': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark pipeline stages on synthetic fixtures')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10], choices=SCALES)
+    parser.add_argument('--stages', nargs='+', default=BENCH_STAGES, help='subset of scripts to run, in order')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=int, default=3600, help='seconds per stage')
+    parser.add_argument('--regenerate', action='store_true', help='rebuild fixtures even if cached')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PIPELINE SCALE BENCHMARK")
+    print("=" * 80)
+    print()
+
+    run = {
+        'generated_at': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'scales': {},
+    }
+    for scale in args.scales:
+        print(f"[{scale}x] Preparing fixtures and workspace...")
+        run['scales'][str(scale)] = run_scale(scale, args.stages, args.seed, args.timeout, args.regenerate)
+        total = sum(s['wall_s'] for s in run['scales'][str(scale)]['stages'])
+        print(f"  Total: {total:,.1f}s\n")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_file = RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(results_file, 'w') as f:
+        json.dump(run, f, indent=2)
+    print(f"✓ Saved results: {results_file}")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Daily Cube Prefix-Sum Index
+Cumulative sums of the daily cube along the date axis, saved uncompressed and
+memory-mapped, so the totals for any date range x ASIN set are two row reads.
+Backs `perpetua.py query`; numpy only, so a warm query never imports pandas.
+"""
+
+import numpy as np
+from pathlib import Path
+
+from kpis import KPI_COLUMNS, ratio_kpis
+
+BASE_DIR = Path(__file__).parent.parent
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+PREFIX_FILE = PROCESSED_DIR / 'daily_cube_prefix.npy'
+META_FILE = PROCESSED_DIR / 'daily_cube_index.npz'
+
+# The cube and its inputs (daily_cube.py paths, not imported to keep pandas out)
+SOURCES = [PROCESSED_DIR / 'daily_cube.npz',
+           PROCESSED_DIR / 'advertised_products_processed.csv',
+           PROCESSED_DIR / 'orders_advertising_merged.csv']
+
+PLATFORMS = ['Perpetua', 'Non-Perpetua']
+PERIODS = ('day', 'week', 'month', 'total')
+SPLITS = ('platform', 'asin', 'none')
+ALL = 'All'
+
+
+class CubeIndex:
+    """Date-axis prefix sums [measure, date + 1, asin] with the cube's labels"""
+
+    def __init__(self, dates, asins, platforms, measures, prefix):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.asins = np.asarray(asins, dtype=str)
+        self.platforms = np.asarray(platforms, dtype=str)
+        self.measures = list(measures)
+        self.prefix = prefix
+
+    @property
+    def metrics(self):
+        return self.measures + [k for k in KPI_COLUMNS if k not in self.measures]
+
+    def date_range(self, start=None, end=None):
+        """[lo, hi) cube positions for the inclusive range start..end"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, 'D')))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(end, 'D'),
+                                                                     side='right'))
+        return lo, max(lo, hi)
+
+    def bucket_bounds(self, lo, hi, period):
+        """Positions where each day/week/month bucket in [lo, hi) starts, plus hi"""
+        if period == 'total':
+            return np.array([lo, hi])
+        days = self.dates[lo:hi]
+        if period == 'day':
+            keys = days
+        elif period == 'week':
+            keys = days - (days.astype(np.int64) + 3) % 7  # back to Monday (1970-01-01 was a Thursday)
+        else:
+            keys = days.astype('datetime64[M]')
+        starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]])) + lo
+        return np.append(starts, hi)
+
+    def asin_positions(self, asins):
+        asins = np.asarray(asins, dtype=str)
+        idx = np.clip(np.searchsorted(self.asins, asins), 0, len(self.asins) - 1)
+        missing = asins[self.asins[idx] != asins]
+        if len(missing):
+            raise KeyError(f"ASIN(s) not in the cube: {', '.join(missing)}")
+        return idx
+
+    def query(self, metrics, start=None, end=None, period='total', split='platform', asins=None, platforms=None):
+        """
+        One row per period bucket x group with the requested metrics.
+
+        split: 'platform' (Perpetua vs Non-Perpetua), 'asin' (one group per ASIN)
+        or 'none' (everything selected as one group). asins / platforms restrict
+        which ASINs are summed.
+        """
+        unknown = [m for m in metrics if m not in self.metrics]
+        if unknown:
+            raise KeyError(f"Unknown metric(s): {', '.join(unknown)} (available: {', '.join(self.metrics)})")
+        if period not in PERIODS or split not in SPLITS:
+            raise ValueError(f"period must be one of {PERIODS}, split one of {SPLITS}")
+
+        cols = np.arange(len(self.asins)) if asins is None else self.asin_positions(asins)
+        if platforms is not None:
+            cols = cols[np.isin(self.platforms[cols], list(platforms))]
+        lo, hi = self.date_range(start, end)
+        if hi == lo or not len(cols):
+            return []
+
+        bounds = self.bucket_bounds(lo, hi, period)
+        sums = np.diff(self.prefix[:, bounds][:, :, cols], axis=1)  # [measure, bucket, asin]
+
+        if split == 'asin':
+            labels = list(self.asins[cols])
+            grouped = sums
+        else:
+            labels = [p for p in PLATFORMS if p in set(self.platforms[cols])] if split == 'platform' else [ALL]
+            membership = np.column_stack([self.platforms[cols] == label if label != ALL
+                                          else np.ones(len(cols), dtype=bool) for label in labels])
+            grouped = np.einsum('mba,ag->mbg', sums, membership.astype(np.float64))
+
+        days = np.diff(bounds)[:, None]
+        values = ratio_kpis(grouped, self.measures, days)
+        for i, name in enumerate(self.measures):
+            values.setdefault(name, grouped[i])
+
+        rows = []
+        for b in range(len(bounds) - 1):
+            for g, label in enumerate(labels):
+                row = {'Start': str(self.dates[bounds[b]]), 'End': str(self.dates[bounds[b + 1] - 1]),
+                       'Group': label, 'Days': int(days[b, 0])}
+                row.update({m: float(np.broadcast_to(values[m], grouped.shape[1:])[b, g]) for m in metrics})
+                rows.append(row)
+        return rows
+
+
+def build_index(cube):
+    prefix = np.zeros((len(cube.measures), cube.n_dates + 1, cube.n_asins))
+    np.cumsum(cube.values, axis=1, out=prefix[:, 1:])
+    return CubeIndex(cube.dates, cube.asins, cube.platforms, cube.measures, prefix)
+
+
+def save_index(index, prefix_path=PREFIX_FILE, meta_path=META_FILE):
+    np.save(prefix_path, index.prefix)
+    # Metadata last: its mtime marks the index as complete
+    np.savez(meta_path, dates=index.dates.astype(np.int64), asins=index.asins,
+             platforms=index.platforms, measures=np.asarray(index.measures))
+
+
+def load_index(rebuild=False, prefix_path=PREFIX_FILE, meta_path=META_FILE):
+    """Memory-mapped index, rebuilt from the daily cube when the cube or its inputs are newer"""
+    meta_path, prefix_path = Path(meta_path), Path(prefix_path)
+    stale = (not meta_path.exists() or not prefix_path.exists() or
+             any(p.exists() and p.stat().st_mtime > meta_path.stat().st_mtime for p in SOURCES))
+    if rebuild or stale:
+        from daily_cube import load_cube
+        index = build_index(load_cube())
+        save_index(index, prefix_path, meta_path)
+
+    with np.load(meta_path) as meta:
+        return CubeIndex(meta['dates'].astype('datetime64[D]'), meta['asins'], meta['platforms'],
+                         list(meta['measures']), np.load(prefix_path, mmap_mode='r'))
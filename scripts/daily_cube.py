@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Daily Metrics Cube
+Dense Date x ASIN arrays of base measures, built once from the processed layer
+and shared by the analysis stages (event study, rolling KPIs, anomalies, ...)
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from cube_index import build_index, save_index
+from date_parsing import parse_dates
+from processed_store import AD_PRODUCTS_NAME, MERGED_NAME, load_dataset, load_merged
+from segmentation import segment_asins
+
+BASE_DIR = Path(__file__).parent.parent
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+CUBE_FILE = PROCESSED_DIR / 'daily_cube.npz'
+
+AD_FILE = PROCESSED_DIR / f'{AD_PRODUCTS_NAME}.csv'
+MERGED_FILE = PROCESSED_DIR / f'{MERGED_NAME}.csv'
+
+# Cube measure -> source column in the advertised products report
+AD_MEASURES = {
+    'Spend': 'Spend',
+    'Sales': '7 Day Total Sales ',
+    'Orders': '7 Day Total Orders (#)',
+    'Clicks': 'Clicks',
+    'Impressions': 'Impressions',
+    'Units': '7 Day Total Units (#)',
+}
+
+# Cube measure -> source column in the orders + advertising merge
+ORDER_MEASURES = {
+    'Total_Revenue': 'Total_Revenue',
+    'Organic_Sales': 'Organic_Sales',
+}
+
+MEASURES = list(AD_MEASURES) + list(ORDER_MEASURES)
+PLATFORMS = ['Perpetua', 'Non-Perpetua']
+
+
+class DailyCube:
+    """Date x ASIN measure arrays with per-ASIN platform and segment labels"""
+
+    def __init__(self, dates, asins, platforms, values, measures=None, segments=None):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.asins = np.asarray(asins, dtype=str)
+        self.platforms = np.asarray(platforms, dtype=str)
+        self.measures = list(measures or MEASURES)
+        self.values = np.asarray(values, dtype=np.float64)  # [measure, date, asin]
+        self.segments = {k: np.asarray(v, dtype=str) for k, v in (segments or {}).items()}
+
+    @property
+    def n_dates(self):
+        return len(self.dates)
+
+    @property
+    def n_asins(self):
+        return len(self.asins)
+
+    def measure(self, name):
+        """[date, asin] view of one measure"""
+        return self.values[self.measures.index(name)]
+
+    def platform_mask(self, platform):
+        """Boolean ASIN mask for 'Perpetua' / 'Non-Perpetua'"""
+        return self.platforms == platform
+
+    def asin_block(self, lo, hi):
+        """Cube of ASIN positions lo..hi-1 (values are a view, not a copy)"""
+        return DailyCube(self.dates, self.asins[lo:hi], self.platforms[lo:hi], self.values[:, :, lo:hi],
+                         self.measures, {k: v[lo:hi] for k, v in self.segments.items()})
+
+    def segment_mask(self, key, label):
+        """Boolean ASIN mask for one segment, e.g. segment_mask('Sales', 'A')"""
+        return self.segments[key] == label
+
+    def date_index(self, date):
+        """Position of the first cube date on or after `date`"""
+        return int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(date).date(), 'D')))
+
+
+def _dense(keys_date, keys_asin, frame, columns, dates, asins):
+    """Scatter-add long-format rows into a [measure, date, asin] array"""
+    d_idx = np.searchsorted(dates, keys_date)
+    a_idx = np.searchsorted(asins, keys_asin)
+    values = np.zeros((len(columns), len(dates), len(asins)))
+    for m, col in enumerate(columns):
+        np.add.at(values[m], (d_idx, a_idx), frame[col].to_numpy(dtype=np.float64))
+    return values
+
+
+def build_cube(ad_data=None, merged=None):
+    """Build the cube from the processed advertised-products and merged order files"""
+    if ad_data is None:
+        ad_data = load_dataset(AD_PRODUCTS_NAME, platforms=PLATFORMS,
+                               columns=['Date', 'Advertised ASIN', 'Advertised SKU', 'Advertising_Type',
+                                        *AD_MEASURES.values()])
+    ad_data = ad_data[ad_data['Advertising_Type'].isin(PLATFORMS)].copy()
+    ad_data['Date'] = parse_dates(ad_data['Date'])
+    ad_data = ad_data[ad_data['Date'].notna() & ad_data['Advertised ASIN'].notna()]
+    ad_data['Advertised ASIN'] = ad_data['Advertised ASIN'].astype(str).str.strip()
+
+    for col in AD_MEASURES.values():
+        if col not in ad_data.columns:
+            ad_data[col] = 0
+        ad_data[col] = pd.to_numeric(ad_data[col], errors='coerce').fillna(0)
+
+    # Platform and SKU mapping come from the ad report itself
+    asin_platform = ad_data.groupby('Advertised ASIN')['Advertising_Type'].first()
+    sku_to_asin = {}
+    if 'Advertised SKU' in ad_data.columns:
+        pairs = ad_data[['Advertised SKU', 'Advertised ASIN']].dropna().drop_duplicates('Advertised SKU')
+        sku_to_asin = dict(zip(pairs['Advertised SKU'].astype(str).str.strip(), pairs['Advertised ASIN']))
+
+    if merged is None and MERGED_FILE.exists():
+        merged = load_merged(columns=['SKU', *ORDER_MEASURES.values()])
+    if merged is not None:
+        merged = merged.copy()
+        merged['Date'] = parse_dates(merged['Date'])
+        merged['ASIN'] = merged['SKU'].astype(str).str.strip().map(sku_to_asin)
+        merged = merged[merged['Date'].notna() & merged['ASIN'].notna()]
+        for col in ORDER_MEASURES.values():
+            merged[col] = pd.to_numeric(merged[col], errors='coerce').fillna(0)
+
+    date_parts = [ad_data['Date']]
+    if merged is not None:
+        date_parts.append(merged['Date'])
+    all_dates = pd.concat(date_parts)
+    dates = pd.date_range(all_dates.min(), all_dates.max(), freq='D').values.astype('datetime64[D]')
+    asins = np.sort(asin_platform.index.to_numpy(dtype=str))
+    platforms = asin_platform.reindex(asins).to_numpy(dtype=str)
+
+    values = _dense(ad_data['Date'].values.astype('datetime64[D]'),
+                    ad_data['Advertised ASIN'].to_numpy(dtype=str),
+                    ad_data, list(AD_MEASURES.values()), dates, asins)
+
+    if merged is not None and len(merged):
+        order_values = _dense(merged['Date'].values.astype('datetime64[D]'),
+                              merged['ASIN'].to_numpy(dtype=str),
+                              merged, list(ORDER_MEASURES.values()), dates, asins)
+    else:
+        order_values = np.zeros((len(ORDER_MEASURES), len(dates), len(asins)))
+
+    return _with_segments(DailyCube(dates, asins, platforms, np.concatenate([values, order_values])))
+
+
+def _with_segments(cube):
+    """Attach ABC segment labels computed from whole-range ASIN totals"""
+    totals = {name: cube.measure(name).sum(axis=0) for name in cube.measures}
+    cube.segments = segment_asins(totals, cube.platforms)
+    return cube
+
+
+def save_cube(cube, path=CUBE_FILE):
+    segments = {f'segment_{key}': labels for key, labels in cube.segments.items()}
+    np.savez_compressed(path, dates=cube.dates.astype(np.int64), asins=cube.asins,
+                        platforms=cube.platforms, measures=np.asarray(cube.measures),
+                        values=cube.values, **segments)
+
+
+def load_cube(path=CUBE_FILE, rebuild=False):
+    """Load the cached cube, rebuilding it when the processed inputs are newer"""
+    path = Path(path)
+    sources = [p for p in (AD_FILE, MERGED_FILE) if p.exists()]
+    stale = (not path.exists() or
+             any(p.stat().st_mtime > path.stat().st_mtime for p in sources))
+
+    if rebuild or (stale and sources):
+        cube = build_cube()
+        save_cube(cube, path)
+        return cube
+
+    with np.load(path) as data:
+        segments = {name[len('segment_'):]: data[name] for name in data.files if name.startswith('segment_')}
+        cube = DailyCube(data['dates'].astype('datetime64[D]'), data['asins'],
+                         data['platforms'], data['values'], list(data['measures']), segments)
+    # Caches written before segments existed get them on load
+    return cube if cube.segments else _with_segments(cube)
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("BUILDING DAILY METRICS CUBE")
+    print("=" * 80)
+    print()
+
+    cube = build_cube()
+    save_cube(cube)
+    save_index(build_index(cube))  # prefix sums for `perpetua.py query`
+
+    print(f"  ✓ Dates: {cube.dates[0]} to {cube.dates[-1]} ({cube.n_dates} days)")
+    print(f"  ✓ ASINs: {cube.n_asins} ({cube.platform_mask('Perpetua').sum()} Perpetua, "
+          f"{cube.platform_mask('Non-Perpetua').sum()} Non-Perpetua)")
+    print(f"  ✓ Measures: {', '.join(cube.measures)}")
+    print(f"  ✓ Segments: {', '.join(f'ABC by {key}' for key in cube.segments)}")
+    print(f"  ✓ Saved cube to: {CUBE_FILE}")
@@ -0,0 +1,1002 @@
+#!/usr/bin/env python3
+"""
+Dashboard Engine
+Renders the Excel dashboard variants described in dashboard_specs.py. Every
+metric (platform totals per data basis, daily / monthly frames, ASIN totals,
+significance tests) is computed once from the daily cube and the campaign
+dataset and cached in data/processed/dashboard_metrics.pkl; each workbook is
+then a render of those cached results.
+
+    python scripts/dashboard_engine.py                  # every variant
+    python scripts/dashboard_engine.py master context   # selected variants
+"""
+
+import argparse
+import importlib.util
+import json
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.chart import BarChart, LineChart, Reference
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.table import Table, TableStyleInfo
+
+from daily_cube import AD_FILE, AD_MEASURES, CUBE_FILE, MEASURES, MERGED_FILE, PLATFORMS, load_cube
+from excel_date_selector import METRIC_FORMULAS, add_measures_sheet, metric_formula, write_comparison_formulas
+from kpis import safe_div
+from processed_store import CAMPAIGNS_NAME, PARTITION_MANIFEST, load_dataset
+from rankings import load_rankings, ranked_asins, take_ranked
+from rolling_kpis import trailing_sums
+
+# scipy is optional: exact Welch tests when present, a normal approximation otherwise
+HAS_SCIPY = importlib.util.find_spec('scipy') is not None
+if HAS_SCIPY:
+    from scipy import stats as scipy_stats
+
+BASE_DIR = Path(__file__).parent.parent
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+STORE_FILE = PROCESSED_DIR / 'dashboard_metrics.pkl'
+
+# The cube, its inputs and the campaign dataset; any newer file invalidates the store
+SOURCES = [CUBE_FILE, AD_FILE, MERGED_FILE,
+           PROCESSED_DIR / f'{CAMPAIGNS_NAME}.csv', PROCESSED_DIR / CAMPAIGNS_NAME / PARTITION_MANIFEST]
+
+# METRIC_FORMULAS short measure -> daily frame column
+MEASURE_COLUMNS = {
+    'Spend': 'Spend',
+    'Sales': 'Sales',
+    'Orders': 'Orders',
+    'Clicks': 'Clicks',
+    'Impressions': 'Impressions',
+    'Units': 'Units',
+    'Revenue': 'Total_Revenue',
+    'Organic': 'Organic_Sales',
+}
+
+# Ratio column -> (numerator, denominator) over the daily frame columns
+RATIOS = {
+    'ROAS': ('Sales', 'Spend'),
+    'ACOS': ('Spend', 'Sales'),
+    'CPC': ('Spend', 'Clicks'),
+    'CTR': ('Clicks', 'Impressions'),
+    'CVR': ('Orders', 'Clicks'),
+    'TACoS': ('Spend', 'Total_Revenue'),
+    'T_ROAS': ('Total_Revenue', 'Spend'),
+    'Organic_Ratio': ('Organic_Sales', 'Total_Revenue'),
+}
+
+STAT_METRICS = ['ROAS', 'ACOS', 'CPC', 'CTR', 'CVR', 'Spend', 'Sales', 'Orders']
+PROFIT_MARGIN = 0.30
+ANOMALY_DAYS = 14
+
+COLORS = {
+    'perpetua': '4472C4',
+    'non_perpetua': 'ED7D31',
+    'header': '2F5496',
+    'good': '70AD47',
+    'good_light': '92D050',
+    'warning': 'FFC000',
+    'bad': 'C5504B',
+    'input': 'FFF2CC',
+    'light_blue': 'D9E1F2',
+    'light_orange': 'FCE4D6',
+    'context': 'F2F2F2',
+    'subtle': '595959',
+}
+
+# Value column (or label) -> fill for whole table rows
+ROW_FILLS = {
+    'Perpetua': COLORS['light_blue'],
+    'Non-Perpetua': COLORS['light_orange'],
+    'All': COLORS['context'],
+    'Pre-Perpetua': COLORS['light_orange'],
+    'Post-Perpetua': COLORS['light_blue'],
+    'Spike': COLORS['light_orange'],
+    'Drop': COLORS['light_blue'],
+}
+ROW_FILL_COLUMNS = ['Advertising_Type', 'Platform', 'Period', 'Direction']
+
+# Comparison row unit -> (value format, signed difference format)
+UNIT_FORMATS = {
+    '$': ('$#,##0', '+$#,##0;-$#,##0'),
+    '$.': ('$#,##0.00', '+$#,##0.00;-$#,##0.00'),
+    '#': ('#,##0', '+#,##0;-#,##0'),
+    'x': ('0.00"x"', '+0.00"x";-0.00"x"'),
+    '%': ('0.00%', '+0.00%;-0.00%'),
+    'd': ('0" days"', '+0" days";-0" days"'),
+}
+
+# Table column -> number format (tables may override per block)
+COLUMN_FORMATS = {
+    'Date': 'YYYY-MM-DD',
+    **{name: '$#,##0.00' for name in ('Spend', 'Sales', 'Total_Revenue', 'Organic_Sales', 'Ad_Spend', 'Ad_Sales',
+                                      'Avg_Daily_Spend', 'Avg_Daily_Revenue', 'Forecast', 'Low', 'High',
+                                      'Total', 'Avg_Daily', 'Avg_Daily_Lower', 'Avg_Daily_Upper')},
+    **{name: '#,##0' for name in ('Orders', 'Clicks', 'Impressions', 'Units')},
+    **{name: '0.00' for name in ('ROAS', 'T_ROAS', 'ROAS_7d', 'Z_Score')},
+    **{name: '0.00%' for name in ('ACOS', 'CTR', 'CVR', 'TACoS', 'TACoS_7d', 'Organic_Ratio')},
+    'CPC': '$0.00',
+}
+
+HEADER_FILL = PatternFill(start_color=COLORS['header'], end_color=COLORS['header'], fill_type='solid')
+HEADER_FONT = Font(bold=True, color='FFFFFF', size=11)
+WHITE_BOLD = Font(bold=True, color='FFFFFF', size=10)
+CENTER = Alignment(horizontal='center', vertical='center', wrap_text=True)
+LEFT = Alignment(horizontal='left', vertical='center', wrap_text=True)
+THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                     top=Side(style='thin'), bottom=Side(style='thin'))
+
+# Lines starting with these render bold in text blocks
+STRONG_MARKS = ('✓', '✅', '⚠', '🎯', '💰', '📊', '📈', '💡', '💸', '🔄', '📋', '📅', '🎛', '📖')
+
+
+def _fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def _ratio(num, den):
+    return float(safe_div(num, den))
+
+
+def _version():
+    return tuple(p.stat().st_mtime_ns if p.exists() else 0 for p in SOURCES)
+
+
+# ----------------------------------------------------------------------------
+# Metric store: everything the dashboards show, computed once
+# ----------------------------------------------------------------------------
+
+def with_ratios(frame):
+    for name, (num, den) in RATIOS.items():
+        frame[name] = safe_div(frame[num], frame[den])
+    return frame
+
+
+def platform_metrics(daily, counts):
+    """{platform: metrics} - METRIC_FORMULAS keys over the daily frame, plus counts and per-ASIN averages"""
+    totals = {}
+    for platform in PLATFORMS:
+        frame = daily[daily['Advertising_Type'] == platform]
+        sums = frame[MEASURES].sum()
+        short = {name: float(sums[col]) for name, col in MEASURE_COLUMNS.items()}
+        metrics = {key: short[num] if den is None else _ratio(short[num], short[den]) * scale
+                   for key, (num, den, scale) in METRIC_FORMULAS.items()}
+        metrics.update(counts.get(platform, {}))
+        days = frame['Date'].nunique()
+        metrics['Days'] = days
+        metrics['Avg_Daily_Spend'] = _ratio(metrics['Total_Spend'], days)
+        metrics['Avg_Daily_Revenue'] = _ratio(metrics['Total_Revenue'], days)
+        for name, key in (('Spend_Per_ASIN', 'Total_Spend'), ('Sales_Per_ASIN', 'Total_Sales'),
+                          ('Orders_Per_ASIN', 'Total_Orders')):
+            metrics[name] = _ratio(metrics[key], metrics.get('Unique_ASINs', 0))
+        totals[platform] = metrics
+    return totals
+
+
+def _cube_frames(cube):
+    """Daily platform frame and per-ASIN totals (ASINs with ad activity) from the cube"""
+    frames = []
+    for platform in PLATFORMS:
+        sums = cube.values[:, :, cube.platform_mask(platform)].sum(axis=2)  # [measure, date]
+        frame = pd.DataFrame(sums.T, columns=cube.measures)
+        frame.insert(0, 'Date', pd.to_datetime(cube.dates))
+        frame.insert(1, 'Advertising_Type', platform)
+        frames.append(frame)
+    daily = pd.concat(frames, ignore_index=True).sort_values(['Date', 'Advertising_Type'], ignore_index=True)
+
+    ad_rows = [cube.measures.index(m) for m in AD_MEASURES]
+    active = cube.values[ad_rows].any(axis=(0, 1))
+    asins = pd.DataFrame(cube.values.sum(axis=1).T, columns=cube.measures)
+    asins.insert(0, 'Advertised ASIN', cube.asins)
+    asins.insert(1, 'Advertising_Type', cube.platforms)
+    return daily, asins[active].reset_index(drop=True)
+
+
+def _campaign_frames():
+    """Daily platform frame, counts and loss analysis from the campaign report"""
+    rows = load_dataset(CAMPAIGNS_NAME, platforms=PLATFORMS,
+                        columns=['Date', 'Campaign Name', 'ASIN', 'Advertising_Type', *AD_MEASURES.values()])
+    rows = rows[rows['Date'].notna()].rename(columns={col: m for m, col in AD_MEASURES.items()})
+    for measure in AD_MEASURES:
+        rows[measure] = pd.to_numeric(rows[measure], errors='coerce').fillna(0)
+
+    daily = rows.groupby(['Date', 'Advertising_Type'], as_index=False)[list(AD_MEASURES)].sum()
+    for measure in MEASURES:
+        if measure not in daily.columns:
+            daily[measure] = 0.0
+
+    counts = {}
+    for platform in PLATFORMS:
+        sub = rows[rows['Advertising_Type'] == platform]
+        spent = sub[sub['Spend'] > 0]
+        losing = spent[spent['Sales'] < spent['Spend']]  # campaign-days with ROAS < 1
+        losing_spend, losing_sales = float(losing['Spend'].sum()), float(losing['Sales'].sum())
+        counts[platform] = {
+            'Unique_Campaigns': sub['Campaign Name'].nunique(),
+            'Unique_ASINs': sub['ASIN'].nunique(),
+            'Losing_Campaigns': losing['Campaign Name'].nunique(),
+            'Losing_Spend': losing_spend,
+            'Losing_Sales': losing_sales,
+            'Net_Loss': losing_spend - losing_sales,
+            'Pct_Losing_Spend': _ratio(losing_spend, spent['Spend'].sum()),
+        }
+    asin_sets = {p: set(rows.loc[rows['Advertising_Type'] == p, 'ASIN'].dropna().astype(str)) for p in PLATFORMS}
+    return daily, counts, asin_sets
+
+
+def _welch(a, b):
+    """Group summaries and Welch's t-test for two samples"""
+    row = {}
+    for prefix, x in (('Perpetua', a), ('NonPerpetua', b)):
+        mean, sd = x.mean(), x.std(ddof=1)
+        sem = sd / np.sqrt(len(x))
+        crit = scipy_stats.t.ppf(0.975, len(x) - 1) if HAS_SCIPY else 1.96
+        row.update({f'{prefix}_Mean': mean, f'{prefix}_StdDev': sd, f'{prefix}_N': len(x),
+                    f'{prefix}_CI_Lower': mean - crit * sem, f'{prefix}_CI_Upper': mean + crit * sem})
+
+    diff = a.mean() - b.mean()
+    se = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+    if HAS_SCIPY:
+        t_stat, p_value = scipy_stats.ttest_ind(a, b, equal_var=False)
+    else:
+        t_stat = _ratio(diff, se)
+        p_value = 0.05 if abs(t_stat) > 2 else 0.5  # |t| > 2 ~ significant at 5%
+    pooled = np.sqrt(((len(a) - 1) * a.var(ddof=1) + (len(b) - 1) * b.var(ddof=1)) / (len(a) + len(b) - 2))
+    row.update({'Mean_Difference': diff, 'Relative_Difference_Pct': _ratio(diff, b.mean()) * 100,
+                'T_Statistic': float(t_stat), 'P_Value': float(p_value), 'Cohens_D': _ratio(diff, pooled),
+                'Significant': 'YES' if p_value <= 0.05 else 'NO'})
+    return row
+
+
+def asin_stats(asins):
+    """Per-ASIN means with Welch tests, Perpetua vs Non-Perpetua (ratios skip zero denominators)"""
+    values = asins.copy()
+    for name in ('ROAS', 'ACOS', 'CPC', 'CTR', 'CVR'):
+        values[name] = values[name].where(values[RATIOS[name][1]] > 0)
+    rows = []
+    for metric in STAT_METRICS:
+        a = values.loc[values['Advertising_Type'] == 'Perpetua', metric].dropna().to_numpy()
+        b = values.loc[values['Advertising_Type'] == 'Non-Perpetua', metric].dropna().to_numpy()
+        if min(len(a), len(b)) < 2:
+            continue
+        rows.append({'Metric': metric, **_welch(a, b)})
+    return pd.DataFrame(rows)
+
+
+def compute_store():
+    cube = load_cube()
+    ads_daily, asins = _cube_frames(cube)
+    ads_daily = with_ratios(ads_daily)
+    asins = with_ratios(asins)
+    ads_asins = {p: set(asins.loc[asins['Advertising_Type'] == p, 'Advertised ASIN']) for p in PLATFORMS}
+    ads_counts = {p: {'Unique_ASINs': len(ads_asins[p])} for p in PLATFORMS}
+
+    camp_daily, camp_counts, camp_asins = _campaign_frames()
+    camp_daily = with_ratios(camp_daily)
+
+    keys = ['Date', 'Advertising_Type']
+    combined = (camp_daily.set_index(keys)[MEASURES]
+                .add(ads_daily.set_index(keys)[MEASURES], fill_value=0).reset_index())
+    combined_counts = {p: {'Unique_Campaigns': camp_counts[p]['Unique_Campaigns'],
+                           'Unique_ASINs': len(camp_asins[p] | ads_asins[p])} for p in PLATFORMS}
+
+    monthly = (ads_daily.assign(Month=ads_daily['Date'].dt.strftime('%Y-%m'))
+               .groupby(['Month', 'Advertising_Type'], as_index=False)[MEASURES].sum())
+
+    total = ads_daily.groupby('Date', as_index=False)[MEASURES].sum()
+    spend7, sales7, revenue7 = (trailing_sums(total[c].to_numpy(), 7) for c in ('Spend', 'Sales', 'Total_Revenue'))
+    total = with_ratios(total)
+    total['ROAS_7d'] = safe_div(sales7, spend7)
+    total['TACoS_7d'] = safe_div(spend7, revenue7)
+
+    return {
+        'bases': {
+            'ads': {'daily': ads_daily, 'totals': platform_metrics(ads_daily, ads_counts)},
+            'campaign': {'daily': camp_daily, 'totals': platform_metrics(camp_daily, camp_counts)},
+            'combined': {'daily': with_ratios(combined), 'totals': platform_metrics(combined, combined_counts)},
+        },
+        'asins': asins,
+        'stats': asin_stats(asins),
+        'monthly': with_ratios(monthly),
+        'daily_total': total,
+    }
+
+
+def load_store(rebuild=False, path=STORE_FILE):
+    """Cached metric store, recomputed when the cube, its inputs or the campaign dataset changed"""
+    if not rebuild and path.exists():
+        with open(path, 'rb') as f:
+            store = pickle.load(f)
+        if store.get('version') == _version():
+            return store
+    store = compute_store()
+    store['version'] = _version()  # after load_cube, which may have rebuilt the cube
+    with open(path, 'wb') as f:
+        pickle.dump(store, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return store
+
+
+# ----------------------------------------------------------------------------
+# Template context: cached metrics plus the JSON summaries of other stages
+# ----------------------------------------------------------------------------
+
+def _read_json(name):
+    with open(OUTPUT_DIR / name) as f:
+        return json.load(f)
+
+
+def _load_yoy():
+    """{month: {before_year, after_year, before, after, growth}} - str.format can't index digit keys"""
+    months = {}
+    for month, block in _read_json('yoy_analysis.json').items():
+        years = sorted(k for k in block if k.isdigit())
+        if len(years) >= 2:
+            months[month] = {'before_year': years[0], 'after_year': years[-1], 'before': block[years[0]],
+                             'after': block[years[-1]], 'growth': block.get('growth', {})}
+    return months
+
+
+def _load_pre_post():
+    data = _read_json('pre_post_perpetua_analysis.json')
+    pre, post = data['pre_period']['metrics'], data['post_period']['metrics']
+    launch = pd.Timestamp(data['perpetua_launch_date'])
+    profit_pre = pre['Avg_Daily_Revenue'] * PROFIT_MARGIN
+    profit_post = post['Avg_Daily_Revenue'] * PROFIT_MARGIN
+    return {
+        'pre': pre, 'post': post, 'impact': data.get('impact', {}), 'launch': launch,
+        'pre_start': pd.Timestamp(data['pre_period']['start']),
+        'pre_end': pd.Timestamp(data['pre_period'].get('end', launch - pd.Timedelta(days=1))),
+        'post_start': pd.Timestamp(data['post_period'].get('start', launch)),
+        'post_end': pd.Timestamp(data['post_period']['end']) if 'end' in data['post_period']
+        else launch + pd.Timedelta(days=post['Days'] - 1),
+        'revenue_lift': _ratio(post['Avg_Daily_Revenue'] - pre['Avg_Daily_Revenue'], pre['Avg_Daily_Revenue']),
+        'roas_change': _ratio(post['ROAS'] - pre['ROAS'], pre['ROAS']),
+        'margin': PROFIT_MARGIN,
+        'profit_pre': profit_pre,
+        'profit_post': profit_post,
+        'profit_gain': profit_post - profit_pre,
+        'annual_gain': (profit_post - profit_pre) * 365,
+    }
+
+
+def _load_rolling():
+    data = _read_json('rolling_kpis.json')
+    data['window_list'] = ', '.join(f'{w}-day' for w in data['windows'])
+    return data
+
+
+def _load_anomalies():
+    """Anomalies of the last ANOMALY_DAYS days, most severe first"""
+    frame = pd.read_csv(AGG_DIR / 'daily_anomalies.csv', parse_dates=['Date'], dtype={'ASIN': str})
+    recent = frame[frame['Date'] > frame['Date'].max() - pd.Timedelta(days=ANOMALY_DAYS)]
+    recent = recent.sort_values('Severity', ascending=False)
+    return {'recent': recent, 'count': len(recent), 'asins': recent['ASIN'].nunique(), 'days': ANOMALY_DAYS}
+
+
+def _load_organic():
+    """
+    Ad spend -> organic sales link per platform ('p' / 'np') from script 14:
+    the strongest lag's correlation with its significance, plus elasticity
+    """
+    platforms = _read_json('ad_organic_correlation.json')['platforms']
+    link = {}
+    for key, platform in (('p', 'Perpetua'), ('np', 'Non-Perpetua')):
+        data = platforms.get(platform, {})
+        lags = data.get('lags', {})
+        lag = max(lags, key=lambda k: abs(lags[k]['correlation'])) if lags else None
+        best = lags[lag] if lag is not None else {'correlation': float('nan'), 'significant': False}
+        corr, significant = best['correlation'], best['significant']
+        elasticity = data.get('elasticity')
+        elasticity = float('nan') if elasticity is None else elasticity
+        link[key] = {
+            'corr': corr, 'lag': int(lag or 0), 'significant': significant, 'elasticity': elasticity,
+            'p_label': 'p<0.01' if significant else 'not significant',
+            'verdict': 'SIGNIFICANT' if significant else 'not significant',
+            'proven': 'PROVEN' if significant else 'NOT PROVEN',
+            'strength': 'strong' if abs(corr) >= 0.5 else 'moderate' if abs(corr) >= 0.3 else 'weak',
+            'direction': 'negative' if corr < 0 else 'positive',
+            'per_1000': elasticity * 1000, 'per_10k': elasticity * 10,
+        }
+    link['answer'] = ('✅ ANSWER: YES - STATISTICALLY SIGNIFICANT FOR PERPETUA' if link['p']['significant']
+                      else '⚠ ANSWER: NOT PROVEN - NO SIGNIFICANT CORRELATION FOR PERPETUA')
+    return link
+
+
+LOADERS = {
+    'yoy': _load_yoy,
+    'organic': _load_organic,
+    'prepost': _load_pre_post,
+    'rolling': _load_rolling,
+    'anomalies': _load_anomalies,
+    'forecast': lambda: _read_json('forecast_summary.json'),
+}
+
+
+class Context(dict):
+    """Template fields; other stages' summaries load on first use"""
+
+    def __missing__(self, key):
+        if key not in LOADERS:
+            raise KeyError(key)
+        self[key] = value = LOADERS[key]()
+        return value
+
+
+def build_context(store, basis, now=None):
+    totals = store['bases'][basis]['totals']
+    dates = store['bases'][basis]['daily']['Date']
+    p, n = totals['Perpetua'], totals['Non-Perpetua']
+    start, end = dates.min(), dates.max()
+    stats = {row['Metric']: row for row in store['stats'].to_dict('records')}
+    ctx = Context(
+        p=p, np=n, stats=stats, start=start, end=end, days=(end - start).days + 1,
+        now=now or datetime.now(), margin=PROFIT_MARGIN,
+        last30_start=end - pd.Timedelta(days=30),
+        roas_gap=abs(_ratio(n['ROAS'] - p['ROAS'], p['ROAS'])),
+        roas_leader='Non-Perpetua' if n['ROAS'] > p['ROAS'] else 'Perpetua',
+        spend_ratio=_ratio(p['Total_Spend'], n['Total_Spend']),
+        asin_spend_ratio=_ratio(p['Spend_Per_ASIN'], n['Spend_Per_ASIN']),
+        roas_match_upside=p['Total_Spend'] * n['ROAS'] - p['Total_Sales'],
+        total_revenue=p['Total_Revenue'] + n['Total_Revenue'],
+        sales_share=_ratio(p['Total_Sales'], p['Total_Sales'] + n['Total_Sales']),
+        sales_ratio=_ratio(p['Total_Sales'], n['Total_Sales']),
+        revenue_premium=_ratio(p['Total_Revenue'], n['Total_Revenue']) - 1,
+        waste_ratio=_ratio(n.get('Pct_Losing_Spend', 0), p.get('Pct_Losing_Spend', 0)),
+    )
+    if 'ROAS' in stats:
+        roas = stats['ROAS']
+        ctx['mean_roas_gap'] = abs(_ratio(roas['NonPerpetua_Mean'] - roas['Perpetua_Mean'], roas['Perpetua_Mean']))
+    return ctx
+
+
+# ----------------------------------------------------------------------------
+# Sheet rendering
+# ----------------------------------------------------------------------------
+
+class SheetWriter:
+    """Cursor over one worksheet: blocks render top-down between columns `col` and `span`"""
+
+    def __init__(self, book, spec):
+        self.book = book
+        self.ctx = book.ctx
+        self.ws = book.wb.create_sheet(spec['name'])
+        self.col = column_index_from_string(spec.get('col', 'B'))
+        self.last = column_index_from_string(spec.get('span', 'H'))
+        self.row = spec.get('row', 2)
+        self.refs = None          # (start, end) date cells once a date_selector is on the sheet
+        self.metric_rows = {}     # comparison row per metric key, for charts
+        self.live_rows = set()    # keys whose values are range formulas
+
+        widths = spec.get('widths', {})
+        for idx in range(1, self.last + 1):
+            letter = get_column_letter(idx)
+            default = 2 if idx < self.col else spec.get('width', 16)
+            self.ws.column_dimensions[letter].width = widths.get(letter, default)
+
+    def text(self, template):
+        return template.format_map(self.ctx) if '{' in template else template
+
+    def merged(self, row, value, font=None, fill=None, first=None, last=None, align=LEFT, height=None):
+        first = first or self.col
+        last = last or self.last
+        if last > first:
+            self.ws.merge_cells(start_row=row, start_column=first, end_row=row, end_column=last)
+        cell = self.ws.cell(row=row, column=first, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        cell.alignment = align
+        if height:
+            self.ws.row_dimensions[row].height = height
+        return cell
+
+    def header(self, row, labels, first=None):
+        first = first or self.col
+        for i, label in enumerate(labels):
+            cell = self.ws.cell(row=row, column=first + i, value=label)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = CENTER
+            cell.border = THIN_BORDER
+        self.ws.row_dimensions[row].height = 28
+
+
+def render_heading(sheet, block):
+    size = block.get('size', 18 if block['type'] == 'title' else 14)
+    fill = block.get('fill')
+    color = 'FFFFFF' if fill else COLORS[block.get('color', 'header')]
+    sheet.merged(sheet.row, sheet.text(block['text']), font=Font(bold=True, size=size, color=color),
+                 fill=_fill(COLORS[fill]) if fill else None, height=max(20, size * 1.7))
+    sheet.row += 1
+    for line in block.get('lines', []):
+        sheet.merged(sheet.row, sheet.text(line), font=Font(italic=True, size=11, color=COLORS['subtle']))
+        sheet.row += 1
+    sheet.row += block.get('gap', 1)
+
+
+def render_lines(sheet, block):
+    fill = _fill(COLORS[block['fill']]) if block.get('fill') else None
+    color = COLORS.get(block.get('color'), '000000')
+    split = column_index_from_string(block['split']) if block.get('split') else None
+    for item in block['items']:
+        if isinstance(item, tuple):
+            left, right = item
+            sheet.merged(sheet.row, sheet.text(left), font=Font(bold=True, size=11, color=color), fill=fill,
+                         last=split - 1)
+            sheet.merged(sheet.row, sheet.text(right), font=Font(size=10, color=color), fill=fill, first=split)
+        elif item:
+            text = sheet.text(item)
+            strong = text.startswith(STRONG_MARKS) or text.rstrip(':').isupper()
+            sheet.merged(sheet.row, text, font=Font(bold=strong, size=11 if strong else 10, color=color), fill=fill)
+        sheet.row += 1
+    sheet.row += block.get('gap', 1)
+
+
+def render_notes(sheet, block):
+    """(label, text, ...) rows; a label on its own is a section heading"""
+    text_col = column_index_from_string(block['text_col']) if block.get('text_col') else sheet.col + 1
+    if block.get('headers'):
+        sheet.header(sheet.row, block['headers'])
+        sheet.row += 1
+    for item in block['items']:
+        if not item:
+            sheet.row += 1
+            continue
+        label, *rest = item
+        if not rest:
+            sheet.merged(sheet.row, sheet.text(label), font=Font(bold=True, size=12, color=COLORS['header']))
+            sheet.row += 1
+            continue
+        sheet.ws.cell(row=sheet.row, column=sheet.col, value=sheet.text(label)).font = Font(bold=True, size=10)
+        for offset, text in enumerate(rest):
+            col = text_col + offset
+            if offset == len(rest) - 1:
+                sheet.merged(sheet.row, sheet.text(text), font=Font(size=10), first=col)
+            else:
+                sheet.ws.cell(row=sheet.row, column=col, value=sheet.text(text)).font = Font(size=10)
+        sheet.row += 1
+    sheet.row += block.get('gap', 1)
+
+
+def render_date_selector(sheet, block):
+    """Start / end dropdowns over the data dates; live comparison rows below read them"""
+    book, ws = sheet.book, sheet.ws
+    dates = book.date_list()
+    sheet.merged(sheet.row, sheet.text(block.get('label', '📅 SELECT DATE RANGE:')),
+                 font=Font(bold=True, size=12, color=COLORS['header']))
+    sheet.row += 1
+
+    row, col = sheet.row, sheet.col
+    validation = DataValidation(type='list', formula1=f"='_Dates'!$A$1:$A${len(dates)}", allow_blank=False)
+    validation.promptTitle = 'Select Date'
+    validation.prompt = 'Choose a date from the dropdown'
+    validation.errorTitle = 'Invalid Date'
+    validation.error = 'Please select a date from the dropdown list'
+    ws.add_data_validation(validation)
+
+    for label_col, label, value in ((col, block.get('start_label', 'Start Date:'), dates[0]),
+                                    (col + 3, block.get('end_label', 'End Date:'), dates[-1])):
+        ws.cell(row=row, column=label_col, value=label).font = Font(bold=True, size=11)
+        cell = ws.cell(row=row, column=label_col + 1, value=value)
+        cell.number_format = 'YYYY-MM-DD'
+        cell.fill = _fill(COLORS['input'])
+        cell.font = Font(bold=True, size=11)
+        cell.border = THIN_BORDER
+        cell.alignment = CENTER
+        validation.add(cell)
+
+    start = f'{get_column_letter(col + 1)}{row}'
+    end = f'{get_column_letter(col + 4)}{row}'
+    sheet.refs = (f'${start[0]}${row}', f'${end[0]}${row}')
+    sheet.ctx.update(start_cell=start, end_cell=end)
+    sheet.row += 1
+    for note in block.get('notes', []):
+        sheet.merged(sheet.row, sheet.text(note), font=Font(italic=True, size=9, color=COLORS['subtle']))
+        sheet.row += 1
+    sheet.row += block.get('gap', 1)
+
+
+def _comparison_pair(sheet, source, key):
+    ctx = sheet.ctx
+    if source == 'platform':
+        return ctx['p'].get(key), ctx['np'].get(key)
+    if source == 'asin_means':
+        stats = ctx['stats'][key]
+        return stats['Perpetua_Mean'], stats['NonPerpetua_Mean']
+    if source == 'pre_post':
+        return ctx['prepost']['pre'].get(key), ctx['prepost']['post'].get(key)
+    month = ctx['yoy'][source.split(':', 1)[1]]  # 'yoy:december'
+    return month['before'].get(key), month['after'].get(key)
+
+
+def render_comparison(sheet, block):
+    """
+    Metric rows side by side with difference, % difference and winner.
+
+    rows: (label, key, unit, lower_better[, note]), a string for a section row
+    or None for a gap. source 'platform' / 'asin_means' compare Perpetua with
+    Non-Perpetua; 'pre_post' / 'yoy:<month>' compare before with after.
+    """
+    ws, first = sheet.ws, sheet.col
+    source = block.get('source', 'platform')
+    change = source == 'pre_post' or source.startswith('yoy')
+    verdicts = block.get('verdicts', ('✓ Better', '✗ Worse'))
+    pct_format = block.get('pct_format', '0.0%;-0.0%')
+    live = block.get('live', False) and sheet.refs is not None
+    headers = [sheet.text(h) for h in block['headers']]
+    width = len(headers)
+
+    sheet.header(sheet.row, headers)
+    sheet.row += 1
+    for item in block['rows']:
+        row = sheet.row
+        sheet.row += 1
+        if item is None:
+            continue
+        if isinstance(item, str):
+            sheet.merged(row, sheet.text(item), font=Font(bold=True, size=11, color=COLORS['header']),
+                         fill=_fill(COLORS['context']), last=first + width - 1)
+            continue
+
+        label, key, unit, lower_better, *note = item
+        a, b = _comparison_pair(sheet, source, key)
+        value_format, diff_format = UNIT_FORMATS[unit]
+        formulas = None
+        if live and source == 'platform':
+            formulas = [metric_formula(sheet.book.layout(), platform, key, *sheet.refs) for platform in PLATFORMS]
+            if None in formulas:
+                formulas = None
+                label += ' (full period)'
+
+        ws.cell(row=row, column=first, value=label).font = Font(bold=True, size=10)
+        for offset, value in enumerate(formulas or (a, b), start=1):
+            cell = ws.cell(row=row, column=first + offset, value=value)
+            cell.number_format = value_format
+            cell.alignment = CENTER
+            cell.border = THIN_BORDER
+        sheet.metric_rows[key] = row
+
+        if formulas:
+            sheet.live_rows.add(key)
+            write_comparison_formulas(ws, row, first + 1, lower_better, COLORS, pct_format)
+            ws.cell(row=row, column=first + 3).number_format = diff_format
+        elif a is not None and b is not None:
+            diff = b - a if change else a - b
+            ws.cell(row=row, column=first + 3, value=diff).number_format = diff_format
+            if lower_better is not None:
+                base = a if change else b
+                ws.cell(row=row, column=first + 4,
+                        value=diff / base if base else None).number_format = pct_format
+                if change:
+                    better = b < a if lower_better else b > a
+                    text, color = (verdicts[0], COLORS['good']) if better else (verdicts[1], COLORS['bad'])
+                else:
+                    wins = a < b if lower_better else a > b
+                    text, color = ('Perpetua ✓', COLORS['perpetua']) if wins else \
+                        ('Non-Perpetua ✓', COLORS['non_perpetua'])
+                cell = ws.cell(row=row, column=first + 5, value=text)
+                cell.fill = _fill(color)
+                cell.font = WHITE_BOLD
+                cell.alignment = CENTER
+        for col in range(first + 3, first + 6):
+            ws.cell(row=row, column=col).border = THIN_BORDER
+
+        if block.get('significance') and key in sheet.ctx['stats']:
+            stats = sheet.ctx['stats'][key]
+            significant = stats['Significant'] == 'YES'
+            cell = ws.cell(row=row, column=first + 6,
+                           value=f"{stats['Significant']} (p={stats['P_Value']:.3f})")
+            cell.alignment = CENTER
+            if significant:
+                cell.fill = _fill(COLORS['good'])
+                cell.font = WHITE_BOLD
+        elif note:
+            ws.cell(row=row, column=first + 6, value=sheet.text(note[0])).font = Font(italic=True, size=9)
+    sheet.row += block.get('gap', 1)
+
+
+def render_cards(sheet, block):
+    """Two headline cards, e.g. Perpetua vs Non-Perpetua ROAS; the better one is highlighted"""
+    key, unit = block.get('key', 'ROAS'), block.get('unit', 'x')
+    p, n = sheet.ctx['p'][key], sheet.ctx['np'][key]
+    p_wins = p < n if block.get('lower_better') else p > n
+    row = sheet.row
+    for offset, label, value, color, wins in ((0, block['labels'][0], p, 'perpetua', p_wins),
+                                              (4, block['labels'][1], n, 'non_perpetua', not p_wins)):
+        first, last = sheet.col + offset, sheet.col + offset + 2
+        sheet.merged(row, label, font=Font(bold=True, size=12, color='FFFFFF'), fill=_fill(COLORS[color]),
+                     first=first, last=last, align=CENTER, height=25)
+        sheet.merged(row + 1, block.get('caption', key), font=Font(bold=True, size=11), first=first, last=last,
+                     align=CENTER)
+        cell = sheet.merged(row + 2, value, font=Font(bold=True, size=24, color='FFFFFF' if wins else '000000'),
+                            fill=_fill(COLORS['good']) if wins else None, first=first, last=last, align=CENTER,
+                            height=40)
+        cell.number_format = UNIT_FORMATS[unit][0]
+    sheet.row += 4 + block.get('gap', 1)
+
+
+def render_bar(sheet, block):
+    """Platform bar chart of one metric; follows the date selector when the metric row is live"""
+    ws, col = sheet.ws, sheet.col
+    key = block.get('key', 'ROAS')
+    row = sheet.row
+    sheet.header(row, ['Platform', block.get('series', key)])
+    for i, (platform, ctx_key) in enumerate((('Perpetua', 'p'), ('Non-Perpetua', 'np')), start=1):
+        ws.cell(row=row + i, column=col, value=platform)
+        if key in sheet.live_rows:
+            value = f'={get_column_letter(sheet.col + i)}{sheet.metric_rows[key]}'
+        else:
+            value = sheet.ctx[ctx_key][key]
+        ws.cell(row=row + i, column=col + 1, value=value).number_format = '0.00'
+
+    chart = BarChart()
+    chart.type = 'col'
+    chart.title = sheet.text(block['title'])
+    chart.y_axis.title = block.get('y_title', key)
+    chart.x_axis.title = block.get('x_title', 'Advertising Type')
+    chart.add_data(Reference(ws, min_col=col + 1, min_row=row, max_row=row + 2), titles_from_data=True)
+    chart.set_categories(Reference(ws, min_col=col, min_row=row + 1, max_row=row + 2))
+    chart.height, chart.width = 10, 16
+    chart.legend = None
+    anchor = block.get('anchor', get_column_letter(col + 3))
+    ws.add_chart(chart, f'{anchor}{row}')
+    sheet.row += 22
+
+
+def _line_chart(ws, spec, first, header_row, last_row, columns):
+    chart = LineChart()
+    chart.title = spec['title']
+    chart.y_axis.title = spec.get('y_title', '')
+    chart.x_axis.title = spec.get('x_title', 'Date')
+    chart.x_axis.number_format = 'mmm dd'
+    chart.height, chart.width = spec.get('height', 10), spec.get('width', 22)
+    for name in spec['series']:
+        col = first + columns.index(name)
+        chart.add_data(Reference(ws, min_col=col, min_row=header_row, max_row=last_row), titles_from_data=True)
+    chart.set_categories(Reference(ws, min_col=first, min_row=header_row + 1, max_row=last_row))
+    ws.add_chart(chart, f"{spec['anchor']}{header_row}")
+
+
+def _table_daily(sheet, block):
+    return sheet.book.store['bases'][block.get('basis', sheet.book.basis)]['daily']
+
+
+def _table_trend(sheet, block):
+    daily = _table_daily(sheet, block)
+    trend = daily.pivot_table(index='Date', columns='Advertising_Type', values=block.get('metric', 'ROAS'))
+    return trend.reindex(columns=PLATFORMS).reset_index()
+
+
+def _table_daily_total(sheet, block):
+    total = sheet.book.store['daily_total'].copy()
+    if block.get('periods'):
+        launch = sheet.ctx['prepost']['launch']
+        total.insert(1, 'Period', np.where(total['Date'] < launch, 'Pre-Perpetua', 'Post-Perpetua'))
+    return total
+
+
+def _table_asins(sheet, block):
+    asins = sheet.book.store['asins']
+    key, n = block.get('top', ('Sales', 50))
+    return take_ranked(asins, ranked_asins(load_rankings(), key, n))
+
+
+def _table_rolling(sheet, block):
+    rows = [{'Platform': platform, 'Window': window, **kpis}
+            for platform, windows in sheet.ctx['rolling']['latest'].items() for window, kpis in windows.items()]
+    return pd.DataFrame(rows)
+
+
+def _table_rolling_trend(sheet, block):
+    frame = pd.read_csv(AGG_DIR / 'rolling_kpis_platform.csv', parse_dates=['Date'])
+    frame = frame[frame['Window'] == block.get('window', 7)]
+    trend = frame.pivot_table(index='Date', columns='Advertising_Type', values=block.get('metric', 'ROAS'))
+    return trend.reindex(columns=[p for p in PLATFORMS if p in trend.columns]).reset_index()
+
+
+def _table_anomalies(sheet, block):
+    return sheet.ctx['anomalies']['recent'].head(block.get('limit', 200))
+
+
+def _table_forecast(sheet, block):
+    rows = [{'Platform': platform, 'Measure': measure, 'Total': v['total'], 'Avg_Daily': v['avg_daily'],
+             'Avg_Daily_Lower': v['avg_daily_lower'], 'Avg_Daily_Upper': v['avg_daily_upper']}
+            for platform, measures in sheet.ctx['forecast']['platforms'].items()
+            for measure, v in measures.items()]
+    return pd.DataFrame(rows)
+
+
+def _table_forecast_band(sheet, block):
+    frame = pd.read_csv(AGG_DIR / 'forecast_platform.csv', parse_dates=['Date'])
+    frame = frame[frame['Advertising_Type'] == block.get('platform', 'All')]
+    measure = block.get('measure', 'Total_Revenue')
+    return pd.DataFrame({'Date': frame['Date'], 'Forecast': frame[measure],
+                         'Low': frame[f'{measure}_Lower'], 'High': frame[f'{measure}_Upper']})
+
+
+TABLE_SOURCES = {
+    'daily': _table_daily,
+    'trend': _table_trend,
+    'daily_total': _table_daily_total,
+    'monthly': lambda sheet, block: sheet.book.store['monthly'],
+    'asins': _table_asins,
+    'stats': lambda sheet, block: sheet.book.store['stats'],
+    'rolling': _table_rolling,
+    'rolling_trend': _table_rolling_trend,
+    'anomalies': _table_anomalies,
+    'forecast': _table_forecast,
+    'forecast_band': _table_forecast_band,
+}
+
+
+def _cell_value(value):
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def render_table(sheet, block):
+    """A frame from TABLE_SOURCES with header, formats, row colours, filter and optional line chart"""
+    ws, first = sheet.ws, sheet.col
+    frame = TABLE_SOURCES[block['source']](sheet, block)
+    if block.get('columns'):
+        frame = frame[block['columns']]
+    frame = frame.rename(columns=block.get('rename', {}))
+    columns = list(frame.columns)
+    formats = {**COLUMN_FORMATS, **block.get('formats', {})}
+    fill_by = [block['fill_by']] if block.get('fill_by') else ROW_FILL_COLUMNS
+    fill_col = next((columns.index(c) for c in fill_by if c in columns), None)
+
+    header_row = sheet.row
+    sheet.header(header_row, [sheet.text(h) for h in block.get('headers', [c.replace('_', ' ') for c in columns])])
+    for r, record in enumerate(frame.itertuples(index=False, name=None), start=header_row + 1):
+        fill = _fill(ROW_FILLS[record[fill_col]]) if fill_col is not None and record[fill_col] in ROW_FILLS \
+            else None
+        for c, value in enumerate(record):
+            cell = ws.cell(row=r, column=first + c, value=_cell_value(value))
+            if columns[c] in formats:
+                cell.number_format = formats[columns[c]]
+            if fill:
+                cell.fill = fill
+    last_row = header_row + max(len(frame), 1)
+
+    ref = f'{get_column_letter(first)}{header_row}:{get_column_letter(first + len(columns) - 1)}{last_row}'
+    if block.get('table_name'):
+        table = Table(displayName=block['table_name'], ref=ref)
+        table.tableStyleInfo = TableStyleInfo(name='TableStyleMedium2', showRowStripes=True)
+        ws.add_table(table)
+    elif block.get('filter', True):
+        ws.auto_filter.ref = ref
+    if block.get('freeze'):
+        ws.freeze_panes = ws.cell(row=header_row + 1, column=first)
+    if block.get('chart'):
+        chart = {**block['chart'], 'title': sheet.text(block['chart']['title'])}
+        _line_chart(ws, chart, first, header_row, last_row, columns)
+    sheet.row = last_row + 1 + block.get('gap', 1)
+
+
+BLOCKS = {
+    'title': render_heading,
+    'heading': render_heading,
+    'lines': render_lines,
+    'notes': render_notes,
+    'date_selector': render_date_selector,
+    'comparison': render_comparison,
+    'cards': render_cards,
+    'bar': render_bar,
+    'table': render_table,
+}
+
+
+class WorkbookRenderer:
+    """One workbook variant: its spec, the shared store and a template context"""
+
+    def __init__(self, spec, store, now=None):
+        self.spec = spec
+        self.store = store
+        self.basis = spec.get('basis', 'ads')
+        self.ctx = build_context(store, self.basis, now)
+        self.wb = Workbook()
+        self.wb.remove(self.wb.active)
+        self._layout = None
+        self._dates = None
+
+    def date_list(self):
+        """Hidden _Dates sheet feeding the dropdowns (one per workbook)"""
+        if self._dates is None:
+            dates = sorted(self.store['bases'][self.basis]['daily']['Date'].unique())
+            self._dates = [pd.Timestamp(d).to_pydatetime() for d in dates]
+            ws = self.wb.create_sheet('_Dates')
+            ws.sheet_state = 'hidden'
+            for i, date in enumerate(self._dates, start=1):
+                ws.cell(row=i, column=1, value=date).number_format = 'YYYY-MM-DD'
+        return self._dates
+
+    def layout(self):
+        """Hidden running-total sheet behind the live comparison formulas"""
+        if self._layout is None:
+            daily = self.store['bases'][self.basis]['daily']
+            self._layout = add_measures_sheet(self.wb, daily, MEASURE_COLUMNS)
+        return self._layout
+
+    def render(self):
+        sheets = self.spec['sheets']
+        for i, sheet_spec in enumerate(sheets, 1):
+            print(f"[{i}/{len(sheets)}] {sheet_spec['name']}...")
+            sheet = SheetWriter(self, sheet_spec)
+            for block in sheet_spec['blocks']:
+                BLOCKS[block['type']](sheet, block)
+        # Visible sheets first, hidden helper sheets last
+        self.wb._sheets.sort(key=lambda ws: ws.sheet_state == 'hidden')
+        self.wb.active = 0
+
+        path = OUTPUT_DIR / self.ctx['now'].strftime(self.spec['file'])
+        self.wb.save(path)
+        documents = [path]
+        self.ctx['workbook'] = path.name
+        for name, template in self.spec.get('documents', []):
+            doc = OUTPUT_DIR / name
+            doc.write_text(template.format_map(self.ctx))
+            documents.append(doc)
+        return documents
+
+
+def render_workbook(name, store, now=None):
+    from dashboard_specs import WORKBOOKS
+
+    spec = WORKBOOKS[name]
+    print("=" * 100)
+    for line in spec['banner']:
+        print(line)
+    print("=" * 100)
+    print()
+
+    renderer = WorkbookRenderer(spec, store, now)
+    paths = renderer.render()
+    print()
+    print("=" * 100)
+    print("✓ DASHBOARD COMPLETE")
+    print("=" * 100)
+    print(f"\n📁 File: {paths[0].name}")
+    for doc in paths[1:]:
+        print(f"📄 {doc.name}")
+    for line in spec.get('highlights', []):
+        print(line.format_map(renderer.ctx))
+    print()
+    return paths
+
+
+def main(argv=None):
+    from dashboard_specs import WORKBOOKS
+
+    parser = argparse.ArgumentParser(description='Render Excel dashboard variants from the cached metric store')
+    parser.add_argument('variants', nargs='*', metavar='variant',
+                        help=f"any of: {', '.join(WORKBOOKS)} (default: all)")
+    parser.add_argument('--rebuild', action='store_true', help='recompute the metric store first')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.variants if name not in WORKBOOKS]
+    if unknown:
+        parser.error(f"unknown variant(s): {', '.join(unknown)}")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    store = load_store(rebuild=args.rebuild)
+    now = datetime.now()
+    for name in args.variants or list(WORKBOOKS):
+        render_workbook(name, store, now)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Dashboard Page
+Single-file HTML front end that draws the Perpetua vs Non-Perpetua charts
+(metric comparison bars, ROAS vs target, weekly/monthly trend, table) as SVG in
+the browser. The data source is pluggable: the page calls fetchMeta() and
+fetchRows(params), which the caller supplies as JavaScript (HTTP API or static
+data files).
+"""
+
+import json
+
+COLORS = {'Perpetua': '#2E86AB', 'Non-Perpetua': '#A23B72', 'All': '#555555'}
+TARGET_ROAS = 2.0
+
+# (metric, label, lower is better) - the comparison grid of the performance report
+COMPARISON = [
+    ('ACOS', 'ACOS (lower is better)', True),
+    ('ROAS', 'ROAS (higher is better)', False),
+    ('CPC', 'Avg CPC ($)', True),
+    ('CVR', 'Conversion Rate', False),
+    ('CTR', 'Click-Through Rate', False),
+    ('Spend', 'Total Spend ($)', None),
+]
+TREND_METRICS = ['ROAS', 'TACoS', 'ACOS', 'Spend', 'Sales', 'Total_Revenue', 'Organic_Ratio', 'CPC', 'CVR']
+
+STYLE = """
+body { font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 22px; margin-bottom: 4px; }
+.controls { display: flex; gap: 12px; flex-wrap: wrap; align-items: end; margin: 16px 0; }
+.controls label { font-size: 12px; color: #555; display: flex; flex-direction: column; gap: 4px; }
+.grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px; }
+.card { border: 1px solid #ddd; border-radius: 6px; padding: 8px; }
+.card h3 { font-size: 13px; margin: 0 0 4px; }
+table { border-collapse: collapse; font-size: 12px; margin-top: 16px; }
+th, td { padding: 4px 8px; border-bottom: 1px solid #eee; text-align: right; }
+th:nth-child(-n+3), td:nth-child(-n+3) { text-align: left; }
+#status { font-size: 12px; color: #888; }
+"""
+
+CHARTS_JS = """
+const COLORS = %(colors)s;
+const TARGET_ROAS = %(target_roas)s;
+const COMPARISON = %(comparison)s;
+const PERCENT = new Set(['ACOS', 'TACoS', 'CTR', 'CVR', 'Organic_Ratio']);
+
+function fmt(value, metric) {
+  if (PERCENT.has(metric)) return (value * 100).toFixed(1) + '%%';
+  if (Math.abs(value) >= 1000) return '$' + Math.round(value).toLocaleString();
+  return value.toFixed(2);
+}
+
+function barChart(title, rows, metric, lowerBetter, target) {
+  const w = 300, h = 200, pad = 30;
+  const max = Math.max(target || 0, ...rows.map(r => r[metric])) || 1;
+  const bw = (w - 2 * pad) / rows.length;
+  const values = rows.map(r => r[metric]);
+  const best = lowerBetter == null ? -1 :
+    values.indexOf(lowerBetter ? Math.min(...values) : Math.max(...values));
+  let bars = rows.map((r, i) => {
+    const bh = (h - 2 * pad) * r[metric] / max, x = pad + i * bw + bw * 0.15, y = h - pad - bh;
+    return `<rect x="${x}" y="${y}" width="${bw * 0.7}" height="${bh}" fill="${COLORS[r.Group] || '#888'}"` +
+      (i === best ? ' stroke="green" stroke-width="3"' : '') + '/>' +
+      `<text x="${x + bw * 0.35}" y="${y - 4}" font-size="11" text-anchor="middle">${fmt(r[metric], metric)}</text>` +
+      `<text x="${x + bw * 0.35}" y="${h - pad + 14}" font-size="11" text-anchor="middle">${r.Group}</text>`;
+  }).join('');
+  if (target) {
+    const ty = h - pad - (h - 2 * pad) * target / max;
+    bars += `<line x1="${pad}" x2="${w - pad}" y1="${ty}" y2="${ty}" stroke="green" stroke-dasharray="6 4"/>` +
+      `<text x="${w - pad}" y="${ty - 4}" font-size="10" fill="green" text-anchor="end">Target ${target}</text>`;
+  }
+  return `<div class="card"><h3>${title}</h3><svg viewBox="0 0 ${w} ${h}" width="100%%">${bars}</svg></div>`;
+}
+
+function lineChart(title, rows, metric) {
+  const w = 900, h = 260, pad = 40;
+  const periods = [...new Set(rows.map(r => r.Start))].sort();
+  const groups = [...new Set(rows.map(r => r.Group))];
+  const max = Math.max(...rows.map(r => r[metric]), 0) || 1;
+  const x = i => pad + (periods.length > 1 ? i * (w - 2 * pad) / (periods.length - 1) : (w - 2 * pad) / 2);
+  const y = v => h - pad - (h - 2 * pad) * v / max;
+  let out = `<line x1="${pad}" x2="${w - pad}" y1="${h - pad}" y2="${h - pad}" stroke="#ccc"/>`;
+  out += `<text x="${pad}" y="${pad - 10}" font-size="11">${fmt(max, metric)}</text>`;
+  groups.forEach(g => {
+    const pts = rows.filter(r => r.Group === g).map(r => `${x(periods.indexOf(r.Start))},${y(r[metric])}`);
+    out += `<polyline fill="none" stroke="${COLORS[g] || '#888'}" stroke-width="2" points="${pts.join(' ')}"/>`;
+  });
+  const step = Math.max(1, Math.ceil(periods.length / 10));
+  periods.forEach((p, i) => {
+    if (i %% step === 0) out += `<text x="${x(i)}" y="${h - pad + 16}" font-size="10" text-anchor="middle">${p}</text>`;
+  });
+  const legend = groups.map(g => `<span style="color:${COLORS[g] || '#888'}">&#9632; ${g}</span>`).join(' &nbsp; ');
+  return `<div class="card"><h3>${title}</h3><div>${legend}</div><svg viewBox="0 0 ${w} ${h}" width="100%%">${out}</svg></div>`;
+}
+
+function table(rows, metrics) {
+  const head = ['Start', 'End', 'Group', ...metrics];
+  return '<table><tr>' + head.map(c => `<th>${c}</th>`).join('') + '</tr>' +
+    rows.map(r => '<tr>' + head.map(c => `<td>${typeof r[c] === 'number' ? fmt(r[c], c) : r[c]}</td>`).join('') +
+      '</tr>').join('') + '</table>';
+}
+"""
+
+APP_JS = """
+const $ = id => document.getElementById(id);
+
+function params() {
+  const p = {start: $('start').value, end: $('end').value, by: $('by').value, split: 'platform'};
+  if ($('asin').value.trim()) p.asin = $('asin').value.trim().split(/[ ,]+/);
+  return p;
+}
+
+async function refresh() {
+  $('status').textContent = 'Loading...';
+  const t0 = performance.now();
+  const p = params(), metric = $('metric').value;
+  const metrics = [...new Set(['Spend', 'Sales', 'Total_Revenue', 'ROAS', 'ACOS', 'TACoS', 'CPC', 'CTR', 'CVR',
+                               'Organic_Ratio', metric])];
+  let totals, trend;
+  try {
+    [totals, trend] = await Promise.all([fetchRows({...p, by: 'total', metrics}), fetchRows({...p, metrics})]);
+  } catch (err) {
+    $('status').textContent = err.message;
+    return;
+  }
+  $('comparison').innerHTML = COMPARISON.map(([m, label, lower]) => barChart(label, totals, m, lower)).join('') +
+    barChart('ROAS vs Target', totals, 'ROAS', false, TARGET_ROAS) +
+    barChart('TACoS (lower is better)', totals, 'TACoS', true) +
+    barChart('Organic Ratio', totals, 'Organic_Ratio', false);
+  $('trend').innerHTML = lineChart(`${metric} by ${p.by}`, trend, metric);
+  $('table').innerHTML = table(trend, ['Spend', 'Sales', 'Total_Revenue', 'ROAS', 'TACoS']);
+  $('status').textContent = `${trend.length} rows in ${Math.round(performance.now() - t0)} ms`;
+}
+
+fetchMeta().then(meta => {
+  $('start').value = $('start').min = $('end').min = meta.start;
+  $('end').value = $('start').max = $('end').max = meta.end;
+  $('subtitle').textContent = `${meta.start} to ${meta.end} - ${meta.asins.length} ASINs`;
+  ['start', 'end', 'by', 'metric'].forEach(id => $(id).addEventListener('change', refresh));
+  $('asin').addEventListener('change', refresh);
+  refresh();
+});
+"""
+
+BODY = """
+<h1>Perpetua vs Non-Perpetua</h1>
+<div id="subtitle"></div>
+<div class="controls">
+  <label>From <input type="date" id="start"></label>
+  <label>To <input type="date" id="end"></label>
+  <label>Period <select id="by"><option>week</option><option>month</option><option>day</option></select></label>
+  <label>Trend metric <select id="metric">%(metric_options)s</select></label>
+  <label>ASINs (optional) <input id="asin" placeholder="B0..., B0..."></label>
+  <span id="status"></span>
+</div>
+<div class="grid" id="comparison"></div>
+<div id="trend" style="margin-top: 16px"></div>
+<div id="table"></div>
+"""
+
+
+def render_page(loader_js, title='Perpetua Dashboard'):
+    """
+    Full HTML page. loader_js must define `async fetchMeta()` -> {start, end, asins}
+    and `async fetchRows(params)` -> query rows (see cube_index.CubeIndex.query).
+    """
+    charts = CHARTS_JS % {
+        'colors': json.dumps(COLORS),
+        'target_roas': json.dumps(TARGET_ROAS),
+        'comparison': json.dumps(COMPARISON),
+    }
+    body = BODY % {'metric_options': ''.join(f'<option>{m}</option>' for m in TREND_METRICS)}
+    return (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title>'
+            f'<style>{STYLE}</style></head><body>{body}'
+            f'<script>{charts}\n{loader_js}\n{APP_JS}</script></body></html>')
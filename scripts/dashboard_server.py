@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Local Dashboard Service
+asyncio HTTP server answering platform / ASIN / date-range metric queries as
+JSON from the cube prefix-sum index, with an in-memory LRU cache of encoded
+responses. A refresh that rebuilds the daily cube changes the index files'
+mtimes; the next request reloads the index and empties the cache.
+
+    python scripts/perpetua.py serve --port 8050
+
+GET /                 dashboard page (charts drawn client-side)
+GET /api/meta         date range, ASINs, platforms, metrics
+GET /api/query        ?metrics=ROAS,TACoS&start=&end=&by=week&split=platform&asin=&platform=
+GET /api/health       index version and cache statistics
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from cube_index import META_FILE, PERIODS, PLATFORMS, PREFIX_FILE, SOURCES, SPLITS, load_index
+from dashboard_page import render_page
+
+CACHE_SIZE = 256
+READ_TIMEOUT = 10  # seconds to receive the request head
+DEFAULT_METRICS = ['Spend', 'Sales', 'Total_Revenue', 'ROAS', 'TACoS']
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+API_LOADER_JS = """
+async function fetchMeta() { return (await fetch('/api/meta')).json(); }
+async function fetchRows(params) {
+  const q = new URLSearchParams();
+  for (const [k, v] of Object.entries(params)) if (v != null && v !== '') q.set(k, [].concat(v).join(','));
+  const body = await (await fetch('/api/query?' + q)).json();
+  if (body.error) throw new Error(body.error);
+  return body.rows;
+}
+"""
+
+
+def _json(status, payload):
+    return status, 'application/json', json.dumps(payload).encode()
+
+
+def _first(query, name, default=None):
+    return query.get(name, [default])[0] or default
+
+
+def _list(values):
+    """Repeated or comma-separated query parameter -> list (None when absent)"""
+    if not values:
+        return None
+    items = [item.strip() for value in values for item in value.split(',') if item.strip()]
+    return items or None
+
+
+class LRUCache:
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class DashboardServer:
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache = LRUCache(cache_size)
+        self.index = None
+        self.version = None
+        self.reload_lock = asyncio.Lock()
+        self.page = render_page(API_LOADER_JS).encode()
+
+    @staticmethod
+    def _version():
+        return tuple(p.stat().st_mtime_ns if p.exists() else 0 for p in (META_FILE, PREFIX_FILE, *SOURCES))
+
+    async def _current_index(self):
+        """The index, reloaded (and the cache emptied) whenever its files or the cube's inputs changed"""
+        if self.index is None or self._version() != self.version:
+            async with self.reload_lock:
+                if self.index is None or self._version() != self.version:
+                    loop = asyncio.get_running_loop()
+                    self.index = await loop.run_in_executor(None, load_index)
+                    self.version = self._version()
+                    self.cache.clear()
+        return self.index
+
+    async def respond(self, method, target):
+        if method not in ('GET', 'HEAD'):
+            return _json(405, {'error': f'{method} not supported'})
+        url = urlsplit(target)
+        if url.path == '/':
+            return 200, 'text/html; charset=utf-8', self.page
+
+        index = await self._current_index()
+        if url.path == '/api/health':
+            return _json(200, {'index_version': max(self.version), 'cache_entries': len(self.cache.entries),
+                               'cache_hits': self.cache.hits, 'cache_misses': self.cache.misses})
+
+        key = (url.path, tuple(sorted((k, tuple(v)) for k, v in parse_qs(url.query).items())))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if url.path == '/api/meta':
+            response = _json(200, {'start': str(index.dates[0]), 'end': str(index.dates[-1]),
+                                   'asins': index.asins.tolist(), 'platforms': PLATFORMS,
+                                   'metrics': index.metrics, 'periods': PERIODS, 'splits': SPLITS})
+        elif url.path == '/api/query':
+            query = parse_qs(url.query)
+            try:
+                rows = await asyncio.get_running_loop().run_in_executor(
+                    None, index.query, _list(query.get('metrics')) or DEFAULT_METRICS,
+                    _first(query, 'start'), _first(query, 'end'), _first(query, 'by', 'total'),
+                    _first(query, 'split', 'platform'), _list(query.get('asin')), _list(query.get('platform')))
+            except (KeyError, ValueError) as exc:
+                return _json(400, {'error': str(exc.args[0])})
+            response = _json(200, {'rows': rows})
+        else:
+            return _json(404, {'error': f'no route {url.path}'})
+
+        self.cache.put(key, response)
+        return response
+
+    async def handle(self, reader, writer):
+        method = 'GET'
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), READ_TIMEOUT)
+            method, target, _ = head.split(b'\r\n', 1)[0].decode('latin-1').split(' ', 2)
+            status, content_type, body = await self.respond(method, target)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError):
+            status, content_type, body = _json(400, {'error': 'malformed request'})
+        except Exception as exc:  # keep serving other clients
+            status, content_type, body = _json(500, {'error': repr(exc)})
+
+        header = (f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n'
+                  f'Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n'
+                  f'Cache-Control: no-cache\r\nConnection: close\r\n\r\n').encode()
+        try:
+            writer.write(header if method == 'HEAD' else header + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8050, cache_size=CACHE_SIZE):
+    app = DashboardServer(cache_size)
+    await app._current_index()  # load (or rebuild) before accepting requests
+    server = await asyncio.start_server(app.handle, host, port)
+    print(f"✓ Serving dashboard on http://{host}:{port}/ (Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,1063 @@
+#!/usr/bin/env python3
+"""
+Dashboard Specs
+Declarative layouts of the Excel dashboard variants rendered by
+dashboard_engine.py: workbook -> sheets -> blocks. Text is a str.format
+template over the engine context (p / np platform metrics for the workbook's
+data basis, start / end dates, stats, yoy, prepost, rolling, forecast, ...).
+"""
+
+# Comparison rows: (label, metric key, unit, lower_better[, note]); str = section, None = gap
+VOLUME_ROWS = [
+    ('Total Spend', 'Total_Spend', '$', None),
+    ('Total Sales', 'Total_Sales', '$', False),
+    ('Total Orders', 'Total_Orders', '#', False),
+    ('Total Clicks', 'Total_Clicks', '#', False),
+    ('Total Impressions', 'Total_Impressions', '#', False),
+]
+
+RATIO_ROWS = [
+    ('ROAS (Return on Ad Spend)', 'ROAS', 'x', False),
+    ('ACOS (Ad Cost of Sales)', 'ACOS', '%', True),
+    ('CPC (Cost Per Click)', 'CPC', '$.', True),
+    ('CTR (Click-Through Rate)', 'CTR', '%', False),
+    ('CVR (Conversion Rate)', 'CVR', '%', False),
+    ('CPA (Cost Per Acquisition)', 'CPA', '$.', True),
+    ('CPM (Cost Per 1000 Impr.)', 'CPM', '$.', True),
+    ('AOV (Avg Order Value)', 'AOV', '$.', False),
+]
+
+TACOS_ROWS = [
+    ('TACoS (Total Ad Cost %)', 'TACoS', '%', True, 'Lower = Less ad-dependent'),
+    ('T-ROAS (Total Return)', 'T_ROAS', 'x', False, 'Total revenue per ad $'),
+    ('Organic Sales $', 'Organic_Sales', '$', None, 'Non-ad revenue'),
+    ('Organic Ratio %', 'Organic_Ratio', '%', None, '% from organic'),
+]
+
+AD_ROWS = [
+    ('Ad-Attributed Sales', 'Ad_Sales', '$', False, '7-day attributed'),
+    ('ROAS (Direct)', 'Regular_ROAS', 'x', False, 'Ad-attributed only'),
+    ('ACOS (Direct)', 'ACOS', '%', True, 'Calc from spend/ad sales'),
+]
+
+DAILY_COLUMNS = ['Date', 'Advertising_Type', 'Spend', 'Sales', 'Orders', 'Clicks', 'Impressions',
+                 'ROAS', 'ACOS', 'CPC', 'CTR', 'CVR']
+ASIN_COLUMNS = ['Advertised ASIN', 'Advertising_Type', 'Spend', 'Sales', 'Orders', 'Clicks', 'Impressions',
+                'ROAS', 'ACOS', 'CPC', 'CTR', 'CVR']
+TACOS_DAILY_COLUMNS = ['Date', 'Advertising_Type', 'Total_Revenue', 'Spend', 'Sales', 'Organic_Sales',
+                       'TACoS', 'T_ROAS', 'ROAS', 'Organic_Ratio']
+MONTHLY_COLUMNS = ['Month', 'Advertising_Type', 'Spend', 'Sales', 'Total_Revenue', 'Organic_Sales',
+                   'ROAS', 'TACoS', 'T_ROAS']
+AD_RENAME = {'Spend': 'Ad_Spend', 'Sales': 'Ad_Sales'}
+
+PLATFORM_HEADERS = ['Metric', 'Perpetua (SaaS)', 'Non-Perpetua (Manual)', 'Difference', '% Diff', 'Winner']
+YOY_HEADERS = ['Metric', '{before_year}', '{after_year}', 'Change', 'Change %', 'Status']
+YOY_ROWS = [
+    ('Ad Spend', 'Ad_Spend', '$', None),
+    ('Ad Sales', 'Ad_Sales', '$', False),
+    ('ROAS', 'ROAS', 'x', False),
+]
+
+STAT_FORMATS = {f'{group}_{field}': '#,##0.0000' for group in ('Perpetua', 'NonPerpetua')
+                for field in ('Mean', 'StdDev', 'CI_Lower', 'CI_Upper')}
+STAT_FORMATS.update({'Mean_Difference': '#,##0.0000', 'Relative_Difference_Pct': '0.0',
+                     'T_Statistic': '0.000', 'P_Value': '0.0000', 'Cohens_D': '0.000'})
+
+
+def daily_sheet(name, title, note, columns=DAILY_COLUMNS, chart=None, **table):
+    """Filterable daily platform table, optionally with a line chart beside it"""
+    blocks = [{'type': 'title', 'text': title, 'size': 16, 'lines': [note]},
+              {'type': 'table', 'source': 'daily', 'columns': columns, 'freeze': True, **table}]
+    if chart:
+        blocks.append({'type': 'heading', 'text': chart[0], 'size': 12})
+        blocks.append({'type': 'table', 'source': 'trend', 'metric': 'ROAS', 'filter': False,
+                       'chart': {'title': chart[1], 'y_title': 'ROAS', 'series': ['Perpetua', 'Non-Perpetua'],
+                                 'anchor': 'F'}})
+    return {'name': name, 'col': 'B', 'span': 'M', 'widths': {'B': 13, 'C': 15}, 'width': 13, 'blocks': blocks}
+
+
+def yoy_blocks(month, label):
+    return [
+        {'type': 'heading', 'text': label, 'size': 12},
+        {'type': 'comparison', 'source': f'yoy:{month}', 'rows': YOY_ROWS,
+         'headers': [h.replace('{', f'{{yoy[{month}][').replace('}', ']}') for h in YOY_HEADERS],
+         'verdicts': ('✓ Improved', '✗ Declined')},
+    ]
+
+
+SELECTOR_PROMPT = '👆 Click {start_cell} and {end_cell} to see date dropdown menus | Or use "Daily Data" sheet filters'
+
+
+WORKBOOKS = {
+    'enhanced': {
+        'file': 'Perpetua_Dashboard_Enhanced_%Y%m%d.xlsx',
+        'banner': ['GENERATING ENHANCED EXCEL DASHBOARD'],
+        'sheets': [
+            {'name': '📊 Executive Dashboard', 'col': 'B', 'span': 'H', 'widths': {'B': 30}, 'blocks': [
+                {'type': 'title', 'text': 'Perpetua Performance Dashboard', 'size': 20, 'lines': [
+                    'Analysis Period: {start:%b %d, %Y} - {end:%b %d, %Y}',
+                    'Generated: {now:%B %d, %Y at %I:%M %p}']},
+                {'type': 'heading', 'text': 'PERFORMANCE OVERVIEW'},
+                {'type': 'comparison', 'headers': ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', '% Diff',
+                                                   'Winner'],
+                 'rows': [('Total Spend', 'Total_Spend', '$', None), ('Total Sales', 'Total_Sales', '$', False),
+                          ('Total Orders', 'Total_Orders', '#', False), ('ROAS', 'ROAS', 'x', False),
+                          ('ACOS', 'ACOS', '%', True), ('Avg CPC', 'CPC', '$.', True),
+                          ('Conversion Rate', 'CVR', '%', False)]},
+                {'type': 'heading', 'text': 'ROAS Comparison', 'size': 12},
+                {'type': 'bar', 'title': 'Return on Ad Spend (ROAS)', 'anchor': 'E'},
+            ]},
+            daily_sheet('📈 Daily Trends', 'Daily Performance Trends',
+                        'Use Excel filters to analyze specific date ranges', table_name='DailyData',
+                        chart=('ROAS Trend Over Time', 'ROAS Trend: Perpetua vs Non-Perpetua')),
+            {'name': '🏆 Top ASINs', 'col': 'B', 'span': 'M', 'widths': {'B': 15, 'C': 15}, 'width': 13, 'blocks': [
+                {'type': 'title', 'text': 'Top 50 ASINs by Sales Revenue', 'size': 16},
+                {'type': 'table', 'source': 'asins', 'top': ('Sales', 50), 'columns': ASIN_COLUMNS},
+            ]},
+            {'name': '💡 Key Insights', 'col': 'B', 'span': 'G', 'widths': {'B': 34}, 'width': 18, 'blocks': [
+                {'type': 'title', 'text': 'Performance Insights & Recommendations', 'size': 16},
+                {'type': 'notes', 'items': [
+                    ('🎯 PRIMARY FINDING',),
+                    ('{roas_leader} Efficiency Advantage', '{roas_gap:.1%} ROAS gap between the platforms'),
+                    ('', 'Non-Perpetua: {np[ROAS]:.2f}x vs Perpetua: {p[ROAS]:.2f}x'),
+                    (),
+                    ('💰 REVENUE IMPACT',),
+                    ('Perpetua Volume Leadership',
+                     'Generates ${p[Total_Sales]:,.0f} in sales ({sales_share:.0%} of total)'),
+                    ('Scale Advantage', '{p[Unique_ASINs]:.0f} ASINs managed vs {np[Unique_ASINs]:.0f}'),
+                    (),
+                    ('⚠️ OPTIMIZATION OPPORTUNITY',),
+                    ('Efficiency Gap', 'If Perpetua matched non-Perpetua ROAS:'),
+                    ('Potential Additional Revenue', '${roas_match_upside:,.0f}'),
+                    (),
+                    ('📋 RECOMMENDATIONS',),
+                    ('1. HIGH PRIORITY', 'Analyze non-Perpetua keyword strategies'),
+                    ('', 'Apply efficient tactics to Perpetua campaigns'),
+                    ('2. MEDIUM PRIORITY', 'Expand negative keyword management'),
+                    ('', 'Reduce wasted spend by 10-15%'),
+                    ('3. STRATEGIC', 'Migrate top non-Perpetua ASINs to Perpetua'),
+                    ('', 'Combine scale + efficiency'),
+                ]},
+            ]},
+        ],
+        'highlights': [
+            '\nFeatures:',
+            '  ✓ Embedded charts (not external PNGs)',
+            '  ✓ Filterable daily data table',
+            '  ✓ Top 50 ASINs with color coding',
+            '  ✓ Key insights and recommendations',
+        ],
+    },
+
+    'interactive': {
+        'file': 'Perpetua_Interactive_Dashboard_%Y%m%d.xlsx',
+        'banner': ['GENERATING INTERACTIVE DASHBOARD WITH DATE CONTROLS'],
+        'sheets': [
+            {'name': '🎛️ Dashboard & Controls', 'col': 'B', 'span': 'H', 'widths': {'B': 22}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA PERFORMANCE DASHBOARD', 'size': 20},
+                {'type': 'date_selector', 'label': '📅 DATE RANGE CONTROLS', 'notes': [
+                    '💡 Change the dates above to filter data. The summary and ROAS chart recalculate automatically!',
+                    'Quick filters: Last 30 Days starts {last30_start:%Y-%m-%d} | All Time starts {start:%Y-%m-%d}',
+                ]},
+                {'type': 'heading', 'text': '📊 PERFORMANCE SUMMARY',
+                 'lines': ['Full data range: {start:%b %d, %Y} to {end:%b %d, %Y}']},
+                {'type': 'comparison', 'live': True, 'headers': ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference',
+                                                                 '% Diff', 'Winner'],
+                 'rows': [('Total Spend', 'Total_Spend', '$', None), ('Total Sales', 'Total_Sales', '$', False),
+                          ('Total Orders', 'Total_Orders', '#', False), ('ROAS', 'ROAS', 'x', False),
+                          ('ACOS', 'ACOS', '%', True)]},
+                {'type': 'heading', 'text': 'ROAS Comparison', 'size': 12},
+                {'type': 'bar', 'title': 'ROAS: Perpetua vs Non-Perpetua', 'anchor': 'E'},
+            ]},
+            daily_sheet('📅 Daily Data (Filterable)', 'DAILY PERFORMANCE DATA',
+                        'Use AutoFilter to analyze specific date ranges or advertising types'),
+            {'name': '📖 How to Use', 'col': 'B', 'span': 'H', 'widths': {'B': 16}, 'width': 14, 'blocks': [
+                {'type': 'title', 'text': '📖 DASHBOARD USER GUIDE', 'size': 16},
+                {'type': 'notes', 'items': [
+                    ('🎯 PURPOSE',),
+                    ('', 'This dashboard compares Perpetua vs Non-Perpetua ASIN performance'),
+                    ('', 'Analyze trends, identify optimization opportunities, and track improvements'),
+                    (),
+                    ('🎛️ HOW TO ADJUST DATE RANGE',),
+                    ('1.', 'Go to "Dashboard & Controls" sheet'),
+                    ('2.', 'Click on the Start Date cell ({start_cell}) and pick a date from the dropdown'),
+                    ('3.', 'Click on the End Date cell ({end_cell}) and pick a date'),
+                    ('4.', 'All summary metrics and the ROAS chart recalculate'),
+                    (),
+                    ('📊 USING THE DAILY DATA SHEET',),
+                    ('1.', 'Navigate to "Daily Data (Filterable)" sheet'),
+                    ('2.', 'Click filter dropdown arrows in header row'),
+                    ('3.', 'Select specific dates or date ranges'),
+                    ('4.', 'Filter by Advertising Type (Perpetua or Non-Perpetua)'),
+                    ('5.', 'Filtered data updates instantly'),
+                    (),
+                    ('💡 QUICK ANALYSIS TIPS',),
+                    ('', '• Compare last 7 days vs last 30 days trends'),
+                    ('', '• Filter to weekdays only to remove weekend seasonality'),
+                    ('', '• Look for ROAS trends - improving or declining?'),
+                    ('', '• Identify days with unusually high/low performance'),
+                    (),
+                    ('📈 KEY METRICS EXPLAINED',),
+                    ('ROAS', 'Return on Ad Spend = Sales ÷ Spend (higher is better)'),
+                    ('', 'Target: 2.0+ is good, 3.0+ is excellent'),
+                    ('ACOS', 'Advertising Cost of Sales = Spend ÷ Sales (lower is better)'),
+                    ('', 'Target: <50% is good, <30% is excellent'),
+                    (),
+                    ('🎯 PERFORMANCE INSIGHTS',),
+                    ('Perpetua', '{p[ROAS]:.2f}x ROAS - Manages higher volume products'),
+                    ('Non-Perpetua', '{np[ROAS]:.2f}x ROAS - More efficient per dollar spent'),
+                    ('Opportunity', 'Apply non-Perpetua efficiency strategies to Perpetua ASINs'),
+                    (),
+                    ('🔄 MONTHLY UPDATES',),
+                    ('1.', 'Export new campaign data from Amazon/Perpetua'),
+                    ('2.', 'Save to: data/recent-reports/ folder'),
+                    ('3.', 'Run: python3 scripts/refresh_reports.py'),
+                    ('4.', 'New dashboard generated with updated data'),
+                ]},
+            ]},
+        ],
+        'highlights': [
+            '\n🎛️ INTERACTIVE FEATURES:',
+            '  ✓ Date range dropdowns in cells {start_cell} and {end_cell}',
+            '  ✓ Summary metrics and ROAS chart recalculate for the selected range',
+            '  ✓ Daily data sheet with AutoFilter',
+            "\n📖 See 'How to Use' sheet for detailed instructions",
+        ],
+    },
+
+    'saas': {
+        'file': 'SaaS_Performance_Analysis_Comprehensive_%Y%m%d_%H%M.xlsx',
+        'banner': ['COMPREHENSIVE SaaS vs NON-SaaS PERFORMANCE ANALYSIS DASHBOARD',
+                   'Research-Based | Statistically Rigorous | Executive-Ready'],
+        'sheets': [
+            {'name': '📊 Executive Summary', 'col': 'B', 'span': 'I', 'widths': {'B': 26, 'H': 22}, 'blocks': [
+                {'type': 'title', 'text': 'SaaS PLATFORM PERFORMANCE ANALYSIS', 'size': 20, 'lines': [
+                    'Perpetua (SaaS) vs Manual Advertising | {start:%b %d} - {end:%b %d, %Y}',
+                    'Generated: {now:%B %d, %Y at %I:%M %p}']},
+                {'type': 'heading', 'text': '🎯 KEY FINDING', 'color': 'bad', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '{roas_leader} leads on per-ASIN ROAS by {mean_roas_gap:.0%}',
+                    'CAUTION: Raw comparison does not adjust for product mix, category, or selection bias',
+                ]},
+                {'type': 'heading', 'text': 'PERFORMANCE OVERVIEW', 'lines': ['Per-ASIN means']},
+                {'type': 'comparison', 'source': 'asin_means', 'significance': True,
+                 'headers': ['Metric', 'Perpetua (SaaS)', 'Non-Perpetua (Manual)', 'Difference', '% Diff',
+                             'Winner', 'Statistical Significance'],
+                 'rows': [('Total Spend', 'Spend', '$', None), ('Total Revenue', 'Sales', '$', False),
+                          ('Total Orders', 'Orders', '#', False), ('ROAS', 'ROAS', 'x', False),
+                          ('ACOS', 'ACOS', '%', True), ('CPC', 'CPC', '$.', True), ('CTR', 'CTR', '%', False),
+                          ('CVR', 'CVR', '%', False)]},
+                {'type': 'heading', 'text': 'ROAS Comparison', 'size': 12},
+                {'type': 'bar', 'title': 'ROAS: Perpetua vs Non-Perpetua', 'anchor': 'E'},
+            ]},
+            {'name': '📈 Statistical Analysis', 'col': 'B', 'span': 'V', 'width': 14, 'blocks': [
+                {'type': 'title', 'text': 'STATISTICAL RIGOR & SIGNIFICANCE TESTING', 'size': 16, 'lines': [
+                    "Welch's t-test (assumes unequal variances), 95% confidence intervals, Cohen's d effect sizes"]},
+                {'type': 'table', 'source': 'stats', 'formats': STAT_FORMATS, 'filter': False},
+            ]},
+            daily_sheet('📅 Time Series Trends', 'DAILY PERFORMANCE TRENDS',
+                        'Filter by date or platform to focus the trend'),
+            {'name': '🔍 ASIN Detail', 'col': 'B', 'span': 'M', 'widths': {'B': 15, 'C': 15}, 'width': 13, 'blocks': [
+                {'type': 'title', 'text': 'ASIN-LEVEL PERFORMANCE DATA', 'size': 16, 'lines': ['Top 100 by spend']},
+                {'type': 'table', 'source': 'asins', 'top': ('Spend', 100), 'columns': ASIN_COLUMNS},
+            ]},
+            {'name': '📖 Methodology', 'col': 'B', 'span': 'G', 'widths': {'B': 24}, 'width': 18, 'blocks': [
+                {'type': 'title', 'text': 'METHODOLOGY & DATA DICTIONARY', 'size': 16},
+                {'type': 'notes', 'items': [
+                    ('PURPOSE',),
+                    ('', 'Compare Perpetua (SaaS advertising automation) vs Manual advertising management'),
+                    ('', 'Identify performance differences and statistical significance'),
+                    (),
+                    ('DATA SOURCE',),
+                    ('', 'Amazon Advertising data from {start:%Y-%m-%d} to {end:%Y-%m-%d}'),
+                    ('', '{p[Unique_ASINs]:,} Perpetua ASINs, {np[Unique_ASINs]:,} Non-Perpetua ASINs'),
+                    (),
+                    ('STATISTICAL METHODS',),
+                    ('', "Welch's t-test: Compare means between groups (unequal variances assumed)"),
+                    ('', '95% Confidence Intervals: Range where true mean likely falls'),
+                    ('', "Cohen's d: Effect size (0.2=small, 0.5=medium, 0.8=large)"),
+                    ('', 'P-value < 0.05: Statistically significant difference'),
+                    (),
+                    ('KEY METRICS',),
+                    ('ROAS', 'Return on Ad Spend = Revenue / Spend (higher is better, target 2.0+)'),
+                    ('ACOS', 'Advertising Cost of Sales = Spend / Revenue (lower is better, target <30%)'),
+                    ('CPC', 'Cost Per Click = Spend / Clicks (lower is better)'),
+                    ('CTR', 'Click-Through Rate = Clicks / Impressions (higher is better, target >0.5%)'),
+                    ('CVR', 'Conversion Rate = Orders / Clicks (higher is better, target >10%)'),
+                    (),
+                    ('LIMITATIONS',),
+                    ('', '1. Selection bias: Products not randomly assigned to platforms'),
+                    ('', '2. Product mix may differ (category, price, competition)'),
+                    ('', '3. Confounding variables not controlled (seasonality, external factors)'),
+                    ('', '4. Causation cannot be inferred from correlation'),
+                    (),
+                    ('RECOMMENDATIONS',),
+                    ('', '1. Do NOT conclude one platform is superior based on raw ROAS alone'),
+                    ('', '2. Consider product mix, category, and price point differences'),
+                    ('', '3. Conduct matched analysis or stratified comparison for fair evaluation'),
+                    ('', '4. Track trends over time rather than single point-in-time snapshots'),
+                ]},
+            ]},
+        ],
+        'highlights': [
+            '\n📈 INSIGHTS:',
+            '  • Perpetua ROAS: {p[ROAS]:.2f}x',
+            '  • Non-Perpetua ROAS: {np[ROAS]:.2f}x',
+            '  • Difference: {roas_gap:.0%} ({roas_leader} better)',
+            "\n⚠️  IMPORTANT: See 'Methodology' sheet for limitations and recommendations",
+        ],
+    },
+
+    'final': {
+        'file': 'Perpetua_Dashboard_FINAL_%Y%m%d_%H%M.xlsx',
+        'banner': ['FINAL SaaS PERFORMANCE DASHBOARD - CORRECTED AGGREGATE METRICS'],
+        'sheets': [
+            {'name': '📊 Executive Dashboard', 'col': 'C', 'span': 'J', 'row': 3, 'widths': {'C': 34}, 'blocks': [
+                {'type': 'title', 'text': 'SaaS PLATFORM PERFORMANCE COMPARISON', 'size': 22, 'lines': [
+                    'Perpetua (SaaS Automation) vs Manual Advertising',
+                    '{start:%B %d, %Y} - {end:%B %d, %Y} ({days} days)']},
+                {'type': 'cards', 'key': 'ROAS', 'labels': ('PERPETUA (SaaS)', 'NON-PERPETUA (Manual)')},
+                {'type': 'heading', 'text': 'ALL PERFORMANCE METRICS'},
+                {'type': 'comparison',
+                 'headers': ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', '% Better', 'Winner'],
+                 'rows': [*VOLUME_ROWS, ('Unique ASINs', 'Unique_ASINs', '#', None), None,
+                          *RATIO_ROWS, None,
+                          ('Spend per ASIN', 'Spend_Per_ASIN', '$', True),
+                          ('Sales per ASIN', 'Sales_Per_ASIN', '$', False),
+                          ('Orders per ASIN', 'Orders_Per_ASIN', '#', False)]},
+                {'type': 'heading', 'text': '💡 KEY INSIGHTS', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '1. {roas_leader} achieves {roas_gap:.0%} better ROAS '
+                    '(Non-Perpetua {np[ROAS]:.2f}x vs Perpetua {p[ROAS]:.2f}x)',
+                    '2. Perpetua manages {p[Unique_ASINs]:.0f} ASINs generating ${p[Total_Sales]:,.0f} in sales',
+                    '3. Non-Perpetua manages {np[Unique_ASINs]:.0f} ASINs generating ${np[Total_Sales]:,.0f} in sales',
+                    '4. Perpetua spends {spend_ratio:.1f}x as much, with a {roas_gap:.0%} ROAS gap',
+                    '5. If Perpetua matched Non-Perpetua ROAS: Additional ${roas_match_upside:,.0f} revenue',
+                ]},
+            ]},
+            daily_sheet('📅 Daily Data (Filter by Date)', 'DAILY PERFORMANCE DATA - FILTERABLE',
+                        'Click filter dropdowns ▼ to analyze specific date ranges'),
+            {'name': '🔍 Top 100 ASINs', 'col': 'B', 'span': 'M', 'widths': {'B': 15, 'C': 15}, 'width': 13,
+             'blocks': [
+                 {'type': 'title', 'text': 'TOP 100 ASINs BY TOTAL SPEND', 'size': 16},
+                 {'type': 'table', 'source': 'asins', 'top': ('Spend', 100), 'columns': ASIN_COLUMNS},
+             ]},
+        ],
+        'highlights': [
+            '\n📊 CORRECT AGGREGATE METRICS:',
+            '  Perpetua:     {p[ROAS]:.2f}x ROAS, {p[ACOS]:.1%} ACOS',
+            '  Non-Perpetua: {np[ROAS]:.2f}x ROAS, {np[ACOS]:.1%} ACOS',
+            '  Difference:   {roas_gap:.0%} better ROAS for {roas_leader}',
+        ],
+    },
+
+    'date_selector': {
+        'file': 'Perpetua_Dashboard_with_DateSelector_%Y%m%d_%H%M.xlsx',
+        'banner': ['DASHBOARD WITH INTERACTIVE DATE SELECTOR DROPDOWNS'],
+        'sheets': [
+            {'name': '📊 Dashboard', 'col': 'C', 'span': 'J', 'widths': {'C': 32}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA (SaaS) vs MANUAL ADVERTISING', 'size': 20,
+                 'lines': ['Performance Comparison Dashboard']},
+                {'type': 'date_selector', 'label': '📅 SELECT DATE RANGE:', 'notes': [
+                    '👆 Click cells {start_cell} and {end_cell} to select dates from dropdown menus',
+                    'Summary metrics and the ROAS chart recalculate for the selected range. '
+                    'Use "Daily Data" sheet filters for row-level analysis.',
+                ]},
+                {'type': 'heading', 'text': 'PERFORMANCE COMPARISON'},
+                {'type': 'comparison', 'live': True, 'headers': PLATFORM_HEADERS,
+                 'rows': [('Unique ASINs', 'Unique_ASINs', '#', None), *VOLUME_ROWS, None, *RATIO_ROWS]},
+                {'type': 'bar', 'title': 'ROAS Comparison', 'anchor': 'F'},
+            ]},
+            daily_sheet('📅 Daily Data (Filter Here)', 'DAILY PERFORMANCE DATA - USE FILTERS TO SELECT DATE RANGE',
+                        '▼ Click dropdown arrows in header row to filter by date or platform',
+                        chart=('Daily ROAS', 'Daily ROAS Trend')),
+            {'name': '📖 Instructions', 'col': 'C', 'span': 'I', 'widths': {'C': 18}, 'width': 14, 'blocks': [
+                {'type': 'title', 'text': 'HOW TO USE DATE SELECTORS', 'size': 16},
+                {'type': 'notes', 'items': [
+                    ('METHOD 1: Use Date Dropdowns on Dashboard Sheet',),
+                    ('Step 1', 'Go to "📊 Dashboard" sheet'),
+                    ('Step 2', 'Click on cell {start_cell} (Start Date)'),
+                    ('Step 3', 'You will see a dropdown arrow appear - click it'),
+                    ('Step 4', 'Select your desired start date from the list'),
+                    ('Step 5', 'Click on cell {end_cell} (End Date) and select end date'),
+                    ('Step 6', 'All summary metrics and the ROAS chart recalculate instantly'),
+                    (),
+                    ('METHOD 2: Use AutoFilter on Daily Data Sheet (RECOMMENDED)',),
+                    ('Step 1', 'Go to "📅 Daily Data" sheet'),
+                    ('Step 2', 'Click the dropdown arrow ▼ in the "Date" column header'),
+                    ('Step 3', 'Choose Date Filters > Between...'),
+                    ('Step 4', 'Enter your custom start and end dates'),
+                    ('Step 5', 'Click OK - data instantly filters to your range'),
+                    ('Step 6', 'You can also filter by "Advertising Type" column'),
+                    (),
+                    ('EXAMPLE ANALYSES',),
+                    ('Last 30 Days', 'Filter dates: {last30_start:%Y-%m-%d} to {end:%Y-%m-%d}'),
+                    ('Single Month', 'Filter dates: first to last day of the month'),
+                    ('Perpetua Only', 'Filter Advertising Type to "Perpetua"'),
+                    ('Weekdays Only', 'Filter Date > Custom > select Mon-Fri'),
+                    (),
+                    ('KEY METRICS EXPLAINED',),
+                    ('ROAS', 'Higher is better | Perpetua: {p[ROAS]:.2f}x, Non-Perpetua: {np[ROAS]:.2f}x'),
+                    ('ACOS', 'Lower is better | Perpetua: {p[ACOS]:.1%}, Non-Perpetua: {np[ACOS]:.1%}'),
+                    ('CPC', 'Lower is better | Perpetua: ${p[CPC]:.2f}, Non-Perpetua: ${np[CPC]:.2f}'),
+                    ('CTR', 'Higher is better | Perpetua: {p[CTR]:.2%}, Non-Perpetua: {np[CTR]:.2%}'),
+                    ('CVR', 'Higher is better | Perpetua: {p[CVR]:.2%}, Non-Perpetua: {np[CVR]:.2%}'),
+                ]},
+            ]},
+        ],
+        'highlights': [
+            '\n🎛️ DATE SELECTOR FEATURES:',
+            '  ✓ Dropdown menus in cells {start_cell} and {end_cell}',
+            '  ✓ Summary metrics are live formulas over the hidden _Measures sheet',
+            '  ✓ AutoFilter on Daily Data sheet for instant filtering',
+            '\n📈 RESULTS:',
+            '  Perpetua:     {p[ROAS]:.2f}x ROAS',
+            '  Non-Perpetua: {np[ROAS]:.2f}x ROAS',
+        ],
+    },
+
+    'campaign': {
+        'file': 'Campaign_Report_Dashboard_%Y%m%d_%H%M.xlsx',
+        'banner': ['DASHBOARD GENERATION FROM CAMPAIGN REPORT (PRIMARY DATA SOURCE)'],
+        'basis': 'campaign',
+        'sheets': [
+            {'name': '📊 Dashboard', 'col': 'C', 'span': 'J', 'widths': {'C': 32}, 'blocks': [
+                {'type': 'title', 'text': 'CAMPAIGN PERFORMANCE: PERPETUA vs MANUAL', 'size': 20, 'lines': [
+                    'Based on Campaign Report | {start:%b %d, %Y} - {end:%b %d, %Y}',
+                    '📄 Data Source: processed campaign report '
+                    '({p[Unique_Campaigns]:,} Perpetua + {np[Unique_Campaigns]:,} Non-Perpetua campaigns)']},
+                {'type': 'date_selector', 'label': '📅 DATE RANGE SELECTOR', 'notes': [SELECTOR_PROMPT]},
+                {'type': 'heading', 'text': 'ALL PERFORMANCE METRICS'},
+                {'type': 'comparison', 'live': True,
+                 'headers': ['Metric', 'Perpetua (SaaS)', 'Non-Perpetua', 'Difference', '% Diff', 'Winner'],
+                 'rows': [('Campaigns Analyzed', 'Unique_Campaigns', '#', None),
+                          ('Unique ASINs', 'Unique_ASINs', '#', None),
+                          ('Total Spend', 'Total_Spend', '$', None),
+                          ('Total Sales (7-day attr.)', 'Total_Sales', '$', False),
+                          *VOLUME_ROWS[2:], None, *RATIO_ROWS]},
+            ]},
+            daily_sheet('📅 Daily Data', 'DAILY CAMPAIGN PERFORMANCE - FILTER BY DATE HERE',
+                        '▼ Click dropdown arrows to filter | Data from Campaign Report'),
+        ],
+        'highlights': [
+            '\n📊 BASIS: Campaign Report (processed campaign dataset)',
+            '  Perpetua:     {p[ROAS]:.2f}x ROAS, ${p[Total_Spend]:,.0f} spend',
+            '  Non-Perpetua: {np[ROAS]:.2f}x ROAS, ${np[Total_Spend]:,.0f} spend',
+            '\n✅ Date selectors in cells {start_cell} and {end_cell} (dropdown menus drive live summary formulas)',
+        ],
+    },
+
+    'combined': {
+        'file': 'Perpetua_Dashboard_COMBINED_%Y%m%d_%H%M.xlsx',
+        'banner': ['COMBINED DASHBOARD: Campaign Report + Advertised Products',
+                   'Matched by ASIN/SKU | All Metrics Included | Date Normalized'],
+        'basis': 'combined',
+        'sheets': [
+            {'name': '📊 Dashboard', 'col': 'C', 'span': 'J', 'widths': {'C': 32}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA vs MANUAL - COMPREHENSIVE ANALYSIS', 'size': 20, 'lines': [
+                    '📊 Combined Data: Campaign Report + Advertised Products | Matched by ASIN/SKU',
+                    '{start:%B %d, %Y} - {end:%B %d, %Y} | {days} days']},
+                {'type': 'date_selector', 'label': '📅 DATE RANGE (Click for dropdown)',
+                 'start_label': 'Start:', 'end_label': 'End:',
+                 'notes': ['⬆️ Click cells above to see dropdown ▼ | Or filter "Daily Data" sheet']},
+                {'type': 'heading', 'text': 'COMPREHENSIVE PERFORMANCE METRICS'},
+                {'type': 'comparison', 'live': True, 'headers': PLATFORM_HEADERS, 'rows': [
+                    '📊 DATA COVERAGE',
+                    ('Campaigns Analyzed', 'Unique_Campaigns', '#', None),
+                    ('Unique ASINs/Products', 'Unique_ASINs', '#', None),
+                    '💰 VOLUME METRICS',
+                    ('Total Ad Spend', 'Total_Spend', '$', None),
+                    ('Total Sales Revenue', 'Total_Sales', '$', False),
+                    *VOLUME_ROWS[2:],
+                    '🎯 EFFICIENCY METRICS',
+                    *RATIO_ROWS,
+                    '📈 PRODUCTIVITY',
+                    ('Spend per ASIN', 'Spend_Per_ASIN', '$', True),
+                    ('Sales per ASIN', 'Sales_Per_ASIN', '$', False),
+                ]},
+            ]},
+            daily_sheet('📅 Daily Data (Filter Here)', 'DAILY DATA - COMBINED SOURCES',
+                        '▼ Click filter dropdowns to select date range | '
+                        'Combined from Campaign + Advertised Products reports'),
+        ],
+        'highlights': [
+            '\n📊 DATA SOURCES COMBINED: campaign report + advertised products',
+            '  Perpetua:     {p[Unique_Campaigns]:,} campaigns, {p[Unique_ASINs]:,} ASINs, {p[ROAS]:.2f}x ROAS',
+            '  Non-Perpetua: {np[Unique_Campaigns]:,} campaigns, {np[Unique_ASINs]:,} ASINs, {np[ROAS]:.2f}x ROAS',
+            '\n✅ Date dropdowns in cells {start_cell} and {end_cell} drive live summary formulas',
+        ],
+    },
+
+    'context': {
+        'file': 'Perpetua_FINAL_with_Context_%Y%m%d_%H%M.xlsx',
+        'banner': ['FINAL DASHBOARD WITH STRATEGIC CONTEXT & DEEP INSIGHTS'],
+        'basis': 'campaign',
+        'sheets': [
+            {'name': '📊 Executive Summary', 'col': 'C', 'span': 'K', 'widths': {'C': 32}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA (SaaS) vs MANUAL ADVERTISING', 'size': 20,
+                 'lines': ['Strategic Performance Analysis with Full Context']},
+                {'type': 'heading', 'text': '⚠️ CRITICAL CONTEXT', 'color': 'bad', 'gap': 0},
+                {'type': 'lines', 'fill': 'input', 'color': 'bad', 'items': [
+                    'Raw ROAS comparison can be misleading - read carefully:',
+                    '1. Perpetua spends ${p[Spend_Per_ASIN]:,.0f} per ASIN vs ${np[Spend_Per_ASIN]:,.0f} '
+                    '({asin_spend_ratio:.1f}x more)',
+                    '2. Lower ROAS at higher spend is EXPECTED (diminishing returns law)',
+                    '3. Wasted spend on money-losing campaigns: Perpetua {p[Pct_Losing_Spend]:.0%} '
+                    'vs Non-Perpetua {np[Pct_Losing_Spend]:.0%}',
+                    '4. Perpetua generates ${p[Total_Sales]:,.0f} sales vs ${np[Total_Sales]:,.0f}',
+                ]},
+                {'type': 'lines', 'items': ['📅 Analysis Period: {start:%b %d, %Y} - {end:%b %d, %Y}']},
+                {'type': 'heading', 'text': 'COMPREHENSIVE PERFORMANCE METRICS'},
+                {'type': 'comparison', 'headers': PLATFORM_HEADERS, 'pct_format': '+0%;-0%', 'rows': [
+                    ('Campaigns', 'Unique_Campaigns', '#', None),
+                    ('ASINs/Products', 'Unique_ASINs', '#', None),
+                    ('Total Spend', 'Total_Spend', '$', None),
+                    ('Total Sales', 'Total_Sales', '$', False),
+                    ('Total Orders', 'Total_Orders', '#', False),
+                    None,
+                    *RATIO_ROWS,
+                    '💸 LOSS ANALYSIS',
+                    ('Losing Campaigns (ROAS < 1)', 'Losing_Campaigns', '#', True),
+                    ('Spend on Losers', 'Losing_Spend', '$', True),
+                    ('% Wasted Spend', 'Pct_Losing_Spend', '%', True),
+                    ('Net Loss', 'Net_Loss', '$', True),
+                ]},
+                {'type': 'heading', 'text': '💡 STRATEGIC INSIGHTS', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '✓ Perpetua generates ${p[Total_Sales]:,.0f} in sales vs ${np[Total_Sales]:,.0f}',
+                    '✓ Wasted spend: Perpetua {p[Pct_Losing_Spend]:.0%} vs Non-Perpetua {np[Pct_Losing_Spend]:.0%}',
+                    '⚠ Perpetua operates at {asin_spend_ratio:.1f}x the spend per ASIN '
+                    '(${p[Spend_Per_ASIN]:,.0f} vs ${np[Spend_Per_ASIN]:,.0f})',
+                    '⚠ Lower ROAS at scale is NORMAL - Perpetua captures incremental demand',
+                    '',
+                    '💰 OPPORTUNITY: ${np[Net_Loss]:,.0f} wasted on Non-Perpetua losers vs '
+                    '${p[Net_Loss]:,.0f} on Perpetua',
+                    '💰 ACTION: Pause {np[Losing_Campaigns]:,} Non-Perpetua losing campaigns = '
+                    '${np[Net_Loss]:,.0f} savings',
+                ]},
+                {'type': 'heading', 'text': '🎯 RECOMMENDED ACTIONS', 'gap': 0},
+                {'type': 'lines', 'split': 'G', 'items': [
+                    ('1. HIGH: Pause {np[Losing_Campaigns]:,} Non-Perpetua losing campaigns',
+                     'Save ${np[Net_Loss]:,.0f}/period'),
+                    ('2. HIGH: Investigate why Non-Perpetua has {np[Pct_Losing_Spend]:.0%} wasted spend',
+                     'Risk management'),
+                    ('3. MEDIUM: Scale Perpetua high-ROAS campaigns 20-30%', 'Grow revenue at proven efficiency'),
+                    ('4. STRATEGIC: Perpetua is working - focus on optimization not replacement',
+                     'Continue automation'),
+                ]},
+            ]},
+            daily_sheet('📅 Daily Data', 'DAILY CAMPAIGN PERFORMANCE', 'Campaign report, campaigns with spend'),
+        ],
+        'documents': [('STRATEGIC_CONTEXT.md', """
+# STRATEGIC CONTEXT FOR PERPETUA vs NON-PERPETUA COMPARISON
+
+## The Story to Tell Executives
+
+### DON'T Say:
+"Non-Perpetua has {np[ROAS]:.2f}x ROAS vs Perpetua's {p[ROAS]:.2f}x, so the better platform is obvious"
+
+### DO Say:
+"Perpetua drives {sales_ratio:.1f}x the sales of Non-Perpetua while operating at {asin_spend_ratio:.1f}x higher
+scale per product. ROAS differences at that scale reflect expected diminishing returns,
+not platform performance on their own."
+
+## Key Context Points
+
+1. **Scale Context**
+   - Perpetua: ${p[Spend_Per_ASIN]:,.0f} spend/ASIN
+   - Non-Perpetua: ${np[Spend_Per_ASIN]:,.0f} spend/ASIN
+   - {asin_spend_ratio:.1f}x difference in investment intensity
+
+2. **Loss Avoidance Context**
+   - Perpetua: {p[Pct_Losing_Spend]:.0%} of spend losing money
+   - Non-Perpetua: {np[Pct_Losing_Spend]:.0%} of spend losing money
+   - Wasted-spend ratio (Non-Perpetua / Perpetua): {waste_ratio:.1f}x
+
+3. **Total Value Context**
+   - Perpetua sales: ${p[Total_Sales]:,.0f}
+   - Non-Perpetua sales: ${np[Total_Sales]:,.0f}
+
+4. **Diminishing Returns Context**
+   - First $100 in ad spend: ROAS might be 5.0x
+   - Next $1,000 in ad spend: ROAS might be 2.5x
+   - Next $10,000 in ad spend: ROAS might be 1.8x
+   - This is NORMAL and EXPECTED at scale
+
+## The Real Opportunity
+
+The issue isn't "Perpetua vs Non-Perpetua" - it's:
+${np[Net_Loss]:,.0f} lost on losing Non-Perpetua campaign-days (${p[Net_Loss]:,.0f} on Perpetua)
+
+**Recommendation:** Pause the losers, not the platform.
+
+Dashboard: {workbook}
+Generated: {now:%Y-%m-%d %H:%M:%S}
+""")],
+        'highlights': [
+            '\n🎯 KEY TAKEAWAYS:',
+            '  ✓ Sales: Perpetua ${p[Total_Sales]:,.0f} vs Non-Perpetua ${np[Total_Sales]:,.0f}',
+            '  ✓ Wasted spend: {p[Pct_Losing_Spend]:.0%} vs {np[Pct_Losing_Spend]:.0%}',
+            '  ✓ Spend per ASIN: {asin_spend_ratio:.1f}x',
+            '\n💰 Real Opportunity: ${np[Net_Loss]:,.0f} in Non-Perpetua losses to eliminate',
+        ],
+    },
+
+    'ultimate': {
+        'file': 'Perpetua_ULTIMATE_YoY_MoM_TACoS_%Y%m%d_%H%M.xlsx',
+        'banner': ['ULTIMATE DASHBOARD - COMPLETE ANALYSIS', 'YoY + MoM + TACoS + Correlation + Context + All Metrics'],
+        'sheets': [
+            {'name': '📊 YoY + MoM Summary', 'col': 'C', 'span': 'K', 'widths': {'C': 22}, 'blocks': [
+                {'type': 'title', 'text': 'YEAR-OVER-YEAR & MONTH-OVER-MONTH ANALYSIS', 'size': 18},
+                {'type': 'heading', 'text': 'YEAR-OVER-YEAR COMPARISON'},
+                *yoy_blocks('december', 'DECEMBER: {yoy[december][before_year]} vs {yoy[december][after_year]}'),
+                *yoy_blocks('january', 'JANUARY: {yoy[january][before_year]} vs {yoy[january][after_year]}'),
+                {'type': 'heading', 'text': 'MONTH-OVER-MONTH TRENDS ({start:%b %Y} → {end:%b %Y})'},
+                {'type': 'table', 'source': 'monthly', 'columns': MONTHLY_COLUMNS, 'rename': AD_RENAME},
+            ]},
+            {'name': '📈 Ad→Organic Correlation', 'col': 'C', 'span': 'J', 'row': 3, 'blocks': [
+                {'type': 'title', 'text': 'DOES ADVERTISING DRIVE ORGANIC SALES?', 'size': 18},
+                {'type': 'lines', 'items': [
+                    '{organic[answer]}',
+                    'Perpetua: {organic[p][corr]:.2f} correlation at a {organic[p][lag]}-day lag '
+                    '({organic[p][p_label]}) - {organic[p][verdict]}',
+                    'Elasticity: 1% ad spend increase → {organic[p][elasticity]:.2f}% organic sales change',
+                    '',
+                    'Non-Perpetua: {organic[np][corr]:.2f} correlation ({organic[np][p_label]})',
+                    'Non-Perpetua products are mostly organic-strong, so ads add less on top',
+                ]},
+            ]},
+        ],
+        'documents': [('ULTIMATE_ANALYSIS_SUMMARY.txt', """
+ULTIMATE ANALYSIS SUMMARY
+========================
+
+YoY PERFORMANCE:
+  December {yoy[december][before_year]}: {yoy[december][before][ROAS]:.2f}x ROAS
+  December {yoy[december][after_year]}: {yoy[december][after][ROAS]:.2f}x ROAS ({yoy[december][growth][ROAS]:+.0f}%)
+
+  January {yoy[january][before_year]}: {yoy[january][before][ROAS]:.2f}x ROAS
+  January {yoy[january][after_year]}: {yoy[january][after][ROAS]:.2f}x ROAS ({yoy[january][growth][ROAS]:+.0f}%)
+
+CORRELATION ANALYSIS (Ad → Organic):
+  Perpetua: {organic[p][corr]:.2f} correlation ({organic[p][p_label]}) - {organic[p][proven]} linkage
+  Elasticity: 1% ad spend → {organic[p][elasticity]:.2f}% organic change
+
+  Non-Perpetua: {organic[np][corr]:.2f} correlation ({organic[np][p_label]})
+  {organic[np][strength]} {organic[np][direction]} link between ad spend and organic sales
+
+TACOS METRICS ({start:%b %d, %Y} - {end:%b %d, %Y}):
+  Perpetua: {p[TACoS]:.1%} TACoS, {p[T_ROAS]:.1f}x T-ROAS, {p[Organic_Ratio]:.0%} organic
+  Non-Perpetua: {np[TACoS]:.1%} TACoS, {np[T_ROAS]:.1f}x T-ROAS, {np[Organic_Ratio]:.0%} organic
+
+THE COMPLETE STORY:
+✓ Perpetua ad → organic link: {organic[p][proven]} ({organic[p][corr]:.2f} correlation)
+✓ Total business revenue: ${total_revenue:,.0f} (orders)
+
+File: {workbook}
+""")],
+        'highlights': [
+            '\n📊 INCLUDES:',
+            '  ✅ Year-over-Year: December and January',
+            '  ✅ Month-over-Month trends',
+            '  ✅ TACoS: Total business impact metrics',
+            '\n🎯 KEY INSIGHTS:',
+            '  • December ROAS {yoy[december][before][ROAS]:.2f}x → {yoy[december][after][ROAS]:.2f}x',
+            '  • January ROAS {yoy[january][before][ROAS]:.2f}x → {yoy[january][after][ROAS]:.2f}x',
+            '  • Total business: ${total_revenue:,.0f} revenue',
+        ],
+    },
+
+    'pre_post': {
+        'file': 'Perpetua_Before_After_Analysis_%Y%m%d_%H%M.xlsx',
+        'banner': ['CREATING PRE vs POST PERPETUA DASHBOARD'],
+        'sheets': [
+            {'name': '📊 Before vs After Perpetua', 'col': 'C', 'span': 'K', 'widths': {'C': 26}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA IMPLEMENTATION IMPACT ANALYSIS', 'size': 20,
+                 'lines': ['Before vs After SaaS Platform Launch']},
+                {'type': 'heading', 'text': '📅 PERPETUA LAUNCH: {prepost[launch]:%B %d, %Y}', 'fill': 'perpetua',
+                 'gap': 0},
+                {'type': 'lines', 'items': [
+                    'Pre-Perpetua: {prepost[pre_start]:%b %d} - {prepost[pre_end]:%b %d, %Y} '
+                    '({prepost[pre][Days]} days manual advertising)',
+                    'Post-Perpetua: {prepost[post_start]:%b %d, %Y} - {prepost[post_end]:%b %d, %Y} '
+                    '({prepost[post][Days]} days with SaaS)',
+                ]},
+                {'type': 'heading', 'text': '🎯 THE VERDICT', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    'Daily revenue {prepost[revenue_lift]:+.0%} ({prepost[impact][Daily_Revenue_Change]:+,.0f} $/day), '
+                    'ROAS {prepost[roas_change]:+.0%}. Annualized revenue change: '
+                    '{prepost[annual_gain]:+,.0f} $ in profit at a {margin:.0%} margin.',
+                ]},
+                {'type': 'heading', 'text': 'COMPLETE PRE vs POST COMPARISON'},
+                {'type': 'comparison', 'source': 'pre_post', 'headers': [
+                    'Metric', 'Pre-Perpetua (Manual)', 'Post-Perpetua (SaaS)', 'Change', '% Change', 'Status'],
+                 'rows': [
+                     ('Period Length', 'Days', 'd', None),
+                     ('Total Revenue', 'Total_Revenue', '$', False),
+                     ('Ad Spend', 'Ad_Spend', '$', None),
+                     ('Ad Sales', 'Ad_Sales', '$', False),
+                     ('Organic Sales', 'Organic_Sales', '$', False),
+                     None,
+                     ('ROAS', 'ROAS', 'x', False),
+                     ('ACOS', 'ACOS', '%', True),
+                     ('TACoS', 'TACoS', '%', True),
+                     ('T-ROAS', 'T_ROAS', 'x', False),
+                     ('Organic Ratio', 'Organic_Ratio', '%', False),
+                     None,
+                     ('Avg Daily Revenue', 'Avg_Daily_Revenue', '$', False),
+                     ('Avg Daily Ad Spend', 'Avg_Daily_Spend', '$', None),
+                 ]},
+                {'type': 'heading', 'text': '💡 STRATEGIC INTERPRETATION', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '✓ Revenue: {prepost[revenue_lift]:+.0%} daily revenue '
+                    '(${prepost[pre][Avg_Daily_Revenue]:,.0f} → ${prepost[post][Avg_Daily_Revenue]:,.0f} per day)',
+                    '⚠ Efficiency: ROAS {prepost[roas_change]:+.0%} '
+                    '({prepost[pre][ROAS]:.2f}x → {prepost[post][ROAS]:.2f}x)',
+                    '⚠ Ad Dependency: TACoS {prepost[pre][TACoS]:.1%} → {prepost[post][TACoS]:.1%}',
+                    '',
+                    '💰 PROFIT ANALYSIS (assuming {margin:.0%} margin):',
+                    '   • Pre-Perpetua profit: ${prepost[profit_pre]:,.0f}/day',
+                    '   • Post-Perpetua profit: ${prepost[profit_post]:,.0f}/day',
+                    '   • Net profit change: {prepost[profit_gain]:+,.0f} $/day',
+                    '   • Annualized: {prepost[annual_gain]:+,.0f} $',
+                ]},
+            ]},
+            {'name': '📈 Daily Trend', 'col': 'B', 'span': 'I', 'widths': {'B': 13, 'C': 15}, 'width': 14, 'blocks': [
+                {'type': 'title', 'text': 'DAILY PERFORMANCE - PRE vs POST PERPETUA', 'size': 16},
+                {'type': 'table', 'source': 'daily_total', 'periods': True, 'rename': AD_RENAME, 'freeze': True,
+                 'columns': ['Date', 'Period', 'Total_Revenue', 'Spend', 'ROAS', 'TACoS', 'ROAS_7d', 'TACoS_7d']},
+            ]},
+        ],
+        'highlights': [
+            '\n📊 RESULTS:',
+            '  Pre-Perpetua (Manual):  {prepost[pre][ROAS]:.2f}x ROAS, ${prepost[pre][Avg_Daily_Revenue]:,.0f}/day revenue',
+            '  Post-Perpetua (SaaS):   {prepost[post][ROAS]:.2f}x ROAS, ${prepost[post][Avg_Daily_Revenue]:,.0f}/day revenue',
+            '  Impact: {prepost[roas_change]:+.0%} ROAS, {prepost[revenue_lift]:+.0%} revenue',
+            '\n💰 PROFIT IMPACT ({margin:.0%} margin): {prepost[profit_gain]:+,.0f} $/day',
+        ],
+    },
+
+    'final_complete': {
+        'file': 'Perpetua_FINAL_Complete_Analysis_%Y%m%d.xlsx',
+        'banner': ['FINAL COMPREHENSIVE DASHBOARD - ALL METRICS + TACOS + CONTEXT'],
+        'sheets': [
+            {'name': '📊 Executive Summary', 'col': 'B', 'span': 'I', 'widths': {'B': 32, 'I': 26}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA (SaaS) vs MANUAL ADVERTISING', 'size': 20, 'lines': [
+                    'Complete Analysis: Advertising Metrics + TACoS + Organic Lift',
+                    '{start:%B %d, %Y} - {end:%B %d, %Y} | Based on Order Reports + Advertising Reports']},
+                {'type': 'heading', 'text': '⚠️ CRITICAL CONTEXT - READ THIS FIRST', 'color': 'bad', 'gap': 0},
+                {'type': 'lines', 'fill': 'input', 'items': [
+                    'TACoS (Total Ad Cost of Sales) shows ad spend as % of TOTAL revenue (organic + paid)',
+                    '→ Lower TACoS = Less ad-dependent.',
+                    'Non-Perpetua: {np[TACoS]:.1%} TACoS, {np[Organic_Ratio]:.0%} organic',
+                    '→ The higher the organic share, the more ads are supplemental.',
+                    'Perpetua: {p[TACoS]:.1%} TACoS, {p[Organic_Ratio]:.0%} organic',
+                    '→ A lower organic share means products need more ad support to maintain sales.',
+                    'CONCLUSION: Different TACoS can be appropriate - it reflects product lifecycle differences',
+                    '→ Compare each platform against the benchmarks for its product types.',
+                ]},
+                {'type': 'date_selector', 'label': '📅 SELECT DATE RANGE', 'start_label': 'Start:',
+                 'end_label': 'End:',
+                 'notes': ['👆 Click cells above for dropdown | Or use "Daily Trends" sheet filters']},
+                {'type': 'heading', 'text': 'COMPLETE PERFORMANCE ANALYSIS'},
+                {'type': 'comparison', 'live': True, 'pct_format': '+0%;-0%',
+                 'headers': ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', '% Diff', 'Winner',
+                             'Interpretation'],
+                 'rows': [
+                     '📊 SCALE & COVERAGE',
+                     ('Total Revenue (Orders)', 'Total_Revenue', '$', False, 'Total business'),
+                     ('Ad Spend', 'Ad_Spend', '$', None, 'Investment level'),
+                     '🎯 TACOS METRICS (Total Business Impact)',
+                     *TACOS_ROWS,
+                     '📈 ADVERTISING METRICS (Direct Attribution)',
+                     *AD_ROWS,
+                 ]},
+                {'type': 'heading', 'text': '💡 VALIDATED INSIGHTS', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '✓ Organic share of revenue: Perpetua {p[Organic_Ratio]:.0%}, Non-Perpetua {np[Organic_Ratio]:.0%}',
+                    '✓ Perpetua TACoS {p[TACoS]:.1%} vs Non-Perpetua {np[TACoS]:.1%}',
+                    '✓ Perpetua drives ${p[Total_Revenue]:,.0f} total revenue vs ${np[Total_Revenue]:,.0f} '
+                    '({revenue_premium:+.0%})',
+                    '⚠ TACoS difference reflects PRODUCT TYPE, not platform performance',
+                    '',
+                    '🎯 STRATEGIC RECOMMENDATION:',
+                    'Keep products on current platforms - assignments match product needs',
+                    'Focus on optimization WITHIN platforms, not moving products BETWEEN platforms',
+                ]},
+            ]},
+            daily_sheet('📈 Daily Trends (Filter Here)', 'DAILY PERFORMANCE - TACOS & ADVERTISING METRICS',
+                        '▼ Use filters to analyze specific date ranges', columns=TACOS_DAILY_COLUMNS,
+                        rename=AD_RENAME),
+            {'name': '📖 Metric Definitions', 'col': 'B', 'span': 'F', 'widths': {'B': 18, 'C': 30}, 'width': 30,
+             'blocks': [
+                 {'type': 'title', 'text': 'METRIC DEFINITIONS & BENCHMARKS', 'size': 16},
+                 {'type': 'notes', 'items': [
+                     ('TACOS METRICS',),
+                     ('TACoS', 'Total Ad Cost of Sales', 'Ad Spend / Total Revenue × 100'),
+                     ('', 'Benchmark', '5-10% excellent, 10-15% healthy, >20% concerning'),
+                     ('T-ROAS', 'Total Return on Ad Spend', 'Total Revenue / Ad Spend'),
+                     ('', 'Includes', 'Both ad-attributed AND organic sales'),
+                     ('Organic Ratio', 'Organic Sales as % of Total', '(Total - Ad Sales) / Total × 100'),
+                     ('', 'Healthy Range', '60-80% for balanced growth'),
+                     (),
+                     ('ADVERTISING METRICS',),
+                     ('ROAS', 'Return on Ad Spend', 'Ad Sales / Ad Spend'),
+                     ('', 'Target', '2.0+ good, 4.0+ excellent'),
+                     ('ACOS', 'Advertising Cost of Sales', 'Ad Spend / Ad Sales × 100'),
+                     ('', 'Target', '<30% good, <20% excellent'),
+                     ('CPC', 'Cost Per Click', 'Ad Spend / Clicks'),
+                     ('CTR', 'Click-Through Rate', 'Clicks / Impressions × 100'),
+                     ('CVR', 'Conversion Rate', 'Orders / Clicks × 100'),
+                 ]},
+             ]},
+        ],
+        'highlights': [
+            '\n🎯 THE COMPLETE STORY:',
+            '  Perpetua: {p[TACoS]:.1%} TACoS, {p[T_ROAS]:.1f}x T-ROAS, ${p[Total_Revenue]:,.0f} revenue',
+            '  Non-Perpetua: {np[TACoS]:.1%} TACoS, {np[T_ROAS]:.1f}x T-ROAS, ${np[Total_Revenue]:,.0f} revenue',
+        ],
+    },
+
+    'master': {
+        'file': 'Perpetua_MASTER_Complete_%Y%m%d_%H%M.xlsx',
+        'banner': ['MASTER CONSOLIDATED DASHBOARD - ALL INSIGHTS IN ONE FILE'],
+        'sheets': [
+            {'name': '1️⃣ Executive Summary', 'col': 'C', 'span': 'I', 'widths': {'C': 30, 'I': 30}, 'blocks': [
+                {'type': 'title', 'text': 'PERPETUA PERFORMANCE ANALYSIS', 'size': 20,
+                 'lines': ['Complete Analysis: Advertising + Orders + YoY + TACoS + Correlation']},
+                {'type': 'heading', 'text': '🎯 TOP-LINE FINDINGS', 'fill': 'good', 'gap': 0},
+                {'type': 'lines', 'items': [
+                    '✓ YoY: December ROAS {yoy[december][before][ROAS]:.2f}x → {yoy[december][after][ROAS]:.2f}x '
+                    '({yoy[december][growth][ROAS]:+.0f}%)',
+                    '✓ AD→ORGANIC: Perpetua link {organic[p][proven]} ({organic[p][corr]:.2f} correlation, '
+                    '{organic[p][elasticity]:.2f} elasticity)',
+                    '✓ TOTAL BUSINESS: ${total_revenue:,.0f} revenue, both platforms contributing',
+                    '✓ PLATFORM ROLES: Perpetua {p[TACoS]:.1%} TACoS, Non-Perpetua {np[TACoS]:.1%} TACoS',
+                    '⚠ CONTEXT CRITICAL: Different TACoS reflects product types, not platform failure',
+                ]},
+                {'type': 'heading', 'text': 'COMPLETE METRICS SUMMARY'},
+                {'type': 'comparison',
+                 'headers': ['Metric', 'Perpetua', 'Non-Perpetua', 'Difference', '% Diff', 'Winner', 'Insight'],
+                 'rows': [
+                     '📊 BUSINESS SCALE',
+                     ('Total Revenue (Orders)', 'Total_Revenue', '$', False, 'Total business impact'),
+                     ('Ad Spend', 'Ad_Spend', '$', None, 'Investment level'),
+                     '🎯 TACOS METRICS (Total Impact)',
+                     ('TACoS %', 'TACoS', '%', True, 'Ad spend as % of total revenue'),
+                     ('T-ROAS', 'T_ROAS', 'x', False, 'Total return including organic'),
+                     ('Organic Ratio %', 'Organic_Ratio', '%', None, '% of sales from organic'),
+                     '📈 AD METRICS (Direct)',
+                     ('Ad Sales', 'Ad_Sales', '$', False, '7-day attributed sales'),
+                     ('ROAS', 'Regular_ROAS', 'x', False, 'Ad-attributed return'),
+                     ('ACOS', 'ACOS', '%', True, 'Ad cost as % of ad sales'),
+                 ]},
+            ]},
+            {'name': '2️⃣ Year-over-Year', 'col': 'C', 'span': 'H', 'widths': {'C': 22}, 'blocks': [
+                {'type': 'title', 'text': 'YEAR-OVER-YEAR PERFORMANCE', 'size': 18,
+                 'lines': ['Comparing {yoy[december][before_year]} vs {yoy[december][after_year]}/'
+                           '{yoy[january][after_year]}']},
+                *yoy_blocks('december', 'DECEMBER COMPARISON'),
+                *yoy_blocks('january', 'JANUARY COMPARISON'),
+            ]},
+            {'name': '3️⃣ Month-over-Month', 'col': 'C', 'span': 'L', 'widths': {'C': 12, 'D': 15}, 'blocks': [
+                {'type': 'title', 'text': 'MONTH-OVER-MONTH TRENDS', 'size': 18,
+                 'lines': ['{start:%B %Y} → {end:%B %Y} Monthly Progression']},
+                {'type': 'table', 'source': 'monthly', 'columns': MONTHLY_COLUMNS + ['Organic_Ratio'],
+                 'rename': AD_RENAME},
+            ]},
+            {'name': '4️⃣ TACoS Analysis', 'col': 'C', 'span': 'J', 'widths': {'C': 26}, 'blocks': [
+                {'type': 'title', 'text': 'TACOS DEEP DIVE', 'size': 18,
+                 'lines': ['Total Advertising Cost of Sales - Business-Wide Efficiency']},
+                {'type': 'notes', 'text_col': 'E', 'items': [
+                    ('WHAT IS TACOS?',),
+                    ('TACoS Formula', 'Ad Spend / Total Revenue × 100'),
+                    ('Difference from ACOS', 'ACOS uses ad sales only, TACoS uses ALL sales (organic + paid)'),
+                    ('Why It Matters', 'Shows true advertising efficiency against total business'),
+                    ('Benchmark', '5-10% excellent, 10-15% healthy, >20% concerning'),
+                    (),
+                    ('PERPETUA TACOS', '{p[TACoS]:.1%}'),
+                    ('Interpretation', 'Growth mode - investing to build market share'),
+                    (),
+                    ('NON-PERPETUA TACOS', '{np[TACoS]:.1%}'),
+                    ('Interpretation', 'Maintenance mode - established organic performers'),
+                ]},
+            ]},
+            {'name': '5️⃣ Ad→Organic Proof', 'col': 'C', 'span': 'J', 'widths': {'C': 26}, 'blocks': [
+                {'type': 'title', 'text': 'DOES ADVERTISING DRIVE ORGANIC SALES?', 'size': 18},
+                {'type': 'heading', 'text': '{organic[answer]}'},
+                {'type': 'notes', 'text_col': 'E', 'items': [
+                    ('PERPETUA',),
+                    ('Correlation Coefficient', '{organic[p][corr]:.2f} ({organic[p][strength]} {organic[p][direction]}, '
+                                                '{organic[p][p_label]})'),
+                    ('Statistical Significance', '{organic[p][verdict]} at a {organic[p][lag]}-day lag'),
+                    ('Elasticity', '{organic[p][elasticity]:.2f} (1% ad spend increase → '
+                                   '{organic[p][elasticity]:.2f}% organic change)'),
+                    ('Practical Meaning', 'Every $1,000 more in ad spend → ~${organic[p][per_1000]:,.0f} '
+                                          'change in organic sales'),
+                    (),
+                    ('NON-PERPETUA',),
+                    ('Correlation Coefficient', '{organic[np][corr]:.2f} ({organic[np][strength]} '
+                                               '{organic[np][direction]}, {organic[np][p_label]})'),
+                    ('Statistical Significance', '{organic[np][verdict]} at a {organic[np][lag]}-day lag'),
+                    ('Explanation', 'Products already organic-strong, ads have minimal incremental impact'),
+                ]},
+            ]},
+            {'name': '6️⃣ Strategic Context', 'col': 'C', 'span': 'J', 'widths': {'C': 26}, 'blocks': [
+                {'type': 'title', 'text': 'STRATEGIC CONTEXT & INTERPRETATION', 'size': 18},
+                {'type': 'notes', 'text_col': 'E', 'items': [
+                    ('🎯 THE COMPLETE STORY',),
+                    ('Baseline', 'December {yoy[december][before_year]}: {yoy[december][before][ROAS]:.2f}x ROAS, '
+                                 'January {yoy[january][before_year]}: {yoy[january][before][ROAS]:.2f}x'),
+                    ('Current Performance', 'December {yoy[december][growth][ROAS]:+.0f}%, '
+                                            'January {yoy[january][growth][ROAS]:+.0f}% ROAS year over year'),
+                    ('Platform Roles', 'Perpetua manages growth/competitive products, '
+                                       'Non-Perpetua manages mature/organic-strong'),
+                    ('TACoS Difference', 'Reflects product lifecycle, not platform failure'),
+                    ('Organic Impact', 'Perpetua ad → organic link {organic[p][proven]} '
+                                       '({organic[p][corr]:.2f} correlation, {organic[p][elasticity]:.2f} elasticity)'),
+                    ('Total Business', '${total_revenue:,.0f} revenue - BOTH platforms contributing'),
+                    (),
+                    ('⚠️ CRITICAL INTERPRETATIONS',),
+                    ('Lower ROAS at Scale', 'Perpetua operates at {spend_ratio:.1f}x the ad spend - '
+                                           'diminishing returns expected and normal'),
+                    ('Higher TACoS', '{p[TACoS]:.1%} vs {np[TACoS]:.1%} reflects growth vs maintenance strategy'),
+                    ('Organic Ratio Gap', 'Non-Perpetua {np[Organic_Ratio]:.0%} organic vs Perpetua '
+                                          '{p[Organic_Ratio]:.0%}'),
+                    ('Perpetua Value', 'Manages ${p[Total_Revenue]:,.0f} in revenue'),
+                    (),
+                    ('💰 DOLLAR-QUANTIFIED OPPORTUNITIES',),
+                    ('Losing Campaigns', 'See the strategic context dashboard for net loss by platform (pause losers)'),
+                    ('YoY Momentum', "Ride the year-over-year improvement, don't disrupt"),
+                    ('Organic Optimization', 'Perpetua {organic[p][elasticity]:.2f} elasticity means each $10K '
+                                             'ad increase = ${organic[p][per_10k]:.1f}K organic change'),
+                    (),
+                    ('🎯 RECOMMENDATIONS',),
+                    ('1. HIGH PRIORITY', 'Continue current platform assignments - working correctly'),
+                    ('2. HIGH PRIORITY', 'Pause identified losing campaigns'),
+                    ('3. MEDIUM', 'Invest more in Perpetua high-performers ({organic[p][elasticity]:.2f} '
+                                  'organic elasticity, {organic[p][proven]})'),
+                    ('4. STRATEGIC', 'Track TACoS monthly - target <6% for mature products'),
+                ]},
+            ]},
+            {'name': '7️⃣ All Metrics', 'col': 'C', 'span': 'H', 'widths': {'C': 18, 'D': 28}, 'blocks': [
+                {'type': 'title', 'text': 'COMPLETE METRICS REFERENCE', 'size': 18},
+                {'type': 'notes', 'headers': ['Metric', 'Formula', 'Perpetua', 'Non-Perpetua', 'Benchmark'],
+                 'items': [
+                     ('TACoS', 'Ad Spend / Total Revenue', '{p[TACoS]:.1%}', '{np[TACoS]:.1%}', '5-15%'),
+                     ('T-ROAS', 'Total Revenue / Ad Spend', '{p[T_ROAS]:.1f}x', '{np[T_ROAS]:.1f}x', '>5x'),
+                     ('ROAS', 'Ad Sales / Ad Spend', '{p[Regular_ROAS]:.2f}x', '{np[Regular_ROAS]:.2f}x', '>2.0x'),
+                     ('ACOS', 'Ad Spend / Ad Sales', '{p[ACOS]:.1%}', '{np[ACOS]:.1%}', '<30%'),
+                     ('Organic Ratio', 'Organic / Total Revenue', '{p[Organic_Ratio]:.1%}',
+                      '{np[Organic_Ratio]:.1%}', '60-80%'),
+                 ]},
+            ]},
+            {'name': '8️⃣ Rolling KPIs', 'col': 'C', 'span': 'M', 'widths': {'C': 14}, 'width': 12, 'blocks': [
+                {'type': 'title', 'text': 'ROLLING-WINDOW KPIs', 'size': 18,
+                 'lines': ['Trailing {rolling[window_list]} windows as of {rolling[as_of]}']},
+                {'type': 'table', 'source': 'rolling', 'filter': False,
+                 'columns': ['Platform', 'Window', 'ROAS', 'ACOS', 'TACoS', 'CPC', 'CVR', 'Organic_Ratio',
+                             'Avg_Daily_Spend', 'Avg_Daily_Revenue'],
+                 'headers': ['Platform', 'Window', 'ROAS', 'ACOS', 'TACoS', 'CPC', 'CVR', 'Organic %',
+                             'Spend / Day', 'Revenue / Day']},
+                {'type': 'heading', 'text': '7-DAY ROAS TREND', 'size': 12},
+                {'type': 'table', 'source': 'rolling_trend', 'window': 7, 'filter': False,
+                 'chart': {'title': '7-Day ROAS: Perpetua vs Non-Perpetua', 'y_title': 'ROAS',
+                           'series': ['Perpetua', 'Non-Perpetua'], 'anchor': 'G'}},
+            ]},
+            {'name': '9️⃣ Anomalies', 'col': 'C', 'span': 'K', 'widths': {'C': 12, 'D': 14}, 'width': 13, 'blocks': [
+                {'type': 'title', 'text': 'DAILY ANOMALIES BY ASIN', 'size': 18, 'lines': [
+                    'Last {anomalies[days]} days: {anomalies[count]:,} anomalies across {anomalies[asins]} ASINs '
+                    '(most severe first)']},
+                {'type': 'table', 'source': 'anomalies', 'limit': 200, 'fill_by': 'Direction',
+                 'columns': ['Date', 'ASIN', 'Advertising_Type', 'Metric', 'Value', 'Baseline', 'Z_Score',
+                             'Direction', 'Rule'],
+                 'headers': ['Date', 'ASIN', 'Platform', 'Metric', 'Value', 'Baseline', 'Z-Score', 'Direction',
+                             'Rule'],
+                 'formats': {'Value': '#,##0.00', 'Baseline': '#,##0.00', 'Z_Score': '+0.0;-0.0'}},
+            ]},
+            {'name': '🔟 Forecast', 'col': 'C', 'span': 'M', 'widths': {'C': 14}, 'width': 14, 'blocks': [
+                {'type': 'title', 'text': '{forecast[horizon_days]}-DAY FORECAST', 'size': 18, 'lines': [
+                    '{forecast[forecast_start]} to {forecast[forecast_end]} - trend + day-of-week ridge fitted on '
+                    'the last {forecast[fit_days]} days, 95% prediction intervals']},
+                {'type': 'table', 'source': 'forecast', 'filter': False,
+                 'headers': ['Platform', 'Measure', 'Forecast Total', 'Avg / Day', 'Low / Day', 'High / Day']},
+                {'type': 'heading', 'text': 'DAILY TOTAL REVENUE FORECAST (ALL ASINs)', 'size': 12},
+                {'type': 'table', 'source': 'forecast_band', 'filter': False,
+                 'chart': {'title': 'Daily Total Revenue Forecast', 'y_title': 'Revenue',
+                           'series': ['Forecast', 'Low', 'High'], 'anchor': 'H'}},
+            ]},
+        ],
+        'documents': [('MASTER_DASHBOARD_SUMMARY.txt', """
+MASTER CONSOLIDATED DASHBOARD - COMPLETE ANALYSIS
+================================================
+
+File: {workbook}
+Generated: {now:%Y-%m-%d %H:%M:%S}
+
+10 COMPREHENSIVE TABS:
+====================
+
+1. Executive Summary - Top findings + complete metrics table
+2. Year-over-Year - {yoy[december][before_year]} vs {yoy[december][after_year]}/{yoy[january][after_year]} comparison
+3. Month-over-Month - {start:%b %Y} to {end:%b %Y} trends
+4. TACoS Analysis - Total business efficiency metrics
+5. Ad→Organic Proof - Correlation and elasticity of ad spend vs organic sales
+6. Strategic Context - Complete story + interpretations + recommendations
+7. All Metrics Reference - Formulas + benchmarks + current values
+8. Rolling KPIs - Trailing {rolling[window_list]} ROAS, TACoS, CPC, CVR by platform
+9. Anomalies - Per-ASIN spend, ROAS and organic sales spikes/drops (last {anomalies[days]} days)
+10. Forecast - Next {forecast[horizon_days]} days of spend, ad sales and revenue with 95% intervals
+
+KEY INSIGHTS CONSOLIDATED:
+=========================
+
+YoY PERFORMANCE:
+✓ December: {yoy[december][before][ROAS]:.2f}x → {yoy[december][after][ROAS]:.2f}x ROAS ({yoy[december][growth][ROAS]:+.0f}%)
+✓ January: {yoy[january][before][ROAS]:.2f}x → {yoy[january][after][ROAS]:.2f}x ROAS ({yoy[january][growth][ROAS]:+.0f}%)
+
+ORGANIC SALES CORRELATION:
+✓ Perpetua: {organic[p][corr]:.2f} correlation ({organic[p][p_label]}) - {organic[p][proven]}
+✓ Elasticity: {organic[p][elasticity]:.2f} (1% ad spend → {organic[p][elasticity]:.2f}% organic change)
+✓ Non-Perpetua: {organic[np][corr]:.2f} ({organic[np][p_label]})
+
+TACOS METRICS:
+✓ Perpetua: {p[TACoS]:.1%} TACoS, {p[T_ROAS]:.1f}x T-ROAS, {p[Organic_Ratio]:.0%} organic
+✓ Non-Perpetua: {np[TACoS]:.1%} TACoS, {np[T_ROAS]:.1f}x T-ROAS, {np[Organic_Ratio]:.0%} organic
+
+BUSINESS RESULTS:
+✓ Total revenue: ${total_revenue:,.0f} (from order data)
+✓ Both platforms contributing to success
+
+ALL METRICS INCLUDED:
+====================
+✓ TACoS, T-ROAS, Organic Ratio, Organic Lift
+✓ ROAS, ACOS, CPC, CTR, CVR, CPA, CPM, AOV
+✓ Rolling {rolling[window_list]} KPIs
+✓ Per-ASIN daily anomaly flags
+✓ {forecast[horizon_days]}-day spend and revenue forecasts
+✓ YoY comparisons and MoM trends
+✓ Strategic context and recommendations
+
+DATA SOURCES INTEGRATED:
+=======================
+✓ Advertised Products Report
+✓ Order Reports (merged with advertising by SKU)
+✓ Campaign Report
+✓ ASIN/SKU mapping lists
+✓ Last year's baseline data
+""")],
+        'highlights': [
+            '\n📊 10 TABS WITH ALL INSIGHTS:',
+            '  1️⃣ Executive Summary - Complete story at a glance',
+            '  2️⃣ Year-over-Year - December and January comparisons',
+            '  3️⃣ Month-over-Month - Seasonal trends and progression',
+            '  4️⃣ TACoS Analysis - Total business efficiency',
+            '  5️⃣ Ad→Organic Proof - Correlation {organic[p][corr]:.2f}, elasticity {organic[p][elasticity]:.2f}',
+            '  6️⃣ Strategic Context - Complete validated story',
+            '  7️⃣ All Metrics - Reference table with formulas',
+            '  8️⃣ Rolling KPIs - Trailing-window trends without daily noise',
+            '  9️⃣ Anomalies - ASIN-days that broke from their own baseline',
+            '  🔟 Forecast - Next {forecast[horizon_days]} days with prediction intervals',
+        ],
+    },
+}
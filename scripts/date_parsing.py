@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared Date Parsing
+Report and order dates are parsed with explicit ISO formats, once per distinct
+value, and floored to the day with dt.normalize. The processed layer stores
+days as int32 ordinals (days since 1970-01-01).
+"""
+
+import numpy as np
+import pandas as pd
+
+ISO_DATE = '%Y-%m-%d'
+ISO_TIMESTAMP = 'ISO8601'  # Amazon order exports: 2025-10-01T14:03:22+00:00
+EPOCH = np.datetime64('1970-01-01', 'D')
+
+
+def _parse_uniques(uniques, fmt, utc):
+    parsed = pd.Series(pd.to_datetime(uniques, format=fmt, errors='coerce', utc=utc))
+    # Values that don't match the format (e.g. "10/01/2025" from an Excel
+    # round trip) fall back to inference, but only those few distinct values
+    missed = parsed.isna().to_numpy() & pd.notna(uniques)
+    if missed.any():
+        parsed[missed] = pd.to_datetime(uniques[missed], format='mixed', errors='coerce', utc=utc)
+    if utc:
+        parsed = parsed.dt.tz_convert(None)
+    return pd.DatetimeIndex(parsed)
+
+
+def parse_dates(values, fmt=ISO_DATE, utc=False):
+    """
+    Parse `values` into datetime64, converting each distinct value once.
+
+    Unparseable values become NaT. With utc=True, offsets are applied and the
+    result is naive UTC. Returns a Series aligned with `values` when given one.
+    """
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.tz_convert(None) if values.dt.tz is not None else values
+    labels, uniques = pd.factorize(np.asarray(values, dtype=object))
+    parsed = _parse_uniques(uniques, fmt, utc).take(labels, allow_fill=True, fill_value=pd.NaT)
+    if isinstance(values, pd.Series):
+        return pd.Series(parsed, index=values.index, name=values.name)
+    return parsed
+
+
+def parse_days(values, fmt=ISO_DATE, utc=False):
+    """parse_dates floored to midnight"""
+    parsed = parse_dates(values, fmt, utc)
+    return parsed.dt.normalize() if isinstance(parsed, pd.Series) else parsed.normalize()
+
+
+def day_ordinals(dates):
+    """int32 days since 1970-01-01 (NaT is not allowed)"""
+    return (pd.DatetimeIndex(dates).values.astype('datetime64[D]') - EPOCH).astype(np.int32)
+
+
+def from_day_ordinals(days):
+    """Inverse of day_ordinals"""
+    return pd.DatetimeIndex(EPOCH + np.asarray(days).astype('timedelta64[D]'))
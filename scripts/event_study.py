@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Event-Study Engine for Perpetua Onboarding
+Aligns every ASIN's daily series to its own onboarding date and computes
+pre/post metrics and average relative-day curves in one pass over the cube
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from date_parsing import parse_dates
+
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
+
+# Optional per-ASIN onboarding dates (columns: ASIN, Onboarding_Date)
+ONBOARDING_FILE = DATA_DIR / 'perpetua_onboarding_dates.csv'
+
+DEFAULT_LAUNCH_DATE = '2025-12-15'
+NO_EVENT = -1
+
+
+def load_onboarding_dates(cube, default_date=DEFAULT_LAUNCH_DATE, path=ONBOARDING_FILE):
+    """
+    Per-ASIN onboarding day index into cube.dates (NO_EVENT for non-Perpetua ASINs).
+
+    Perpetua ASINs missing from the onboarding file fall back to the global launch date.
+    """
+    onboarding = pd.Series(pd.Timestamp(default_date), index=cube.asins)
+
+    path = Path(path)
+    if path.exists():
+        listed = pd.read_csv(path)
+        listed['ASIN'] = listed['ASIN'].astype(str).str.strip()
+        listed['Onboarding_Date'] = parse_dates(listed['Onboarding_Date'])
+        listed = listed.dropna(subset=['Onboarding_Date']).drop_duplicates('ASIN', keep='last')
+        listed = listed[listed['ASIN'].isin(onboarding.index)]
+        onboarding.loc[listed['ASIN']] = listed['Onboarding_Date'].to_numpy()
+
+    day_index = np.searchsorted(cube.dates, onboarding.to_numpy().astype('datetime64[D]'))
+    return np.where(cube.platform_mask('Perpetua'), day_index, NO_EVENT)
+
+
+def _safe_div(num, den):
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den > 0)
+
+
+def _period_metrics(totals, days):
+    """Same metric set as calc_period_metrics() in the pre/post script"""
+    spend, ad_sales = totals['Spend'], totals['Sales']
+    revenue, organic = totals['Total_Revenue'], totals['Organic_Sales']
+    return {
+        'Days': days,
+        'Total_Revenue': revenue,
+        'Ad_Spend': spend,
+        'Ad_Sales': ad_sales,
+        'Organic_Sales': organic,
+        'ROAS': _safe_div(ad_sales, spend),
+        'ACOS': _safe_div(spend, ad_sales),
+        'TACoS': _safe_div(spend, revenue),
+        'T_ROAS': _safe_div(revenue, spend),
+        'Organic_Ratio': _safe_div(organic, revenue),
+        'Avg_Daily_Spend': _safe_div(spend, days),
+        'Avg_Daily_Revenue': _safe_div(revenue, days),
+        'Avg_Daily_Ad_Sales': _safe_div(ad_sales, days),
+        'Avg_Daily_Organic': _safe_div(organic, days),
+    }
+
+
+def run_event_study(cube, event_index, pre_days=30, post_days=None, window=(-30, 60)):
+    """
+    Pre/post metrics per ASIN and pooled, plus relative-day curves.
+
+    event_index holds each ASIN's onboarding day index (NO_EVENT to exclude).
+    Pre window is [-pre_days, -1] relative days; post is [0, post_days) or to
+    the end of the data. Returns (asin_metrics, pooled, curves).
+    """
+    treated = event_index != NO_EVENT
+    event = event_index[treated]
+    values = cube.values[:, :, treated]  # [measure, date, asin]
+
+    # Relative day of every cube cell, broadcast as [date, asin]
+    relative = np.arange(cube.n_dates)[:, None] - event[None, :]
+    pre_mask = (relative >= -pre_days) & (relative < 0)
+    post_mask = relative >= 0
+    if post_days is not None:
+        post_mask &= relative < post_days
+
+    pre_sums = np.einsum('mda,da->ma', values, pre_mask)
+    post_sums = np.einsum('mda,da->ma', values, post_mask)
+    pre_days_n = pre_mask.sum(axis=0)
+    post_days_n = post_mask.sum(axis=0)
+
+    def by_measure(sums):
+        return {name: sums[m] for m, name in enumerate(cube.measures)}
+
+    pre = _period_metrics(by_measure(pre_sums), pre_days_n)
+    post = _period_metrics(by_measure(post_sums), post_days_n)
+
+    asin_metrics = pd.DataFrame({'ASIN': cube.asins[treated],
+                                 'Onboarding_Date': cube.dates[0] + event.astype('timedelta64[D]')})
+    for prefix, period in [('Pre', pre), ('Post', post)]:
+        for key, val in period.items():
+            asin_metrics[f'{prefix}_{key}'] = val
+    asin_metrics['ROAS_Change'] = asin_metrics['Post_ROAS'] - asin_metrics['Pre_ROAS']
+    asin_metrics['TACoS_Change'] = asin_metrics['Post_TACoS'] - asin_metrics['Pre_TACoS']
+    asin_metrics['Daily_Revenue_Change'] = (asin_metrics['Post_Avg_Daily_Revenue']
+                                            - asin_metrics['Pre_Avg_Daily_Revenue'])
+
+    # Pooled metrics use ASIN-days so staggered onboarding is weighted correctly
+    pooled = {
+        'pre': _period_metrics(by_measure(pre_sums.sum(axis=1)), int(pre_days_n.sum())),
+        'post': _period_metrics(by_measure(post_sums.sum(axis=1)), int(post_days_n.sum())),
+        'asins': int(treated.sum()),
+    }
+    for period in ('pre', 'post'):
+        pooled[period] = {k: float(v) for k, v in pooled[period].items()}
+
+    # Relative-day curves: gather [measure, offset, asin] in one fancy-index pass
+    offsets = np.arange(window[0], window[1] + 1)
+    day_idx = event[None, :] + offsets[:, None]
+    valid = (day_idx >= 0) & (day_idx < cube.n_dates)
+    gathered = values[:, np.clip(day_idx, 0, cube.n_dates - 1), np.arange(len(event))[None, :]]
+    gathered = np.where(valid[None], gathered, 0.0)
+    n_valid = valid.sum(axis=1)
+
+    totals = gathered.sum(axis=2)  # [measure, offset]
+    curves = pd.DataFrame({'Relative_Day': offsets, 'ASINs': n_valid})
+    for m, name in enumerate(cube.measures):
+        curves[f'Avg_{name}'] = _safe_div(totals[m], n_valid)
+    spend = totals[cube.measures.index('Spend')]
+    curves['ROAS'] = _safe_div(totals[cube.measures.index('Sales')], spend)
+    curves['TACoS'] = _safe_div(spend, totals[cube.measures.index('Total_Revenue')])
+
+    return asin_metrics, pooled, curves
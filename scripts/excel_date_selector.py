@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Live Date Selector Support for Excel Dashboards
+Writes a hidden per-day-per-platform running-total sheet so that summary cells
+can be Excel formulas driven by the start/end date dropdowns
+"""
+
+import pandas as pd
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+PLATFORMS = ['Perpetua', 'Non-Perpetua']
+
+# Metric key -> (numerator measure, denominator measure, scale)
+# Measures are short names mapped to daily columns by each dashboard
+METRIC_FORMULAS = {
+    'Total_Spend': ('Spend', None, 1),
+    'Total_Sales': ('Sales', None, 1),
+    'Total_Orders': ('Orders', None, 1),
+    'Total_Clicks': ('Clicks', None, 1),
+    'Total_Impressions': ('Impressions', None, 1),
+    'Total_Units': ('Units', None, 1),
+    'ROAS': ('Sales', 'Spend', 1),
+    'ACOS': ('Spend', 'Sales', 1),
+    'CPC': ('Spend', 'Clicks', 1),
+    'CTR': ('Clicks', 'Impressions', 1),
+    'CVR': ('Orders', 'Clicks', 1),
+    'CPA': ('Spend', 'Orders', 1),
+    'CPM': ('Spend', 'Impressions', 1000),
+    'AOV': ('Sales', 'Orders', 1),
+
+    # Order-report (TACoS) measures
+    'Total_Revenue': ('Revenue', None, 1),
+    'Ad_Spend': ('Spend', None, 1),
+    'Ad_Sales': ('Sales', None, 1),
+    'Organic_Sales': ('Organic', None, 1),
+    'TACoS': ('Spend', 'Revenue', 1),
+    'T_ROAS': ('Revenue', 'Spend', 1),
+    'Regular_ROAS': ('Sales', 'Spend', 1),
+    'Organic_Ratio': ('Organic', 'Revenue', 1),
+}
+
+
+def add_measures_sheet(wb, daily, measures, sheet_name='_Measures',
+                       date_col='Date', platform_col='Advertising_Type'):
+    """
+    Write hidden sheet of cumulative daily measures per platform.
+
+    Row 2 is a zero sentinel dated the day before the first date, so a range
+    total is always INDEX(end) - INDEX(day before start) with no edge cases.
+    Returns a layout dict used by range_total_formula().
+    """
+    value_cols = list(measures.values())
+    pivot = daily.pivot_table(index=date_col, columns=platform_col, values=value_cols,
+                              aggfunc='sum', fill_value=0).sort_index()
+    cumulative = pivot.cumsum()
+    dates = [pd.Timestamp(d) for d in cumulative.index]
+
+    ws = wb.create_sheet(sheet_name)
+    ws.sheet_state = 'hidden'
+    ws.cell(row=1, column=1, value='Date')
+
+    sentinel = dates[0] - pd.Timedelta(days=1) if dates else pd.Timestamp.today().normalize()
+    ws.cell(row=2, column=1, value=sentinel.to_pydatetime()).number_format = 'YYYY-MM-DD'
+    for idx, date in enumerate(dates, start=3):
+        ws.cell(row=idx, column=1, value=date.to_pydatetime()).number_format = 'YYYY-MM-DD'
+
+    columns = {}
+    col_idx = 2
+    for platform in PLATFORMS:
+        for short_name, daily_col in measures.items():
+            letter = get_column_letter(col_idx)
+            columns[(platform, short_name)] = letter
+            ws.cell(row=1, column=col_idx, value=f'{platform} {short_name} (cumulative)')
+            ws.cell(row=2, column=col_idx, value=0)
+
+            if (daily_col, platform) in cumulative.columns:
+                values = cumulative[(daily_col, platform)].tolist()
+            else:
+                values = [0] * len(dates)
+            for idx, value in enumerate(values, start=3):
+                ws.cell(row=idx, column=col_idx, value=float(value))
+            col_idx += 1
+
+    return {
+        'sheet': sheet_name,
+        'last_row': len(dates) + 2,
+        'columns': columns,
+    }
+
+
+def range_total_formula(layout, platform, measure, start_ref, end_ref):
+    """Excel expression for a measure total between two date cells (inclusive)"""
+    sheet = layout['sheet']
+    last = layout['last_row']
+    col = layout['columns'][(platform, measure)]
+    values = f"'{sheet}'!${col}$2:${col}${last}"
+    dates = f"'{sheet}'!$A$2:$A${last}"
+    return (f"(IFERROR(INDEX({values},MATCH({end_ref},{dates},1)),0)"
+            f"-IFERROR(INDEX({values},MATCH({start_ref}-1,{dates},1)),0))")
+
+
+def metric_formula(layout, platform, key, start_ref, end_ref):
+    """Full cell formula for a dashboard metric key, or None if not range-additive"""
+    if key not in METRIC_FORMULAS:
+        return None
+
+    numerator, denominator, scale = METRIC_FORMULAS[key]
+    if (platform, numerator) not in layout['columns']:
+        return None
+
+    num = range_total_formula(layout, platform, numerator, start_ref, end_ref)
+    if denominator is None:
+        return f'={num}'
+
+    if (platform, denominator) not in layout['columns']:
+        return None
+    den = range_total_formula(layout, platform, denominator, start_ref, end_ref)
+    scaled = f'{num}/{den}*{scale}' if scale != 1 else f'{num}/{den}'
+    return f'=IF({den}>0,{scaled},0)'
+
+
+def write_comparison_formulas(ws, row, first_col, lower_better, colors, pct_format='0.0%;-0.0%'):
+    """
+    Fill the Difference / % Diff / Winner cells as formulas over the two value cells.
+
+    Winner colouring uses conditional formatting so it follows the selected dates.
+    """
+    p_ref = f'{get_column_letter(first_col)}{row}'
+    np_ref = f'{get_column_letter(first_col + 1)}{row}'
+
+    ws.cell(row=row, column=first_col + 2, value=f'={p_ref}-{np_ref}')
+
+    if lower_better is None:
+        return
+
+    ws.cell(row=row, column=first_col + 3,
+            value=f'=IF({np_ref}<>0,({p_ref}-{np_ref})/{np_ref},"")').number_format = pct_format
+
+    better = f'{p_ref}<{np_ref}' if lower_better else f'{p_ref}>{np_ref}'
+    winner_col = get_column_letter(first_col + 4)
+    cell = ws.cell(row=row, column=first_col + 4,
+                   value=f'=IF({better},"Perpetua ✓","Non-Perpetua ✓")')
+    cell.fill = PatternFill(start_color=colors['non_perpetua'], end_color=colors['non_perpetua'],
+                            fill_type='solid')
+    cell.font = Font(bold=True, color='FFFFFF', size=10)
+    cell.alignment = Alignment(horizontal='center', vertical='center')
+
+    perpetua_fill = PatternFill(start_color=colors['perpetua'], end_color=colors['perpetua'],
+                                fill_type='solid')
+    ws.conditional_formatting.add(f'{winner_col}{row}',
+                                  FormulaRule(formula=[better], fill=perpetua_fill))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Batched Spend and Revenue Forecasting
+Ridge regression on trend + day-of-week, fitted for every ASIN (and platform
+total) in a single solve - the design matrix is shared, only the targets differ
+"""
+
+import numpy as np
+import pandas as pd
+
+from daily_cube import PROCESSED_DIR, DailyCube
+from rolling_kpis import platform_values
+
+FORECAST_FILE = PROCESSED_DIR / 'forecast_cube.npz'
+
+FORECAST_MEASURES = ['Spend', 'Sales', 'Total_Revenue']
+FIT_DAYS = 56
+HORIZON_DAYS = 30
+RIDGE_ALPHA = 1.0
+INTERVAL_Z = 1.96  # 95% prediction interval
+
+
+def design_matrix(dates, origin, scale):
+    """[date, feature] matrix: intercept, linear trend, Tue-Sun day-of-week dummies"""
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    trend = (dates - origin).astype(np.float64) / scale
+    weekday = (dates.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday; Monday = 0
+    dow = (weekday[:, None] == np.arange(1, 7)[None, :]).astype(np.float64)
+    return np.column_stack([np.ones(len(dates)), trend, dow])
+
+
+def fit_ridge(X, Y, alpha=RIDGE_ALPHA):
+    """
+    Ridge coefficients for every column of Y at once.
+
+    The intercept is not penalised. Returns (beta [feature, series],
+    (X'X + aI)^-1) - the latter is reused for prediction-interval widths.
+    """
+    penalty = alpha * np.eye(X.shape[1])
+    penalty[0, 0] = 0
+    gram_inv = np.linalg.inv(X.T @ X + penalty)
+    return gram_inv @ (X.T @ Y), gram_inv
+
+
+def forecast_series(values, dates, horizon=HORIZON_DAYS, fit_days=FIT_DAYS, alpha=RIDGE_ALPHA,
+                    z=INTERVAL_Z):
+    """
+    Forecast every column of a [date, series] array `horizon` days past the last date.
+
+    Fits on the trailing `fit_days`. Returns (future dates, mean, lower, upper),
+    each array [horizon, series]; forecasts are floored at zero.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    fit_days = min(fit_days, len(dates))
+    fit_dates = dates[-fit_days:]
+    future = dates[-1] + np.arange(1, horizon + 1).astype('timedelta64[D]')
+
+    X = design_matrix(fit_dates, fit_dates[0], fit_days)
+    Y = np.asarray(values, dtype=np.float64)[-fit_days:]
+    beta, gram_inv = fit_ridge(X, Y, alpha)
+
+    dof = max(fit_days - X.shape[1], 1)
+    sigma = np.sqrt(((Y - X @ beta) ** 2).sum(axis=0) / dof)  # [series]
+
+    X_new = design_matrix(future, fit_dates[0], fit_days)
+    leverage = np.einsum('hf,fg,hg->h', X_new, gram_inv, X_new)  # [horizon]
+    width = z * np.sqrt(1 + leverage)[:, None] * sigma[None, :]
+
+    mean = X_new @ beta
+    return future, np.maximum(mean, 0), np.maximum(mean - width, 0), np.maximum(mean + width, 0)
+
+
+def _to_cube(future, mean, lower, upper, keys, platforms, measures):
+    """Pack [horizon, measure * key] forecasts into a DailyCube with Lower/Upper measures"""
+    n_keys = len(keys)
+    blocks, names = [], []
+    for m, name in enumerate(measures):
+        cols = slice(m * n_keys, (m + 1) * n_keys)
+        blocks += [mean[:, cols], lower[:, cols], upper[:, cols]]
+        names += [name, f'{name}_Lower', f'{name}_Upper']
+    return DailyCube(future, keys, platforms, np.stack(blocks), names)
+
+
+def forecast_cube(cube, measures=FORECAST_MEASURES, horizon=HORIZON_DAYS, fit_days=FIT_DAYS,
+                  alpha=RIDGE_ALPHA):
+    """
+    Forecasts for every ASIN and for each platform total, as two DailyCubes.
+
+    Platform totals are fitted as their own series (not summed from ASIN
+    forecasts) so their intervals reflect the aggregate's actual noise.
+    """
+    m_idx = [cube.measures.index(m) for m in measures]
+    totals, keys = platform_values(cube)
+
+    # One solve for everything: columns are [measure x ASIN] then [measure x platform]
+    asin_cols = cube.values[m_idx].transpose(1, 0, 2).reshape(cube.n_dates, -1)
+    platform_cols = totals[m_idx].transpose(1, 0, 2).reshape(cube.n_dates, -1)
+    future, mean, lower, upper = forecast_series(np.hstack([asin_cols, platform_cols]), cube.dates,
+                                                 horizon, fit_days, alpha)
+
+    split = asin_cols.shape[1]
+    asin_fc = _to_cube(future, mean[:, :split], lower[:, :split], upper[:, :split],
+                       cube.asins, cube.platforms, measures)
+    platform_fc = _to_cube(future, mean[:, split:], lower[:, split:], upper[:, split:],
+                           keys, keys, measures)
+    return asin_fc, platform_fc
+
+
+def forecast_frame(fc, key_name):
+    """Long Date x key frame with mean/lower/upper columns per forecast measure"""
+    frame = pd.DataFrame({
+        'Date': np.repeat(fc.dates, fc.n_asins),
+        key_name: np.tile(fc.asins, fc.n_dates),
+    })
+    if key_name == 'ASIN':
+        frame['Advertising_Type'] = np.tile(fc.platforms, fc.n_dates)
+    for m, name in enumerate(fc.measures):
+        frame[name] = fc.values[m].ravel()
+    return frame
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Integer-Keyed Sort-Merge Join
+Date+SKU joins on int64 keys (SKU code from the master index, day ordinal)
+instead of string columns, with the same left_only / right_only / both
+breakdown as pd.merge(..., indicator=True)
+"""
+
+import numpy as np
+import pandas as pd
+
+from date_parsing import day_ordinals, from_day_ordinals
+
+MERGE_LABELS = ['left_only', 'right_only', 'both']
+
+
+def sku_index(master_skus, *other_skus):
+    """
+    SKU -> code index: master-list SKUs first (stable across refreshes), then any
+    SKUs only seen in the reports, each block sorted
+    """
+    master = pd.Index(sorted({str(s).strip() for s in master_skus}))
+    seen = set()
+    for skus in other_skus:
+        seen.update(str(s).strip() for s in pd.unique(np.asarray(skus)))
+    extra = pd.Index(sorted(seen - set(master)))
+    return master.append(extra)
+
+
+class DateSkuKey:
+    """Packs (SKU code, day number) into one int64 that sorts by SKU then day"""
+
+    def __init__(self, skus):
+        self.skus = skus
+        self.stride = 1 << 32
+
+    def encode(self, sku, dates):
+        # String work only on the distinct SKUs, then broadcast codes back to rows
+        labels, uniques = pd.factorize(np.asarray(sku))
+        codes = self.skus.get_indexer([str(s).strip() for s in uniques])[labels]
+        if (codes < 0).any():
+            raise ValueError('SKU missing from the SKU index')
+        return codes.astype(np.int64) * self.stride + (day_ordinals(dates).astype(np.int64) + (1 << 31))
+
+    def decode(self, keys):
+        days = (keys % self.stride) - (1 << 31)
+        return self.skus[keys // self.stride], from_day_ordinals(days)
+
+
+def sort_merge_outer(left, right, left_keys, right_keys):
+    """
+    Outer join on precomputed int64 keys; left keys must be unique.
+
+    Both sides are sorted once, right rows are matched to left rows with
+    searchsorted, and unmatched left rows are appended. Returns (frame, keys)
+    where frame has every left and right column plus a categorical '_merge',
+    ordered by key.
+    """
+    left_order = np.argsort(left_keys, kind='stable')
+    lk = np.asarray(left_keys)[left_order]
+    if len(lk) > 1 and (lk[1:] == lk[:-1]).any():
+        raise ValueError('Left join keys must be unique')
+
+    right_order = np.argsort(right_keys, kind='stable')
+    rk = np.asarray(right_keys)[right_order]
+
+    pos = np.searchsorted(lk, rk)
+    hit = pos < len(lk)
+    hit[hit] = lk[pos[hit]] == rk[hit]
+
+    used = np.zeros(len(lk), dtype=bool)
+    used[pos[hit]] = True
+    left_only = np.flatnonzero(~used)
+
+    # Output rows: every right row (matched or not), then unmatched left rows
+    matched_left = np.full(len(rk), -1)
+    matched_left[hit] = left_order[pos[hit]]
+    keys = np.concatenate([rk, lk[left_only]])
+    left_rows = np.concatenate([matched_left, left_order[left_only]])
+    right_rows = np.concatenate([right_order, np.full(len(left_only), -1)])
+    indicator = np.concatenate([np.where(hit, 2, 1), np.zeros(len(left_only), dtype=int)])
+
+    final = np.argsort(keys, kind='stable')
+    keys, left_rows, right_rows, indicator = keys[final], left_rows[final], right_rows[final], indicator[final]
+
+    left_part = left.reset_index(drop=True).reindex(left_rows).reset_index(drop=True)
+    right_part = right.reset_index(drop=True).reindex(right_rows).reset_index(drop=True)
+    frame = pd.concat([left_part, right_part], axis=1)
+    frame['_merge'] = pd.Categorical.from_codes(indicator, categories=MERGE_LABELS)
+    return frame, keys
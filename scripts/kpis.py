@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Ratio KPIs
+ROAS, ACOS, TACoS, CPC, CTR, CVR, organic ratio and daily averages from summed
+base measures - numpy only, so query paths can use it without importing pandas
+"""
+
+import numpy as np
+
+KPI_COLUMNS = ['ROAS', 'ACOS', 'TACoS', 'CPC', 'CTR', 'CVR', 'Organic_Ratio',
+               'Avg_Daily_Spend', 'Avg_Daily_Sales', 'Avg_Daily_Revenue']
+
+
+def safe_div(num, den):
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den > 0)
+
+
+def ratio_kpis(sums, measures, days):
+    """Ratio KPIs from window totals; sums is [measure, ...] aligned with `measures`"""
+    m = {name: sums[i] for i, name in enumerate(measures)}
+    spend, sales = m['Spend'], m['Sales']
+    revenue = m['Total_Revenue']
+    return {
+        'Spend': spend,
+        'Sales': sales,
+        'Total_Revenue': revenue,
+        'ROAS': safe_div(sales, spend),
+        'ACOS': safe_div(spend, sales),
+        'TACoS': safe_div(spend, revenue),
+        'CPC': safe_div(spend, m['Clicks']),
+        'CTR': safe_div(m['Clicks'], m['Impressions']),
+        'CVR': safe_div(m['Orders'], m['Clicks']),
+        'Organic_Ratio': safe_div(m['Organic_Sales'], revenue),
+        'Avg_Daily_Spend': safe_div(spend, days),
+        'Avg_Daily_Sales': safe_div(sales, days),
+        'Avg_Daily_Revenue': safe_div(revenue, days),
+    }
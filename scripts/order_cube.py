@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Order Dimension Cube
+Order revenue kept by fulfillment channel, sales channel, B2B vs consumer and
+ship state, on top of Date x SKU. Only populated cells are stored (small-int
+dimension codes plus measure arrays), so rollups to any subset of dimensions
+are one bincount and never touch the raw order exports.
+
+Ad spend and attributed revenue only exist per Date x SKU; they are spread
+over that day's order cells pro rata to revenue (order lines when the day has
+no revenue), so TACoS and organic ratio can be sliced by any order dimension.
+Ad activity on a Date x SKU without order lines lands in a cell whose
+dimensions are all Unknown, so rollups add back up to the merge totals.
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from order_lines import ORDER_LINES_NAME, load_order_lines, priced_lines
+from processed_store import BINARY_SUFFIXES, MERGED_NAME, PROCESSED_DIR, load_merged
+
+ORDER_CUBE_FILE = PROCESSED_DIR / 'order_cube.npz'
+
+# Cube dimension -> source column in the order export
+DIMENSIONS = {
+    'Fulfillment': 'fulfillment-channel',
+    'Sales_Channel': 'sales-channel',
+    'B2B': 'is-business-order',
+    'Ship_State': 'ship-state',
+}
+
+MEASURES = ['Revenue', 'Units', 'Order_Lines', 'Ad_Spend', 'Attributed_Revenue']
+UNKNOWN = 'Unknown'
+
+
+def _dimension_labels(lines):
+    """Normalized text per dimension (blank -> Unknown, B2B flag -> B2B/Consumer)"""
+    labels = {}
+    for dim, col in DIMENSIONS.items():
+        values = lines[col].fillna('').astype(str).str.strip()
+        if dim == 'B2B':
+            values = np.where(values.str.lower() == 'true', 'B2B', 'Consumer')
+        elif dim == 'Ship_State':
+            values = values.str.upper()
+        labels[dim] = pd.Series(values, index=lines.index).replace('', UNKNOWN)
+    return labels
+
+
+def _lookup(sorted_labels, values):
+    """Position of each value in sorted_labels, -1 where it's absent"""
+    pos = np.minimum(np.searchsorted(sorted_labels, values), len(sorted_labels) - 1)
+    return np.where(sorted_labels[pos] == values, pos, -1)
+
+
+class OrderCube:
+    """Sparse Date x SKU x order-dimension cube of order and allocated ad measures"""
+
+    def __init__(self, dates, skus, platforms, dims, cells, values, measures=None):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.skus = np.asarray(skus, dtype=str)
+        self.platforms = np.asarray(platforms, dtype=str)     # per SKU
+        self.dims = {k: np.asarray(v, dtype=str) for k, v in dims.items()}  # labels per dimension
+        self.cells = dict(cells)                              # 'Date', 'SKU' and each dimension -> codes
+        self.measures = list(measures or MEASURES)
+        self.values = np.asarray(values, dtype=np.float64)    # [measure, cell]
+
+    @property
+    def n_cells(self):
+        return self.values.shape[1]
+
+    def measure(self, name):
+        return self.values[self.measures.index(name)]
+
+    def _axis(self, name):
+        """(codes per cell, labels) for a dimension, 'Date', 'SKU' or 'Platform'"""
+        if name == 'Date':
+            return self.cells['Date'], self.dates
+        if name == 'SKU':
+            return self.cells['SKU'], self.skus
+        if name == 'Platform':
+            codes, labels = pd.factorize(self.platforms, sort=True)
+            return codes[self.cells['SKU']], np.asarray(labels)
+        return self.cells[name], self.dims[name]
+
+    def mask(self, **filters):
+        """Boolean cell mask, e.g. mask(B2B='B2B', Platform='Perpetua')"""
+        keep = np.ones(self.n_cells, dtype=bool)
+        for name, label in filters.items():
+            codes, labels = self._axis(name)
+            keep &= np.isin(codes, np.flatnonzero(np.isin(labels, np.atleast_1d(label))))
+        return keep
+
+    def rollup(self, by, mask=None):
+        """Measure totals grouped by the `by` axes, with TACoS and organic ratio"""
+        by = [by] if isinstance(by, str) else list(by)
+        axes = [self._axis(name) for name in by]
+        keep = slice(None) if mask is None else mask
+        values = self.values[:, keep]
+
+        if by:
+            key = np.ravel_multi_index([codes[keep] for codes, _ in axes],
+                                       [len(labels) for _, labels in axes])
+            groups, inverse = np.unique(key, return_inverse=True)
+            sums = np.stack([np.bincount(inverse, weights=v, minlength=len(groups)) for v in values])
+            positions = np.unravel_index(groups, [len(labels) for _, labels in axes])
+            frame = pd.DataFrame({name: labels[pos] for name, (_, labels), pos in zip(by, axes, positions)})
+        else:
+            sums = values.sum(axis=1, keepdims=True)
+            frame = pd.DataFrame(index=[0])
+
+        for i, name in enumerate(self.measures):
+            frame[name] = sums[i]
+        revenue = frame['Revenue'].to_numpy()
+        frame['Organic_Revenue'] = revenue - frame['Attributed_Revenue']
+        frame['TACoS'] = np.divide(frame['Ad_Spend'], revenue, out=np.zeros(len(frame)), where=revenue > 0)
+        frame['Organic_Ratio'] = np.divide(frame['Organic_Revenue'], revenue, out=np.zeros(len(frame)),
+                                           where=revenue > 0)
+        frame['Revenue_Share'] = revenue / revenue.sum() if revenue.sum() > 0 else 0.0
+        return frame
+
+
+def build_order_cube(lines=None, merged=None):
+    """Build the cube from the order-line store and the orders + advertising merge"""
+    if lines is None:
+        lines = load_order_lines()
+    lines = priced_lines(lines)
+    if merged is None:
+        merged = load_merged(columns=['SKU', 'Advertising_Type', 'Ad_Spend', 'Ad_Sales', 'Attributed_Revenue'])
+
+    lines['sku'] = lines['sku'].astype(str).str.strip()
+    merged_skus = merged['SKU'].astype(str).str.strip()
+    ads = merged[merged['Date'].notna()]
+    ad_dates = ads['Date'].values.astype('datetime64[D]')
+
+    # Date and SKU axes also cover ad-only keys, so their spend has a cell to land in
+    all_dates = np.concatenate([lines['Date'].values.astype('datetime64[D]'), ad_dates])
+    dates = pd.date_range(all_dates.min(), all_dates.max(), freq='D').values.astype('datetime64[D]')
+    skus = np.union1d(lines['sku'].unique(), merged_skus.unique()).astype(str)
+
+    sku_platform = merged.groupby(merged_skus)['Advertising_Type'].first()
+    platforms = sku_platform.reindex(skus).fillna(UNKNOWN).to_numpy(dtype=str)
+
+    # One code per axis for every line, then collapse identical code tuples into cells
+    axes = {'Date': (np.searchsorted(dates, lines['Date'].values.astype('datetime64[D]')), len(dates)),
+            'SKU': (np.searchsorted(skus, lines['sku'].to_numpy(dtype=str)), len(skus))}
+    dims = {}
+    for dim, labels in _dimension_labels(lines).items():
+        uniques = np.union1d(labels.unique().astype(str), [UNKNOWN])
+        axes[dim] = (np.searchsorted(uniques, labels.to_numpy(dtype=str)), len(uniques))
+        dims[dim] = uniques
+
+    sizes = [size for _, size in axes.values()]
+    cell_keys, inverse = np.unique(np.ravel_multi_index([codes for codes, _ in axes.values()], sizes),
+                                   return_inverse=True)
+    n = len(cell_keys)
+    positions = dict(zip(axes, np.unravel_index(cell_keys, sizes)))
+
+    revenue = np.bincount(inverse, weights=lines['revenue'].to_numpy(dtype=np.float64), minlength=n)
+    units = np.bincount(inverse, weights=lines['quantity'].to_numpy(dtype=np.float64), minlength=n)
+    order_lines = np.bincount(inverse, minlength=n).astype(np.float64)
+
+    # Spread each Date x SKU's spend and attributed revenue over its cells by
+    # revenue share, or by order-line share on days whose lines carry no revenue
+    n_keys = len(dates) * len(skus)
+    sku_day = positions['Date'].astype(np.int64) * len(skus) + positions['SKU']
+    sku_day_revenue = np.bincount(sku_day, weights=revenue, minlength=n_keys)[sku_day]
+    sku_day_lines = np.bincount(sku_day, weights=order_lines, minlength=n_keys)[sku_day]
+    share = np.where(sku_day_revenue > 0,
+                     np.divide(revenue, sku_day_revenue, out=np.zeros(n), where=sku_day_revenue > 0),
+                     order_lines / sku_day_lines)
+
+    ad_key = (np.searchsorted(dates, ad_dates).astype(np.int64) * len(skus)
+              + np.searchsorted(skus, merged_skus[ads.index].to_numpy(dtype=str)))
+
+    # Merges written before attribution alignment only have same-day Ad_Sales
+    attributed = 'Attributed_Revenue' if 'Attributed_Revenue' in ads.columns else 'Ad_Sales'
+    per_key = [np.bincount(ad_key, weights=ads[col].to_numpy(dtype=np.float64), minlength=n_keys)
+               for col in ('Ad_Spend', attributed)]
+
+    # Ad activity on keys with no order lines gets one cell with every dimension Unknown
+    has_lines = np.zeros(n_keys, dtype=bool)
+    has_lines[sku_day] = True
+    orphan = np.flatnonzero(~has_lines & ((per_key[0] != 0) | (per_key[1] != 0)))
+    positions['Date'] = np.concatenate([positions['Date'], orphan // len(skus)])
+    positions['SKU'] = np.concatenate([positions['SKU'], orphan % len(skus)])
+    for dim, labels in dims.items():
+        positions[dim] = np.concatenate([positions[dim], np.full(len(orphan), np.searchsorted(labels, UNKNOWN))])
+    cells = {name: pos.astype(np.uint16 if size < 1 << 16 else np.int32)
+             for (name, pos), size in zip(positions.items(), sizes)}
+
+    no_orders = np.zeros(len(orphan))
+    values = np.stack([np.concatenate([revenue, no_orders]),
+                       np.concatenate([units, no_orders]),
+                       np.concatenate([order_lines, no_orders])]
+                      + [np.concatenate([totals[sku_day] * share, totals[orphan]]) for totals in per_key])
+    return OrderCube(dates, skus, platforms, dims, cells, values)
+
+
+def ad_totals_gap(cube, merged=None):
+    """Largest |cube total - merge total| over Ad_Spend and Attributed_Revenue (0 when nothing is dropped)"""
+    if merged is None:
+        merged = load_merged(columns=['SKU', 'Ad_Spend', 'Ad_Sales', 'Attributed_Revenue'])
+    merged = merged[merged['Date'].notna()]
+    attributed = 'Attributed_Revenue' if 'Attributed_Revenue' in merged.columns else 'Ad_Sales'
+    return max(abs(cube.measure('Ad_Spend').sum() - merged['Ad_Spend'].sum()),
+               abs(cube.measure('Attributed_Revenue').sum() - merged[attributed].sum()))
+
+
+def save_order_cube(cube, path=ORDER_CUBE_FILE):
+    cells = {f'cell_{name}': codes for name, codes in cube.cells.items()}
+    dims = {f'dim_{name}': labels for name, labels in cube.dims.items()}
+    np.savez_compressed(path, dates=cube.dates.astype(np.int64), skus=cube.skus, platforms=cube.platforms,
+                        measures=np.asarray(cube.measures), values=cube.values, **cells, **dims)
+
+
+def load_order_cube(path=ORDER_CUBE_FILE, rebuild=False):
+    """Load the cached cube, rebuilding it when the order-line store or merge is newer"""
+    path = Path(path)
+    sources = [PROCESSED_DIR / (name + suffix) for name in (ORDER_LINES_NAME, MERGED_NAME)
+               for suffix in BINARY_SUFFIXES + ('.csv',)]
+    sources = [p for p in sources if p.exists()]
+    stale = (not path.exists() or
+             any(p.stat().st_mtime > path.stat().st_mtime for p in sources))
+
+    if rebuild or stale:
+        cube = build_order_cube()
+        save_order_cube(cube, path)
+        return cube
+
+    with np.load(path) as data:
+        cells = {name[len('cell_'):]: data[name] for name in data.files if name.startswith('cell_')}
+        dims = {name[len('dim_'):]: data[name] for name in data.files if name.startswith('dim_')}
+        return OrderCube(data['dates'].astype('datetime64[D]'), data['skus'], data['platforms'],
+                         dims, cells, data['values'], list(data['measures']))
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("BUILDING ORDER DIMENSION CUBE")
+    print("=" * 80)
+    print()
+
+    cube = build_order_cube()
+    save_order_cube(cube)
+    gap = ad_totals_gap(cube)
+    if gap > 0.01:
+        raise ValueError(f"Order cube is ${gap:,.2f} off the merged ad totals")
+
+    print(f"  ✓ Dates: {cube.dates[0]} to {cube.dates[-1]} ({len(cube.dates)} days)")
+    print(f"  ✓ SKUs: {len(cube.skus)}")
+    for dim, labels in cube.dims.items():
+        print(f"  ✓ {dim}: {len(labels)} values")
+    print(f"  ✓ Ad spend and attributed revenue match the merge (${cube.measure('Ad_Spend').sum():,.0f} spend)")
+    print(f"  ✓ Populated cells: {cube.n_cells:,}")
+    print(f"  ✓ Saved cube to: {ORDER_CUBE_FILE}")
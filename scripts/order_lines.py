@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Incremental Order-Line Ingest
+Order exports in data/recent-reports are read once: shipped lines are
+fingerprinted into uint64 hashes at parse time, checked against a persistent
+fingerprint set and appended to a binary order-line store. Overlapping
+exports dropped in later only add the lines that weren't seen before.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from date_parsing import ISO_TIMESTAMP, parse_dates
+from processed_store import PROCESSED_DIR, load_table, save_table
+
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'data' / 'recent-reports'
+
+ORDER_LINES_NAME = 'order_lines'
+FINGERPRINT_FILE = PROCESSED_DIR / 'order_fingerprints.npy'
+MANIFEST_FILE = PROCESSED_DIR / 'order_files_manifest.json'
+
+# Column names from Amazon Order Report structure
+ORDER_COLUMNS = [
+    'amazon-order-id', 'merchant-order-id', 'purchase-date', 'last-updated-date',
+    'order-status', 'fulfillment-channel', 'sales-channel', 'order-channel',
+    'url', 'ship-service-level', 'product-name', 'sku', 'asin', 'item-status',
+    'quantity', 'currency', 'item-price', 'item-tax', 'shipping-price',
+    'shipping-tax', 'gift-wrap-price', 'gift-wrap-tax', 'item-promotion-discount',
+    'ship-promotion-discount', 'ship-city', 'ship-state', 'ship-postal-code',
+    'ship-country', 'promotion-ids', 'is-business-order', 'purchase-order-number',
+    'price-designation', 'fulfilled-by', 'is-iba', 'signature-confirmation-recommended',
+    'buyer-name'
+]
+
+# An order line is the same line if these match
+DEDUP_COLUMNS = ['amazon-order-id', 'sku', 'quantity']
+
+
+def fingerprint(lines, columns=DEDUP_COLUMNS):
+    """uint64 hash per row of `columns` (values are hashed as text, so 2 and '2' agree)"""
+    return pd.util.hash_pandas_object(lines[columns].astype(str), index=False).to_numpy(dtype=np.uint64)
+
+
+class FingerprintSet:
+    """Sorted uint64 array on disk; membership via searchsorted"""
+
+    def __init__(self, path=FINGERPRINT_FILE, load=True):
+        self.path = Path(path)
+        if load and self.path.exists():
+            self.values = np.load(self.path)
+        else:
+            self.values = np.empty(0, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.values)
+
+    def contains(self, fps):
+        pos = np.searchsorted(self.values, fps)
+        found = pos < len(self.values)
+        found[found] = self.values[pos[found]] == fps[found]
+        return found
+
+    def add(self, fps):
+        self.values = np.union1d(self.values, fps)
+
+    def save(self):
+        """Write to a temp file and swap it in, so a crash never leaves a half-written set"""
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, self.values)
+        os.replace(tmp, self.path)
+
+
+def order_report_files(data_dir=DATA_DIR):
+    """Tab-separated order exports in data_dir (identified by their header row)"""
+    files = []
+    for path in sorted(Path(data_dir).glob('*.txt')):
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            if f.readline().split('\t')[0].strip() == 'amazon-order-id':
+                files.append(path)
+    return files
+
+
+def _file_signature(path):
+    stat = path.stat()
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def _read_manifest():
+    """(file signatures, store row count) - manifests from before the row count return None for it"""
+    data = json.loads(MANIFEST_FILE.read_text())
+    if 'files' in data:
+        return data['files'], data.get('store_rows')
+    return data, None
+
+
+def _write_manifest(files, store_rows):
+    tmp = MANIFEST_FILE.with_name(MANIFEST_FILE.name + '.tmp')
+    tmp.write_text(json.dumps({'files': files, 'store_rows': store_rows}, indent=2))
+    os.replace(tmp, MANIFEST_FILE)
+
+
+def ingest_orders(files=None, rebuild=False):
+    """
+    Bring the order-line store up to date and return (shipped lines, stats).
+
+    Only files that are new or changed since the last run are parsed. Within
+    those, duplicate lines and lines already in the store are dropped by
+    fingerprint before appending.
+    """
+    files = order_report_files() if files is None else [Path(f) for f in files]
+    store_exists = any((PROCESSED_DIR / (ORDER_LINES_NAME + s)).exists() for s in ('.parquet', '.pkl'))
+    repaired = False
+    if rebuild or not (store_exists and FINGERPRINT_FILE.exists() and MANIFEST_FILE.exists()):
+        manifest, seen, stored = {}, FingerprintSet(FINGERPRINT_FILE, load=False), None
+    else:
+        manifest, store_rows = _read_manifest()
+        seen = FingerprintSet(FINGERPRINT_FILE)
+        stored = load_table(ORDER_LINES_NAME, date_cols=())
+        # A run interrupted after appending to the store left the fingerprints
+        # (and manifest) behind it - rebuild them from what the store holds
+        if store_rows != len(stored):
+            seen = FingerprintSet(FINGERPRINT_FILE, load=False)
+            seen.add(fingerprint(stored))
+            repaired = True
+
+    stats = {'files_read': [], 'files_skipped': [], 'lines_read': 0, 'shipped': 0,
+             'duplicates_in_batch': 0, 'duplicates_seen': 0, 'new_lines': 0}
+    to_read = []
+    for path in files:
+        if manifest.get(path.name) == _file_signature(path):
+            stats['files_skipped'].append(path.name)
+        else:
+            to_read.append(path)
+
+    batches = []
+    for path in to_read:
+        lines = pd.read_csv(path, sep='\t', names=ORDER_COLUMNS, header=0, low_memory=False, dtype=str)
+        stats['lines_read'] += len(lines)
+        lines = lines[lines['order-status'] == 'Shipped']
+        stats['shipped'] += len(lines)
+        batches.append(lines)
+        stats['files_read'].append(path.name)
+        manifest[path.name] = _file_signature(path)
+
+    if batches:
+        batch = pd.concat(batches, ignore_index=True)
+        fps = fingerprint(batch)
+        _, first = np.unique(fps, return_index=True)
+        keep = np.zeros(len(batch), dtype=bool)
+        keep[first] = True
+        stats['duplicates_in_batch'] = int((~keep).sum())
+
+        already = seen.contains(fps) & keep
+        stats['duplicates_seen'] = int(already.sum())
+        keep &= ~already
+
+        new_lines = batch[keep].reset_index(drop=True)
+        stats['new_lines'] = len(new_lines)
+        seen.add(fps[keep])
+        stored = new_lines if stored is None else pd.concat([stored, new_lines], ignore_index=True)
+        save_table(stored, ORDER_LINES_NAME, csv=False)
+
+    if batches or repaired:
+        # Fingerprints and manifest only after the store (each swapped in whole);
+        # the manifest's row count tells the next run whether all three agree
+        seen.save()
+        _write_manifest(manifest, len(stored))
+
+    if stored is None:
+        stored = pd.DataFrame(columns=ORDER_COLUMNS)
+    return stored, stats
+
+
+def load_order_lines():
+    """Every unique shipped order line in the store (raw text columns)"""
+    return load_table(ORDER_LINES_NAME, date_cols=())
+
+
+def priced_lines(lines):
+    """
+    Order lines with a parsed purchase date, numeric price/quantity, a positive
+    price and a per-line revenue; Date is the UTC purchase day
+    """
+    lines = lines.copy()
+    # ISO 8601 with offset, parsed once per distinct timestamp, kept in UTC
+    lines['purchase-date'] = parse_dates(lines['purchase-date'], ISO_TIMESTAMP, utc=True)
+    lines = lines[lines['purchase-date'].notna()]
+    lines['item-price'] = pd.to_numeric(lines['item-price'], errors='coerce').fillna(0)
+    lines['quantity'] = pd.to_numeric(lines['quantity'], errors='coerce').fillna(0)
+    lines = lines[lines['item-price'] > 0].copy()
+    lines['revenue'] = lines['item-price'] * lines['quantity']
+    lines['Date'] = lines['purchase-date'].dt.normalize()
+    return lines
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Perpetua Command Line
+Answers metric questions straight from the cached daily cube index, without
+running a pipeline script:
+
+    python scripts/perpetua.py query --metrics ROAS TACoS --start 2025-12-01 --end 2026-01-31 --by week
+    python scripts/perpetua.py query --asin B0XXXXXXXX --split asin --format json
+    python scripts/perpetua.py serve --port 8050
+    python scripts/perpetua.py export --out outputs/static_dashboard
+"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def _print_table(rows, columns):
+    def fmt(value):
+        return f'{value:,.4f}' if isinstance(value, float) else str(value)
+
+    cells = [[fmt(row[c]) for c in columns] for row in rows]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    print('  '.join(c.ljust(w) if i < 3 else c.rjust(w) for i, (c, w) in enumerate(zip(columns, widths))))
+    print('  '.join('-' * w for w in widths))
+    for r in cells:
+        print('  '.join(v.ljust(w) if i < 3 else v.rjust(w) for i, (v, w) in enumerate(zip(r, widths))))
+
+
+def query_command(args):
+    from cube_index import load_index
+
+    index = load_index(rebuild=args.rebuild)
+    try:
+        rows = index.query(args.metrics, args.start, args.end, args.by, args.split, args.asin, args.platform)
+    except (KeyError, ValueError) as exc:
+        print(f"✗ {exc.args[0]}", file=sys.stderr)
+        return 2
+
+    columns = ['Start', 'End', 'Group', 'Days'] + args.metrics
+    if args.format == 'json':
+        print(json.dumps(rows, indent=2))
+    elif args.format == 'csv':
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    elif rows:
+        _print_table(rows, columns)
+    else:
+        print("  No data for this selection")
+    return 0
+
+
+def serve_command(args):
+    import asyncio
+    from dashboard_server import serve
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    return 0
+
+
+def export_command(args):
+    from cube_index import load_index
+    from static_dashboard import export_dashboard
+
+    written, total, size = export_dashboard(args.out, load_index(rebuild=args.rebuild))
+    print(f"✓ Static dashboard: {args.out / 'index.html'}")
+    print(f"  {written} of {total} shards rewritten, {size / 1e6:.1f} MB on disk")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='perpetua', description='Perpetua reporting command line')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    query = sub.add_parser('query', help='metrics for a date range, by period and platform/ASIN')
+    query.add_argument('--metrics', nargs='+', default=['Spend', 'Sales', 'Total_Revenue', 'ROAS', 'TACoS'],
+                       help='base measures (Spend, Sales, Orders, ...) and KPIs (ROAS, ACOS, TACoS, ...)')
+    query.add_argument('--start', help='first date (YYYY-MM-DD, default: start of data)')
+    query.add_argument('--end', help='last date, inclusive (default: end of data)')
+    query.add_argument('--by', choices=['day', 'week', 'month', 'total'], default='total',
+                       help='period buckets (weeks start on Monday)')
+    query.add_argument('--split', choices=['platform', 'asin', 'none'], default='platform',
+                       help='Perpetua vs Non-Perpetua, one row per ASIN, or one combined row')
+    query.add_argument('--asin', nargs='+', help='only these ASINs')
+    query.add_argument('--platform', nargs='+', choices=['Perpetua', 'Non-Perpetua'], help='only these platforms')
+    query.add_argument('--format', choices=['table', 'csv', 'json'], default='table')
+    query.add_argument('--rebuild', action='store_true', help='rebuild the index from the daily cube first')
+    query.set_defaults(handler=query_command)
+
+    serve = sub.add_parser('serve', help='local dashboard web service (JSON API + charts page)')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8050)
+    serve.add_argument('--cache-size', type=int, default=256, help='cached responses kept in memory')
+    serve.set_defaults(handler=serve_command)
+
+    export = sub.add_parser('export', help='static HTML dashboard with lazily loaded data shards (no server)')
+    export.add_argument('--out', type=Path, default=BASE_DIR / 'outputs' / 'static_dashboard')
+    export.add_argument('--rebuild', action='store_true', help='rebuild the index from the daily cube first')
+    export.set_defaults(handler=export_command)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
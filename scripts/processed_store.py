@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Processed Table Store
+Binary columnar copies of processed tables so downstream scripts load typed
+columns instead of re-parsing CSV text. Day columns are stored as int32 day
+ordinals and come back as datetime64.
+Parquet when pyarrow is installed, otherwise pandas' pickle format.
+
+Date-grained tables are stored as datasets partitioned by month and platform
+(data/processed/<name>/month=YYYY-MM/platform=<type>.<ext> plus a manifest),
+so loaders that ask for a date range, a platform or a few columns only read
+the partitions they need.
+"""
+
+import importlib.util
+import json
+import shutil
+import pandas as pd
+from pathlib import Path
+
+from date_parsing import day_ordinals, from_day_ordinals, parse_dates
+
+# Only check that pyarrow exists; pandas imports it when a parquet file is read or written
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+BASE_DIR = Path(__file__).parent.parent
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+
+MERGED_NAME = 'orders_advertising_merged'
+CAMPAIGNS_NAME = 'campaigns_processed'
+AD_PRODUCTS_NAME = 'advertised_products_processed'
+BINARY_SUFFIXES = ('.parquet', '.pkl')
+
+PARTITION_MANIFEST = '_partitions.json'
+NO_VALUE = 'none'  # partition key for undated rows / rows without a platform
+
+
+def _binary_path(name):
+    return PROCESSED_DIR / (name + ('.parquet' if HAS_PYARROW else '.pkl'))
+
+
+def _encode_days(df, date_cols):
+    """Day columns without NaT or time-of-day -> int32 day ordinals"""
+    encoded = None
+    for col in date_cols:
+        if col not in df.columns or not pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        dates = df[col]
+        if dates.isna().any() or (dates != dates.dt.normalize()).any():
+            continue
+        if encoded is None:
+            encoded = df.copy()
+        encoded[col] = day_ordinals(dates)
+    return df if encoded is None else encoded
+
+
+def _decode_days(df, date_cols):
+    for col in date_cols:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = from_day_ordinals(df[col].to_numpy())
+    return df
+
+
+def save_table(df, name, csv=True, date_cols=('Date',)):
+    """Write `name` as binary (and CSV for spreadsheet users); returns the binary path"""
+    path = _binary_path(name)
+    binary = _encode_days(df, date_cols)
+    if HAS_PYARROW:
+        binary.to_parquet(path, index=False)
+    else:
+        binary.to_pickle(path)
+    if csv:
+        df.to_csv(PROCESSED_DIR / f'{name}.csv', index=False)
+    return path
+
+
+def load_table(name, date_cols=('Date',)):
+    """
+    Load `name` from its binary copy when it's at least as new as the CSV,
+    otherwise fall back to parsing the CSV
+    """
+    csv_path = PROCESSED_DIR / f'{name}.csv'
+    csv_mtime = csv_path.stat().st_mtime if csv_path.exists() else 0
+    for suffix in BINARY_SUFFIXES:
+        path = PROCESSED_DIR / (name + suffix)
+        if path.exists() and path.stat().st_mtime >= csv_mtime:
+            if suffix == '.parquet' and HAS_PYARROW:
+                return _decode_days(pd.read_parquet(path), date_cols)
+            if suffix == '.pkl':
+                return _decode_days(pd.read_pickle(path), date_cols)
+
+    df = pd.read_csv(csv_path, low_memory=False)
+    for col in date_cols:
+        if col in df.columns:
+            df[col] = parse_dates(df[col])
+    return df
+
+
+def _partition_value(value):
+    return NO_VALUE if pd.isna(value) else str(value).replace('/', '_')
+
+
+def save_dataset(df, name, csv=True, date_col='Date', platform_col='Advertising_Type'):
+    """
+    Write `name` partitioned by month of `date_col` and by `platform_col` (and
+    as CSV for spreadsheet users); returns the dataset directory
+    """
+    # CSV first: the dataset is only trusted while its manifest is at least as new
+    if csv:
+        df.to_csv(PROCESSED_DIR / f'{name}.csv', index=False)
+
+    dataset_dir = PROCESSED_DIR / name
+    staging_dir = PROCESSED_DIR / f'{name}.tmp'
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+
+    typed = df.copy()
+    typed[date_col] = parse_dates(typed[date_col])
+    months = typed[date_col].dt.strftime('%Y-%m').fillna(NO_VALUE)
+    platforms = typed[platform_col] if platform_col in typed.columns else pd.Series(None, index=typed.index)
+    platforms = platforms.map(_partition_value)
+
+    suffix = '.parquet' if HAS_PYARROW else '.pkl'
+    partitions = []
+    for (month, platform), part in typed.groupby([months, platforms], sort=True):
+        path = Path(f'month={month}') / f'platform={platform}{suffix}'
+        (staging_dir / path.parent).mkdir(exist_ok=True)
+        binary = _encode_days(part.reset_index(drop=True), (date_col,))
+        if HAS_PYARROW:
+            binary.to_parquet(staging_dir / path, index=False)
+        else:
+            binary.to_pickle(staging_dir / path)
+        partitions.append({
+            'path': path.as_posix(),
+            'month': month,
+            'platform': platform,
+            'rows': len(part),
+            'min_date': None if month == NO_VALUE else str(part[date_col].min().date()),
+            'max_date': None if month == NO_VALUE else str(part[date_col].max().date()),
+        })
+
+    manifest = {'date_col': date_col, 'platform_col': platform_col,
+                'columns': list(df.columns), 'partitions': partitions}
+    (staging_dir / PARTITION_MANIFEST).write_text(json.dumps(manifest, indent=2))
+    if dataset_dir.exists():
+        shutil.rmtree(dataset_dir)
+    staging_dir.rename(dataset_dir)
+    return dataset_dir
+
+
+def _read_partition(path, columns, date_col):
+    """One partition with its day ordinals decoded - the undated partition keeps
+    datetime64, so decoding after concat would leave an object column"""
+    if path.suffix == '.parquet':
+        part = pd.read_parquet(path, columns=columns)
+    else:
+        part = pd.read_pickle(path)
+        part = part if columns is None else part[columns]
+    return _decode_days(part, (date_col,))
+
+
+def _filter_rows(df, date_col, platform_col, start, end, platforms):
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df[date_col] >= start
+    if end is not None:
+        mask &= df[date_col] <= end
+    if platforms is not None:
+        mask &= df[platform_col].isin(platforms)
+    return df if mask.all() else df[mask]
+
+
+def load_dataset(name, start=None, end=None, columns=None, platforms=None):
+    """
+    Rows of `name` with a date in [start, end] (inclusive) and a platform in
+    `platforms`, restricted to `columns` (columns the table lacks are skipped).
+    Only the month/platform partitions that overlap the filters are read; rows
+    are then trimmed to the exact range and returned in date order. Falls back to the single-file table
+    when the dataset is missing or older than the CSV.
+    """
+    start = None if start is None else pd.Timestamp(start)
+    end = None if end is None else pd.Timestamp(end)
+    dataset_dir = PROCESSED_DIR / name
+    manifest_path = dataset_dir / PARTITION_MANIFEST
+    csv_path = PROCESSED_DIR / f'{name}.csv'
+
+    if not manifest_path.exists() or (csv_path.exists() and
+                                      csv_path.stat().st_mtime > manifest_path.stat().st_mtime):
+        df = load_table(name)
+        date_col, platform_col = 'Date', 'Advertising_Type'
+        if columns is None:
+            return _filter_rows(df, date_col, platform_col, start, end, platforms)
+        # Filter on the full table, then keep only the requested columns
+        columns = [c for c in columns if c in df.columns]
+        return _filter_rows(df, date_col, platform_col, start, end, platforms)[columns]
+
+    manifest = json.loads(manifest_path.read_text())
+    date_col, platform_col = manifest['date_col'], manifest['platform_col']
+    read_columns = None
+    if columns is not None:
+        columns = [c for c in columns if c in manifest['columns']]
+        needed = ([date_col] if start is not None or end is not None else []) + \
+                 ([platform_col] if platforms is not None else [])
+        read_columns = columns + [c for c in needed if c not in columns]
+
+    wanted = None if platforms is None else {_partition_value(p) for p in platforms}
+    parts = []
+    for part in manifest['partitions']:
+        if wanted is not None and part['platform'] not in wanted:
+            continue
+        if (start is not None or end is not None) and part['month'] == NO_VALUE:
+            continue
+        if start is not None and pd.Timestamp(part['max_date']) < start:
+            continue
+        if end is not None and pd.Timestamp(part['min_date']) > end:
+            continue
+        parts.append(_read_partition(dataset_dir / part['path'], read_columns, date_col))
+
+    if parts:
+        df = pd.concat(parts, ignore_index=True)
+        if date_col in df.columns and len(parts) > 1:
+            df = df.sort_values(date_col, kind='stable', ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=read_columns or manifest['columns'])
+    df = _filter_rows(df, date_col, platform_col, start, end, platforms)
+    return df if columns is None else df[columns]
+
+
+def load_merged(start=None, end=None, columns=None, platforms=None):
+    """Orders + advertising Date x SKU table with parsed dates and no undated rows"""
+    if columns is not None and 'Date' not in columns:
+        columns = ['Date'] + list(columns)
+    merged = load_dataset(MERGED_NAME, start, end, columns, platforms)
+    return merged[merged['Date'].notna()]
+
+
+if __name__ == '__main__':
+    # Self-check: a table with undated rows round-trips through the dataset
+    # with a datetime64 Date column, and filtered column subsets load from
+    # both the dataset and the single-file fallback
+    import tempfile
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmp:
+        PROCESSED_DIR = Path(tmp)
+        table = pd.DataFrame({
+            'Date': pd.to_datetime(['2025-10-01', '2025-11-02', '2025-11-03', None]),
+            'Advertising_Type': ['Perpetua', 'Perpetua', 'Non-Perpetua', 'Perpetua'],
+            'Spend': [1.0, 2.0, 3.0, 4.0],
+        })
+        save_dataset(table, 'check')
+        for platforms in (None, ['Perpetua']):
+            loaded = load_dataset('check', platforms=platforms)
+            expected = table if platforms is None else table[table['Advertising_Type'].isin(platforms)]
+            assert pd.api.types.is_datetime64_any_dtype(loaded['Date']), loaded['Date'].dtype
+            assert sorted(loaded['Spend']) == sorted(expected['Spend'])
+            assert loaded['Date'].isna().sum() == expected['Date'].isna().sum()
+        assert list(load_dataset('check', start='2025-11-01', columns=['Spend'])['Spend']) == [2.0, 3.0]
+
+        shutil.rmtree(PROCESSED_DIR / 'check')
+        save_table(table, 'check')
+        spend = load_dataset('check', start='2025-11-01', columns=['Spend'], platforms=['Perpetua'])
+        assert list(spend.columns) == ['Spend'] and np.allclose(spend['Spend'], [2.0])
+    print("✓ Processed store round-trips undated rows and filtered column subsets")
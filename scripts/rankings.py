@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+ASIN Rankings
+Top/bottom-N ASINs by spend, sales, ROAS, TACoS, wasted spend and sales growth
+for every platform and month, selected with argpartition instead of full sorts
+and cached so every dashboard reads the same lists
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from daily_cube import CUBE_FILE, load_cube
+from rolling_kpis import PLATFORMS
+
+BASE_DIR = Path(__file__).parent.parent
+RANKINGS_FILE = BASE_DIR / 'data' / 'aggregated' / 'asin_rankings.csv'
+
+RANK_KEYS = ['Spend', 'Sales', 'ROAS', 'TACoS', 'Wasted_Spend', 'Sales_Growth']
+TOP_N = 100
+ALL = 'All'
+
+
+def top_n_indices(values, n, largest=True):
+    """
+    Indices of the n largest (or smallest) values along the last axis, best first.
+
+    argpartition selects the n candidates in O(len) and only those n are sorted.
+    NaN never ranks; rows with fewer than n finite values return -1 padding.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    fill = -np.inf if largest else np.inf
+    keyed = np.where(np.isfinite(values), values, fill)
+    if largest:
+        keyed = -keyed
+    n = min(n, values.shape[-1])
+    if n < values.shape[-1]:
+        picked = np.argpartition(keyed, n - 1, axis=-1)[..., :n]
+    else:
+        picked = np.broadcast_to(np.arange(n), values.shape[:-1] + (n,))
+    order = np.argsort(np.take_along_axis(keyed, picked, axis=-1), axis=-1, kind='stable')
+    picked = np.take_along_axis(picked, order, axis=-1)
+    finite = np.isfinite(np.take_along_axis(values, picked, axis=-1))
+    return np.where(finite, picked, -1)
+
+
+def top_n(frame, column, n, largest=True):
+    """Rows of `frame` with the n largest (or smallest) `column` values, best first"""
+    idx = top_n_indices(frame[column].to_numpy(dtype=np.float64), n, largest)
+    return frame.iloc[idx[idx >= 0]]
+
+
+def _rank_matrix(sums, previous, measures):
+    """[key, asin] matrix of ranking values from one period's measure sums"""
+    m = {name: sums[i] for i, name in enumerate(measures)}
+    spend, sales, revenue = m['Spend'], m['Sales'], m['Total_Revenue']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roas = np.where(spend > 0, sales / spend, np.nan)
+        tacos = np.where(revenue > 0, spend / revenue, np.nan)
+    growth = sales - previous[measures.index('Sales')] if previous is not None else np.full_like(sales, np.nan)
+    return np.stack([spend, sales, roas, tacos, m['Wasted_Spend'], growth])
+
+
+def compute_rankings(cube, n=TOP_N):
+    """
+    Top and bottom n ASINs for every RANK_KEYS x platform x period.
+
+    Periods are each calendar month plus 'All' (whole range; growth compares the
+    last month to the one before). Returns a long frame: Period, Platform, Key,
+    Direction, Rank, ASIN, Value.
+    """
+    # Wasted spend: spend on ASIN-days with clicks but no attributed orders
+    wasted = np.where((cube.measure('Clicks') > 0) & (cube.measure('Orders') == 0), cube.measure('Spend'), 0)
+    values = np.concatenate([cube.values, wasted[None]])
+    measures = cube.measures + ['Wasted_Spend']
+
+    months = cube.dates.astype('datetime64[M]')
+    labels, starts = np.unique(months, return_index=True)
+    monthly = np.add.reduceat(values, starts, axis=1)  # [measure, month, asin]
+
+    periods = [(str(label), monthly[:, i], monthly[:, i - 1] if i else None) for i, label in enumerate(labels)]
+    periods.append((ALL, values.sum(axis=1), None))
+
+    platform_masks = [(p, cube.platform_mask(p)) for p in PLATFORMS] + [(ALL, np.ones(cube.n_asins, dtype=bool))]
+
+    frames = []
+    for period, sums, previous in periods:
+        matrix = _rank_matrix(sums, previous, measures)
+        if period == ALL and len(labels) > 1:
+            # Whole-range growth compares the last month with the one before
+            sales = monthly[measures.index('Sales')]
+            matrix[RANK_KEYS.index('Sales_Growth')] = sales[-1] - sales[-2]
+        for platform, mask in platform_masks:
+            asin_idx = np.flatnonzero(mask)
+            sub = matrix[:, asin_idx]
+            for direction, largest in [('Top', True), ('Bottom', False)]:
+                picked = top_n_indices(sub, n, largest)  # [key, n] - every key in one call
+                key_idx, rank = np.nonzero(picked >= 0)
+                cols = picked[key_idx, rank]
+                frames.append(pd.DataFrame({
+                    'Period': period,
+                    'Platform': platform,
+                    'Key': np.asarray(RANK_KEYS)[key_idx],
+                    'Direction': direction,
+                    'Rank': rank + 1,
+                    'ASIN': cube.asins[asin_idx[cols]],
+                    'Value': sub[key_idx, cols],
+                }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_rankings(path=RANKINGS_FILE, rebuild=False):
+    """Cached rankings, recomputed when the daily cube is newer than the cache"""
+    cube_mtime = CUBE_FILE.stat().st_mtime if CUBE_FILE.exists() else 0
+    if rebuild or not path.exists() or path.stat().st_mtime < cube_mtime:
+        rankings = compute_rankings(load_cube())
+        rankings.to_csv(path, index=False)
+        return rankings
+    return pd.read_csv(path, dtype={'Period': str, 'ASIN': str})
+
+
+def ranked_asins(rankings, key, n=TOP_N, platform=ALL, period=ALL, direction='Top'):
+    """Ordered ASIN list for one ranking"""
+    sel = rankings[(rankings['Key'] == key) & (rankings['Platform'] == platform) &
+                   (rankings['Period'] == period) & (rankings['Direction'] == direction)]
+    return sel.sort_values('Rank')['ASIN'].head(n).tolist()
+
+
+def take_ranked(frame, asins, asin_col='Advertised ASIN'):
+    """Rows of `frame` whose ASIN is in `asins`, in ranking order"""
+    position = pd.Series(np.arange(len(asins)), index=pd.Index(asins).astype(str))
+    ranks = frame[asin_col].astype(str).str.strip().map(position)
+    return frame.loc[ranks.dropna().sort_values(kind='stable').index]
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("PRECOMPUTING ASIN RANKINGS")
+    print("=" * 80)
+    print()
+
+    rankings = load_rankings(rebuild=True)
+
+    print(f"  ✓ Keys: {', '.join(RANK_KEYS)} (top and bottom {TOP_N})")
+    print(f"  ✓ Periods: {', '.join(rankings['Period'].unique())}")
+    print(f"  ✓ {len(rankings):,} ranked entries")
+    print(f"  ✓ Saved rankings to: {RANKINGS_FILE}")
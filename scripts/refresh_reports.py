@@ -2,30 +2,81 @@
 """
 Refresh All Reports - Automation Script
 Re-runs entire analysis pipeline with updated data files
+
+Every stage's wall/CPU time, peak memory, rows and bytes in/out are appended
+to outputs/refresh_runs.jsonl and the run-history database, and the run is
+checked against the previous runs for regressions. --profile also saves a
+cProfile per stage under outputs/profiles/<run id>/, and each stage's import
+time and slowest imports are reported alongside its metrics.
+--json-only skips the Excel/PNG report builders (they import openpyxl and
+matplotlib) when only the CSV/JSON outputs are needed.
 """
 
-import subprocess
+import argparse
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
 
+from run_history import connect, print_report, record_run, regression_report
+from stage_runner import run_stage, write_profile_summary
+
 BASE_DIR = Path(__file__).parent.parent
 SCRIPTS_DIR = BASE_DIR / 'scripts'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+RUN_LOG = OUTPUT_DIR / 'refresh_runs.jsonl'
+PROFILE_DIR = OUTPUT_DIR / 'profiles'
+STAGE_TIMEOUT = 300  # 5 minutes max per script
+
+parser = argparse.ArgumentParser(description='Re-run the full report pipeline')
+parser.add_argument('--profile', action='store_true',
+                    help='save a cProfile (.prof + top-function summary) for every stage')
+parser.add_argument('--json-only', action='store_true',
+                    help='skip the Excel/PNG report builders; refresh CSV/JSON outputs only')
+args = parser.parse_args()
+
+run_started = datetime.now()
+run_id = run_started.strftime('%Y%m%d_%H%M%S')
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+if args.profile:
+    (PROFILE_DIR / run_id).mkdir(parents=True, exist_ok=True)
+
+
+def log_record(record):
+    with open(RUN_LOG, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+    return record
+
 
 print("=" * 80)
 print("PERPETUA REPORT REFRESH - AUTOMATED PIPELINE")
 print("=" * 80)
-print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+print(f"Started: {run_started.strftime('%Y-%m-%d %H:%M:%S')} (run {run_id})")
 print()
 
 scripts_to_run = [
     ('1_process_campaign_data.py', 'Processing campaign data and tagging Perpetua vs Non-Perpetua'),
     ('2_asin_level_analysis.py', 'Running ASIN-level performance analysis'),
+    ('daily_cube.py', 'Building daily metrics cube'),
+    ('rankings.py', 'Precomputing ASIN rankings'),
+    ('18_event_study_analysis.py', 'Running per-ASIN onboarding event study'),
+    ('19_matched_did_analysis.py', 'Estimating matched-control difference-in-differences'),
+    ('20_rolling_kpi_analysis.py', 'Computing rolling-window KPIs'),
+    ('21_anomaly_detection.py', 'Detecting per-ASIN daily anomalies'),
+    ('22_forecast_analysis.py', 'Forecasting spend and revenue'),
+    ('23_pareto_segmentation.py', 'Segmenting ASINs (Pareto / ABC)'),
+    ('24_order_dimension_analysis.py', 'Slicing TACoS by order channel, B2B and ship state'),
+    ('warehouse.py', 'Building SQL warehouse (star schema + aggregates)'),
     ('3_generate_performance_report.py', 'Generating performance reports and visualizations'),
     ('4_generate_excel_dashboard.py', 'Creating Excel dashboard')
 ]
+# Stages that only render Excel/PNG deliverables from the outputs above
+REPORT_BUILDERS = {'3_generate_performance_report.py', '4_generate_excel_dashboard.py'}
+if args.json_only:
+    scripts_to_run = [(script, desc) for script, desc in scripts_to_run if script not in REPORT_BUILDERS]
 
 failed_scripts = []
+stage_records = []
 
 for idx, (script, description) in enumerate(scripts_to_run, 1):
     print(f"[{idx}/{len(scripts_to_run)}] {description}...")
@@ -36,38 +87,71 @@ for idx, (script, description) in enumerate(scripts_to_run, 1):
     if not script_path.exists():
         print(f"  ✗ ERROR: Script not found: {script_path}")
         failed_scripts.append(script)
+        stage_records.append(log_record({'event': 'stage', 'run_id': run_id, 'stage': idx, 'script': script,
+                                         'description': description, 'status': 'missing'}))
         continue
 
-    try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes max per script
-        )
-
-        if result.returncode == 0:
-            print(f"  ✓ {script} completed successfully")
-        else:
-            print(f"  ✗ {script} failed with exit code {result.returncode}")
-            print(f"  Error output:")
-            print(result.stderr)
-            failed_scripts.append(script)
-
-    except subprocess.TimeoutExpired:
-        print(f"  ✗ {script} timed out after 5 minutes")
+    profile_path = PROFILE_DIR / run_id / f'{script_path.stem}.prof' if args.profile else None
+    stage_started = datetime.now()
+    result = run_stage(script_path, BASE_DIR, timeout=STAGE_TIMEOUT, profile_path=profile_path)
+
+    if result['returncode'] == 0:
+        print(f"  ✓ {script} completed successfully")
+    elif result['returncode'] is None:
+        print(f"  ✗ {script} timed out after {STAGE_TIMEOUT // 60} minutes")
         failed_scripts.append(script)
-    except Exception as e:
-        print(f"  ✗ {script} failed with error: {e}")
+    else:
+        print(f"  ✗ {script} failed with exit code {result['returncode']}")
+        print(f"  Error output:")
+        print(result['stderr'])
         failed_scripts.append(script)
 
+    rss = f", peak {result['peak_rss_mb']:,.0f} MB" if result['peak_rss_mb'] is not None else ''
+    print(f"    {result['wall_s']:.1f}s wall, {result['cpu_s'] or 0:.1f}s CPU{rss}, "
+          f"{result['rows_in'] or 0:,} rows in / {result['rows_out'] or 0:,} out")
+    if result['top_imports']:
+        slowest = ', '.join(f"{name} {s:.2f}s" for name, s in result['top_imports'][:3])
+        print(f"    Imports: {result['import_s']:.2f}s ({slowest})")
+    if result['profile']:
+        write_profile_summary(result['profile'], profile_path.with_suffix('.txt'))
+        print(f"    Profile: {profile_path.with_suffix('.txt')}")
+
+    stage_records.append(log_record({
+        'event': 'stage',
+        'run_id': run_id,
+        'started_at': stage_started.isoformat(),
+        'stage': idx,
+        'description': description,
+        'status': 'ok' if result['returncode'] == 0 else ('timeout' if result['returncode'] is None else 'failed'),
+        **{k: v for k, v in result.items() if k not in ('stdout', 'stderr')},
+    }))
+
     print()
 
 print("=" * 80)
 print("REFRESH COMPLETE")
 print("=" * 80)
 print(f"Finished: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+print(f"Stage metrics: {RUN_LOG}")
+print()
+
+run_record = log_record({
+    'event': 'run',
+    'run_id': run_id,
+    'started_at': run_started.isoformat(),
+    'wall_s': (datetime.now() - run_started).total_seconds(),
+    'stages': len(scripts_to_run),
+    'failed': failed_scripts,
+    'profiled': args.profile,
+    'json_only': args.json_only,
+})
+
+# Run history: flag stages that got slower / hungrier than their recent baseline
+history = connect()
+record_run(history, run_record, stage_records)
+print("Performance vs previous runs:")
+print_report(*regression_report(history, timeout=STAGE_TIMEOUT))
+history.close()
 print()
 
 if failed_scripts:
@@ -80,6 +164,9 @@ if failed_scripts:
 else:
     print("✓ All reports refreshed successfully!")
     print()
+    if args.json_only:
+        print("Excel/PNG reports were skipped (--json-only)")
+        sys.exit(0)
     print("Updated files in outputs/:")
     print("  - Perpetua_Performance_Dashboard_YYYYMMDD.xlsx")
     print("  - Campaign_Performance_Report.txt")
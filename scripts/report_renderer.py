@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Report Renderer
+Text and markdown performance reports rendered from templates over cached
+summaries: the Perpetua vs Non-Perpetua report from asin_level_comparison.json,
+and per-month or per-ASIN variants from the daily cube. A report is rewritten
+only when the hash of its summary or of this module's templates and rules
+changed (hashes are kept in data/processed/report_hashes.json).
+
+    python scripts/report_renderer.py                        # Campaign_Performance_Report.txt / _Summary.md
+    python scripts/report_renderer.py --by month             # outputs/reports/month/YYYY-MM.{txt,md}
+    python scripts/report_renderer.py --by asin --asin B0XXXXXXXX
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from daily_cube import AD_MEASURES, PLATFORMS, load_cube
+from kpis import ratio_kpis
+
+BASE_DIR = Path(__file__).parent.parent
+AGG_DIR = BASE_DIR / 'data' / 'aggregated'
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+OUTPUT_DIR = BASE_DIR / 'outputs'
+VARIANT_DIR = OUTPUT_DIR / 'reports'
+SUMMARY_FILE = AGG_DIR / 'asin_level_comparison.json'
+HASH_FILE = PROCESSED_DIR / 'report_hashes.json'
+
+TARGET_ROAS = 2.0
+FORMATS = ['txt', 'md']
+MAIN_FILES = {'txt': 'Campaign_Performance_Report.txt', 'md': 'Campaign_Performance_Summary.md'}
+
+# (metric key, label, unit, lower is better)
+METRICS = [
+    ('Total_Spend', 'Total Spend', '$', False),
+    ('Total_Sales', 'Total Sales', '$', False),
+    ('Total_Orders', 'Total Orders', '', False),
+    ('ACOS', 'ACOS', '%', True),
+    ('ROAS', 'ROAS', 'x', False),
+    ('Avg_CPC', 'Avg CPC', '$', True),
+    ('Avg_CVR', 'Conversion Rate', '%', False),
+    ('CTR', 'CTR', '%', False),
+]
+
+TEXT_TEMPLATE = """\
+{rule}
+CAMPAIGN PERFORMANCE ANALYSIS: {title_upper}
+{rule}
+
+Report Generated: {generated}
+{period}
+EXECUTIVE SUMMARY
+{dash}
+{facts}
+
+PERFORMANCE METRICS
+{dash}
+{header}
+{dash}
+{rows}
+
+KEY INSIGHTS
+{dash}
+{insights}
+
+RECOMMENDATIONS
+{dash}
+{recommendations}
+
+{rule}
+END OF REPORT
+{rule}"""
+
+MARKDOWN_TEMPLATE = """\
+# Campaign Performance Analysis: {title}
+
+**Report Generated:** {generated}
+{period}
+## Executive Summary
+
+{facts}
+
+## Performance Comparison
+
+| Metric | {left} | {right} | Winner |
+|--------|----------|--------------|--------|
+{rows}
+
+## Key Insights
+
+{insights}{charts}"""
+
+CHARTS_MARKDOWN = """
+
+## Visualizations
+
+### Perpetua vs Non-Perpetua Comparison
+![Comparison](perpetua_vs_nonperpetua_comparison.png)
+
+### Spend vs Sales
+![Spend vs Sales](spend_vs_sales_scatter.png)
+
+### ROAS Comparison
+![ROAS](roas_comparison.png)
+
+### Efficiency Metrics
+![Efficiency](efficiency_metrics_comparison.png)"""
+
+# Per-format pieces: fact line, table row, period line, money prefix
+PARTS = {
+    'txt': {'template': TEXT_TEMPLATE, 'fact': '  {0}: {1}', 'row': '{0:<25} | {1:>15} | {2:>15} | {3:<12}',
+            'period': 'Period: {0}\n', 'dollar': '$'},
+    'md': {'template': MARKDOWN_TEMPLATE, 'fact': '- **{0}:** {1}', 'row': '| {0} | {1} | {2} | {3} |',
+           'period': '**Period:** {0}\n', 'dollar': '\\$'},
+}
+
+# (metric, lower is better, left-wins line, right-wins line)
+EDGE_INSIGHTS = [
+    ('ACOS', True, '  ✓ {left} has {pct:.1f}% better ACOS (more efficient)',
+     '  ⚠ {right} has {pct:.1f}% better ACOS'),
+    ('ROAS', False, '  ✓ {left} has {pct:.1f}% better ROAS',
+     '  ⚠ {right} has {pct:.1f}% better ROAS'),
+    ('Avg_CPC', True, '  ✓ {left} has {pct:.1f}% lower CPC (more cost-efficient)',
+     '  ⚠ {right} has {pct:.1f}% lower CPC'),
+]
+
+VOLUME_INSIGHTS = [
+    '  • {left} spends {spend_pct:.0f}% {spend_dir} than {peers}',
+    '  • {left} generates {sales_pct:.0f}% {sales_dir} sales revenue',
+]
+
+PLATFORM_INSIGHTS = [
+    '  • {left} manages {left_count} ASINs vs {right_count} {right_lower} ASINs',
+    '',
+    'Per-ASIN Metrics:',
+    '  • {left}: ${left_spend_per:,.0f} spend/ASIN → ${left_sales_per:,.0f} sales/ASIN',
+    '  • {right}: ${right_spend_per:,.0f} spend/ASIN → ${right_sales_per:,.0f} sales/ASIN',
+]
+
+# (condition over the context, text) per report kind
+RECOMMENDATIONS = {
+    'platform': [
+        (lambda c: c['roas_edge'] < 0,
+         '  1. {right} products show better ROAS - investigate what strategies can be\n'
+         '     applied from {right_lower} to {left} campaigns'),
+        (lambda c: c['l']['ROAS'] < TARGET_ROAS,
+         '  2. {left} ROAS is below {target:.1f} target - consider:\n'
+         '     - Streams bid optimization adjustments\n'
+         '     - Negative keyword expansion to reduce wasted spend\n'
+         '     - Budget reallocation from low-performing to high-performing campaigns'),
+        (lambda c: c['l']['Avg_CPC'] > c['r']['Avg_CPC'],
+         '  3. {left} has higher CPC - this may indicate:\n'
+         '     - More competitive keywords (expected for higher-volume products)\n'
+         '     - Opportunity to refine bidding strategies'),
+        (lambda c: True, '  4. Continue leveraging automation for {left} products while monitoring efficiency'),
+        (lambda c: True, '  5. Consider expanding {left} management to high-performing {right_lower} ASINs'),
+    ],
+    'asin': [
+        (lambda c: c['l']['ROAS'] < TARGET_ROAS,
+         '  1. ROAS is below the {target:.1f} target - review bids and negative keywords for this ASIN'),
+        (lambda c: c['roas_edge'] < 0,
+         '  2. ROAS trails the {platform} average - compare its targeting with the platform\'s top ASINs'),
+        (lambda c: c['l']['ROAS'] >= TARGET_ROAS and c['roas_edge'] >= 0,
+         '  • At or above target and the {platform} average - a candidate for more budget'),
+    ],
+}
+
+
+def _edge(left, right, lower_better):
+    """% by which left beats right (negative when right is better), 0 without a baseline"""
+    if right <= 0:
+        return 0.0
+    return (right - left) / right * 100 if lower_better else (left - right) / right * 100
+
+
+def _value(value, unit, dollar):
+    if unit == '$':
+        return f"{dollar}{value:,.2f}"
+    if unit == '%':
+        return f"{value * 100:.2f}%"
+    if unit == 'x':
+        return f"{value:.2f}x"
+    return f"{value:,.0f}"
+
+
+def _context(summary):
+    left, right = summary['left_metrics'], summary['right_metrics']
+    spend = _edge(left['Total_Spend'], right['Total_Spend'], False)
+    sales = _edge(left['Total_Sales'], right['Total_Sales'], False)
+    ctx = {
+        'left': summary['left'], 'right': summary['right'],
+        'right_lower': summary['right'][0].lower() + summary['right'][1:],
+        'peers': summary['peers'], 'platform': summary.get('platform', summary['left']), 'target': TARGET_ROAS,
+        'l': left, 'r': right, 'roas_edge': _edge(left['ROAS'], right['ROAS'], False),
+        'spend_pct': abs(spend), 'spend_dir': 'more' if spend >= 0 else 'less',
+        'sales_pct': abs(sales), 'sales_dir': 'more' if sales >= 0 else 'less',
+    }
+    if summary['kind'] == 'platform':
+        lc, rc = summary['counts']
+        ctx.update(left_count=lc, right_count=rc,
+                   left_spend_per=left['Total_Spend'] / lc, left_sales_per=left['Total_Sales'] / lc,
+                   right_spend_per=right['Total_Spend'] / rc, right_sales_per=right['Total_Sales'] / rc)
+    return ctx
+
+
+def render(summary, fmt, generated=None):
+    """Report text for one summary in 'txt' or 'md'"""
+    parts = PARTS[fmt]
+    ctx = _context(summary)
+    left, right = ctx['left'], ctx['right']
+
+    rows = []
+    for key, label, unit, lower_better in METRICS:
+        l, r = ctx['l'][key], ctx['r'][key]
+        winner = left if (l < r if lower_better else l > r) else right
+        rows.append(parts['row'].format(label, _value(l, unit, parts['dollar']), _value(r, unit, parts['dollar']),
+                                        f'{winner} ✓'))
+
+    insights = []
+    for key, lower_better, better, worse in EDGE_INSIGHTS:
+        pct = _edge(ctx['l'][key], ctx['r'][key], lower_better)
+        insights.append((better if pct > 0 else worse).format(pct=abs(pct), **ctx))
+    insights += [line.format(**ctx) for line in VOLUME_INSIGHTS]
+    if summary['kind'] == 'platform':
+        insights += [line.format(**ctx) for line in PLATFORM_INSIGHTS]
+
+    recommendations = [text.format(**ctx) for condition, text in RECOMMENDATIONS[summary['kind']] if condition(ctx)]
+
+    return parts['template'].format(
+        rule='=' * 80, dash='-' * 80,
+        title=summary['title'], title_upper=summary['title'].upper(), left=left, right=right,
+        generated=generated or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        period=parts['period'].format(summary['period']) if summary.get('period') else '',
+        facts='\n'.join(parts['fact'].format(label, value) for label, value in summary['facts']),
+        header=parts['row'].format('Metric', left, right, 'Winner'),
+        rows='\n'.join(rows),
+        insights='\n'.join(insights),
+        recommendations='\n'.join(recommendations),
+        charts=CHARTS_MARKDOWN if summary.get('charts') else '',
+    )
+
+
+# Templates, insight and recommendation rules (lambdas included), TARGET_ROAS
+# and the formatting helpers all live in this file, so its source versions
+# every render - editing any of them invalidates the stored hashes
+TEMPLATE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _digest(summary, fmt):
+    payload = json.dumps([TEMPLATE_VERSION, fmt, summary], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def write_reports(summaries, paths, formats=FORMATS, force=False):
+    """
+    Render {name: summary} to paths(name, fmt), skipping reports whose summary
+    and TEMPLATE_VERSION hash matches the last render. Returns (written, total).
+    """
+    hashes = json.loads(HASH_FILE.read_text()) if HASH_FILE.exists() else {}
+    written = total = 0
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for name, summary in summaries.items():
+        for fmt in formats:
+            path = Path(paths(name, fmt))
+            try:
+                key = str(path.relative_to(BASE_DIR))
+            except ValueError:
+                key = str(path)
+            digest = _digest(summary, fmt)
+            total += 1
+            if not force and path.exists() and hashes.get(key) == digest:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(render(summary, fmt, generated))
+            hashes[key] = digest
+            written += 1
+    if written:
+        HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        HASH_FILE.write_text(json.dumps(hashes, indent=2, sort_keys=True))
+    return written, total
+
+
+def platform_summary(path=SUMMARY_FILE):
+    """Summary of the Perpetua vs Non-Perpetua report from 2_asin_level_analysis.py's JSON"""
+    with open(path, 'r') as f:
+        analysis = json.load(f)
+    counts = (analysis['perpetua_asins_analyzed'], analysis['non_perpetua_asins_analyzed'])
+    return {
+        'kind': 'platform', 'title': 'Perpetua vs Non-Perpetua', 'left': 'Perpetua', 'right': 'Non-Perpetua',
+        'peers': 'non-Perpetua products', 'counts': counts, 'charts': True,
+        'facts': [('Perpetua ASINs Analyzed', counts[0]), ('Non-Perpetua ASINs Analyzed', counts[1])],
+        'left_metrics': {key: analysis['perpetua_metrics'][key] for key, *_ in METRICS},
+        'right_metrics': {key: analysis['non_perpetua_metrics'][key] for key, *_ in METRICS},
+    }
+
+
+def _metrics(sums, measures, days):
+    """Report metrics from summed cube measures (ratios of totals)"""
+    kpis = ratio_kpis(sums, measures, days)
+    m = dict(zip(measures, sums))
+    return {'Total_Spend': float(m['Spend']), 'Total_Sales': float(m['Sales']), 'Total_Orders': float(m['Orders']),
+            'ACOS': float(kpis['ACOS']), 'ROAS': float(kpis['ROAS']), 'Avg_CPC': float(kpis['CPC']),
+            'Avg_CVR': float(kpis['CVR']), 'CTR': float(kpis['CTR'])}
+
+
+def _ad_activity(cube):
+    """[date, asin] mask of ASIN-days with any ad measure"""
+    return cube.values[[cube.measures.index(m) for m in AD_MEASURES]].any(axis=0)
+
+
+def month_summaries(cube):
+    """{'YYYY-MM': summary} of Perpetua vs Non-Perpetua within each calendar month"""
+    active = _ad_activity(cube)
+    months = cube.dates.astype('datetime64[M]')
+    summaries = {}
+    for month in np.unique(months):
+        days = months == month
+        metrics, counts = {}, {}
+        for platform in PLATFORMS:
+            mask = cube.platform_mask(platform)
+            sums = cube.values[:, days][:, :, mask].sum(axis=(1, 2))
+            metrics[platform] = _metrics(sums, cube.measures, int(days.sum()))
+            counts[platform] = int(active[days][:, mask].any(axis=0).sum())
+        dates = cube.dates[days]
+        summaries[str(month)] = {
+            'kind': 'platform', 'title': f'Perpetua vs Non-Perpetua ({month})', 'left': 'Perpetua',
+            'right': 'Non-Perpetua', 'peers': 'non-Perpetua products', 'period': f'{dates[0]} to {dates[-1]}',
+            'counts': (max(counts['Perpetua'], 1), max(counts['Non-Perpetua'], 1)),
+            'facts': [('Perpetua ASINs Analyzed', counts['Perpetua']),
+                      ('Non-Perpetua ASINs Analyzed', counts['Non-Perpetua'])],
+            'left_metrics': metrics['Perpetua'], 'right_metrics': metrics['Non-Perpetua'],
+        }
+    return summaries
+
+
+def asin_summaries(cube, asins=None):
+    """{asin: summary} of each ASIN against the average ASIN of its platform"""
+    active = _ad_activity(cube)
+    has_ads = active.any(axis=0)
+    totals = cube.values.sum(axis=1)  # [measure, asin]
+    days = len(cube.dates)
+
+    averages = {}
+    for platform in PLATFORMS:
+        peers = cube.platform_mask(platform) & has_ads
+        n = max(int(peers.sum()), 1)
+        metrics = _metrics(totals[:, peers].sum(axis=1), cube.measures, days)
+        for key in ('Total_Spend', 'Total_Sales', 'Total_Orders'):
+            metrics[key] /= n
+        averages[platform] = (metrics, n)
+
+    wanted = set(asins) if asins else None
+    summaries = {}
+    for a, asin in enumerate(cube.asins):
+        platform = str(cube.platforms[a])
+        if not has_ads[a] or platform not in averages or (wanted is not None and asin not in wanted):
+            continue
+        on = np.flatnonzero(active[:, a])
+        peer_metrics, n = averages[platform]
+        summaries[str(asin)] = {
+            'kind': 'asin', 'title': f'{asin} vs {platform} Average', 'left': str(asin),
+            'right': f'{platform} Avg', 'peers': f'the average {platform} ASIN', 'platform': platform,
+            'period': f'{cube.dates[on[0]]} to {cube.dates[on[-1]]}',
+            'facts': [('Advertising Type', platform), ('Active Ad Days', len(on)),
+                      (f'{platform} ASINs Compared', n)],
+            'left_metrics': _metrics(totals[:, a], cube.measures, days), 'right_metrics': peer_metrics,
+        }
+    if wanted:
+        missing = wanted - set(summaries)
+        if missing:
+            raise KeyError(f"no ad activity in the cube for: {', '.join(sorted(missing))}")
+    return summaries
+
+
+def render_platform_report(formats=FORMATS, force=False):
+    """Campaign_Performance_Report.txt and Campaign_Performance_Summary.md; returns (written, total)"""
+    return write_reports({'platform': platform_summary()}, lambda name, fmt: OUTPUT_DIR / MAIN_FILES[fmt],
+                         formats, force)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render performance reports from cached summaries')
+    parser.add_argument('--by', choices=['platform', 'month', 'asin'], default='platform',
+                        help='one Perpetua vs Non-Perpetua report, one per month, or one per ASIN')
+    parser.add_argument('--asin', nargs='+', help='only these ASINs (with --by asin)')
+    parser.add_argument('--format', nargs='+', choices=FORMATS, default=FORMATS)
+    parser.add_argument('--force', action='store_true', help='rewrite reports even when their inputs are unchanged')
+    args = parser.parse_args(argv)
+
+    if args.by == 'platform':
+        written, total = render_platform_report(args.format, args.force)
+        out_dir = OUTPUT_DIR
+    else:
+        cube = load_cube()
+        try:
+            summaries = month_summaries(cube) if args.by == 'month' else asin_summaries(cube, args.asin)
+        except KeyError as exc:
+            print(f"✗ {exc.args[0]}", file=sys.stderr)
+            return 2
+        out_dir = VARIANT_DIR / args.by
+        written, total = write_reports(summaries, lambda name, fmt: out_dir / f'{name}.{fmt}', args.format,
+                                       args.force)
+    print(f"✓ {written} of {total} reports rewritten in {out_dir} ({total - written} unchanged)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Rolling-Window KPI Engine
+Trailing 7/14/28/90-day sums of the cube's base measures from one cumulative
+sum per measure, with ratio KPIs derived from the window totals
+"""
+
+import numpy as np
+import pandas as pd
+
+from kpis import KPI_COLUMNS, ratio_kpis
+
+WINDOWS = (7, 14, 28, 90)
+PLATFORMS = ['Perpetua', 'Non-Perpetua']
+
+
+def trailing_sums(values, window, axis=0):
+    """
+    Sum of the last `window` entries along `axis` at every position.
+
+    One cumulative sum, then each step is prefix[t] - prefix[t - window];
+    positions before a full window sum what is available.
+    """
+    values = np.moveaxis(np.asarray(values, dtype=np.float64), axis, 0)
+    prefix = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)])
+    end = np.arange(1, len(values) + 1)
+    sums = prefix[end] - prefix[np.maximum(end - window, 0)]
+    return np.moveaxis(sums, 0, axis)
+
+
+def window_days(n_dates, window):
+    """Days actually covered by each trailing window (shorter at the start of the data)"""
+    return np.minimum(np.arange(1, n_dates + 1), window)
+
+
+def platform_values(cube):
+    """Collapse the ASIN axis to [measure, date, platform] for PLATFORMS + 'All'"""
+    membership = np.column_stack([cube.platform_mask(p) for p in PLATFORMS] +
+                                 [np.ones(cube.n_asins, dtype=bool)]).astype(np.float64)
+    return np.einsum('mda,ap->mdp', cube.values, membership), PLATFORMS + ['All']
+
+
+def _long_frame(values, measures, dates, keys, key_name, windows):
+    """Rolling KPIs for a [measure, date, key] array as a long Date x key x Window frame"""
+    n_dates, n_keys = values.shape[1], values.shape[2]
+    frames = []
+    for window in windows:
+        days = window_days(n_dates, window)[:, None]
+        kpis = ratio_kpis(trailing_sums(values, window, axis=1), measures, days)
+        frame = pd.DataFrame({
+            'Date': np.repeat(dates, n_keys),
+            key_name: np.tile(keys, n_dates),
+            'Window': window,
+            'Days': np.repeat(days[:, 0], n_keys),
+        })
+        for name, arr in kpis.items():
+            frame[name] = np.broadcast_to(arr, (n_dates, n_keys)).ravel()
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def rolling_asin_kpis(cube, windows=WINDOWS):
+    """Trailing-window KPIs for every Date x ASIN x window"""
+    frame = _long_frame(cube.values, cube.measures, cube.dates, cube.asins, 'ASIN', windows)
+    repeats = len(frame) // cube.n_asins
+    frame.insert(2, 'Advertising_Type', np.tile(cube.platforms, repeats))
+    for key, labels in cube.segments.items():
+        frame[f'ABC_{key}'] = np.tile(labels, repeats)
+    return frame
+
+
+def rolling_platform_kpis(cube, windows=WINDOWS):
+    """Trailing-window KPIs for every Date x platform (plus 'All') x window"""
+    values, keys = platform_values(cube)
+    return _long_frame(values, cube.measures, cube.dates, np.asarray(keys), 'Advertising_Type', windows)
+
+
+def latest_snapshot(platform_kpis):
+    """{platform: {'7d': {kpi: value}, ...}} for the last date - for JSON summaries"""
+    latest = platform_kpis[platform_kpis['Date'] == platform_kpis['Date'].max()]
+    snapshot = {}
+    for _, row in latest.iterrows():
+        snapshot.setdefault(row['Advertising_Type'], {})[f"{row['Window']}d"] = {
+            key: float(row[key]) for key in ['Days', 'Spend', 'Sales', 'Total_Revenue'] + KPI_COLUMNS
+        }
+    return snapshot
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Refresh Run History
+Every refresh's stage metrics in a local SQLite database
+(outputs/run_history.sqlite), and a regression report comparing the latest
+run with the median of the runs before it (profiled runs only with earlier
+profiled runs).
+
+    python scripts/run_history.py report [--baseline 5] [--threshold 0.25]
+    python scripts/run_history.py import      # backfill from refresh_runs.jsonl
+"""
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+OUTPUT_DIR = BASE_DIR / 'outputs'
+HISTORY_DB = OUTPUT_DIR / 'run_history.sqlite'
+RUN_LOG = OUTPUT_DIR / 'refresh_runs.jsonl'
+
+BASELINE_RUNS = 5        # previous successful runs per stage in the baseline
+THRESHOLD = 0.25         # flag +25% over baseline
+MIN_WALL_S = 1.0         # ignore stages too short to time reliably
+MIN_RSS_MB = 50.0
+TIMEOUT_WARNING = 0.8    # flag stages using 80% of their timeout
+
+STAGE_METRICS = ['wall_s', 'cpu_s', 'peak_rss_mb', 'rows_in', 'rows_out', 'bytes_read', 'bytes_written', 'import_s']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started_at  TEXT,
+    wall_s      REAL,
+    stages      INTEGER,
+    failed      TEXT,
+    profiled    INTEGER
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id        TEXT REFERENCES runs(run_id),
+    stage         INTEGER,
+    script        TEXT,
+    description   TEXT,
+    status        TEXT,
+    started_at    TEXT,
+    wall_s        REAL,
+    cpu_s         REAL,
+    peak_rss_mb   REAL,
+    rows_in       INTEGER,
+    rows_out      INTEGER,
+    bytes_read    INTEGER,
+    bytes_written INTEGER,
+    import_s      REAL,
+    PRIMARY KEY (run_id, script)
+);
+CREATE INDEX IF NOT EXISTS stages_by_script ON stages(script, run_id);
+"""
+
+
+def connect(path=HISTORY_DB):
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    # Databases created before import times were recorded
+    columns = {row['name'] for row in conn.execute('PRAGMA table_info(stages)')}
+    if 'import_s' not in columns:
+        conn.execute('ALTER TABLE stages ADD COLUMN import_s REAL')
+    return conn
+
+
+def record_run(conn, run, stages):
+    """Store one run record and its stage records (as written to the JSONL log)"""
+    with conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)',
+            (run['run_id'], run.get('started_at'), run.get('wall_s'), run.get('stages'),
+             json.dumps(run.get('failed', [])), int(bool(run.get('profiled'))))
+        )
+        conn.executemany(
+            'INSERT OR REPLACE INTO stages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(run['run_id'], s.get('stage'), s['script'], s.get('description'), s.get('status'),
+              s.get('started_at'), *(s.get(m) for m in STAGE_METRICS)) for s in stages]
+        )
+
+
+def import_run_log(conn, path=RUN_LOG):
+    """Load every complete run from the JSONL log; returns the number of runs imported"""
+    if not Path(path).exists():
+        return 0
+    stages, runs = {}, []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('event') == 'run':
+                runs.append(record)
+            elif record.get('event') == 'stage':
+                stages.setdefault(record['run_id'], []).append(record)
+    for run in runs:
+        record_run(conn, run, stages.get(run['run_id'], []))
+    return len(runs)
+
+
+def _baseline(values):
+    return statistics.median(values) if values else None
+
+
+def regression_report(conn, baseline_runs=BASELINE_RUNS, threshold=THRESHOLD, timeout=None, run_id=None):
+    """
+    Compare each stage of `run_id` (default: the latest run) with the median
+    of its previous `baseline_runs` successful runs of the same kind - a
+    profiled run against earlier profiled runs, anything else against
+    unprofiled ones. Returns (run_id, rows) where each row has the stage's
+    current and baseline wall time and peak RSS, their ratios, which kind of
+    baseline was used, and a list of alerts.
+    """
+    if run_id is None:
+        latest = conn.execute('SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1').fetchone()
+        if latest is None:
+            return None, []
+        run_id = latest['run_id']
+    run = conn.execute('SELECT profiled FROM runs WHERE run_id = ?', (run_id,)).fetchone()
+    profiled = int(bool(run and run['profiled']))
+
+    rows = []
+    for stage in conn.execute('SELECT * FROM stages WHERE run_id = ? ORDER BY stage', (run_id,)):
+        # Profiled runs are slower by design, so they are only compared with each other
+        history = conn.execute(
+            'SELECT s.wall_s, s.peak_rss_mb FROM stages s JOIN runs r ON r.run_id = s.run_id '
+            "WHERE s.script = ? AND s.run_id < ? AND s.status = 'ok' AND r.profiled = ? "
+            'ORDER BY s.run_id DESC LIMIT ?', (stage['script'], run_id, profiled, baseline_runs)
+        ).fetchall()
+        base_wall = _baseline([h['wall_s'] for h in history if h['wall_s'] is not None])
+        base_rss = _baseline([h['peak_rss_mb'] for h in history if h['peak_rss_mb'] is not None])
+
+        alerts = []
+        if stage['status'] != 'ok':
+            alerts.append(stage['status'])
+        wall_ratio = stage['wall_s'] / base_wall if base_wall and stage['wall_s'] is not None else None
+        rss_ratio = stage['peak_rss_mb'] / base_rss if base_rss and stage['peak_rss_mb'] is not None else None
+        if wall_ratio and wall_ratio > 1 + threshold and stage['wall_s'] >= MIN_WALL_S:
+            alerts.append(f'time +{wall_ratio - 1:.0%}')
+        if rss_ratio and rss_ratio > 1 + threshold and stage['peak_rss_mb'] >= MIN_RSS_MB:
+            alerts.append(f'memory +{rss_ratio - 1:.0%}')
+        if timeout and stage['wall_s'] is not None and stage['wall_s'] >= TIMEOUT_WARNING * timeout:
+            alerts.append(f'{stage["wall_s"] / timeout:.0%} of timeout')
+
+        rows.append({
+            'stage': stage['stage'],
+            'script': stage['script'],
+            'status': stage['status'],
+            'wall_s': stage['wall_s'],
+            'baseline_wall_s': base_wall,
+            'wall_ratio': wall_ratio,
+            'peak_rss_mb': stage['peak_rss_mb'],
+            'baseline_rss_mb': base_rss,
+            'import_s': stage['import_s'],
+            'rss_ratio': rss_ratio,
+            'baseline_runs': len(history),
+            'baseline': 'profiled' if profiled else 'unprofiled',
+            'alerts': alerts,
+        })
+    return run_id, rows
+
+
+def print_report(run_id, rows):
+    if run_id is None:
+        print("  No runs recorded yet")
+        return
+    baseline = rows[0]['baseline'] if rows else 'unprofiled'
+    print(f"Run {run_id}{' (profiled)' if baseline == 'profiled' else ''} "
+          f"vs median of previous {baseline} runs")
+    print(f"{'Stage':<40} {'Wall':>8} {'Base':>8} {'RSS MB':>8} {'Base':>8}  Alerts")
+    print("-" * 90)
+
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else format('-', '>' + spec.split('.')[0])
+
+    for row in rows:
+        print(f"{row['script']:<40} {fmt(row['wall_s'], '8.1f')} {fmt(row['baseline_wall_s'], '8.1f')} "
+              f"{fmt(row['peak_rss_mb'], '8.0f')} {fmt(row['baseline_rss_mb'], '8.0f')}  "
+              f"{', '.join(row['alerts'])}")
+    flagged = [row for row in rows if row['alerts']]
+    print()
+    print(f"⚠ {len(flagged)} stage(s) flagged" if flagged else "✓ No regressions")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Refresh run history and regression report')
+    sub = parser.add_subparsers(dest='command', required=True)
+    report = sub.add_parser('report', help='compare the latest run with the rolling baseline')
+    report.add_argument('--run', help='run id to check (default: latest)')
+    report.add_argument('--baseline', type=int, default=BASELINE_RUNS, help='previous runs in the baseline')
+    report.add_argument('--threshold', type=float, default=THRESHOLD, help='relative increase to flag')
+    report.add_argument('--timeout', type=float, help='per-stage timeout (s) to warn against')
+    report.add_argument('--json', action='store_true', help='print the report as JSON')
+    sub.add_parser('import', help=f'backfill runs from {RUN_LOG.name}')
+    args = parser.parse_args()
+
+    conn = connect()
+    if args.command == 'import':
+        print(f"✓ Imported {import_run_log(conn)} run(s) into {HISTORY_DB}")
+        sys.exit(0)
+
+    run_id, rows = regression_report(conn, args.baseline, args.threshold, args.timeout, args.run)
+    if args.json:
+        print(json.dumps({'run_id': run_id, 'stages': rows}, indent=2))
+    else:
+        print_report(run_id, rows)
+    sys.exit(1 if any(row['alerts'] for row in rows) else 0)
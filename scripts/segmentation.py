@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Pareto / ABC Segmentation
+Cumulative-share curves and A/B/C classes of ASINs by sales, spend and organic
+revenue within each platform - one sort and one cumsum per key
+"""
+
+import numpy as np
+import pandas as pd
+
+PLATFORMS = ['Perpetua', 'Non-Perpetua']
+
+# Segment key -> cube measure
+SEGMENT_KEYS = {
+    'Sales': 'Sales',
+    'Spend': 'Spend',
+    'Organic': 'Organic_Sales',
+}
+
+# Cumulative share at which A ends and B ends
+ABC_CUTOFFS = (0.80, 0.95)
+CLASSES = np.array(['A', 'B', 'C'])
+
+
+def pareto_order(values):
+    """(descending order, cumulative share after each ASIN in that order)"""
+    values = np.asarray(values, dtype=np.float64)
+    order = np.argsort(-values, kind='stable')
+    cumulative = np.cumsum(values[order])
+    total = cumulative[-1] if len(cumulative) else 0
+    share = cumulative / total if total > 0 else np.zeros(len(values))
+    return order, share
+
+
+def abc_classes(values, cutoffs=ABC_CUTOFFS):
+    """
+    A/B/C label per value.
+
+    An ASIN is in A while the share *before* it is under the A cutoff, so the ASIN
+    that crosses 80% is still A. ASINs with nothing to contribute are always C.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    order, share = pareto_order(values)
+    before = np.concatenate([[0.0], share[:-1]])
+    ranked = np.searchsorted(np.asarray(cutoffs), before, side='right')
+    labels = np.empty(len(values), dtype='<U1')
+    labels[order] = CLASSES[ranked]
+    labels[values <= 0] = 'C'
+    return labels
+
+
+def segment_asins(totals, platforms, keys=SEGMENT_KEYS):
+    """
+    {segment key: per-ASIN ABC labels} with classes computed within each platform.
+
+    totals maps each cube measure to its per-ASIN total over the cube's dates.
+    """
+    segments = {}
+    for key, measure in keys.items():
+        labels = np.full(len(platforms), 'C', dtype='<U1')
+        for platform in PLATFORMS:
+            mask = platforms == platform
+            if mask.any():
+                labels[mask] = abc_classes(totals[measure][mask])
+        segments[key] = labels
+    return segments
+
+
+def pareto_curves(cube, keys=SEGMENT_KEYS):
+    """Long frame of cumulative share vs share of ASINs, per key and platform"""
+    frames = []
+    for key, measure in keys.items():
+        totals = cube.measure(measure).sum(axis=0)
+        for platform in PLATFORMS:
+            asin_idx = np.flatnonzero(cube.platform_mask(platform))
+            if len(asin_idx) == 0:
+                continue
+            order, share = pareto_order(totals[asin_idx])
+            frames.append(pd.DataFrame({
+                'Key': key,
+                'Platform': platform,
+                'Rank': np.arange(1, len(order) + 1),
+                'ASIN': cube.asins[asin_idx[order]],
+                'Value': totals[asin_idx[order]],
+                'ASIN_Share': np.arange(1, len(order) + 1) / len(order),
+                'Cumulative_Share': share,
+                'Class': cube.segments[key][asin_idx[order]],
+            }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def concentration(curves, asin_share=0.2):
+    """{key: {platform: share of the total held by the top `asin_share` of ASINs}}"""
+    summary = {}
+    for (key, platform), curve in curves.groupby(['Key', 'Platform'], sort=False):
+        top = curve[curve['ASIN_Share'] <= asin_share]
+        summary.setdefault(key, {})[platform] = {
+            'asins': len(curve),
+            f'top_{int(asin_share * 100)}pct_share': float(top['Cumulative_Share'].max()) if len(top) else 0.0,
+            'class_counts': {c: int((curve['Class'] == c).sum()) for c in CLASSES},
+        }
+    return summary
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Shared Daily Cube
+Publishes the daily cube's measure array once - in a multiprocessing
+shared-memory block, or a memory-mapped .npy file when /dev/shm is too small -
+so process-pool workers attach to it zero-copy from a small descriptor instead
+of unpickling the data. Worker startup cost does not grow with the cube.
+
+    with SharedCube(cube) as descriptor:
+        ...  # hand `descriptor` to workers; attach(descriptor) -> DailyCube
+
+pool_map() wraps the common case: fn(cube, item) for each item on a process pool.
+"""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+from daily_cube import DailyCube
+
+BASE_DIR = Path(__file__).parent.parent
+PROCESSED_DIR = BASE_DIR / 'data' / 'processed'
+SHM_DIR = Path('/dev/shm')
+SHM_HEADROOM = 1.1  # free /dev/shm needed, as a multiple of the array size
+BACKENDS = ('auto', 'shm', 'npy')
+
+_worker_cube = None
+
+
+def _shm_fits(nbytes):
+    """True when /dev/shm exists and has room for nbytes (always True off Linux, where shm is not tmpfs)"""
+    if not sys.platform.startswith('linux'):
+        return True
+    if not SHM_DIR.exists():
+        return False
+    stat = os.statvfs(SHM_DIR)
+    return stat.f_bavail * stat.f_frsize >= nbytes * SHM_HEADROOM
+
+
+class SharedCube:
+    """
+    Context manager holding one published copy of cube.values. `descriptor` is
+    a plain dict - block name or file path, shape, dtype and the cube's date /
+    ASIN labels, never the measure data. The block or file is removed on exit.
+    """
+
+    def __init__(self, cube, backend='auto', directory=PROCESSED_DIR):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' (use one of {', '.join(BACKENDS)})")
+        values = np.ascontiguousarray(cube.values, dtype=np.float64)
+        if backend == 'auto':
+            backend = 'shm' if _shm_fits(values.nbytes) else 'npy'
+
+        self.shm = self.path = None
+        if backend == 'shm':
+            self.shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, values.dtype, buffer=self.shm.buf)[...] = values
+            location = {'name': self.shm.name}
+        else:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            fd, path = tempfile.mkstemp(prefix='shared_cube_', suffix='.npy', dir=directory)
+            os.close(fd)
+            self.path = Path(path)
+            np.save(self.path, values)
+            location = {'path': str(self.path)}
+
+        self.descriptor = {
+            'backend': backend, **location, 'shape': values.shape, 'dtype': values.dtype.str,
+            'dates': cube.dates, 'asins': cube.asins, 'platforms': cube.platforms,
+            'measures': list(cube.measures), 'segments': dict(cube.segments),
+        }
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+
+    def __enter__(self):
+        return self.descriptor
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(descriptor):
+    """Read-only DailyCube over the published array (no copy of the measure data)"""
+    if descriptor['backend'] == 'shm':
+        try:
+            shm = shared_memory.SharedMemory(name=descriptor['name'], track=False)  # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=descriptor['name'])
+        values = np.ndarray(descriptor['shape'], np.dtype(descriptor['dtype']), buffer=shm.buf)
+    else:
+        shm = None
+        values = np.load(descriptor['path'], mmap_mode='r')
+    values.flags.writeable = False
+
+    cube = DailyCube(descriptor['dates'], descriptor['asins'], descriptor['platforms'], values,
+                     descriptor['measures'], descriptor['segments'])
+    cube.shared_block = shm  # keeps the mapping alive as long as the cube
+    return cube
+
+
+def _init_worker(descriptor):
+    global _worker_cube
+    _worker_cube = attach(descriptor)
+
+
+def _call(fn, item):
+    return fn(_worker_cube, item)
+
+
+def pool_map(fn, items, cube, workers, backend='auto'):
+    """
+    [fn(cube, item) for item in items] on `workers` processes. The cube is
+    published once and each worker attaches to it at startup; fn must be a
+    module-level function (or a partial of one) so it pickles.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [fn(cube, item) for item in items]
+    with SharedCube(cube, backend) as descriptor, \
+            ProcessPoolExecutor(min(workers, len(items)), initializer=_init_worker,
+                                initargs=(descriptor,)) as pool:
+        return list(pool.map(partial(_call, fn), items))
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Pipeline Stage Runner
+Runs one pipeline script in a child Python process (exactly as
+`python scripts/<name>.py` would) and measures it from the inside: wall time,
+CPU time and peak RSS of that process alone, DataFrame rows read and written
+through pandas, bytes of the data files it read, and bytes of the files it
+created or changed under data/ and outputs/. The child runs with
+`-X importtime`, so each stage also reports how long its imports took and
+which top-level modules cost the most. Optionally profiles the stage with
+cProfile.
+
+    python scripts/stage_runner.py   # self-check: a tiny stage reports its own peak RSS
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+WATCH_DIRS = ('data', 'outputs')
+PROFILE_TOP = 30
+IMPORT_TOP = 5
+
+# Executed with `python -X importtime -c`; argv: script path, metrics path, profile path ('' = off)
+_CHILD = r'''
+import importlib.util, json, os, runpy, sys, time
+script, metrics_path, profile_path = sys.argv[1:4]
+sys.argv = [script]
+sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+
+io = {'rows_in': 0, 'rows_out': 0, 'bytes_read': 0}
+
+
+class _AfterImport:
+    """Meta path finder calling hooks[name](module) once `name` is imported - nothing is imported early"""
+    def __init__(self, hooks):
+        self.hooks = hooks
+
+    def find_spec(self, name, path, target=None):
+        hook = self.hooks.pop(name, None)
+        spec = importlib.util.find_spec(name) if hook else None
+        if spec is None or spec.loader is None:
+            return None
+        exec_module = spec.loader.exec_module
+
+        def run(module):
+            exec_module(module)
+            hook(module)
+        spec.loader.exec_module = run
+        return spec
+
+
+def _rows(obj):
+    if hasattr(obj, 'shape') and hasattr(obj, 'index'):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(_rows(v) for v in obj.values())
+    return 0
+
+def _reader(read):
+    def wrapped(source, *args, **kwargs):
+        result = read(source, *args, **kwargs)
+        io['rows_in'] += _rows(result)
+        if isinstance(source, (str, os.PathLike)) and os.path.isfile(source):
+            io['bytes_read'] += os.path.getsize(source)
+        return result
+    return wrapped
+
+def _writer(write):
+    def wrapped(self, *args, **kwargs):
+        io['rows_out'] += len(self)
+        return write(self, *args, **kwargs)
+    return wrapped
+
+def _instrument_pandas(pd):
+    for name in ('read_csv', 'read_excel', 'read_pickle', 'read_parquet', 'read_json'):
+        setattr(pd, name, _reader(getattr(pd, name)))
+    for name in ('to_csv', 'to_excel', 'to_pickle', 'to_parquet', 'to_json'):
+        setattr(pd.DataFrame, name, _writer(getattr(pd.DataFrame, name)))
+
+def _instrument_numpy(np):
+    np.load = _reader(np.load)
+
+sys.meta_path.insert(0, _AfterImport({'pandas': _instrument_pandas, 'numpy': _instrument_numpy}))
+
+profiler = None
+if profile_path:
+    import cProfile
+    profiler = cProfile.Profile()
+
+cpu0 = time.process_time()
+code = 0
+try:
+    if profiler:
+        profiler.enable()
+    runpy.run_path(script, run_name='__main__')
+except SystemExit as exc:
+    code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+finally:
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+    metrics = {'cpu_s': time.process_time() - cpu0, 'peak_rss_mb': None, **io}
+    # VmHWM is this process's own high-water mark; Linux carries ru_maxrss
+    # over from the parent through fork/exec, so it is only the fallback
+    try:
+        with open('/proc/self/status') as f:
+            hwm = [line.split()[1] for line in f if line.startswith('VmHWM:')]
+        if hwm:
+            metrics['peak_rss_mb'] = int(hwm[0]) / 1024
+    except OSError:
+        pass
+    if metrics['peak_rss_mb'] is None:
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            metrics['peak_rss_mb'] = peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+        except ImportError:
+            pass
+    with open(metrics_path, 'w') as f:
+        json.dump(metrics, f)
+sys.exit(code)
+'''
+
+
+def _file_state(root, dirs=WATCH_DIRS):
+    state = {}
+    for sub in dirs:
+        for dirpath, _, filenames in os.walk(Path(root).resolve() / sub):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (stat.st_size, stat.st_mtime_ns)
+    return state
+
+
+def _bytes_written(before, after, exclude=()):
+    return sum(size for path, (size, mtime) in after.items()
+               if before.get(path) != (size, mtime) and path not in exclude)
+
+
+def _split_import_times(stderr, top=IMPORT_TOP):
+    """
+    Separate `-X importtime` lines from the stage's own stderr. Returns
+    (stderr, total import seconds, [(module, seconds)] for the slowest top-level imports)
+    """
+    kept, modules = [], []
+    for line in stderr.splitlines(keepends=True):
+        if not line.startswith('import time:'):
+            kept.append(line)
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header
+        name = fields[2].rstrip('\n')
+        # Nested imports are indented under the module that triggered them
+        if not name[1:].startswith(' '):
+            modules.append((name.strip(), int(fields[1]) / 1e6))
+    slowest = sorted(modules, key=lambda m: m[1], reverse=True)[:top]
+    return ''.join(kept), sum(s for _, s in modules), [[name, round(s, 4)] for name, s in slowest]
+
+
+def write_profile_summary(profile_path, summary_path, top=PROFILE_TOP):
+    """Top functions by cumulative time as text next to the binary .prof"""
+    import io
+    import pstats
+    out = io.StringIO()
+    pstats.Stats(str(profile_path), stream=out).sort_stats('cumulative').print_stats(top)
+    Path(summary_path).write_text(out.getvalue())
+
+
+def run_stage(script_path, cwd, timeout=300, profile_path=None):
+    """
+    Run `script_path` with cwd `cwd`. Returns a dict with returncode (None on
+    timeout), wall_s, cpu_s, peak_rss_mb, rows_in, rows_out, bytes_read,
+    bytes_written, import_s, top_imports, profile (path or None), stdout and
+    stderr (without the import-time lines).
+    """
+    before = _file_state(cwd)
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics_path = Path(tmp) / 'metrics.json'
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', _CHILD, str(script_path), str(metrics_path),
+                 str(profile_path) if profile_path else ''],
+                cwd=str(cwd), capture_output=True, text=True, timeout=timeout
+            )
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+        except subprocess.TimeoutExpired as exc:
+            returncode, stdout, stderr = None, exc.stdout or '', exc.stderr or ''
+        wall = time.perf_counter() - start
+
+        metrics = {'cpu_s': None, 'peak_rss_mb': None, 'rows_in': None, 'rows_out': None, 'bytes_read': None}
+        if metrics_path.exists():
+            metrics.update(json.loads(metrics_path.read_text()))
+
+    profile = None
+    if profile_path and Path(profile_path).exists():
+        profile = str(Path(profile_path).resolve())
+    written = _bytes_written(before, _file_state(cwd), exclude={profile} if profile else ())
+
+    if isinstance(stdout, bytes):
+        stdout, stderr = stdout.decode(errors='replace'), stderr.decode(errors='replace')
+    stderr, import_s, top_imports = _split_import_times(stderr)
+    return {
+        'script': Path(script_path).name,
+        'returncode': returncode,
+        'wall_s': wall,
+        'cpu_s': metrics['cpu_s'],
+        'peak_rss_mb': metrics['peak_rss_mb'],
+        'rows_in': metrics['rows_in'],
+        'rows_out': metrics['rows_out'],
+        'bytes_read': metrics['bytes_read'],
+        'bytes_written': written,
+        'import_s': import_s,
+        'top_imports': top_imports,
+        'profile': profile,
+        'stdout': stdout,
+        'stderr': stderr,
+    }
+
+
+if __name__ == '__main__':
+    # Self-check: a trivial stage must report its own small peak, not the
+    # runner's, even after the runner has allocated a lot
+    ballast = bytearray(600 * 1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / 'tiny_stage.py'
+        script.write_text('print(1)\n')
+        result = run_stage(script, tmp)
+    del ballast
+    peak = result['peak_rss_mb']
+    print(f"  tiny stage peak RSS with a 600 MB runner: {peak:.1f} MB")
+    if peak is None or peak > 200:
+        print("✗ Stage peak RSS includes the runner's memory", file=sys.stderr)
+        sys.exit(1)
+    print("✓ Per-stage peak RSS is the stage's own")
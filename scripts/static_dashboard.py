@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Static Dashboard Export
+Writes the dashboard page as a self-contained static site: index.html with the
+date/ASIN metadata inline, plus gzip-compressed data shards the page loads on
+demand - one per month of Perpetua / Non-Perpetua daily totals and one per ASIN
+(daily history, fetched only when the ASIN filter is used). Opening the page
+reads only the months in the selected range, and it works from file:// with no
+server.
+
+    python scripts/perpetua.py export --out outputs/static_dashboard
+"""
+
+import base64
+import gzip
+import json
+import numpy as np
+from pathlib import Path
+
+from cube_index import PLATFORMS, load_index
+from dashboard_page import render_page
+
+BASE_DIR = Path(__file__).parent.parent
+EXPORT_DIR = BASE_DIR / 'outputs' / 'static_dashboard'
+SHARD_DIR = 'shards'
+DECIMALS = 4
+
+# Shards are <script> files rather than fetched JSON: browsers block fetch() on
+# file:// pages, but a script tag can call back into the page.
+SHARD_JS = "perpetuaShard(%s, %s);\n"
+
+LOADER_JS = """
+const META = %(meta)s;
+const PLATFORMS = %(platforms)s;
+const pending = {};
+
+function perpetuaShard(name, data) { pending[name].resolve(data); }
+
+function loadShard(name) {
+  if (!pending[name]) {
+    let resolve, reject;
+    const promise = new Promise((res, rej) => { resolve = res; reject = rej; }).then(async data => {
+      const bytes = Uint8Array.from(atob(data), c => c.charCodeAt(0));
+      const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+      return new Response(stream).json();
+    });
+    pending[name] = {resolve, promise};
+    const script = document.createElement('script');
+    script.src = `%(shard_dir)s/${name}.js`;
+    script.onerror = () => reject(new Error(`missing shard ${name}`));
+    document.head.appendChild(script);
+  }
+  return pending[name].promise;
+}
+
+async function fetchMeta() { return META; }
+
+function bisect(value, right) {
+  let lo = 0, hi = META.dates.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (META.dates[mid] < value || (right && META.dates[mid] === value)) lo = mid + 1; else hi = mid;
+  }
+  return lo;
+}
+
+function bucketKey(date, period) {
+  if (period === 'day') return date;
+  if (period === 'month') return date.slice(0, 7);
+  if (period === 'total') return '';
+  const d = new Date(date + 'T00:00:00Z');
+  d.setUTCDate(d.getUTCDate() - (d.getUTCDay() + 6) %% 7);  // back to Monday
+  return d.toISOString().slice(0, 10);
+}
+
+// Daily measure sums [group][measure][day - lo] for positions lo..hi-1
+async function dailySums(lo, hi, asins) {
+  const n = hi - lo, groups = {};
+  const add = (group, values, offset) => {
+    groups[group] = groups[group] || META.measures.map(() => new Float64Array(n));
+    values.forEach((series, m) => {
+      for (let d = Math.max(lo, offset); d < Math.min(hi, offset + series.length); d++) {
+        groups[group][m][d - lo] += series[d - offset];
+      }
+    });
+  };
+  if (asins) {
+    for (const asin of asins) {
+      if (!(asin in META.asin_platforms)) throw new Error(`ASIN not in the cube: ${asin}`);
+    }
+    const shards = await Promise.all(asins.map(asin => loadShard('asin_' + asin)));
+    shards.forEach((shard, i) => add(META.asin_platforms[asins[i]], shard.values, shard.offset));
+  } else {
+    const months = Object.entries(META.months).filter(([, [a, b]]) => a < hi && b > lo).map(([m]) => m);
+    const shards = await Promise.all(months.map(month => loadShard('month_' + month)));
+    shards.forEach(shard => Object.entries(shard.values).forEach(([g, values]) => add(g, values, shard.offset)));
+  }
+  return groups;
+}
+
+function ratioKpis(s, days) {
+  const div = (a, b) => b > 0 ? a / b : 0;
+  return {
+    ROAS: div(s.Sales, s.Spend), ACOS: div(s.Spend, s.Sales), TACoS: div(s.Spend, s.Total_Revenue),
+    CPC: div(s.Spend, s.Clicks), CTR: div(s.Clicks, s.Impressions), CVR: div(s.Orders, s.Clicks),
+    Organic_Ratio: div(s.Organic_Sales, s.Total_Revenue), Avg_Daily_Spend: div(s.Spend, days),
+    Avg_Daily_Sales: div(s.Sales, days), Avg_Daily_Revenue: div(s.Total_Revenue, days),
+  };
+}
+
+// Same rows as cube_index.CubeIndex.query with split='platform'
+async function fetchRows(params) {
+  const lo = params.start ? bisect(params.start, false) : 0;
+  const hi = Math.max(lo, params.end ? bisect(params.end, true) : META.dates.length);
+  if (hi === lo) return [];
+  const groups = await dailySums(lo, hi, params.asin);
+  const period = params.by || 'total', bounds = [lo];
+  for (let d = lo + 1; d < hi; d++) {
+    if (bucketKey(META.dates[d], period) !== bucketKey(META.dates[d - 1], period)) bounds.push(d);
+  }
+  bounds.push(hi);
+  const rows = [];
+  for (let b = 0; b + 1 < bounds.length; b++) {
+    const days = bounds[b + 1] - bounds[b];
+    for (const group of PLATFORMS.filter(g => g in groups)) {
+      const sums = {};
+      META.measures.forEach((m, i) => {
+        sums[m] = 0;
+        for (let d = bounds[b]; d < bounds[b + 1]; d++) sums[m] += groups[group][i][d - lo];
+      });
+      rows.push({Start: META.dates[bounds[b]], End: META.dates[bounds[b + 1] - 1], Group: group, Days: days,
+                 ...sums, ...ratioKpis(sums, days)});
+    }
+  }
+  return rows;
+}
+"""
+
+
+def _shard(name, payload):
+    """Script body for one shard: gzip'd JSON, base64 so it can sit in a string literal"""
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    packed = base64.b64encode(gzip.compress(raw, compresslevel=9, mtime=0)).decode('ascii')
+    return SHARD_JS % (json.dumps(name), json.dumps(packed))
+
+
+def _series(values):
+    """[measure, day] array -> nested lists, whole numbers as ints so the JSON stays compact"""
+    return [[float(v) if v % 1 else int(v) for v in row] for row in values]
+
+
+def _month_ranges(index):
+    """{'YYYY-MM': (lo, hi)} cube positions of each calendar month"""
+    months, starts, counts = np.unique(index.dates.astype('datetime64[M]'), return_index=True, return_counts=True)
+    return {str(m): (int(lo), int(lo + n)) for m, lo, n in zip(months, starts, counts)}
+
+
+def build_shards(index):
+    """{shard name: script text} for every month and every ASIN in the index"""
+    daily = np.round(np.diff(index.prefix, axis=1), DECIMALS)  # [measure, date, asin]
+    shards = {}
+    for month, (lo, hi) in _month_ranges(index).items():
+        values = {p: _series(daily[:, lo:hi, index.platforms == p].sum(axis=2))
+                  for p in PLATFORMS if (index.platforms == p).any()}
+        name = f'month_{month}'
+        shards[name] = _shard(name, {'offset': lo, 'values': values})
+
+    for a, asin in enumerate(index.asins):
+        active = np.flatnonzero(daily[:, :, a].any(axis=0))
+        lo, hi = (int(active[0]), int(active[-1]) + 1) if len(active) else (0, 0)
+        name = f'asin_{asin}'
+        shards[name] = _shard(name, {'offset': lo, 'values': _series(daily[:, lo:hi, a])})
+    return shards
+
+
+def export_dashboard(out_dir=EXPORT_DIR, index=None):
+    """
+    Write index.html and the shards to out_dir. Shards whose content did not
+    change are left untouched, and shards that no longer exist are removed, so
+    re-exporting after a refresh rewrites only the new months and active ASINs.
+    Returns (shards written, shards total, bytes total).
+    """
+    if index is None:
+        index = load_index()
+    out_dir = Path(out_dir)
+    shard_dir = out_dir / SHARD_DIR
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    shards = build_shards(index)
+    written = 0
+    for name, text in shards.items():
+        path = shard_dir / f'{name}.js'
+        if not path.exists() or path.read_text() != text:
+            path.write_text(text)
+            written += 1
+    for path in shard_dir.glob('*.js'):
+        if path.stem not in shards:
+            path.unlink()
+
+    meta = {
+        'start': str(index.dates[0]),
+        'end': str(index.dates[-1]),
+        'dates': [str(d) for d in index.dates],
+        'months': _month_ranges(index),
+        'asins': index.asins.tolist(),
+        'asin_platforms': dict(zip(index.asins.tolist(), index.platforms.tolist())),
+        'measures': index.measures,
+    }
+    loader = LOADER_JS % {'meta': json.dumps(meta, separators=(',', ':')),
+                          'platforms': json.dumps(PLATFORMS), 'shard_dir': SHARD_DIR}
+    (out_dir / 'index.html').write_text(render_page(loader, title='Perpetua Dashboard (static)'))
+
+    total = sum(p.stat().st_size for p in out_dir.rglob('*') if p.is_file())
+    return written, len(shards), total
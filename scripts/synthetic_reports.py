@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Synthetic Amazon-Shaped Reports
+Deterministic fixtures in the exact layouts the pipeline reads from
+data/recent-reports: ASIN list, SP campaign CSV, advertised products XLSX,
+order report TSVs, search term (STR) and targeting XLSX. Scale 1 is roughly
+the size of the real 4-month exports; 10 and 100 multiply the catalog.
+"""
+
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from order_lines import ORDER_COLUMNS
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Scale 1 matches the real catalog and date range
+BASE_ASINS = 455
+BASE_PERPETUA = 238
+START_DATE = '2025-10-01'
+DAYS = 122
+LAUNCH_DATE = '2025-12-15'
+
+# Excel sheets stop at 1,048,576 rows (header included)
+EXCEL_MAX_ROWS = 1_048_575
+
+ASIN_LIST_FILE = 'ASIN list - perpetua.xlsx'
+CAMPAIGN_FILE = 'SP_Campaign_-_4_Months.csv'
+AD_PRODUCTS_FILE = 'SP_Advertised_Products_-_Max (1).xlsx'
+STR_FILE = 'STR_-max_.xlsx'
+TARGETING_FILE = 'SP_Target_Max.xlsx'
+MANIFEST_NAME = 'fixture_manifest.json'
+
+SKU_PREFIXES = np.array(['NT', 'SD', 'PN'])
+MATCH_TYPES = np.array(['EXACT', 'PHRASE', 'BROAD', '-'])
+SEARCH_WORDS = np.array(['vitamin', 'd3', 'magnesium', 'gummies', 'probiotic', 'turmeric', 'collagen',
+                         'zinc', 'melatonin', 'omega', 'b12', 'elderberry', 'biotin', 'ashwagandha'])
+STATES = np.array(['CA', 'TX', 'FL', 'NY', 'PA', 'IL', 'OH', 'GA', 'NC', 'MI', 'NJ', 'VA', 'WA', 'AZ',
+                   'MA', 'TN', 'IN', 'MO', 'MD', 'WI', 'CO', 'MN', 'SC', 'AL', 'LA', 'KY', 'OR', 'OK'])
+
+
+def _percent(values):
+    return np.char.add(np.round(values * 100, 2).astype(str), '%')
+
+
+def _catalog(rng, scale):
+    n = BASE_ASINS * scale
+    asins = np.char.add('B0', np.char.zfill((np.arange(n) * 7919 + 10_000_019).astype(str), 8))
+    skus = np.char.add(rng.choice(SKU_PREFIXES, n), np.char.zfill(np.arange(1, n + 1).astype(str), 5))
+    perpetua = np.zeros(n, dtype=bool)
+    perpetua[rng.choice(n, BASE_PERPETUA * scale, replace=False)] = True
+    return pd.DataFrame({
+        'ASIN': asins,
+        'SKU': skus,
+        'Perpetua': perpetua,
+        'Price': rng.lognormal(np.log(18), 0.45, n).round(2),
+        'Demand': rng.lognormal(0, 1.0, n),          # relative daily demand
+        'CPC': rng.lognormal(np.log(0.9), 0.35, n),
+        'CTR': rng.beta(2, 400, n),
+        'CVR': rng.beta(6, 50, n),
+    })
+
+
+def _ad_days(rng, catalog, dates):
+    """One advertised-products row per active ASIN-day"""
+    n_asins, n_days = len(catalog), len(dates)
+    active = rng.random((n_days, n_asins)) < 0.9
+    d_idx, a_idx = np.nonzero(active)
+    items = catalog.iloc[a_idx].reset_index(drop=True)
+
+    launched = (dates[d_idx] >= np.datetime64(LAUNCH_DATE)) & items['Perpetua'].to_numpy()
+    impressions = rng.poisson(items['Demand'].to_numpy() * 900 * np.where(launched, 1.35, 1.0)) + 1
+    clicks = rng.binomial(impressions, items['CTR'].to_numpy())
+    cpc = items['CPC'].to_numpy() * rng.lognormal(0, 0.15, len(items))
+    spend = (clicks * cpc).round(2)
+    orders = rng.binomial(clicks, items['CVR'].to_numpy())
+    units = orders + rng.binomial(orders, 0.2)
+    sales = (units * items['Price'].to_numpy()).round(2)
+    return pd.DataFrame({
+        'Date': dates[d_idx],
+        'ASIN': items['ASIN'],
+        'SKU': items['SKU'],
+        'Impressions': impressions,
+        'Clicks': clicks,
+        'Spend': spend,
+        'Orders': orders,
+        'Units': units,
+        'Sales': sales,
+    })
+
+
+def _ratios(frame):
+    spend, sales, clicks = frame['Spend'], frame['Sales'], frame['Clicks']
+    return {
+        'Click-Thru Rate (CTR)': _percent(np.divide(clicks, frame['Impressions'], out=np.zeros(len(frame)),
+                                                    where=frame['Impressions'] > 0)),
+        'Cost Per Click (CPC)': np.divide(spend, clicks, out=np.zeros(len(frame)), where=clicks > 0).round(2),
+        'Total Advertising Cost of Sales (ACOS) ': _percent(np.divide(spend, sales, out=np.zeros(len(frame)),
+                                                                      where=sales > 0)),
+        'Total Return on Advertising Spend (ROAS)': np.divide(sales, spend, out=np.zeros(len(frame)),
+                                                              where=spend > 0).round(2),
+    }
+
+
+def _write_xlsx(path, sheets):
+    """Write-only workbook (constant memory); sheets beyond Excel's row limit are truncated"""
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    written = {}
+    for name, frame in sheets.items():
+        ws = wb.create_sheet(name)
+        ws.append(list(frame.columns))
+        frame = frame.iloc[:EXCEL_MAX_ROWS]
+        for row in frame.itertuples(index=False, name=None):
+            ws.append(row)
+        written[name] = len(frame)
+    wb.save(path)
+    return written
+
+
+def _campaign_report(rng, ads):
+    """Two campaigns per ASIN (auto + manual) splitting each ASIN-day, plus brand campaigns"""
+    auto_share = rng.uniform(0.3, 0.7, len(ads))
+    parts = []
+    for kind, share in (('Auto', auto_share), ('Manual', 1 - auto_share)):
+        part = ads.copy()
+        for col in ('Impressions', 'Clicks', 'Orders', 'Units'):
+            part[col] = np.floor(ads[col] * share).astype(int)
+        for col in ('Spend', 'Sales'):
+            part[col] = (ads[col] * share).round(2)
+        part['Campaign Name'] = 'SP - ' + part['SKU'] + ' - ' + part['ASIN'] + f' - {kind}'
+        parts.append(part)
+    report = pd.concat(parts, ignore_index=True)
+
+    # Brand / category campaigns carry no ASIN and end up 'Unknown'
+    brand = report.sample(frac=0.05, random_state=int(rng.integers(1 << 31)))
+    brand = brand.assign(**{'Campaign Name': 'SP - Brand Defense - ' + brand['Date'].dt.strftime('%b')})
+    report = pd.concat([report, brand], ignore_index=True).sort_values(['Date', 'Campaign Name'], kind='stable')
+
+    out = pd.DataFrame({
+        'Date': report['Date'].dt.strftime('%Y-%m-%d'),
+        'Portfolio name': 'Nature\'s Truth',
+        'Currency': 'USD',
+        'Campaign Name': report['Campaign Name'],
+        'Country': 'United States',
+        'Status': 'ENABLED',
+        'Impressions': report['Impressions'],
+        'Clicks': report['Clicks'],
+        'Spend': report['Spend'],
+        '7 Day Total Sales ': report['Sales'],
+        '7 Day Total Orders (#)': report['Orders'],
+        '7 Day Total Units (#)': report['Units'],
+    })
+    for col, values in _ratios(report).items():
+        out[col] = values
+    return out
+
+
+def _advertised_products(ads):
+    out = pd.DataFrame({
+        'Date': ads['Date'],
+        'Portfolio name': 'Nature\'s Truth',
+        'Currency': 'USD',
+        'Campaign Name': 'SP - ' + ads['SKU'] + ' - ' + ads['ASIN'] + ' - Auto',
+        'Ad Group Name': 'Ad group - ' + ads['SKU'],
+        'Advertised SKU': ads['SKU'],
+        'Advertised ASIN': ads['ASIN'],
+        'Impressions': ads['Impressions'],
+        'Clicks': ads['Clicks'],
+        'Spend': ads['Spend'],
+        '7 Day Total Sales ': ads['Sales'],
+        '7 Day Total Orders (#)': ads['Orders'],
+        '7 Day Total Units (#)': ads['Units'],
+    })
+    for col, values in _ratios(ads).items():
+        out[col] = values
+    out['7 Day Conversion Rate'] = _percent(np.divide(ads['Orders'], ads['Clicks'], out=np.zeros(len(ads)),
+                                                      where=ads['Clicks'] > 0))
+    return out
+
+
+def _search_terms(rng, ads, keep=0.5):
+    """Search term and targeting rows for a sample of ASIN-days"""
+    rows = ads[rng.random(len(ads)) < keep].reset_index(drop=True)
+    n = len(rows)
+    words = rng.choice(SEARCH_WORDS, (n, 3))
+    term = np.char.add(np.char.add(np.char.add(words[:, 0], ' '), np.char.add(words[:, 1], ' ')), words[:, 2])
+    match = rng.choice(MATCH_TYPES, n)
+    base = {
+        'Date': rows['Date'],
+        'Portfolio name': 'Nature\'s Truth',
+        'Currency': 'USD',
+        'Campaign Name': 'SP - ' + rows['SKU'] + ' - ' + rows['ASIN'] + ' - Manual',
+        'Ad Group Name': 'Ad group - ' + rows['SKU'],
+        'Targeting': np.where(match == '-', 'close-match', term),
+        'Match Type': match,
+    }
+    metrics = {
+        'Impressions': rows['Impressions'],
+        'Clicks': rows['Clicks'],
+        'Spend': rows['Spend'],
+        '7 Day Total Sales ': rows['Sales'],
+        '7 Day Total Orders (#)': rows['Orders'],
+        '7 Day Total Units (#)': rows['Units'],
+        **_ratios(rows),
+    }
+    search_terms = pd.DataFrame({**base, 'Customer Search Term': term, **metrics})
+    targeting = pd.DataFrame({**base, **metrics,
+                              'Top-of-search Impression Share': _percent(rng.beta(2, 8, n))})
+    return search_terms, targeting
+
+
+def _order_lines(rng, catalog, dates, ads):
+    """Order-report lines: ad-driven units plus organic demand, split into monthly exports"""
+    n_asins, n_days = len(catalog), len(dates)
+    ad_units = np.zeros((n_days, n_asins))
+    d_idx = np.searchsorted(dates, ads['Date'].to_numpy(dtype='datetime64[D]'))
+    a_idx = np.searchsorted(catalog['ASIN'].to_numpy(), ads['ASIN'].to_numpy())
+    np.add.at(ad_units, (d_idx, a_idx), ads['Orders'].to_numpy())
+    lines_per_day = rng.poisson(ad_units + catalog['Demand'].to_numpy() * 1.2)
+
+    d_idx, a_idx = np.nonzero(lines_per_day)
+    counts = lines_per_day[d_idx, a_idx]
+    d_idx, a_idx = np.repeat(d_idx, counts), np.repeat(a_idx, counts)
+    n = len(d_idx)
+    items = catalog.iloc[a_idx].reset_index(drop=True)
+
+    seconds = rng.integers(0, 86_400, n)
+    purchase = dates[d_idx].astype('datetime64[s]') + seconds.astype('timedelta64[s]')
+    purchase_text = pd.Series(purchase).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+    quantity = 1 + rng.binomial(2, 0.1, n)
+    status = rng.choice(['Shipped', 'Shipped', 'Shipped', 'Shipped', 'Shipped', 'Shipped', 'Shipped',
+                         'Shipped', 'Pending', 'Cancelled'], n)
+    price = (items['Price'].to_numpy() * quantity).round(2)
+    fulfillment = rng.choice(['Amazon', 'Merchant'], n, p=[0.88, 0.12])
+
+    lines = pd.DataFrame({col: '' for col in ORDER_COLUMNS}, index=range(n))
+    lines['amazon-order-id'] = [f'{111 + i % 3:03d}-{i:07d}-{(i * 7919) % 10_000_000:07d}' for i in range(n)]
+    lines['merchant-order-id'] = lines['amazon-order-id']
+    lines['purchase-date'] = purchase_text
+    lines['last-updated-date'] = purchase_text
+    lines['order-status'] = status
+    lines['fulfillment-channel'] = fulfillment
+    lines['sales-channel'] = rng.choice(['Amazon.com', 'Amazon.ca', 'Non-Amazon'], n, p=[0.93, 0.04, 0.03])
+    lines['order-channel'] = ''
+    lines['ship-service-level'] = rng.choice(['Standard', 'Expedited'], n, p=[0.85, 0.15])
+    lines['product-name'] = 'Nature\'s Truth ' + items['SKU']
+    lines['sku'] = items['SKU']
+    lines['asin'] = items['ASIN']
+    lines['item-status'] = status
+    lines['quantity'] = quantity
+    lines['currency'] = 'USD'
+    lines['item-price'] = np.where(status == 'Cancelled', '', price.astype(str))
+    lines['item-tax'] = (price * 0.07).round(2)
+    lines['shipping-price'] = 0
+    lines['ship-city'] = ''
+    lines['ship-state'] = rng.choice(STATES, n)
+    lines['ship-postal-code'] = rng.integers(10_000, 99_999, n)
+    lines['ship-country'] = 'US'
+    lines['is-business-order'] = np.where(rng.random(n) < 0.06, 'true', 'false')
+    lines['fulfilled-by'] = np.where(fulfillment == 'Amazon', 'Amazon', '')
+    lines['is-iba'] = 'false'
+    lines['day'] = d_idx
+    return lines.sort_values('purchase-date', kind='stable').reset_index(drop=True)
+
+
+def generate_reports(out_dir, scale=1, seed=0, start=START_DATE, days=DAYS):
+    """
+    Write every input file into `out_dir` and return the manifest (rows and
+    bytes per file). Same scale and seed always give the same files.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng([seed, scale])
+    dates = pd.date_range(start, periods=days, freq='D').values.astype('datetime64[D]')
+
+    catalog = _catalog(rng, scale)
+    ads = _ad_days(rng, catalog, dates)
+    ads['Date'] = pd.to_datetime(ads['Date'])
+    manifest = {'scale': scale, 'seed': seed, 'start': start, 'days': days,
+                'asins': len(catalog), 'perpetua_asins': int(catalog['Perpetua'].sum()), 'files': {}}
+
+    def record(name, rows, note=None):
+        entry = {'rows': int(rows), 'bytes': (out_dir / name).stat().st_size}
+        if note:
+            entry['note'] = note
+        manifest['files'][name] = entry
+
+    perpetua = catalog[catalog['Perpetua']]
+    written = _write_xlsx(out_dir / ASIN_LIST_FILE, {
+        'perpetua list': perpetua[['ASIN', 'SKU']],
+        'All ASIns': catalog[['ASIN', 'SKU']].rename(columns={'ASIN': 'ASIN (Informational only)'}),
+    })
+    record(ASIN_LIST_FILE, sum(written.values()))
+
+    campaigns = _campaign_report(rng, ads)
+    campaigns.to_csv(out_dir / CAMPAIGN_FILE, index=False)
+    record(CAMPAIGN_FILE, len(campaigns))
+
+    for name, frame in [(AD_PRODUCTS_FILE, _advertised_products(ads)),
+                        *zip((STR_FILE, TARGETING_FILE), _search_terms(rng, ads))]:
+        rows = _write_xlsx(out_dir / name, {'Sheet1': frame})['Sheet1']
+        record(name, rows, f'truncated from {len(frame):,} rows (Excel row limit)' if rows < len(frame) else None)
+
+    # Monthly exports that overlap by three days, like back-to-back downloads
+    lines = _order_lines(rng, catalog, dates, ads)
+    months = pd.Series(dates).dt.to_period('M').unique()
+    for month in months:
+        first = int(np.searchsorted(dates, np.datetime64(month.start_time.date(), 'D')))
+        last = int(np.searchsorted(dates, np.datetime64(month.end_time.date(), 'D'), side='right'))
+        chunk = lines[(lines['day'] >= max(first - 3, 0)) & (lines['day'] < last)]
+        name = f'All_Orders_{month.strftime("%Y%m")}.txt'
+        chunk[ORDER_COLUMNS].to_csv(out_dir / name, sep='\t', index=False)
+        record(name, len(chunk))
+
+    with open(out_dir / MANIFEST_NAME, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write synthetic Amazon-shaped input reports')
+    parser.add_argument('--scale', type=int, default=1, help='catalog multiplier (1, 10, 100)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', type=Path, default=BASE_DIR / 'benchmarks' / 'fixtures',
+                        help='output directory (default: benchmarks/fixtures/scale_<n>)')
+    args = parser.parse_args()
+    out_dir = args.out / f'scale_{args.scale}' if args.out.name == 'fixtures' else args.out
+
+    print("=" * 80)
+    print(f"GENERATING SYNTHETIC REPORTS (scale {args.scale}x, seed {args.seed})")
+    print("=" * 80)
+    print()
+
+    manifest = generate_reports(out_dir, args.scale, args.seed)
+    for name, entry in manifest['files'].items():
+        note = f"  ({entry['note']})" if 'note' in entry else ''
+        print(f"  ✓ {name}: {entry['rows']:,} rows, {entry['bytes'] / 1e6:,.1f} MB{note}")
+    print(f"\n  ✓ Saved fixtures to: {out_dir}")
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Analytics Warehouse
+Local SQLite star schema over the processed layer for ad-hoc SQL: an ad fact
+table at Date x ASIN x campaign grain, an order fact table at Date x SKU grain,
+date/ASIN/SKU/platform/campaign dimensions, and aggregate tables (daily and
+monthly by platform, weekly by ASIN) with ROAS / ACOS / TACoS precomputed.
+
+    python scripts/warehouse.py build
+    python scripts/warehouse.py sql "SELECT * FROM agg_monthly_platform"
+    python scripts/warehouse.py tables
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from daily_cube import load_cube
+from event_study import NO_EVENT, load_onboarding_dates
+from processed_store import AD_PRODUCTS_NAME, MERGED_NAME, PROCESSED_DIR, load_dataset, load_merged
+
+WAREHOUSE_DB = PROCESSED_DIR / 'warehouse.sqlite'
+SOURCES = [PROCESSED_DIR / f'{AD_PRODUCTS_NAME}.csv', PROCESSED_DIR / f'{MERGED_NAME}.csv']
+
+LAUNCH_DATE = '2025-12-15'
+UNKNOWN = 'Unknown'
+
+# Fact column -> source column in the advertised products report
+AD_FACTS = {
+    'impressions': 'Impressions',
+    'clicks': 'Clicks',
+    'spend': 'Spend',
+    'sales': '7 Day Total Sales ',
+    'orders': '7 Day Total Orders (#)',
+    'units': '7 Day Total Units (#)',
+}
+
+# Fact column -> source column in the orders + advertising merge
+ORDER_FACTS = {
+    'total_revenue': 'Total_Revenue',
+    'organic_sales': 'Organic_Sales',
+    'ad_spend': 'Ad_Spend',
+    'ad_sales': 'Ad_Sales',
+}
+
+SCHEMA = """
+CREATE TABLE dim_date (
+    date_id     INTEGER PRIMARY KEY,   -- YYYYMMDD
+    date        TEXT NOT NULL,
+    year        INTEGER,
+    quarter     INTEGER,
+    month       TEXT,                  -- YYYY-MM
+    week_start  TEXT,                  -- Monday of the ISO week
+    day_of_week INTEGER,               -- 0 = Monday
+    is_weekend  INTEGER,
+    post_launch INTEGER
+);
+CREATE TABLE dim_platform (
+    platform_id INTEGER PRIMARY KEY,
+    platform    TEXT UNIQUE NOT NULL
+);
+CREATE TABLE dim_asin (
+    asin_id          INTEGER PRIMARY KEY,
+    asin             TEXT UNIQUE NOT NULL,
+    platform_id      INTEGER REFERENCES dim_platform(platform_id),
+    onboarding_date  TEXT,
+    sales_segment    TEXT,
+    spend_segment    TEXT,
+    organic_segment  TEXT
+);
+CREATE TABLE dim_sku (
+    sku_id      INTEGER PRIMARY KEY,
+    sku         TEXT UNIQUE NOT NULL,
+    asin_id     INTEGER REFERENCES dim_asin(asin_id),
+    platform_id INTEGER REFERENCES dim_platform(platform_id)
+);
+CREATE TABLE dim_campaign (
+    campaign_id   INTEGER PRIMARY KEY,
+    campaign_name TEXT UNIQUE NOT NULL,
+    portfolio     TEXT
+);
+CREATE TABLE fact_ad_daily (
+    date_id     INTEGER NOT NULL REFERENCES dim_date(date_id),
+    asin_id     INTEGER NOT NULL REFERENCES dim_asin(asin_id),
+    campaign_id INTEGER NOT NULL REFERENCES dim_campaign(campaign_id),
+    impressions INTEGER,
+    clicks      INTEGER,
+    spend       REAL,
+    sales       REAL,
+    orders      INTEGER,
+    units       INTEGER,
+    PRIMARY KEY (date_id, asin_id, campaign_id)
+) WITHOUT ROWID;
+CREATE TABLE fact_sku_daily (
+    date_id       INTEGER NOT NULL REFERENCES dim_date(date_id),
+    sku_id        INTEGER NOT NULL REFERENCES dim_sku(sku_id),
+    total_revenue REAL,
+    organic_sales REAL,
+    ad_spend      REAL,
+    ad_sales      REAL,
+    PRIMARY KEY (date_id, sku_id)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX fact_ad_by_asin ON fact_ad_daily(asin_id, date_id);
+CREATE INDEX fact_ad_by_campaign ON fact_ad_daily(campaign_id, date_id);
+CREATE INDEX fact_sku_by_sku ON fact_sku_daily(sku_id, date_id);
+CREATE INDEX dim_asin_by_platform ON dim_asin(platform_id);
+CREATE INDEX dim_date_by_month ON dim_date(month);
+CREATE INDEX dim_date_by_week ON dim_date(week_start);
+"""
+
+# Flat view for ad-hoc filtering; aggregates below are materialized at build time
+VIEWS = """
+CREATE VIEW v_ad_daily AS
+SELECT d.date, d.week_start, d.month, a.asin, p.platform, c.campaign_name, c.portfolio,
+       f.impressions, f.clicks, f.spend, f.sales, f.orders, f.units
+FROM fact_ad_daily f
+JOIN dim_date d ON d.date_id = f.date_id
+JOIN dim_asin a ON a.asin_id = f.asin_id
+JOIN dim_platform p ON p.platform_id = a.platform_id
+JOIN dim_campaign c ON c.campaign_id = f.campaign_id;
+"""
+
+# table -> (grain columns, grain expressions). Ad and order facts are summed
+# separately to the grain and then joined, so neither fact is fanned out
+AGGREGATES = {
+    'agg_daily_platform': (['date', 'platform'], ['d.date', 'p.platform']),
+    'agg_weekly_asin': (['week_start', 'asin', 'platform'], ['d.week_start', 'a.asin', 'p.platform']),
+    'agg_monthly_platform': (['month', 'platform'], ['d.month', 'p.platform']),
+}
+
+
+def _aggregate_sql(table, columns, exprs):
+    grain = ', '.join(f'{expr} AS {col}' for col, expr in zip(columns, exprs))
+    group = ', '.join(exprs)
+    on = ' AND '.join(f'keys.{col} = {{side}}.{col}' for col in columns)
+    key_columns = ', '.join(columns)
+    order_grain = grain.replace('a.asin', 's_asin.asin')
+    order_group = group.replace('a.asin', 's_asin.asin')
+    # Both sides go through temp tables: CTEs would be re-evaluated for every join probe
+    return f"""
+CREATE TEMP TABLE ads AS
+    SELECT {grain}, SUM(f.impressions) AS impressions, SUM(f.clicks) AS clicks,
+           SUM(f.spend) AS spend, SUM(f.sales) AS sales, SUM(f.orders) AS orders
+    FROM fact_ad_daily f
+    JOIN dim_date d ON d.date_id = f.date_id
+    JOIN dim_asin a ON a.asin_id = f.asin_id
+    JOIN dim_platform p ON p.platform_id = a.platform_id
+    GROUP BY {group};
+CREATE TEMP TABLE orders AS
+    SELECT {order_grain}, SUM(f.total_revenue) AS total_revenue, SUM(f.organic_sales) AS organic_sales
+    FROM fact_sku_daily f
+    JOIN dim_date d ON d.date_id = f.date_id
+    JOIN dim_sku s ON s.sku_id = f.sku_id
+    {'JOIN dim_asin s_asin ON s_asin.asin_id = s.asin_id' if 'asin' in columns else ''}
+    JOIN dim_platform p ON p.platform_id = s.platform_id
+    GROUP BY {order_group};
+CREATE INDEX temp.ads_grain ON ads({key_columns});
+CREATE INDEX temp.orders_grain ON orders({key_columns});
+CREATE TABLE {table} AS
+WITH keys AS (
+    SELECT {key_columns} FROM ads UNION SELECT {key_columns} FROM orders
+)
+SELECT keys.*,
+       COALESCE(ads.impressions, 0) AS impressions, COALESCE(ads.clicks, 0) AS clicks,
+       COALESCE(ads.spend, 0) AS spend, COALESCE(ads.sales, 0) AS sales, COALESCE(ads.orders, 0) AS orders,
+       COALESCE(orders.total_revenue, 0) AS total_revenue, COALESCE(orders.organic_sales, 0) AS organic_sales,
+       CASE WHEN ads.spend > 0 THEN ads.sales / ads.spend END AS roas,
+       CASE WHEN ads.sales > 0 THEN ads.spend / ads.sales END AS acos,
+       CASE WHEN orders.total_revenue > 0 THEN COALESCE(ads.spend, 0) / orders.total_revenue END AS tacos,
+       CASE WHEN ads.clicks > 0 THEN ads.spend / ads.clicks END AS cpc,
+       CASE WHEN ads.clicks > 0 THEN CAST(ads.orders AS REAL) / ads.clicks END AS cvr
+FROM keys
+LEFT JOIN ads ON {on.format(side='ads')}
+LEFT JOIN orders ON {on.format(side='orders')};
+CREATE INDEX {table}_grain ON {table}({key_columns});
+DROP TABLE temp.ads;
+DROP TABLE temp.orders;
+"""
+
+
+def _date_ids(dates):
+    return (dates.dt.year * 10000 + dates.dt.month * 100 + dates.dt.day).astype(np.int64)
+
+
+def _codes(values, labels):
+    """1-based ids of `values` in the sorted `labels` (0 when missing)"""
+    if len(labels) == 0:
+        return np.zeros(len(values), dtype=np.int64)
+    idx = np.clip(np.searchsorted(labels, values), 0, len(labels) - 1)
+    return np.where(labels[idx] == values, idx + 1, 0)
+
+
+def _dimensions(ads, merged, cube):
+    """Dimension frames (each with a 1-based id column) shared by both facts"""
+    platforms = np.array(sorted(set(cube.platforms) | {UNKNOWN}))
+    platform = pd.DataFrame({'platform_id': np.arange(1, len(platforms) + 1), 'platform': platforms})
+
+    onboarding = load_onboarding_dates(cube)
+    asin = pd.DataFrame({
+        'asin_id': np.arange(1, cube.n_asins + 1),
+        'asin': cube.asins,
+        'platform_id': _codes(cube.platforms, platforms),
+        'onboarding_date': [str(cube.dates[i]) if i != NO_EVENT and i < cube.n_dates else None
+                            for i in onboarding],
+        'sales_segment': cube.segments.get('Sales'),
+        'spend_segment': cube.segments.get('Spend'),
+        'organic_segment': cube.segments.get('Organic'),
+    })
+
+    # SKUs from the ad report map to ASINs; order-only SKUs keep the merge's platform
+    pairs = ads[['Advertised SKU', 'Advertised ASIN']].dropna().drop_duplicates('Advertised SKU')
+    sku_asin = dict(zip(pairs['Advertised SKU'], pairs['Advertised ASIN']))
+    sku_platform = merged.groupby('SKU')['Advertising_Type'].first()
+    skus = np.array(sorted(set(sku_asin) | set(merged['SKU'])))
+    asin_ids = _codes(np.array([sku_asin.get(s, '') for s in skus]), cube.asins)
+    sku_platform_ids = np.where(asin_ids > 0, asin['platform_id'].to_numpy()[asin_ids - 1],
+                                _codes(sku_platform.reindex(skus).fillna(UNKNOWN).to_numpy(dtype=str), platforms))
+    sku = pd.DataFrame({'sku_id': np.arange(1, len(skus) + 1), 'sku': skus,
+                        'asin_id': np.where(asin_ids > 0, asin_ids, None),
+                        'platform_id': np.where(sku_platform_ids > 0, sku_platform_ids, None)})
+
+    names = ads[['Campaign Name', 'Portfolio name']].drop_duplicates('Campaign Name').sort_values('Campaign Name')
+    campaign = pd.DataFrame({'campaign_id': np.arange(1, len(names) + 1),
+                             'campaign_name': names['Campaign Name'].to_numpy(),
+                             'portfolio': names['Portfolio name'].to_numpy()})
+
+    all_dates = pd.concat([ads['Date'], merged['Date']])
+    days = pd.Series(pd.date_range(all_dates.min(), all_dates.max(), freq='D'))
+    date = pd.DataFrame({
+        'date_id': _date_ids(days),
+        'date': days.dt.strftime('%Y-%m-%d'),
+        'year': days.dt.year,
+        'quarter': days.dt.quarter,
+        'month': days.dt.strftime('%Y-%m'),
+        'week_start': (days - pd.to_timedelta(days.dt.dayofweek, unit='D')).dt.strftime('%Y-%m-%d'),
+        'day_of_week': days.dt.dayofweek,
+        'is_weekend': (days.dt.dayofweek >= 5).astype(int),
+        'post_launch': (days >= pd.Timestamp(LAUNCH_DATE)).astype(int),
+    })
+    return {'dim_date': date, 'dim_platform': platform, 'dim_asin': asin, 'dim_sku': sku, 'dim_campaign': campaign}
+
+
+def _insert(conn, table, frame):
+    rows = frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+    conn.executemany(f'INSERT INTO {table} ({", ".join(frame.columns)}) '
+                     f'VALUES ({", ".join("?" * len(frame.columns))})', rows)
+
+
+def build_warehouse(path=WAREHOUSE_DB, ads=None, merged=None, cube=None):
+    """Build the warehouse into a temporary file and swap it in; returns row counts per table"""
+    if ads is None:
+        ads = load_dataset(AD_PRODUCTS_NAME, platforms=['Perpetua', 'Non-Perpetua'],
+                           columns=['Date', 'Portfolio name', 'Campaign Name', 'Advertised SKU',
+                                    'Advertised ASIN', 'Advertising_Type', *AD_FACTS.values()])
+    if merged is None:
+        merged = load_merged(columns=['SKU', 'Advertising_Type', *ORDER_FACTS.values()])
+    if cube is None:
+        cube = load_cube()
+
+    ads = ads[ads['Date'].notna() & ads['Advertised ASIN'].notna() & ads['Campaign Name'].notna()].copy()
+    for col in ('Advertised ASIN', 'Advertised SKU', 'Campaign Name'):
+        ads[col] = ads[col].astype(str).str.strip()
+    for col in AD_FACTS.values():
+        if col not in ads.columns:
+            ads[col] = 0
+        ads[col] = pd.to_numeric(ads[col], errors='coerce').fillna(0)
+    merged = merged[merged['SKU'].notna()].copy()
+    merged['SKU'] = merged['SKU'].astype(str).str.strip()
+    for col in ORDER_FACTS.values():
+        if col not in merged.columns:
+            merged[col] = 0
+        merged[col] = pd.to_numeric(merged[col], errors='coerce').fillna(0)
+
+    dims = _dimensions(ads, merged, cube)
+
+    # Ad groups and advertised SKUs collapse into the Date x ASIN x campaign grain
+    ads['date_id'] = _date_ids(ads['Date'])
+    ads['asin_id'] = _codes(ads['Advertised ASIN'].to_numpy(dtype=str), cube.asins)
+    ads['campaign_id'] = _codes(ads['Campaign Name'].to_numpy(dtype=str),
+                                dims['dim_campaign']['campaign_name'].to_numpy(dtype=str))
+    ads = ads[ads['asin_id'] > 0]
+    fact_ad = (ads.groupby(['date_id', 'asin_id', 'campaign_id'], sort=True)[list(AD_FACTS.values())]
+               .sum().reset_index().rename(columns={v: k for k, v in AD_FACTS.items()}))
+
+    merged['date_id'] = _date_ids(merged['Date'])
+    merged['sku_id'] = _codes(merged['SKU'].to_numpy(dtype=str), dims['dim_sku']['sku'].to_numpy(dtype=str))
+    fact_sku = (merged.groupby(['date_id', 'sku_id'], sort=True)[list(ORDER_FACTS.values())]
+                .sum().reset_index().rename(columns={v: k for k, v in ORDER_FACTS.items()}))
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        with conn:
+            conn.executescript(SCHEMA)
+            for table, frame in dims.items():
+                _insert(conn, table, frame)
+            _insert(conn, 'fact_ad_daily', fact_ad)
+            _insert(conn, 'fact_sku_daily', fact_sku)
+        conn.executescript(INDEXES + VIEWS)
+        for table, (columns, exprs) in AGGREGATES.items():
+            conn.executescript(_aggregate_sql(table, columns, exprs))
+        conn.execute('ANALYZE')
+        counts = {table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                  for table in [*dims, 'fact_ad_daily', 'fact_sku_daily', *AGGREGATES]}
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return counts
+
+
+def connect(path=WAREHOUSE_DB, rebuild=False):
+    """Read-only connection to the warehouse, rebuilding it when the processed inputs are newer"""
+    path = Path(path)
+    sources = [p for p in SOURCES if p.exists()]
+    stale = not path.exists() or any(p.stat().st_mtime > path.stat().st_mtime for p in sources)
+    if rebuild or (stale and sources):
+        build_warehouse(path)
+    return sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+
+
+def query(sql, params=(), path=WAREHOUSE_DB):
+    """Run one SELECT against the warehouse and return a DataFrame"""
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local SQL warehouse over the processed data')
+    sub = parser.add_subparsers(dest='command')
+    sub.add_parser('build', help='rebuild the star schema and aggregates')
+    sql = sub.add_parser('sql', help='run a query and print the result')
+    sql.add_argument('query')
+    sql.add_argument('--csv', action='store_true', help='print CSV instead of a table')
+    sub.add_parser('tables', help='list tables and views with row counts')
+    args = parser.parse_args()
+
+    if args.command == 'sql':
+        result = query(args.query)
+        print(result.to_csv(index=False) if args.csv else result.to_string(index=False))
+        sys.exit(0)
+
+    if args.command == 'tables':
+        conn = connect()
+        for name, kind in conn.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view') "
+                                       "ORDER BY type, name"):
+            rows = conn.execute(f'SELECT COUNT(*) FROM {name}').fetchone()[0]
+            print(f"  {kind:<6} {name:<24} {rows:>12,}")
+        conn.close()
+        sys.exit(0)
+
+    print("=" * 80)
+    print("BUILDING ANALYTICS WAREHOUSE")
+    print("=" * 80)
+    print()
+
+    counts = build_warehouse()
+    for table, rows in counts.items():
+        print(f"  ✓ {table:<24} {rows:>12,} rows")
+    print(f"  ✓ Saved warehouse to: {WAREHOUSE_DB}")